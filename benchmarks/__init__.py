@@ -0,0 +1 @@
+# Mesures de performances de l'application (à lancer depuis la racine du projet : python -m benchmarks.<module>)
@@ -0,0 +1,87 @@
+# Importation des modules nécessaires
+import datetime  # Pour manipuler les dates
+import random  # Pour générer des données reproductibles
+from typing import Dict, Iterator, Optional  # Pour les annotations de type
+
+from models.depots import Depot  # Couche de stockage
+from models.elo import esperance  # Score attendu selon l'écart Elo
+from models.joueur_model import JoueurManager  # Gestionnaire des joueurs
+from models.tournoi_model import Tournoi  # Modèle pour les tournois
+
+NOMS = ("Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau")
+PRENOMS = ("Camille", "Louis", "Emma", "Jules", "Léa", "Hugo", "Chloé", "Arthur", "Manon", "Gabriel")
+TAUX_NULLES = 0.3  # Proportion de parties nulles entre deux joueurs de même Elo
+CHAMPS_ENTETE = ("index", "nom_tournoi", "date_debut", "date_fin", "nb_rondes", "nb_max_joueurs", "type_tournoi")
+
+
+# Fonction pour générer des joueurs synthétiques (dictionnaires au format de joueur.json, détails tous distincts)
+def joueurs_synthetiques(nombre: int, premier_index: int = 1, graine: int = 0) -> Iterator[Dict]:
+    aleatoire = random.Random(graine)
+    origine = datetime.date(1940, 1, 1).toordinal()
+    for index in range(premier_index, premier_index + nombre):
+        yield {
+            "index": index,
+            "nom": f"{aleatoire.choice(NOMS)}{index}",  # Suffixe : aucun doublon (nom, prénom, naissance)
+            "prenom": aleatoire.choice(PRENOMS),
+            "date_naissance": datetime.date.fromordinal(origine + aleatoire.randrange(70 * 365)).isoformat(),
+            "elo": aleatoire.randint(1000, 2800)
+        }
+
+
+# Fonction pour tirer un résultat réaliste : le mieux classé gagne plus souvent, les nulles sont fréquentes à Elo égal
+def resultat_realiste(elo_blanc: int, elo_noir: int, aleatoire: random.Random) -> str:
+    attendu = esperance(int(elo_blanc) - int(elo_noir))  # Score attendu des blancs
+    nulle = TAUX_NULLES * (1 - abs(2 * attendu - 1))  # Probabilité de nulle, plus faible si l'écart est grand
+    tirage = aleatoire.random()
+    if tirage < attendu - nulle / 2:
+        return "1-0"
+    if tirage < attendu + nulle / 2:
+        return "0.5-0.5"
+    return "0-1"
+
+
+# Fonction pour créer un tournoi joué : joueurs tirés au hasard, rondes appariées par le système suisse,
+# résultats réalistes
+#
+# Le tournoi est enregistré dans le dépôt du gestionnaire des joueurs (une écriture par ronde, comme à l'usage).
+def tournoi_synthetique(joueur_manager: JoueurManager, nom: str, nb_joueurs: int, nb_rondes: int,
+                        rondes_jouees: Optional[int] = None, index: int = 0, graine: int = 0) -> Tournoi:
+    aleatoire = random.Random(graine)
+    debut = datetime.date(2024, 1, 1) + datetime.timedelta(days=7 * index)
+    tournoi = Tournoi(index, nom, debut, debut + datetime.timedelta(days=nb_rondes), nb_joueurs, nb_rondes, "Suisse",
+                      depot=joueur_manager.depot, joueur_manager=joueur_manager)
+    tournoi.joueurs = aleatoire.sample(joueur_manager.joueurs, nb_joueurs)
+    tournoi.demarrer_tournoi()
+    for _ in range(nb_rondes if rondes_jouees is None else rondes_jouees):
+        ronde = tournoi.creer_ronde()
+        if ronde is None:
+            break
+        for match in ronde.matchs:
+            resultat = resultat_realiste(match.joueur_blanc.elo, match.joueur_noir.elo, aleatoire)
+            tournoi.enregistrer_resultat(ronde, match, resultat)
+        ronde.terminer_ronde()
+    if len(tournoi.rondes) >= nb_rondes:
+        tournoi.terminer_tournoi()
+    tournoi.sauvegarder_tournoi()
+    return tournoi
+
+
+# Fonction pour remplir un dépôt : joueurs synthétiques puis tournois joués (copies d'un tournoi modèle)
+#
+# Un seul tournoi est réellement apparié et joué ; les autres reprennent ses rondes sous un autre nom, ce qui
+# garde la préparation rapide aux grandes échelles sans changer le volume de données lu et écrit.
+def peupler_depot(depot: Depot, nb_joueurs: int, nb_tournois: int, inscrits: int, nb_rondes: int,
+                  graine: int = 0) -> JoueurManager:
+    depot.enregistrer_joueurs(joueurs_synthetiques(nb_joueurs, graine=graine))
+    joueur_manager = JoueurManager(depot)
+    joueur_manager.quota = None
+    modele = tournoi_synthetique(joueur_manager, "Tournoi 1", inscrits, nb_rondes, graine=graine).to_dict()
+    entetes = {}
+    with depot.transaction():
+        for numero in range(1, nb_tournois + 1):
+            nom = f"Tournoi {numero}"
+            data = {**modele, "index": numero - 1, "nom_tournoi": nom}
+            depot.synchroniser_tournoi(nom, data)
+            entetes[nom] = {cle: data[cle] for cle in CHAMPS_ENTETE}  # Format de tournaments.json
+        depot.synchroniser_entetes(entetes)
+    return joueur_manager
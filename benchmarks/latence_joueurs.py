@@ -0,0 +1,104 @@
+# Importation des modules nécessaires
+import argparse  # Pour analyser les arguments de la ligne de commande
+import datetime  # Pour manipuler les dates
+import os  # Pour les opérations liées au système de fichiers
+import random  # Pour choisir les joueurs interrogés
+import tempfile  # Pour créer une base de données jetable par mesure
+import time  # Pour mesurer les durées
+from typing import Dict, List  # Pour les annotations de type
+
+from benchmarks.generateurs import joueurs_synthetiques  # Joueurs synthétiques
+from benchmarks.mesures import chronometrer, environnement, enregistrer_resultats, statistiques  # Outils de mesure
+from models.depots import Depot, DepotJSON  # Couches de stockage
+from models.joueur_model import JoueurManager  # Gestionnaire des joueurs
+from models.persistance import Persistance  # Écritures et durabilité
+
+TAILLES = (100, 1_000, 10_000, 100_000, 1_000_000)  # Nombres de joueurs en base
+STOCKAGES = ("json", "sqlite")  # Moteurs de stockage mesurés
+OPERATIONS = ("ajout", "recherche_index", "recherche_details", "sauvegarde")  # Opérations mesurées
+
+
+# Fonction pour créer un dépôt jetable contenant `taille` joueurs
+def creer_depot(stockage: str, dossier: str, taille: int, durabilite: str) -> Depot:
+    if stockage == "sqlite":
+        from models.depot_sqlite import DepotSQLite  # Import à la demande, comme dans obtenir_depot()
+        depot = DepotSQLite(os.path.join(dossier, "echecs.sqlite3"), durabilite)
+    else:
+        depot = DepotJSON(dossier, Persistance(durabilite))
+    depot.enregistrer_joueurs(joueurs_synthetiques(taille))  # Une seule écriture, hors mesure
+    return depot
+
+
+# Fonction pour mesurer les opérations unitaires sur une base de `taille` joueurs
+def mesurer(stockage: str, taille: int, repetitions: int, durabilite: str) -> Dict:
+    with tempfile.TemporaryDirectory() as dossier:
+        depot = creer_depot(stockage, dossier, taille, durabilite)
+        debut = time.perf_counter()
+        manager = JoueurManager(depot)
+        manager.quota = None  # Mesure sans plafond, quel que soit config.QUOTA_JOUEURS
+        chargement = time.perf_counter() - debut
+        aleatoire = random.Random(1)
+        cibles = [aleatoire.randint(1, taille) for _ in range(repetitions)]  # Joueurs interrogés et modifiés
+        naissance = datetime.date(2000, 1, 1)
+
+        # Fonctions mesurées (un appel par répétition)
+        def ajout(numero: int) -> None:
+            manager.ajouter_joueur(f"Nouveau{numero}", "Joueur", naissance, 1500)
+
+        def recherche_index(numero: int) -> None:
+            manager.trouver_joueur_par_index(cibles[numero])
+
+        def recherche_details(numero: int) -> None:
+            joueur = manager.trouver_joueur_par_index(cibles[numero])
+            manager.trouver_joueur_par_details(joueur.nom, joueur.prenom, joueur.date_naissance)
+
+        def sauvegarde(numero: int) -> None:
+            joueur = manager.trouver_joueur_par_index(cibles[numero])
+            manager.modifier_joueur(joueur.index, joueur.nom, joueur.prenom, joueur.date_naissance, joueur.elo + 1)
+
+        resultats = {"stockage": stockage, "taille": taille, "chargement_s": round(chargement, 3)}
+        for nom, operation in zip(OPERATIONS, (ajout, recherche_index, recherche_details, sauvegarde)):
+            resultats[nom] = statistiques(chronometrer(operation, repetitions))
+        if hasattr(depot, "fermer"):
+            depot.fermer()
+        return resultats
+
+
+# Fonction pour afficher les mesures sous forme de tableau, avec l'écart entre la plus petite et la plus grande base
+def afficher(mesures: List[Dict]) -> None:
+    print(f"{'stockage':<8} {'joueurs':>9} {'chargement':>11} " + " ".join(f"{nom:>18}" for nom in OPERATIONS))
+    for mesure in mesures:
+        colonnes = " ".join(f"{mesure[nom]['mediane_ms'] * 1000:>10.1f} µs/op " for nom in OPERATIONS)
+        print(f"{mesure['stockage']:<8} {mesure['taille']:>9} {mesure['chargement_s']:>10.2f}s " + colonnes)
+    for stockage in sorted({mesure["stockage"] for mesure in mesures}):
+        serie = [mesure for mesure in mesures if mesure["stockage"] == stockage]
+        if len(serie) > 1:
+            rapports = ", ".join(f"{nom} x{serie[-1][nom]['mediane_ms'] / serie[0][nom]['mediane_ms']:.2f}"
+                                 for nom in OPERATIONS)
+            print(f"{stockage} : {serie[-1]['taille']} joueurs / {serie[0]['taille']} joueurs -> {rapports}")
+
+
+# Fonction principale : mesure chaque stockage pour chaque taille de base
+def main(arguments: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Latence des ajouts, recherches et sauvegardes de joueurs "
+                                                 "en fonction du nombre de joueurs en base.")
+    parser.add_argument("--tailles", type=int, nargs="+", default=list(TAILLES), help="Nombres de joueurs en base")
+    parser.add_argument("--stockage", choices=STOCKAGES, nargs="+", default=list(STOCKAGES), help="Moteurs mesurés")
+    parser.add_argument("--repetitions", type=int, default=200, help="Nombre d'appels mesurés par opération")
+    parser.add_argument("--durabilite", choices=("immediat", "periodique", "manuel"), default="manuel",
+                        help="Mode de durabilité (par défaut : manuel, pour ne pas mesurer les fsync du disque)")
+    parser.add_argument("--sortie", help="Fichier JSON où enregistrer les mesures")
+    args = parser.parse_args(arguments)
+    mesures = []
+    for stockage in args.stockage:
+        for taille in args.tailles:
+            mesures.append(mesurer(stockage, taille, args.repetitions, args.durabilite))
+            afficher(mesures[-1:])
+    afficher(mesures)
+    if args.sortie:
+        enregistrer_resultats({"environnement": environnement(), "mesures": mesures}, args.sortie)
+
+
+# Point d'entrée du programme
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Importation des modules nécessaires
+import contextlib  # Pour faire taire les messages des modèles pendant les mesures
+import datetime  # Pour dater les résultats
+import json  # Pour enregistrer les résultats
+import os  # Pour les opérations liées au système de fichiers
+import platform  # Pour décrire la machine de mesure
+import statistics  # Pour les médianes et moyennes
+import subprocess  # Pour lire le commit mesuré
+import time  # Pour mesurer les durées
+from typing import Any, Callable, Dict, List, Optional  # Pour les annotations de type
+
+from models.persistance import ecrire_atomique  # Écriture atomique des résultats
+
+
+# Fonction pour mesurer la durée de chaque appel d'une opération (secondes)
+#
+# `preparation`, si elle est fournie, est appelée avant chaque mesure (hors chronomètre) et son résultat est
+# passé à l'opération : elle sert aux opérations qui modifient leurs données (créer une ronde, par exemple).
+def chronometrer(operation: Callable[[Any], Any], repetitions: int,
+                 preparation: Optional[Callable[[int], Any]] = None) -> List[float]:
+    durees = []
+    with open(os.devnull, 'w') as silence, contextlib.redirect_stdout(silence):  # Les modèles affichent par print
+        for numero in range(repetitions):
+            argument = preparation(numero) if preparation else numero
+            debut = time.perf_counter()
+            operation(argument)
+            durees.append(time.perf_counter() - debut)
+    return durees
+
+
+# Fonction pour résumer une série de durées (millisecondes)
+def statistiques(durees: List[float]) -> Dict[str, float]:
+    triees = sorted(durees)
+    return {
+        "repetitions": len(triees),
+        "min_ms": round(triees[0] * 1000, 6),
+        "mediane_ms": round(statistics.median(triees) * 1000, 6),
+        "moyenne_ms": round(statistics.fmean(triees) * 1000, 6),
+        "p95_ms": round(triees[max(0, int(len(triees) * 0.95) - 1)] * 1000, 6)
+    }
+
+
+# Fonction pour décrire l'environnement de mesure (comparaison des résultats dans le temps)
+def environnement() -> Dict[str, str]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "processeur": platform.processor()
+    }
+
+
+# Fonction pour enregistrer des résultats dans un fichier JSON (dossiers créés au besoin)
+def enregistrer_resultats(resultats: Dict, fichier: str) -> None:
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    ecrire_atomique(fichier, json.dumps(resultats, indent=2, ensure_ascii=False) + "\n")
@@ -0,0 +1,145 @@
+# Importation des modules nécessaires
+import argparse  # Pour analyser les arguments de la ligne de commande
+import contextlib  # Pour faire taire les messages des modèles pendant la préparation
+import datetime  # Pour nommer le fichier de résultats
+import json  # Pour relire des résultats précédents
+import os  # Pour les opérations liées au système de fichiers
+import random  # Pour choisir les joueurs modifiés
+import tempfile  # Pour créer un dépôt jetable par échelle
+from typing import Callable, Dict, List, Optional, Tuple  # Pour les annotations de type
+
+import rapports  # Rapports textuels mesurés
+from benchmarks.generateurs import peupler_depot  # Données synthétiques
+from benchmarks.mesures import chronometrer, environnement, enregistrer_resultats, statistiques  # Outils de mesure
+from models.depots import Depot, DepotJSON  # Couches de stockage
+from models.persistance import Persistance  # Écritures et durabilité
+from models.tournoi_manager import TournoiManager  # Gestionnaire des tournois
+from models.tournoi_model import Tournoi  # Modèle pour les tournois
+
+# Échelles mesurées : joueurs en base, nombre de tournois, inscrits et rondes par tournoi
+ECHELLES = {
+    "petite": {"joueurs": 200, "tournois": 5, "inscrits": 16, "rondes": 5},
+    "moyenne": {"joueurs": 5_000, "tournois": 20, "inscrits": 64, "rondes": 7},
+    "grande": {"joueurs": 50_000, "tournois": 50, "inscrits": 256, "rondes": 9}
+}
+DOSSIER_RESULTATS = os.path.join(os.path.dirname(__file__), "resultats")  # Emplacement par défaut des résultats
+
+
+# Fonction pour créer un dépôt jetable dans un dossier
+def creer_depot(stockage: str, dossier: str, durabilite: str) -> Depot:
+    if stockage == "sqlite":
+        from models.depot_sqlite import DepotSQLite  # Import à la demande, comme dans obtenir_depot()
+        return DepotSQLite(os.path.join(dossier, "echecs.sqlite3"), durabilite)
+    return DepotJSON(dossier, Persistance(durabilite))
+
+
+# Fonction pour construire la liste des opérations mesurées : (nom, opération, préparation éventuelle)
+def operations(depot: Depot, taille: Dict[str, int]) -> List[Tuple[str, Callable, Optional[Callable]]]:
+    from models.joueur_model import JoueurManager  # Gestionnaire relu depuis le dépôt rempli
+    joueur_manager = JoueurManager(depot)
+    joueur_manager.quota = None
+    tournoi_manager = TournoiManager(depot, joueur_manager)
+    complet = depot.charger_tournoi("Tournoi 1")  # Tournoi joué jusqu'à la dernière ronde
+    partiel = {**complet, "nom_tournoi": "Mesure", "rondes": complet["rondes"][:-1], "statut": "En cours"}
+    tournoi = Tournoi.from_dict(complet, depot, joueur_manager)
+    aleatoire = random.Random(0)
+
+    # Préparations (hors chronomètre)
+    def joueur_modifie(_: int) -> None:
+        joueur = aleatoire.choice(joueur_manager.joueurs)
+        joueur.elo += 1  # Une modification : la sauvegarde n'écrit que la différence
+
+    def tournoi_partiel(_: int) -> Tournoi:
+        return Tournoi.from_dict(partiel, depot, joueur_manager)  # Avant la dernière ronde
+
+    def entete(_: int) -> Tournoi:
+        entete_seule = {cle: valeur for cle, valeur in complet.items() if cle != "rondes"}
+        return Tournoi.from_dict(entete_seule, depot, joueur_manager)
+
+    return [
+        ("joueurs.charger", lambda _: joueur_manager.charger_joueurs(), None),
+        ("joueurs.sauvegarder", lambda _: joueur_manager.sauvegarder_joueurs(), joueur_modifie),
+        ("tournois.charger", lambda _: tournoi_manager.charger_tournois(), None),
+        ("tournoi.charger", lambda t: t.charger(), entete),
+        ("tournoi.from_dict", lambda _: Tournoi.from_dict(complet, depot, joueur_manager), None),
+        ("tournoi.to_dict", lambda _: tournoi.to_dict(), None),
+        ("tournoi.generer_paires", lambda t: t.generer_paires(), tournoi_partiel),
+        ("tournoi.creer_ronde", lambda t: t.creer_ronde(), tournoi_partiel),
+        ("tournoi.classement", lambda _: tournoi.classement(), None),
+        ("rapports.liste_joueurs_alphabetique",
+         lambda _: rapports.liste_joueurs_alphabetique(joueur_manager.joueurs), None),
+        ("rapports.liste_tournois", lambda _: rapports.liste_tournois(tournoi_manager.tournois), None),
+        ("rapports.details_tournoi", lambda _: rapports.details_tournoi(tournoi), None),
+        ("rapports.liste_joueurs_tournoi_alphabetique",
+         lambda _: rapports.liste_joueurs_tournoi_alphabetique(tournoi), None),
+        ("rapports.classement_tournoi", lambda _: rapports.classement_tournoi(tournoi), None),
+        ("rapports.liste_tours_et_matchs", lambda _: rapports.liste_tours_et_matchs(tournoi), None),
+        ("rapports.liste_tours_et_matchs_alternative",
+         lambda _: rapports.liste_tours_et_matchs_alternative(tournoi), None)
+    ]
+
+
+# Fonction pour mesurer toutes les opérations à une échelle
+def mesurer_echelle(taille: Dict[str, int], stockage: str, repetitions: int, durabilite: str,
+                    filtre: Optional[str] = None) -> Dict[str, Dict]:
+    with tempfile.TemporaryDirectory() as dossier:
+        depot = creer_depot(stockage, dossier, durabilite)
+        with open(os.devnull, 'w') as silence, contextlib.redirect_stdout(silence):  # Rondes affichées par creer_ronde
+            peupler_depot(depot, taille["joueurs"], taille["tournois"], taille["inscrits"], taille["rondes"])
+        mesures = {}
+        for nom, operation, preparation in operations(depot, taille):
+            if filtre and filtre not in nom:
+                continue
+            mesures[nom] = statistiques(chronometrer(operation, repetitions, preparation))
+        if hasattr(depot, "fermer"):
+            depot.fermer()
+        return mesures
+
+
+# Fonction pour afficher les mesures d'une échelle, comparées si possible à des résultats précédents
+def afficher(echelle: str, mesures: Dict[str, Dict], reference: Optional[Dict] = None) -> None:
+    print(f"== Échelle {echelle} ==")
+    anciennes = (reference or {}).get("echelles", {}).get(echelle, {}).get("mesures", {})
+    for nom, stats in mesures.items():
+        ligne = f"{nom:<46} {stats['mediane_ms']:>11.3f} ms  (p95 {stats['p95_ms']:.3f} ms)"
+        if nom in anciennes and anciennes[nom]["mediane_ms"]:
+            ligne += f"  x{stats['mediane_ms'] / anciennes[nom]['mediane_ms']:.2f} vs référence"
+        print(ligne)
+
+
+# Fonction principale : mesure chaque échelle demandée et enregistre les résultats en JSON
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Mesure des chemins critiques : chargement, sauvegarde, "
+                                                 "appariement, classement et rapports.")
+    parser.add_argument("--echelles", nargs="+", choices=list(ECHELLES), default=list(ECHELLES),
+                        help="Échelles mesurées")
+    parser.add_argument("--stockage", choices=("json", "sqlite"), default="json", help="Moteur de stockage")
+    parser.add_argument("--repetitions", type=int, default=10, help="Nombre d'appels mesurés par opération")
+    parser.add_argument("--durabilite", choices=("immediat", "periodique", "manuel"), default="manuel",
+                        help="Mode de durabilité (par défaut : manuel, pour ne pas mesurer les fsync du disque)")
+    parser.add_argument("--filtre", help="Ne mesurer que les opérations dont le nom contient ce texte")
+    parser.add_argument("--sortie", help="Fichier JSON des résultats (par défaut : benchmarks/resultats/<date>.json)")
+    parser.add_argument("--comparer", help="Fichier JSON de résultats précédents à comparer")
+    args = parser.parse_args(arguments)
+    reference = None
+    if args.comparer:
+        with open(args.comparer, 'r', encoding='utf-8') as file:
+            reference = json.load(file)
+    resultats = {
+        "environnement": environnement(),
+        "parametres": {"stockage": args.stockage, "repetitions": args.repetitions, "durabilite": args.durabilite},
+        "echelles": {}
+    }
+    for echelle in args.echelles:
+        mesures = mesurer_echelle(ECHELLES[echelle], args.stockage, args.repetitions, args.durabilite, args.filtre)
+        resultats["echelles"][echelle] = {"taille": ECHELLES[echelle], "mesures": mesures}
+        afficher(echelle, mesures, reference)
+    horodatage = f"{datetime.datetime.now():%Y%m%d-%H%M%S}"
+    sortie = args.sortie or os.path.join(DOSSIER_RESULTATS, f"{horodatage}-{args.stockage}.json")
+    enregistrer_resultats(resultats, sortie)
+    print(f"Résultats enregistrés dans {sortie}")
+
+
+# Point d'entrée du programme
+if __name__ == "__main__":
+    main()
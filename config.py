@@ -1,2 +1,16 @@
-MAX_JOUEURS = 100
-MAX_TOURNOIS = 15
+QUOTA_JOUEURS = None  # Nombre maximum de joueurs (None : illimité)
+QUOTA_TOURNOIS = None  # Nombre maximum de tournois (None : illimité)
+STOCKAGE = "json"  # Moteur de stockage : "json" (fichiers + journaux) ou "sqlite"
+DOSSIER_DONNEES = "data"  # Dossier des fichiers JSON
+FICHIER_SQLITE = "data/echecs.sqlite3"  # Base SQLite utilisée lorsque STOCKAGE = "sqlite"
+DURABILITE = "immediat"  # Écriture sur disque : "immediat" (chaque modification), "periodique" ou "manuel"
+INTERVALLE_DURABILITE_MS = 200  # Délai maximal avant écriture sur disque en mode "periodique"
+# Modèles de mise en page des exports ("<format>/page.tmpl", "<format>/tableau.tmpl"), facultatifs
+DOSSIER_MODELES = "modeles"
+PROCESSUS_EXPORT = None  # Processus utilisés pour exporter une saison (None : un par cœur, 1 : sans parallélisme)
+INSTRUMENTATION = False  # Mesure des temps : tableau récapitulatif à la fermeture (sur la sortie d'erreur)
+# Fichier de trace Chrome (chrome://tracing) écrit à la fermeture, si INSTRUMENTATION (ex. "data/trace.json")
+FICHIER_TRACE = None
+CHARGEMENT_ARRIERE_PLAN = True  # Menu principal affiché immédiatement, joueurs et tournois chargés en arrière-plan
+# Détail des temps de démarrage (importations, chargement) à la fermeture, sur la sortie d'erreur
+RAPPORT_DEMARRAGE = False
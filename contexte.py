@@ -0,0 +1,144 @@
+# Importation des modules nécessaires
+import threading  # Pour charger les données en arrière-plan
+from typing import Callable, List, Optional  # Pour les annotations de type
+
+from controllers.joueur_controller import JoueurController  # Contrôleur des joueurs
+from controllers.tournoi_controller import TournoiController  # Contrôleur des tournois
+from models import demarrage  # Étapes et jalons du rapport de démarrage
+from models.depots import Depot, obtenir_depot  # Dépôt de stockage configuré
+from models.joueur_model import JoueurManager, obtenir_joueur_manager  # Gestionnaire partagé des joueurs
+from models.tournoi_manager import TournoiManager  # Gestionnaire des tournois
+from views.joueur_vue import JoueurVue  # Interface des joueurs
+from views.tournoi_vue import TournoiVue  # Interface des tournois
+
+# Un menu est une fonction qui reçoit le contexte et retourne le menu à ouvrir,
+# None pour revenir au menu précédent ou QUITTER pour fermer l'application.
+Menu = Callable[["ContexteApplication"], object]
+QUITTER = object()  # Valeur retournée par un menu pour fermer l'application
+
+_contexte: Optional["ContexteApplication"] = None  # Contexte partagé par tous les menus
+
+
+# Définition de la classe ContexteApplication : gestionnaires, contrôleurs et vues de l'application
+#
+# Le contexte est créé une seule fois au démarrage (chargement des joueurs et des en-têtes de tournois)
+# puis partagé par tous les menus : passer d'un menu à l'autre ne relit aucun fichier.
+# En arrière-plan, le chargement s'effectue dans un fil séparé : les menus s'affichent immédiatement
+# et seul le premier accès aux données (gestionnaires, contrôleurs, vues) attend la fin du chargement.
+class ContexteApplication:
+    # Constructeur de la classe ContexteApplication
+    def __init__(self, depot: Optional[Depot] = None, arriere_plan: bool = False):
+        self._depot = depot  # Dépôt fourni (sinon : dépôt configuré, ouvert pendant le chargement)
+        self.pile: List[Menu] = []  # Pile de navigation : le sommet est le menu affiché
+        self._pret = threading.Event()  # Signalé à la fin du chargement (réussi ou non)
+        self._erreur: Optional[BaseException] = None  # Erreur survenue pendant le chargement
+        if arriere_plan:
+            threading.Thread(target=self._charger, name="chargement", daemon=True).start()
+        else:
+            self._charger()
+            self.attendre()  # Erreur de chargement signalée immédiatement
+
+    # Méthode pour charger les données et construire les contrôleurs et les vues
+    def _charger(self) -> None:
+        try:
+            with demarrage.etape("ouverture du dépôt"):
+                self._depot = self._depot or obtenir_depot()
+            with demarrage.etape("chargement des joueurs"):
+                self._joueur_manager = obtenir_joueur_manager(self._depot)  # Table d'identité des joueurs
+            with demarrage.etape("chargement des tournois"):
+                self._tournoi_manager = TournoiManager(self._depot, self._joueur_manager)  # En-têtes des tournois
+            self._joueur_controller = JoueurController(self._joueur_manager)
+            self._tournoi_controller = TournoiController(self._tournoi_manager)
+            self._joueur_vue = JoueurVue(self._joueur_controller)
+            self._tournoi_vue = TournoiVue(self._tournoi_controller, self._joueur_manager)
+        except BaseException as erreur:  # Transmise au fil principal au premier accès aux données
+            self._erreur = erreur
+        finally:
+            demarrage.jalon("données prêtes")
+            self._pret.set()
+
+    # Méthode pour attendre la fin du chargement (immédiate si les données sont déjà prêtes)
+    def attendre(self) -> None:
+        if not self._pret.is_set():
+            print("Chargement des données en cours...")
+            self._pret.wait()
+        if self._erreur is not None:
+            raise self._erreur
+
+    # Méthode pour fermer le contexte : attend la fin du chargement, pour que la fermeture de l'application
+    # n'interrompe pas une écriture du fil de chargement (migration vers SQLite, compaction d'un journal)
+    def fermer(self) -> None:
+        self._pret.wait()
+
+    # Méthode pour savoir si les données sont chargées, sans attendre
+    def est_pret(self) -> bool:
+        return self._pret.is_set()
+
+    # Propriété pour obtenir le dépôt de stockage
+    @property
+    def depot(self) -> Depot:
+        self.attendre()
+        return self._depot
+
+    # Propriété pour obtenir le gestionnaire des joueurs
+    @property
+    def joueur_manager(self) -> JoueurManager:
+        self.attendre()
+        return self._joueur_manager
+
+    # Propriété pour obtenir le gestionnaire des tournois
+    @property
+    def tournoi_manager(self) -> TournoiManager:
+        self.attendre()
+        return self._tournoi_manager
+
+    # Propriété pour obtenir le contrôleur des joueurs
+    @property
+    def joueur_controller(self) -> JoueurController:
+        self.attendre()
+        return self._joueur_controller
+
+    # Propriété pour obtenir le contrôleur des tournois
+    @property
+    def tournoi_controller(self) -> TournoiController:
+        self.attendre()
+        return self._tournoi_controller
+
+    # Propriété pour obtenir la vue des joueurs
+    @property
+    def joueur_vue(self) -> JoueurVue:
+        self.attendre()
+        return self._joueur_vue
+
+    # Propriété pour obtenir la vue des tournois
+    @property
+    def tournoi_vue(self) -> TournoiVue:
+        self.attendre()
+        return self._tournoi_vue
+
+    # Méthode pour parcourir les menus à partir d'un menu de départ, jusqu'à la fermeture de l'application
+    #
+    # Chaque menu retourne le sous-menu à empiler, None pour être dépilé (retour) ou QUITTER.
+    # La profondeur de la pile d'appels reste constante quel que soit le nombre d'allers-retours.
+    def naviguer(self, menu: Menu) -> None:
+        self.pile.append(menu)
+        profondeur = len(self.pile) - 1  # Menus déjà ouverts avant celui-ci (navigation imbriquée)
+        while len(self.pile) > profondeur:
+            suivant = self.pile[-1](self)
+            if suivant is QUITTER:
+                del self.pile[profondeur:]  # Ferme tous les menus ouverts depuis le menu de départ
+            elif suivant is None:
+                self.pile.pop()  # Retour au menu précédent
+            else:
+                self.pile.append(suivant)  # Ouverture d'un sous-menu
+
+
+# Fonction pour obtenir le contexte de l'application (créé une seule fois pour le dépôt configuré)
+#
+# Avec arriere_plan, le contexte créé charge ses données dans un fil séparé (le dépôt est alors ouvert
+# par ce fil, sauf s'il est fourni).
+def obtenir_contexte(depot: Optional[Depot] = None, arriere_plan: bool = False) -> ContexteApplication:
+    global _contexte
+    if _contexte is None or (depot or obtenir_depot()) is not _contexte.depot:
+        _contexte = ContexteApplication(depot, arriere_plan)
+    return _contexte
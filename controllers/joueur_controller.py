@@ -1,5 +1,8 @@
 # Importation de la classe JoueurManager depuis le module models.joueur_model
-from models.joueur_model import JoueurManager
+from models.joueur_model import JoueurManager, obtenir_joueur_manager
+
+# Importation des fonctions d'import et d'export des fichiers de joueurs
+from models.import_joueurs import RapportImport, exporter_csv_joueurs, lire_fichier_joueurs
 
 # Importation du type Optional depuis le module typing
 from typing import Optional
@@ -11,9 +14,9 @@ import datetime
 # Définition de la classe JoueurController pour gérer les opérations sur les joueurs
 class JoueurController:
     # Constructeur de la classe JoueurController
-    def __init__(self):
-        # Création d'une instance de JoueurManager pour gérer les données des joueurs
-        self.joueur_manager = JoueurManager()
+    def __init__(self, joueur_manager: Optional[JoueurManager] = None):
+        # Gestionnaire partagé des joueurs (la même table d'identité que celle des tournois)
+        self.joueur_manager: JoueurManager = joueur_manager or obtenir_joueur_manager()
 
     # Méthode pour ajouter un joueur
     # Prend en paramètres le nom, le prénom, la date de naissance et l'elo du joueur
@@ -24,21 +27,47 @@ class JoueurController:
 
     # Méthode pour modifier un joueur existant
     # Prend en paramètres l'index du joueur, le nom, le prénom, la date de naissance et l'elo
-    # Ne retourne rien
-    def modifier_joueur(self, index: int, nom: str, prenom: str, date_naissance: datetime.date, elo: int) -> None:
+    # Retourne un booléen indiquant si la modification a réussi (refusée pour un doublon ou un joueur trop jeune)
+    def modifier_joueur(self, index: int, nom: str, prenom: str, date_naissance: datetime.date, elo: int) -> bool:
         # Appelle la méthode modifier_joueur de JoueurManager avec les paramètres fournis
-        self.joueur_manager.modifier_joueur(index, nom, prenom, date_naissance, elo)
+        if not self.joueur_manager.modifier_joueur(index, nom, prenom, date_naissance, elo):
+            return False  # Raison déjà affichée par JoueurManager
         # Affiche un message de succès
         print("Joueur modifié avec succès.")
+        return True
 
     # Méthode pour supprimer un joueur
     # Prend en paramètre l'index du joueur
-    # Ne retourne rien
-    def supprimer_joueur(self, index: int) -> None:
+    # Retourne un booléen indiquant si la suppression a réussi (refusée si un tournoi référence le joueur)
+    def supprimer_joueur(self, index: int) -> bool:
         # Appelle la méthode supprimer_joueur de JoueurManager avec l'index fourni
-        self.joueur_manager.supprimer_joueur(index)
+        if not self.joueur_manager.supprimer_joueur(index):
+            return False  # Raison déjà affichée par JoueurManager
         # Affiche un message de succès
         print("Joueur supprimé avec succès.")
+        return True
+
+    # Méthode pour importer les joueurs d'un fichier (CSV ou liste de classement FIDE)
+    # Prend en paramètres le chemin du fichier et son format (déduit de l'extension si absent)
+    # Retourne le rapport d'import, ou None si le fichier est illisible
+    def importer_joueurs(self, fichier: str, format_joueurs: Optional[str] = None) -> Optional[RapportImport]:
+        try:
+            # Les lignes sont lues au fil de l'eau et les joueurs acceptés écrits en une seule fois
+            return self.joueur_manager.importer_joueurs(lire_fichier_joueurs(fichier, format_joueurs))
+        except (OSError, ValueError) as erreur:
+            print(f"Import impossible : {erreur}")
+            return None
+
+    # Méthode pour exporter tous les joueurs dans un fichier CSV
+    # Prend en paramètre le chemin du fichier
+    # Retourne un booléen indiquant si l'export a réussi
+    def exporter_joueurs(self, fichier: str) -> bool:
+        try:
+            exporter_csv_joueurs(self.joueur_manager.joueurs, fichier)
+        except OSError as erreur:
+            print(f"Export impossible : {erreur}")
+            return False
+        return True
 
     # Méthode pour obtenir la liste des joueurs
     # Retourne la liste des joueurs gérée par JoueurManager
@@ -60,5 +89,5 @@ class JoueurController:
     # Prend en paramètres le nom et le prénom du joueur
     # Retourne une liste des joueurs correspondant ou None si aucun joueur n'est trouvé
     def rechercher_joueur(self, nom: str, prenom: str) -> Optional[list]:
-        # Utilise une liste en compréhension pour trouver les joueurs correspondant au nom et prénom
-        return [joueur for joueur in self.joueur_manager.joueurs if joueur.nom == nom and joueur.prenom == prenom]
\ No newline at end of file
+        # Utilise l'index des noms normalisés du JoueurManager (recherche en O(1))
+        return self.joueur_manager.rechercher_joueurs_par_nom(nom, prenom)
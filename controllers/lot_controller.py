@@ -0,0 +1,253 @@
+# Importation des modules nécessaires
+import csv  # Pour lire les fichiers de résultats CSV
+import datetime  # Pour manipuler les dates
+import json  # Pour lire les spécifications et les résultats JSON
+import os  # Pour les opérations liées au système de fichiers
+from typing import Dict, List, Optional, Tuple  # Pour les annotations de type
+
+from models.tournoi_manager import TournoiManager  # Gestion des tournois
+from models.tournoi_model import Ronde, Tournoi  # Tournois et rondes
+from models.joueur_model import Joueur, JoueurManager, obtenir_joueur_manager  # Table d'identité des joueurs
+from models.departages import ORDRE_DEPARTAGES  # Départages du classement
+from models.elo import MoteurElo  # Mise à jour des classements Elo
+from models.unite_travail import unite_de_travail  # Sauvegardes regroupées en fin d'opération
+from rapports import ecrire_rapport_fichier, lignes_classement_tournoi, lignes_tours_et_matchs  # Rapports texte
+
+# Codes de sortie stables, du moins grave au plus grave (le code d'un lot est le plus grave de ses tournois)
+CODE_OK = 0  # Tournoi traité, toutes les rondes disponibles jouées
+CODE_INCOMPLET = 1  # Résultats manquants : la ronde en attente est appariée, le tournoi s'arrête là
+CODE_USAGE = 2  # Arguments de la ligne de commande invalides (code d'argparse)
+CODE_RESULTATS_INVALIDES = 3  # Fichier de résultats illisible ou incohérent avec les appariements
+CODE_SPEC_INVALIDE = 4  # Spécification du tournoi illisible ou incomplète
+CODE_ERREUR_INTERNE = 5  # Erreur inattendue
+
+CHAMPS_SPEC = ("nom_tournoi", "date_debut", "date_fin", "nb_rondes", "nb_max_joueurs", "type_tournoi", "joueurs")
+RESULTATS_ACCEPTES = {"1-0": "1-0", "0-1": "0-1", "0.5-0.5": "0.5-0.5", "1/2-1/2": "0.5-0.5", "½-½": "0.5-0.5"}
+RESULTAT_INVERSE = {"1-0": "0-1", "0-1": "1-0", "0.5-0.5": "0.5-0.5"}  # Résultat vu depuis l'autre couleur
+
+
+# Définition de l'exception ErreurLot : erreur d'un tournoi du lot, avec son code de sortie
+class ErreurLot(Exception):
+    # Constructeur de la classe ErreurLot
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code  # Code de sortie correspondant
+
+
+# Définition de la classe LotController : traitement d'un tournoi sans saisie interactive
+#
+# Pour chaque tournoi : création (ou reprise) du tournoi, inscription des joueurs, puis pour chaque ronde
+# appariement, saisie des résultats lus dans les fichiers, classement ; enfin rapports et Elo si demandés.
+# Un traitement relancé sur le même tournoi reprend les rondes déjà créées (résultats corrigés si besoin).
+class LotController:
+    # Constructeur de la classe LotController
+    def __init__(self, tournoi_manager: Optional[TournoiManager] = None,
+                 joueur_manager: Optional[JoueurManager] = None):
+        self.tournoi_manager = tournoi_manager or TournoiManager()  # Gestionnaire des tournois
+        self.joueur_manager = joueur_manager or obtenir_joueur_manager(self.tournoi_manager.depot)  # Joueurs partagés
+
+    # Méthode pour traiter un tournoi (spécification + fichiers de résultats) et obtenir le compte rendu JSON
+    def traiter(self, fichier_spec: str, fichiers_resultats: Optional[List[str]] = None,
+                dossier_rapports: Optional[str] = None, elo: bool = False) -> Dict:
+        compte_rendu: Dict = {"spec": fichier_spec, "code": CODE_OK, "erreurs": []}
+        try:
+            spec = self.charger_spec(fichier_spec)
+            compte_rendu["tournoi"] = spec["nom_tournoi"]
+            if not fichiers_resultats:  # Par défaut : fichiers indiqués dans la spécification
+                dossier = os.path.dirname(fichier_spec)
+                fichiers_resultats = [os.path.join(dossier, fichier) for fichier in spec.get("resultats", [])]
+            resultats = self.charger_resultats(fichiers_resultats)
+            tournoi = self.preparer_tournoi(spec)
+            with unite_de_travail(self.tournoi_manager.depot):  # Tournoi et en-têtes écrits une fois, à la fin du lot
+                jouees = self.jouer_rondes(tournoi, resultats)
+                self.tournoi_manager.sauvegarder_tournois()
+            if jouees < int(tournoi.nb_rondes):
+                compte_rendu["code"] = CODE_INCOMPLET
+                compte_rendu["erreurs"].append(f"Résultats manquants à partir de la ronde {jouees + 1}.")
+            if elo and jouees:
+                compte_rendu["elo"] = self.mettre_a_jour_elo(tournoi)
+            if dossier_rapports:
+                compte_rendu["rapports"] = self.ecrire_rapports(tournoi, dossier_rapports)
+            compte_rendu.update(self.resume(tournoi))
+        except ErreurLot as erreur:
+            compte_rendu["code"] = erreur.code
+            compte_rendu["erreurs"].append(str(erreur))
+        except Exception as erreur:  # Le lot continue avec les tournois suivants
+            compte_rendu["code"] = CODE_ERREUR_INTERNE
+            compte_rendu["erreurs"].append(f"Erreur inattendue : {erreur!r}")
+        return compte_rendu
+
+    # Méthode pour lire et valider la spécification d'un tournoi (fichier JSON)
+    def charger_spec(self, fichier: str) -> Dict:
+        try:
+            with open(fichier, 'r', encoding='utf-8') as file:
+                spec = json.load(file)
+        except (OSError, json.JSONDecodeError) as erreur:
+            raise ErreurLot(CODE_SPEC_INVALIDE, f"Spécification {fichier} illisible : {erreur}")
+        if not isinstance(spec, dict):
+            raise ErreurLot(CODE_SPEC_INVALIDE, f"Spécification {fichier} : un objet JSON est attendu.")
+        manquants = [champ for champ in CHAMPS_SPEC if champ not in spec]
+        if manquants:
+            raise ErreurLot(CODE_SPEC_INVALIDE, f"Spécification {fichier} : champs manquants {', '.join(manquants)}.")
+        try:
+            spec["date_debut"] = datetime.date.fromisoformat(spec["date_debut"])
+            spec["date_fin"] = datetime.date.fromisoformat(spec["date_fin"])
+            spec["nb_rondes"] = int(spec["nb_rondes"])
+            spec["nb_max_joueurs"] = int(spec["nb_max_joueurs"])
+        except (TypeError, ValueError) as erreur:
+            raise ErreurLot(CODE_SPEC_INVALIDE, f"Spécification {fichier} : valeur invalide ({erreur}).")
+        if isinstance(spec.get("resultats"), str):
+            spec["resultats"] = [spec["resultats"]]
+        return spec
+
+    # Méthode pour lire les résultats (CSV ou JSON) : numéro de ronde -> {(blanc, noir): résultat}
+    def charger_resultats(self, fichiers: List[str]) -> Dict[int, Dict[Tuple[int, int], str]]:
+        resultats: Dict[int, Dict[Tuple[int, int], str]] = {}
+        for fichier in fichiers:
+            for numero, (ligne, blanc, noir, resultat) in enumerate(self._lire_lignes(fichier), 1):
+                try:
+                    ronde, blanc, noir = int(ligne), int(blanc), int(noir)
+                except (TypeError, ValueError):
+                    raise ErreurLot(CODE_RESULTATS_INVALIDES, f"{fichier}, ligne {numero} : ronde ou joueur invalide.")
+                if resultat not in RESULTATS_ACCEPTES:
+                    raise ErreurLot(CODE_RESULTATS_INVALIDES,
+                                    f"{fichier}, ligne {numero} : résultat '{resultat}' invalide.")
+                resultats.setdefault(ronde, {})[(blanc, noir)] = RESULTATS_ACCEPTES[resultat]
+        return resultats
+
+    # Méthode pour créer le tournoi (ou le reprendre s'il existe déjà) et inscrire ses joueurs
+    def preparer_tournoi(self, spec: Dict) -> Tournoi:
+        tournoi = next((t for t in self.tournoi_manager.tournois if t.nom == spec["nom_tournoi"]), None)
+        if tournoi is None:
+            tournoi = self.tournoi_manager.ajouter_tournoi(spec["nom_tournoi"], spec["date_debut"], spec["date_fin"],
+                                                           spec["nb_max_joueurs"], spec["nb_rondes"],
+                                                           spec["type_tournoi"])
+            if tournoi is None:
+                raise ErreurLot(CODE_SPEC_INVALIDE, f"Impossible de créer le tournoi {spec['nom_tournoi']}.")
+        joueurs = [self.trouver_ou_creer_joueur(joueur) for joueur in spec["joueurs"]]
+        with unite_de_travail(self.tournoi_manager.depot):  # Tournoi écrit une fois pour toutes les inscriptions
+            for joueur in joueurs:
+                if joueur not in tournoi.joueurs and not tournoi.ajouter_joueur(joueur):
+                    raise ErreurLot(CODE_SPEC_INVALIDE,
+                                    f"Tournoi {tournoi.nom} complet : {joueur.nom} {joueur.prenom} non inscrit.")
+        return tournoi
+
+    # Méthode pour retrouver un joueur de la spécification (index ou détails), en le créant si nécessaire
+    def trouver_ou_creer_joueur(self, joueur_spec) -> Joueur:
+        if isinstance(joueur_spec, int):
+            joueur = self.joueur_manager.trouver_joueur_par_index(joueur_spec)
+            if joueur is None:
+                raise ErreurLot(CODE_SPEC_INVALIDE, f"Joueur d'index {joueur_spec} inconnu.")
+            return joueur
+        try:
+            nom, prenom = joueur_spec["nom"], joueur_spec["prenom"]
+            date_naissance = datetime.date.fromisoformat(joueur_spec["date_naissance"])
+            elo = int(joueur_spec.get("elo", 0))
+        except (TypeError, KeyError, ValueError):
+            raise ErreurLot(CODE_SPEC_INVALIDE, f"Joueur invalide dans la spécification : {joueur_spec!r}.")
+        joueur = self.joueur_manager.trouver_joueur_par_details(nom, prenom, date_naissance)
+        if joueur is None:
+            if not self.joueur_manager.ajouter_joueur(nom, prenom, date_naissance, elo):  # Mêmes règles que la saisie
+                raise ErreurLot(CODE_SPEC_INVALIDE, f"Joueur {nom} {prenom} refusé.")
+            joueur = self.joueur_manager.trouver_joueur_par_details(nom, prenom, date_naissance)
+        return joueur
+
+    # Méthode pour jouer les rondes dont les résultats sont disponibles (retourne le nombre de rondes complètes)
+    def jouer_rondes(self, tournoi: Tournoi, resultats: Dict[int, Dict[Tuple[int, int], str]]) -> int:
+        inconnues = [numero for numero in resultats if not 0 < numero <= int(tournoi.nb_rondes)]
+        if inconnues:
+            raise ErreurLot(CODE_RESULTATS_INVALIDES, f"Rondes inexistantes dans les résultats : {sorted(inconnues)}.")
+        tournoi.demarrer_tournoi()
+        for numero in range(1, int(tournoi.nb_rondes) + 1):
+            # Ronde suivante appariée même sans résultats : ses appariements figurent dans le compte rendu
+            if numero > len(tournoi.rondes) and tournoi.creer_ronde() is None:
+                raise ErreurLot(CODE_SPEC_INVALIDE, f"Appariement de la ronde {numero} impossible.")
+            if not self.saisir_resultats(tournoi, tournoi.rondes[numero - 1], resultats.get(numero, {})):
+                return numero - 1
+        tournoi.terminer_tournoi()
+        tournoi.sauvegarder_tournoi()
+        return int(tournoi.nb_rondes)
+
+    # Méthode pour saisir les résultats d'une ronde (retourne Vrai si tous ses matchs ont un résultat)
+    def saisir_resultats(self, tournoi: Tournoi, ronde: Ronde, resultats: Dict[Tuple[int, int], str]) -> bool:
+        restants = dict(resultats)
+        for match in ronde.matchs:
+            blanc, noir = match.joueur_blanc.index, match.joueur_noir.index
+            if (blanc, noir) in restants:
+                resultat = restants.pop((blanc, noir))
+            elif (noir, blanc) in restants:  # Couleurs inversées dans le fichier : résultat vu depuis les blancs
+                resultat = RESULTAT_INVERSE[restants.pop((noir, blanc))]
+            else:
+                continue
+            if resultat != match.resultat:
+                tournoi.enregistrer_resultat(ronde, match, resultat)
+        if restants:
+            paires = ", ".join(f"{blanc}-{noir}" for blanc, noir in restants)
+            raise ErreurLot(CODE_RESULTATS_INVALIDES,
+                            f"Ronde {ronde.numero} : parties absentes des appariements ({paires}).")
+        complete = all(match.resultat for match in ronde.matchs)
+        if complete:
+            ronde.statut = "terminée"
+        tournoi.sauvegarder_tournoi()
+        return complete
+
+    # Méthode pour mettre à jour les Elo après le tournoi (index -> variation)
+    def mettre_a_jour_elo(self, tournoi: Tournoi) -> Dict[str, int]:
+        variations = MoteurElo(self.joueur_manager).noter_tournoi(tournoi)
+        return {str(index): variation for index, (variation, _) in variations.items()}
+
+    # Méthode pour écrire les rapports texte d'un tournoi dans un dossier (retourne les fichiers écrits)
+    def ecrire_rapports(self, tournoi: Tournoi, dossier: str) -> List[str]:
+        os.makedirs(dossier, exist_ok=True)
+        base = os.path.join(dossier, tournoi.nom.replace(' ', '_'))
+        fichiers = []
+        rapports = (("_classement.txt", lignes_classement_tournoi), ("_rondes.txt", lignes_tours_et_matchs))
+        for suffixe, rapport in rapports:
+            ecrire_rapport_fichier(rapport(tournoi), base + suffixe)  # Écrit au fil de l'eau
+            fichiers.append(base + suffixe)
+        return fichiers
+
+    # Méthode pour résumer un tournoi (rondes, matchs et classement) sous forme de dictionnaire JSON
+    def resume(self, tournoi: Tournoi) -> Dict:
+        departages = tournoi.departages()
+        return {
+            "statut": tournoi.statut,
+            "nb_rondes": int(tournoi.nb_rondes),
+            "rondes_jouees": sum(1 for ronde in tournoi.rondes if ronde.statut == "terminée"),
+            "rondes": [
+                {
+                    "numero": ronde.numero,
+                    "statut": ronde.statut,
+                    "exempt": ronde.exempt.index if ronde.exempt is not None else None,
+                    "matchs": [{"blanc": match.joueur_blanc.index, "noir": match.joueur_noir.index,
+                                "resultat": match.resultat or None} for match in ronde.matchs]
+                }
+                for ronde in tournoi.rondes
+            ],
+            "classement": [
+                {
+                    "rang": rang,
+                    "index": joueur.index,
+                    "nom": joueur.nom,
+                    "prenom": joueur.prenom,
+                    "points": points,
+                    **{critere: departages.valeur(critere, joueur) for critere in ORDRE_DEPARTAGES}
+                }
+                for rang, (joueur, points) in enumerate(departages.classer(), 1)
+            ]
+        }
+
+    # Méthode interne pour lire les lignes (ronde, blanc, noir, résultat) d'un fichier CSV ou JSON
+    @staticmethod
+    def _lire_lignes(fichier: str) -> List[Tuple]:
+        try:
+            with open(fichier, 'r', encoding='utf-8', newline='') as file:
+                if fichier.lower().endswith(".json"):
+                    data = json.load(file)
+                    lignes = data.get("resultats", []) if isinstance(data, dict) else data
+                else:
+                    lignes = list(csv.DictReader(file))
+            return [(ligne.get("ronde"), ligne.get("blanc"), ligne.get("noir"), str(ligne.get("resultat", "")).strip())
+                    for ligne in lignes]
+        except (OSError, json.JSONDecodeError, csv.Error, AttributeError) as erreur:
+            raise ErreurLot(CODE_RESULTATS_INVALIDES, f"Résultats {fichier} illisibles : {erreur}")
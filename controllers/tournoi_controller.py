@@ -1,14 +1,17 @@
 # Importation des modules nécessaires
 import datetime  # Pour manipuler les dates
 from models.tournoi_manager import TournoiManager  # Importation de la classe TournoiManager depuis le module models.tournoi_manager
-from models.joueur_model import Joueur  # Importation de la classe Joueur depuis le module models.joueur_model
-from typing import Optional  # Pour les annotations de type optionnelles
+from models.joueur_model import Joueur, JoueurManager  # Importation des classes Joueur et JoueurManager
+from models.elo import MoteurElo  # Mise à jour des classements Elo
+from models import exporteurs  # Exports CSV, HTML, Markdown et texte
+from models.unite_travail import unite_de_travail  # Sauvegardes regroupées en fin d'opération
+from typing import Dict, List, Optional, Union  # Pour les annotations de type
 
 # Définition de la classe TournoiController pour gérer les opérations sur les tournois
 class TournoiController:
     # Constructeur de la classe TournoiController
-    def __init__(self):
-        self.tournoi_manager = TournoiManager()  # Création d'une instance de TournoiManager
+    def __init__(self, tournoi_manager: Optional[TournoiManager] = None):
+        self.tournoi_manager = tournoi_manager or TournoiManager()  # Gestionnaire fourni ou nouvelle instance
 
     # Méthode pour ajouter un tournoi
     def ajouter_tournoi(self, nom: str, date_debut: datetime.date, date_fin: datetime.date, nb_max_joueurs: int, nb_rondes: int, type_tournoi: str) -> bool:
@@ -30,7 +33,10 @@ class TournoiController:
             tournoi.nb_max_joueurs = nb_max_joueurs
             tournoi.nb_rondes = nb_rondes
             tournoi.type_tournoi = type_tournoi
-            tournoi.sauvegarder_tournoi()  # Sauvegarde des modifications du tournoi
+            # Le tournoi et les en-têtes sont écrits une fois chacun
+            with unite_de_travail(self.tournoi_manager.depot):
+                tournoi.sauvegarder_tournoi()  # Sauvegarde des modifications du tournoi
+                self.tournoi_manager.sauvegarder_tournois()  # Les en-têtes (nom, dates, rondes) ont changé
             print("Tournoi modifié avec succès.")  # Affiche un message de succès
         else:
             print("Tournoi non trouvé.")  # Affiche un message d'erreur si le tournoi n'est pas trouvé
@@ -40,19 +46,13 @@ class TournoiController:
         self.tournoi_manager.supprimer_tournoi(index)  # Appelle la méthode supprimer_tournoi de TournoiManager
 
     # Méthode pour ajouter un joueur à un tournoi
-    def ajouter_joueur_au_tournoi(self, index_tournoi: int, joueur: dict) -> bool:
+    def ajouter_joueur_au_tournoi(self, index_tournoi: int, joueur: Union[Joueur, Dict, int]) -> bool:
         tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
-            # Création d'un nouvel objet Joueur à partir des données du dictionnaire joueur
-            nouveau_joueur = Joueur(
-                index=joueur['index'],
-                nom=joueur['nom'],
-                prenom=joueur['prenom'],
-                date_naissance=datetime.datetime.strptime(joueur['date_naissance'], '%Y-%m-%d').date(),
-                elo=joueur['elo']
-            )
-            if tournoi.ajouter_joueur(nouveau_joueur):  # Ajoute le joueur au tournoi
-                tournoi.sauvegarder_tournoi()  # Sauvegarde des modifications du tournoi
+            # Le joueur est retrouvé dans la table d'identité partagée : aucune copie n'est créée
+            joueur_inscrit = self.tournoi_manager.trouver_joueur(tournoi, joueur)
+            # Ajoute le joueur (et sauvegarde le tournoi)
+            if joueur_inscrit and tournoi.ajouter_joueur(joueur_inscrit):
                 return True  # Retourne True en cas de succès
         return False  # Retourne False en cas d'échec
 
@@ -60,10 +60,7 @@ class TournoiController:
     def supprimer_joueur_du_tournoi(self, index_tournoi: int, joueur: Joueur) -> bool:
         tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
-            tournoi.joueurs.remove(joueur)  # Supprime le joueur de la liste des joueurs du tournoi
-            tournoi.sauvegarder_joueurs()  # Sauvegarde des modifications des joueurs du tournoi
-            tournoi.sauvegarder_tournoi()  # Sauvegarde des modifications du tournoi
-            return True  # Retourne True en cas de succès
+            return tournoi.supprimer_joueur(joueur)  # Retire le joueur (et son classement) puis sauvegarde
         return False  # Retourne False en cas d'échec
 
     # Méthode pour obtenir la liste des tournois
@@ -74,8 +71,9 @@ class TournoiController:
     def creer_ronde(self, index_tournoi):
         tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
-            tournoi.creer_ronde()  # Crée une nouvelle ronde
-            self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
+            with unite_de_travail(self.tournoi_manager.depot):  # La ronde et les en-têtes sont écrits une fois chacun
+                tournoi.creer_ronde()  # Crée une nouvelle ronde
+                self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
             print("Ronde créée avec succès.")  # Affiche un message de succès
         else:
             print("Tournoi non trouvé.")  # Affiche un message d'erreur si le tournoi n'est pas trouvé
@@ -91,9 +89,12 @@ class TournoiController:
                 print(f"Match {i + 1}: {match.joueur_blanc.nom} vs {match.joueur_noir.nom} - Résultat actuel: {match.resultat}")
                 resultat = input(f"Entrez le nouveau résultat pour {match.joueur_blanc.nom} vs {match.joueur_noir.nom} (ex: 1-0, 0.5-0.5) ou laissez vide pour conserver l'actuel: ")
                 if resultat:
-                    match.saisir_resultat(resultat)  # Modifie le résultat du match
+                    tournoi.enregistrer_resultat(ronde, match, resultat)  # Modifie le résultat et le classement
 
-            self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
+            # Le tournoi et les en-têtes sont écrits une fois chacun
+            with unite_de_travail(self.tournoi_manager.depot):
+                tournoi.sauvegarder_tournoi()  # Sauvegarde des résultats de la ronde
+                self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
             print("Ronde modifiée avec succès.")  # Affiche un message de succès
         else:
             print("Numéro de ronde invalide.")  # Affiche un message d'erreur si la ronde n'est pas trouvée
@@ -102,8 +103,11 @@ class TournoiController:
     def supprimer_ronde(self, index_tournoi, ronde_numero):
         tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi and 0 < ronde_numero <= len(tournoi.rondes):  # Si le tournoi et la ronde sont trouvés
-            tournoi.rondes.pop(ronde_numero - 1)  # Supprime la ronde de la liste des rondes du tournoi
-            self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
+            tournoi.supprimer_ronde(ronde_numero)  # Supprime la ronde de la liste des rondes du tournoi
+            # Le tournoi et les en-têtes sont écrits une fois chacun
+            with unite_de_travail(self.tournoi_manager.depot):
+                tournoi.sauvegarder_tournoi()  # Sauvegarde des rondes restantes
+                self.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
             print("Ronde supprimée avec succès.")  # Affiche un message de succès
         else:
             print("Numéro de ronde invalide.")  # Affiche un message d'erreur si la ronde n'est pas trouvée
@@ -119,32 +123,50 @@ class TournoiController:
     def afficher_classement_final(self, index_tournoi):
         tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
-            scores = {}  # Dictionnaire pour stocker les scores des joueurs
-            for ronde in tournoi.rondes:  # Parcourt toutes les rondes du tournoi
-                for match in ronde.matchs:  # Parcourt tous les matchs de chaque ronde
-                    joueur_blanc = match.joueur_blanc
-                    joueur_noir = match.joueur_noir
-                    resultat = match.resultat
-
-                    if joueur_blanc not in scores:
-                        scores[joueur_blanc] = 0
-                    if joueur_noir not in scores:
-                        scores[joueur_noir] = 0
-
-                    if resultat == "1-0":
-                        scores[joueur_blanc] += 1
-                    elif resultat == "0-1":
-                        scores[joueur_noir] += 1
-                    elif resultat == "0.5-0.5":
-                        scores[joueur_blanc] += 0.5
-                        scores[joueur_noir] += 0.5
-
-            classement = sorted(scores.items(), key=lambda x: x[1], reverse=True)  # Trie les joueurs par score décroissant
-            return classement  # Retourne le classement final
+            return tournoi.classement()  # Retourne le classement final (tenu à jour à chaque résultat)
         else:
             print("Tournoi non trouvé")  # Affiche un message d'erreur si le tournoi n'est pas trouvé
             return None  # Retourne None en cas d'échec
 
+    # Méthode pour mettre à jour les Elo après une ronde (ou après tout le tournoi si aucune ronde n'est précisée)
+    def mettre_a_jour_elo(self, index_tournoi: int, joueur_manager: JoueurManager,
+                          numero_ronde: Optional[int] = None) -> bool:
+        tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
+        if not tournoi:
+            print("Tournoi non trouvé.")
+            return False
+        moteur = MoteurElo(joueur_manager)
+        if numero_ronde is None:
+            variations = moteur.noter_tournoi(tournoi)  # Un seul lot pour tout le tournoi
+        else:
+            variations = moteur.noter_ronde(tournoi, numero_ronde)
+        for index, (variation, parties) in variations.items():  # Affiche les variations appliquées
+            joueur = joueur_manager.trouver_joueur_par_index(index)
+            print(f"{joueur.nom} {joueur.prenom} : {variation:+d} ({parties} parties) -> {joueur.elo}")
+        return bool(variations)
+
+    # Méthode pour exporter un tournoi dans plusieurs formats (retourne les fichiers écrits)
+    def exporter_tournoi(self, index_tournoi: int, formats: List[str],
+                         dossier: str = exporteurs.DOSSIER_EXPORTS) -> List[str]:
+        tournoi = self.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
+        if not tournoi:
+            print("Tournoi non trouvé.")
+            return []
+        try:
+            return exporteurs.exporter_tournoi(tournoi, formats, dossier)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de l'export du tournoi : {str(e)}")  # Format inconnu ou dossier inaccessible
+            return []
+
+    # Méthode pour exporter tous les tournois d'une saison (None : tous les tournois), répartis entre les processus
+    def exporter_saison(self, saison: Optional[int], formats: List[str], dossier: str = exporteurs.DOSSIER_EXPORTS,
+                        processus: Optional[int] = None) -> List[str]:
+        try:
+            return self.tournoi_manager.exporter_saison(saison, formats, dossier, processus)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de l'export de la saison : {str(e)}")  # Format inconnu ou dossier inaccessible
+            return []
+
     # Méthode pour trouver un tournoi par son index
     def trouver_tournoi_par_index(self, index):
         return self.tournoi_manager.trouver_tournoi_par_index(index)  # Appelle la méthode trouver_tournoi_par_index de TournoiManager
@@ -1,104 +1,149 @@
 # Importation des modules nécessaires
+import sys  # Pour les options de la ligne de commande
+from models import demarrage  # Importé en premier : le rapport de démarrage mesure aussi les importations suivantes
+if __name__ == "__main__" and "--demarrage" in sys.argv:
+    demarrage.activer()  # python main_menu.py --demarrage : rapport de démarrage à la fermeture
+import config  # Paramètres de l'application (chargement en arrière-plan)
+from contexte import QUITTER, ContexteApplication, obtenir_contexte  # Contexte partagé et navigation entre les menus
+from menu_joueur import gestion_joueur  # Importe la fonction gestion_joueur du module menu_joueur
 from menu_tournoi import gestion_tournoi  # Importe la fonction gestion_tournoi du module menu_tournoi
 from controllers.tournoi_controller import TournoiController  # Importe la classe TournoiController
-from models.joueur_model import JoueurManager  # Importe la classe JoueurManager
+from models.joueur_model import JoueurManager  # Gestionnaire partagé des joueurs
 from views.tournoi_vue import TournoiVue  # Importe la classe TournoiVue
-import sys  # Importe le module sys pour les opérations système
+from typing import Iterator, Optional  # Pour les annotations de type
 from rapports import (
-    liste_joueurs_alphabetique,
-    details_tournoi,
-    liste_joueurs_tournoi_alphabetique,
-    liste_tours_et_matchs
-)  # Importe les fonctions de rapport
+    lignes_joueurs_alphabetique,
+    lignes_details_tournoi,
+    lignes_joueurs_tournoi_alphabetique,
+    lignes_tours_et_matchs,
+    lignes_classement_tournoi,
+    afficher_rapport,
+    ecrire_rapport_fichier
+)  # Importe les rapports produits ligne à ligne et leurs sorties (console paginée, fichier)
 
 
 # Définition de la fonction du menu principal
-def main_menu() -> None:
-    
-    tournoi_controller = TournoiController()  # Crée une instance de TournoiController
-    joueur_manager = JoueurManager()  # Crée une instance de JoueurManager
-    tournoi_vue = TournoiVue(tournoi_controller, joueur_manager)  # Crée une instance de TournoiVue
+# Le contexte (gestionnaires, contrôleurs, vues) est créé une seule fois puis partagé par tous les menus ;
+# avec config.CHARGEMENT_ARRIERE_PLAN, le menu s'affiche pendant le chargement des données.
+# Des données illisibles (fichier d'export corrompu) arrêtent l'application avec le code de sortie 1.
+def main_menu(contexte: Optional[ContexteApplication] = None) -> None:
+    try:
+        contexte = contexte or obtenir_contexte(arriere_plan=config.CHARGEMENT_ARRIERE_PLAN)
+        contexte.naviguer(menu_principal)
+    except ValueError as erreur:  # Chargement impossible : le fichier est laissé intact pour être corrigé
+        print(f"Erreur : {erreur}")
+        sys.exit(1)
+    contexte.fermer()  # Attend la fin du chargement en arrière-plan avant de quitter
 
+
+# Définition de la fonction du menu principal : retourne le sous-menu choisi ou QUITTER
+def menu_principal(contexte: ContexteApplication) -> object:
     while True:  # Boucle principale du menu
         print("===== Gestion des Joueurs et Tournois =====")
         print("1. Gestion des Joueurs")
         print("2. Gestion des Tournois")
         print("3. Générer des Rapports")
         print("4. Quitter")
+        demarrage.jalon("premier menu affiché")
         choix = input("Entrez votre choix : ")  # Demande le choix de l'utilisateur
 
         if choix == "1":
-            from menu_joueur import gestion_joueur  # Importe la fonction gestion_joueur
-            gestion_joueur()  # Appelle la fonction gestion_joueur
+            return gestion_joueur  # Ouvre le menu des joueurs
         elif choix == "2":
-            gestion_tournoi(tournoi_vue)  # Appelle la fonction gestion_tournoi
+            return gestion_tournoi  # Ouvre le menu des tournois
         elif choix == "3":
-            generer_rapports(tournoi_controller, joueur_manager, tournoi_vue)  # Appelle la fonction generer_rapports
+            return generer_rapports  # Ouvre le menu des rapports
         elif choix == "4":
             print("Merci d'avoir utilisé l'application. À bientôt !")
-            sys.exit()  # Quitte l'application
+            return QUITTER  # Quitte l'application
         else:
             print("Choix invalide. Veuillez réessayer.")
 
 # Définition de la fonction pour générer des rapports
-def generer_rapports(
-    tournoi_controller: TournoiController,
-    joueur_manager: JoueurManager,
-    tournoi_vue: TournoiVue
-) -> None:
+# Retourne None lorsque l'utilisateur revient au menu principal
+def generer_rapports(contexte: ContexteApplication) -> None:
+    tournoi_controller = contexte.tournoi_controller
+    joueur_manager = contexte.joueur_manager
+    tournoi_vue = contexte.tournoi_vue
+    while True:
+        try:
+            return choix_rapports(tournoi_controller, joueur_manager, tournoi_vue)
+        except ValueError as erreur:  # Tournoi illisible (joueur introuvable) : signalé, puis retour au menu
+            print(f"Erreur : {erreur}")
+
+
+# Définition de la fonction choix_rapports : affiche le menu des rapports et produit les rapports choisis
+# Retourne None lorsque l'utilisateur revient au menu principal
+def choix_rapports(tournoi_controller: TournoiController, joueur_manager: JoueurManager,
+                   tournoi_vue: TournoiVue) -> None:
     while True:  # Boucle du menu des rapports
         print("===== Menu Rapports =====")
         print("1. Liste des joueurs par ordre alphabétique")
         print("2. Nom et Date d'un tournoi")
         print("3. Liste des joueurs d'un tournoi par ordre alphabétique")
         print("4. Liste des rondes et matchs d'un tournoi")
-        print("5. Retour")
+        print("5. Classement d'un tournoi avec départages")
+        print("6. Enregistrer un rapport dans un fichier")
+        print("7. Retour")
         choix = input("Entrez votre choix : ")  # Demande le choix de l'utilisateur
 
-        if choix == "1":
-            joueurs = joueur_manager.charger_joueurs()  # Charge la liste des joueurs
-            if joueurs:
-                print(liste_joueurs_alphabetique(joueurs))  # Affiche la liste des joueurs par ordre alphabétique
-            else:
-                print("Aucun joueur n'est enregistré.")
-        elif choix == "2":
-            index_tournoi = tournoi_vue.saisir_index_tournoi()  # Demande l'index du tournoi
-            if index_tournoi is not None:
-                # Trouve le tournoi
-                tournoi = tournoi_controller.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  
-                if tournoi:
-                    print(details_tournoi(tournoi))  # Affiche les détails du tournoi
-                else:
-                    print("Tournoi non trouvé.")
-        elif choix == "3":
-            index_tournoi = tournoi_vue.saisir_index_tournoi()  # Demande l'index du tournoi
-            if index_tournoi is not None:
-                 # Trouve le tournoi
-                tournoi = tournoi_controller.tournoi_manager.trouver_tournoi_par_index(index_tournoi) 
-                if tournoi:
-                    print(liste_joueurs_tournoi_alphabetique(tournoi))  # Affiche la liste des joueurs du tournoi
-                else:
-                    print("Tournoi non trouvé.")
-        elif choix == "4":
-            index_tournoi = tournoi_vue.saisir_index_tournoi()  # Demande l'index du tournoi
-            if index_tournoi is not None:
-                # Trouve le tournoi
-                tournoi = tournoi_controller.tournoi_manager.trouver_tournoi_par_index(index_tournoi) 
-                if tournoi:
-                    print(f"Nombre de rondes dans le tournoi : {len(tournoi.rondes)}")
-                    for ronde in tournoi.rondes:
-                        print(f"Ronde {ronde.numero} - Nombre de matchs : {len(ronde.matchs)}")
-                    resultat = liste_tours_et_matchs(tournoi)  # Obtient la liste des tours et matchs
-                    print(resultat)  # Affiche la liste des tours et matchs
-                else:
-                    print("Tournoi non trouvé.")
-            else:
-                print("Index de tournoi invalide.")
-        elif choix == "5":
-            break  # Retourne au menu principal
+        if choix in ("1", "2", "3", "4", "5"):
+            lignes = lignes_rapport(choix, tournoi_controller, joueur_manager, tournoi_vue)
+            if lignes is not None:
+                afficher_rapport(lignes)  # Affiche le rapport page par page
+        elif choix == "6":
+            numero = input("Numéro du rapport à enregistrer (1-5) : ")
+            if numero not in ("1", "2", "3", "4", "5"):
+                print("Choix invalide. Veuillez réessayer.")
+                continue
+            lignes = lignes_rapport(numero, tournoi_controller, joueur_manager, tournoi_vue)
+            if lignes is not None:
+                fichier = input("Fichier de destination (ex. exports/rapport.txt) : ").strip()
+                try:
+                    ecrire_rapport_fichier(lignes, fichier)  # Écrit le rapport au fil de l'eau
+                    print(f"Rapport enregistré dans {fichier}.")
+                except OSError as erreur:
+                    print(f"Impossible d'écrire le fichier {fichier} : {erreur}")
+        elif choix == "7":
+            return None  # Retourne au menu principal
         else:
             print("Choix invalide. Veuillez réessayer.")
 
+
+# Définition de la fonction pour obtenir les lignes d'un rapport (None si le rapport ne peut pas être produit)
+def lignes_rapport(
+    choix: str,
+    tournoi_controller: TournoiController,
+    joueur_manager: JoueurManager,
+    tournoi_vue: TournoiVue
+) -> Optional[Iterator[str]]:
+    if choix == "1":
+        joueurs = joueur_manager.joueurs  # Joueurs déjà chargés au démarrage
+        if not joueurs:
+            print("Aucun joueur n'est enregistré.")
+            return None
+        return lignes_joueurs_alphabetique(joueurs)  # Liste des joueurs par ordre alphabétique
+    index_tournoi = tournoi_vue.saisir_index_tournoi()  # Demande l'index du tournoi
+    if index_tournoi is None:
+        if choix == "4":
+            print("Index de tournoi invalide.")
+        return None
+    # Trouve le tournoi
+    tournoi = tournoi_controller.tournoi_manager.trouver_tournoi_par_index(index_tournoi)
+    if not tournoi:
+        print("Tournoi non trouvé.")
+        return None
+    if choix == "2":
+        return lignes_details_tournoi(tournoi)  # Détails du tournoi
+    if choix == "3":
+        return lignes_joueurs_tournoi_alphabetique(tournoi)  # Liste des joueurs du tournoi
+    if choix == "4":
+        print(f"Nombre de rondes dans le tournoi : {len(tournoi.rondes)}")
+        for ronde in tournoi.rondes:
+            print(f"Ronde {ronde.numero} - Nombre de matchs : {len(ronde.matchs)}")
+        return lignes_tours_et_matchs(tournoi)  # Liste des tours et matchs
+    return lignes_classement_tournoi(tournoi)  # Classement avec les départages
+
 # Point d'entrée du programme
 if __name__ == "__main__":
     main_menu()  # Appelle la fonction du menu principal
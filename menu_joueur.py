@@ -1,13 +1,12 @@
-# Importation de la classe JoueurVue depuis le module views.joueur_vue
-from views.joueur_vue import JoueurVue
+# Importation du contexte partagé par tous les menus
+from contexte import ContexteApplication, obtenir_contexte
 
 
-# Définition de la fonction gestion_joueur
-def gestion_joueur():
-    # Importation de la fonction main_menu depuis le module main_menu
-    from main_menu import main_menu
-    # Création d'une instance de JoueurVue avec la fonction gestion_joueur comme paramètre
-    joueur_vue = JoueurVue(gestion_joueur)
+# Définition de la fonction gestion_joueur (menu des joueurs)
+# Retourne None lorsque l'utilisateur revient au menu précédent
+def gestion_joueur(contexte: ContexteApplication) -> None:
+    # Vue des joueurs du contexte de l'application (créée une seule fois au démarrage)
+    joueur_vue = contexte.joueur_vue
 
     # Boucle principale pour la gestion des joueurs
     while True:
@@ -18,18 +17,8 @@ def gestion_joueur():
 
         # Traitement du choix de l'utilisateur
         if choix == "1":
-            # Si l'ajout de joueur réussit, continue la boucle
-            if joueur_vue.saisir_joueur() is True:
-                continue
-            # Si le nombre maximal de joueurs est atteint, affiche un message
-            elif len(joueur_vue.joueur_controller.joueur_manager.joueurs) >= JoueurManager.MAX_JOUEURS:
-                print("Le nombre maximal de joueurs est déjà atteint.")
-            # Sinon, ajoute le nouveau joueur
-            else:
-                joueur = joueur_vue.saisir_joueur()
-                joueur_vue.joueur_controller.ajouter_joueur(
-                    joueur.nom, joueur.prenom, joueur.date_naissance, joueur.elo
-                )
+            # Saisit et ajoute des joueurs jusqu'à ce que l'utilisateur revienne au menu (ou que le quota soit atteint)
+            joueur_vue.saisir_joueur()
         elif choix == "2":
             # Appelle la méthode pour modifier un joueur
             joueur_vue.modifier_joueur()
@@ -43,17 +32,21 @@ def gestion_joueur():
             # Appelle la méthode pour afficher les détails d'un joueur
             joueur_vue.afficher_details_joueur()
         elif choix == "6":
+            # Appelle la méthode pour importer des joueurs depuis un fichier
+            joueur_vue.importer_joueurs()
+        elif choix == "7":
+            # Appelle la méthode pour exporter les joueurs dans un fichier CSV
+            joueur_vue.exporter_joueurs()
+        elif choix == "8":
             # Retourne au menu principal
             print("Retour au menu principal")
-            main_menu()
-            return
+            return None
         else:
             # Affiche un message d'erreur pour un choix invalide
             print("Choix invalide. Veuillez réessayer.")
-    return
 
 
 # Vérifie si le script est exécuté directement (et non importé comme module)
 if __name__ == "__main__":
-    # Appelle la fonction gestion_joueur
-    gestion_joueur()
\ No newline at end of file
+    # Ouvre le menu des joueurs dans le contexte de l'application
+    obtenir_contexte().naviguer(gestion_joueur)
@@ -1,9 +1,24 @@
-# Importation de la classe TournoiVue depuis le module views.tournoi_vue
+# Importation du contexte partagé par tous les menus
+from contexte import ContexteApplication, obtenir_contexte
+
+# Importation de la vue des tournois
 from views.tournoi_vue import TournoiVue
 
 
-# Définition de la fonction gestion_tournoi qui prend un objet TournoiVue en paramètre
-def gestion_tournoi(tournoi_vue: TournoiVue) -> None:
+# Définition de la fonction gestion_tournoi (menu des tournois)
+# Retourne None lorsque l'utilisateur revient au menu précédent
+def gestion_tournoi(contexte: ContexteApplication) -> None:
+    tournoi_vue = contexte.tournoi_vue  # Vue des tournois du contexte de l'application
+    while True:
+        try:
+            return choix_tournoi(tournoi_vue)
+        except ValueError as erreur:  # Tournoi illisible (joueur introuvable) : signalé, puis retour au menu
+            print(f"Erreur : {erreur}")
+
+
+# Définition de la fonction choix_tournoi : affiche le menu des tournois et exécute les choix de l'utilisateur
+# Retourne None lorsque l'utilisateur revient au menu précédent
+def choix_tournoi(tournoi_vue: TournoiVue) -> None:
     while True:  # Boucle infinie pour afficher le menu et gérer les choix de l'utilisateur
         tournoi_vue.afficher_menu()  # Affiche le menu des options du tournoi
         choix = input("Entrez votre choix : ")  # Demande à l'utilisateur de saisir son choix
@@ -72,7 +87,8 @@ def gestion_tournoi(tournoi_vue: TournoiVue) -> None:
                     print("3. Saisir les résultats d'une ronde")
                     print("4. Jouer une ronde")
                     print("5. Afficher le classement")
-                    print("6. Retour")
+                    print("6. Mettre à jour les classements Elo")
+                    print("7. Retour")
                     option = input("Sélectionnez une option : ")  # Demande à l'utilisateur de saisir son choix
 
                     if option == "1":
@@ -91,13 +107,22 @@ def gestion_tournoi(tournoi_vue: TournoiVue) -> None:
                         for ligne in tournoi.classement():
                             print(f"{ligne[0].nom} {ligne[0].prenom} : {ligne[1]} points")
                     elif option == "6":
+                        numero = input("Numéro de la ronde (vide pour tout le tournoi) : ")  # Ronde ou tournoi complet
+                        tournoi_vue.tournoi_controller.mettre_a_jour_elo(
+                            index_tournoi, tournoi_vue.joueur_manager, int(numero) if numero.isdigit() else None
+                        )
+                    elif option == "7":
                         break  # Retourne au menu principal
                     else:
                         print("Option invalide.")
 
-        # 6- Quitter
+        # 6- Exporter un tournoi ou une saison
         elif choix == "6":
-            break  # Quitte la boucle et termine la fonction
+            tournoi_vue.exporter()  # Demande le tournoi (ou la saison), les formats et le dossier
+
+        # 7- Retour
+        elif choix == "7":
+            return None  # Retour au menu précédent
 
         else:
             print("Choix invalide. Veuillez réessayer.")  # Message d'erreur pour choix invalide
@@ -105,12 +130,4 @@ def gestion_tournoi(tournoi_vue: TournoiVue) -> None:
 
 # Bloc principal du programme
 if __name__ == "__main__":
-    # Importation des modules nécessaires pour le bloc principal
-    from controllers.tournoi_controller import TournoiController
-    from models.joueur_model import JoueurManager
-
-    tournoi_controller = TournoiController()  # Création d'une instance de TournoiController
-    joueur_manager = JoueurManager()  # Création d'une instance de JoueurManager
-    tournoi_vue = TournoiVue(tournoi_controller, joueur_manager)  # Création d'une instance de TournoiVue
-
-    gestion_tournoi(tournoi_vue)  # Appel de la fonction gestion_tournoi avec l'instance de TournoiVue
\ No newline at end of file
+    obtenir_contexte().naviguer(gestion_tournoi)  # Ouvre le menu des tournois dans le contexte de l'application
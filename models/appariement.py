@@ -0,0 +1,230 @@
+# Importation des modules nécessaires
+from bisect import bisect_left  # Pour situer la cible hollandaise dans un bloc
+from typing import Dict, List, Optional, Set, Tuple  # Pour les annotations de type
+
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+from models.classement import POINTS_CODE, POINTS_EXEMPT  # Barème des points
+from models.couplage import couplage_poids_maximal  # Couplage de poids maximal (algorithme d'Edmonds)
+from models.instrumentation import chronometre  # Mesure des temps (si l'instrumentation est activée)
+BLANC = "B"  # Couleur blanche dans l'historique des couleurs
+NOIR = "N"  # Couleur noire dans l'historique des couleurs
+SEUIL_GRAPHE_COMPLET = 64  # Au-delà, le couplage d'un bloc est d'abord cherché parmi des adversaires candidats
+TAILLE_BLOC = 128  # Au-delà, le classement est apparié par blocs (fusionnés tant qu'une revanche subsiste)
+NB_CANDIDATS = 4  # Adversaires candidats par joueur et par zone du classement (voisins, position hollandaise)
+
+
+# Définition de la classe ParticipantAppariement : état d'un joueur utile à l'appariement
+class ParticipantAppariement:
+    # Constructeur de la classe ParticipantAppariement
+    def __init__(self, joueur: Joueur, score: float = 0.0, adversaires: Optional[Set[int]] = None,
+                 couleurs: Optional[List[str]] = None, exempte: bool = False):
+        self.joueur = joueur  # Joueur concerné
+        self.score = score  # Points marqués depuis le début du tournoi
+        # Index des adversaires déjà rencontrés
+        self.adversaires: Set[int] = adversaires if adversaires is not None else set()
+        self.couleurs: List[str] = couleurs if couleurs is not None else []  # Historique des couleurs ("B" ou "N")
+        self.exempte = exempte  # Vrai si le joueur a déjà été exempt
+
+    # Méthode pour mesurer l'envie de jouer avec les blancs (positif : blancs, négatif : noirs)
+    def envie_blancs(self) -> int:
+        ecart = self.couleurs.count(NOIR) - self.couleurs.count(BLANC)  # Plus de noirs que de blancs : envie de blancs
+        derniere = self.couleurs[-1] if self.couleurs else ""
+        return 2 * ecart + (1 if derniere == NOIR else -1 if derniere == BLANC else 0)
+
+    # Méthode pour obtenir la préférence absolue de couleur (None si le joueur peut jouer les deux couleurs)
+    def couleur_imposee(self) -> Optional[str]:
+        ecart = self.couleurs.count(BLANC) - self.couleurs.count(NOIR)
+        if ecart <= -2 or self.couleurs[-2:] == [NOIR, NOIR]:
+            return BLANC
+        if ecart >= 2 or self.couleurs[-2:] == [BLANC, BLANC]:
+            return NOIR
+        return None
+
+
+# Fonction pour apparier une ronde selon le système suisse (écarts de score, couleurs, exempt)
+# Les joueurs sont appariés par un couplage de poids maximal (models.couplage). Par ordre de priorité, le poids
+# d'une paire pénalise : une revanche (ou un second exempt), le carré de l'écart de score, un conflit de couleurs,
+# puis l'écart à l'appariement hollandais (moitié haute contre moitié basse du groupe de score).
+# Jusqu'à TAILLE_BLOC joueurs, un seul couplage porte sur toute la ronde. Au-delà, le classement est découpé en
+# blocs consécutifs appariés séparément ; un bloc contenant une revanche est fusionné avec son voisin et réapparié,
+# jusqu'à la ronde entière si besoin. Une revanche n'est donc retenue que si aucun appariement complet de la ronde
+# n'en est exempt ; l'optimalité des écarts de score n'est garantie qu'à l'intérieur de chaque bloc.
+@chronometre("appariement.suisse", "appariement")
+def apparier_suisse(
+        participants: List[ParticipantAppariement]) -> Tuple[List[Tuple[Joueur, Joueur]], Optional[Joueur]]:
+    classes = sorted(participants, key=lambda p: (-p.score, -p.joueur.elo, p.joueur.index))
+    if len(classes) < 2:
+        return [], classes[0].joueur if classes else None
+
+    graphe = _GrapheAppariement(classes)
+    blocs = graphe.decouper_blocs(TAILLE_BLOC)
+    resultats = [graphe.apparier_bloc(bloc) for bloc in blocs]
+    while len(blocs) > 1:
+        numero = next((k for k, paires in enumerate(resultats) if graphe.contient_revanche(paires)), None)
+        if numero is None:
+            break
+        numero = min(numero, len(blocs) - 2)  # Fusion avec le bloc suivant (ou le précédent pour le dernier)
+        blocs[numero:numero + 2] = [blocs[numero] + blocs[numero + 1]]
+        resultats[numero:numero + 2] = [graphe.apparier_bloc(blocs[numero])]
+
+    paires = sorted(paire for paires_bloc in resultats for paire in paires_bloc)  # Échiquiers par ordre de classement
+    exempt = next((classes[i].joueur for i, j in paires if j == graphe.exempt), None)
+    paires = [(classes[i], classes[j]) for i, j in paires if j != graphe.exempt]
+    return [_attribuer_couleurs(p1, p2, numero) for numero, (p1, p2) in enumerate(paires)], exempt
+
+
+# Définition de la classe interne _GrapheAppariement : poids des paires possibles d'une ronde
+# Les joueurs sont désignés par leur rang dans le classement ; le rang len(classes) est l'exempt (ronde impaire).
+class _GrapheAppariement:
+    # Constructeur de la classe _GrapheAppariement
+    def __init__(self, classes: List[ParticipantAppariement]):
+        self.classes = classes
+        nb = len(classes)
+        self.exempt = nb if nb % 2 == 1 else None  # Être apparié avec ce sommet fictif, c'est être exempt
+        self.points = [round(2 * p.score) for p in classes]  # Demi-points : écarts entiers
+        ecart_max = self.points[0] - self.points[-1]
+        self.unite_couleur = nb * nb  # Supérieure à la somme des pénalités de classement
+        self.unite_score = self.unite_couleur * (2 * nb + 1)  # Supérieure aux pénalités de couleur et de classement
+        self.unite_revanche = self.unite_score * (nb * ecart_max * ecart_max + 1)  # Supérieure à toutes les autres
+
+        # Groupes de score [début, fin) et décalage hollandais de chaque joueur vers sa cible de la moitié basse
+        self.groupes: List[Tuple[int, int]] = []
+        self.decalage = [0] * nb
+        debut = 0
+        while debut < nb:
+            fin = debut
+            while fin < nb and self.points[fin] == self.points[debut]:
+                fin += 1
+            moitie = (fin - debut) // 2
+            self.decalage[debut:debut + moitie] = [moitie] * moitie  # La moitié basse n'a pas de cible plus bas
+            self.groupes.append((debut, fin))
+            debut = fin
+
+    # Méthode pour découper le classement en blocs de taille paire d'au moins `taille` joueurs (sauf le dernier)
+    # Un grand groupe de score est coupé en tranches alignées sur l'appariement hollandais (S1[a:b] avec S2[a:b]).
+    def decouper_blocs(self, taille: int) -> List[List[int]]:
+        blocs: List[List[int]] = []
+        courant: List[int] = []
+        for debut, fin in self.groupes:
+            moitie = (fin - debut) // 2
+            if fin - debut <= taille:
+                tranches = [list(range(debut, fin))]
+            else:
+                pas = taille // 2
+                tranches = [list(range(debut + a, debut + min(a + pas, moitie)))
+                            + list(range(debut + moitie + a, debut + moitie + min(a + pas, moitie)))
+                            for a in range(0, moitie, pas)]
+                if (fin - debut) % 2 == 1:
+                    tranches[-1].append(fin - 1)  # Dernier joueur de la moitié basse (groupe impair)
+            for tranche in tranches:
+                courant += tranche
+                if len(courant) >= taille:  # Bloc pair : un joueur en trop passe au bloc suivant
+                    reste = len(courant) % 2
+                    blocs.append(courant[:len(courant) - reste])
+                    courant = courant[len(courant) - reste:]
+        if self.exempt is not None:
+            courant.append(self.exempt)  # L'exempt est choisi parmi les derniers du classement
+        if courant and blocs and len(courant) < taille // 2:
+            blocs[-1] += courant  # Reliquat trop petit : rattaché au dernier bloc
+        elif courant:
+            blocs.append(courant)
+        return blocs
+
+    # Méthode pour calculer le poids d'une paire (i classé avant j, j pouvant être l'exempt)
+    def poids(self, i: int, j: int) -> int:
+        p1 = self.classes[i]
+        if j == self.exempt:  # Exempt : le moins bien classé, au plus petit score, jamais exempt
+            ecart = self.points[i] - self.points[-1]
+            return (self.unite_revanche * (not p1.exempte) - self.unite_score * ecart * ecart
+                    - (len(self.classes) - 1 - i))
+        p2 = self.classes[j]
+        couleur = 2 if _conflit_couleurs(p1, p2) else 0
+        if not couleur and p1.envie_blancs() * p2.envie_blancs() > 0:
+            couleur = 1  # Même couleur souhaitée, sans obligation
+        revanche = p2.joueur.index in p1.adversaires
+        ecart = self.points[i] - self.points[j]
+        return (self.unite_revanche * (not revanche) - self.unite_score * ecart * ecart
+                - self.unite_couleur * couleur - abs(j - i - self.decalage[i]))
+
+    # Méthode pour construire les arêtes d'un bloc (sommets numérotés par position dans le bloc)
+    # Avec nb_candidats, seuls les adversaires jamais rencontrés proches dans le bloc ou de la position hollandaise
+    # sont candidats, et seuls les derniers du bloc jamais exempts peuvent l'être ; sinon toutes les paires le sont.
+    def aretes(self, bloc: List[int], nb_candidats: Optional[int]) -> List[Tuple[int, int, int]]:
+        joueurs = [i for i in bloc if i != self.exempt]
+        if nb_candidats is None:
+            aretes = [(a, b, self.poids(i, j)) for a, i in enumerate(joueurs) for b, j in enumerate(joueurs) if a < b]
+        else:
+            candidats: Set[Tuple[int, int]] = set()
+            for a, i in enumerate(joueurs):
+                cible = bisect_left(joueurs, i + self.decalage[i])
+                for depart in {a + 1, cible - nb_candidats // 2}:  # Voisins, puis autour de la cible hollandaise
+                    b, trouves = max(depart, a + 1), 0
+                    while b < len(joueurs) and trouves < nb_candidats:
+                        if self.classes[joueurs[b]].joueur.index not in self.classes[i].adversaires:
+                            candidats.add((a, b))
+                            trouves += 1
+                        b += 1
+            aretes = [(a, b, self.poids(joueurs[a], joueurs[b])) for a, b in sorted(candidats)]
+        if len(joueurs) < len(bloc):
+            positions = range(len(joueurs) - 1, -1, -1)
+            if nb_candidats is not None:
+                positions = [a for a in positions if not self.classes[joueurs[a]].exempte][:nb_candidats]
+            aretes += [(a, len(joueurs), self.poids(joueurs[a], self.exempt)) for a in positions]
+        return aretes
+
+    # Méthode pour apparier un bloc : couplage parfait, parmi des candidats puis (à défaut) toutes les paires
+    def apparier_bloc(self, bloc: List[int]) -> List[Tuple[int, int]]:
+        nb_candidats = NB_CANDIDATS if len(bloc) > SEUIL_GRAPHE_COMPLET else None
+        while True:
+            conjoints = couplage_poids_maximal(self.aretes(bloc, nb_candidats), parfait=True)
+            if nb_candidats is None or (len(conjoints) == len(bloc) and -1 not in conjoints):
+                return [(bloc[a], bloc[b]) for a, b in enumerate(conjoints) if a < b]
+            nb_candidats = 4 * nb_candidats if 4 * nb_candidats < len(bloc) else None  # Candidats élargis
+
+    # Méthode pour savoir si des paires contiennent une revanche ou un second exempt
+    def contient_revanche(self, paires: List[Tuple[int, int]]) -> bool:
+        for i, j in paires:
+            if j == self.exempt:
+                if self.classes[i].exempte:
+                    return True
+            elif self.classes[j].joueur.index in self.classes[i].adversaires:
+                return True
+        return False
+
+
+# Fonction interne pour savoir si deux joueurs ont la même couleur imposée
+def _conflit_couleurs(p1: ParticipantAppariement, p2: ParticipantAppariement) -> bool:
+    couleur = p1.couleur_imposee()
+    return couleur is not None and couleur == p2.couleur_imposee()
+
+
+# Fonction interne pour choisir les couleurs d'une paire (le joueur ayant le plus envie des blancs les reçoit)
+def _attribuer_couleurs(p1: ParticipantAppariement, p2: ParticipantAppariement, numero: int) -> Tuple[Joueur, Joueur]:
+    envie1, envie2 = p1.envie_blancs(), p2.envie_blancs()
+    if envie1 == envie2:  # Pas de préférence : alternance des couleurs d'un échiquier à l'autre
+        return (p1.joueur, p2.joueur) if numero % 2 == 0 else (p2.joueur, p1.joueur)
+    return (p1.joueur, p2.joueur) if envie1 > envie2 else (p2.joueur, p1.joueur)
+
+
+# Fonction pour calculer l'état d'appariement de chaque joueur à partir des rondes déjà jouées
+def participants_depuis_rondes(joueurs: List[Joueur], rondes) -> List[ParticipantAppariement]:
+    participants: Dict[int, ParticipantAppariement] = {j.index: ParticipantAppariement(j) for j in joueurs}
+    for ronde in rondes:
+        for index_blanc, index_noir, code in ronde.parties():  # Lecture directe des colonnes de la ronde
+            blanc = participants.get(index_blanc)
+            noir = participants.get(index_noir)
+            if blanc:
+                blanc.adversaires.add(index_noir)
+                blanc.couleurs.append(BLANC)
+            if noir:
+                noir.adversaires.add(index_blanc)
+                noir.couleurs.append(NOIR)
+            points_blanc, points_noir = POINTS_CODE[code]
+            if blanc:
+                blanc.score += points_blanc
+            if noir:
+                noir.score += points_noir
+        if ronde.exempt is not None and ronde.exempt.index in participants:
+            participants[ronde.exempt.index].score += POINTS_EXEMPT
+            participants[ronde.exempt.index].exempte = True
+    return list(participants.values())
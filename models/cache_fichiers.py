@@ -0,0 +1,76 @@
+# Importation des modules nécessaires
+import os  # Pour les opérations liées au système de fichiers
+import threading  # Le cache est partagé avec le fil de chargement en arrière-plan
+from typing import Any, Callable, Dict, Optional, TextIO, Tuple  # Pour les annotations de type
+
+from models.instrumentation import compter  # Compteurs de succès et d'échecs (si l'instrumentation est activée)
+
+Signature = Tuple[int, int, int]  # Date de modification (ns), taille, inode
+
+
+# Définition de la classe CacheFichiers : contenu analysé des fichiers lus, par chemin
+#
+# Une lecture retourne le contenu déjà analysé tant que le fichier n'a pas changé : date de modification,
+# taille et inode identiques. L'inode détecte les remplacements atomiques (fichier temporaire renommé), même
+# à taille et date égales. Le contenu retourné est partagé entre les lecteurs : il ne doit pas être modifié.
+class CacheFichiers:
+    # Constructeur de la classe CacheFichiers
+    def __init__(self):
+        # Chemin absolu -> (signature, fonction d'analyse, contenu analysé)
+        self._entrees: Dict[str, Tuple[Signature, Callable[[TextIO], Any], Any]] = {}
+        self._verrou = threading.Lock()
+        self.succes = 0  # Lectures servies par le cache
+        self.echecs = 0  # Lectures ayant analysé le fichier
+
+    # Méthode pour obtenir la signature d'un fichier (None s'il n'existe pas)
+    @staticmethod
+    def signature(fichier: str) -> Optional[Signature]:
+        try:
+            etat = os.stat(fichier)
+        except FileNotFoundError:
+            return None
+        return etat.st_mtime_ns, etat.st_size, etat.st_ino
+
+    # Méthode pour lire un fichier texte et l'analyser (json.load...), ou retourner l'analyse déjà faite
+    #
+    # Lève FileNotFoundError si le fichier n'existe pas ; une erreur d'analyse est propagée et rien n'est conservé.
+    def lire(self, fichier: str, analyser: Callable[[TextIO], Any]) -> Any:
+        cle = os.path.abspath(fichier)
+        signature = self.signature(cle)
+        if signature is None:
+            self.invalider(cle)
+            raise FileNotFoundError(f"Fichier {fichier} introuvable.")
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None and entree[0] == signature and entree[1] is analyser:
+                self.succes += 1
+                compter("cache.succes")
+                return entree[2]
+            self.echecs += 1
+        compter("cache.echecs")
+        with open(cle, 'r', encoding='utf-8') as file:
+            contenu = analyser(file)
+        with self._verrou:
+            self._entrees[cle] = (signature, analyser, contenu)
+        return contenu
+
+    # Méthode pour oublier un fichier (ou tous les fichiers si aucun n'est indiqué)
+    def invalider(self, fichier: Optional[str] = None) -> None:
+        with self._verrou:
+            if fichier is None:
+                self._entrees.clear()
+            else:
+                self._entrees.pop(os.path.abspath(fichier), None)
+
+    # Méthode pour obtenir les compteurs du cache
+    def statistiques(self) -> Dict[str, int]:
+        with self._verrou:
+            return {"succes": self.succes, "echecs": self.echecs, "fichiers": len(self._entrees)}
+
+
+_cache = CacheFichiers()  # Cache partagé par les dépôts et les exports (créé à l'importation, avant tout fil)
+
+
+# Fonction pour obtenir le cache des fichiers partagé
+def obtenir_cache() -> CacheFichiers:
+    return _cache
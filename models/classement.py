@@ -0,0 +1,182 @@
+# Importation des modules nécessaires
+import bisect  # Pour maintenir le classement trié
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple  # Pour les annotations de type
+
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+from models.colonnes_matchs import RESULTATS  # Résultats par code (colonnes de matchs)
+from models.inscription import Inscription  # État d'un joueur propre au tournoi
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.tournoi_model
+    from models.tournoi_model import Match, Ronde
+
+POINTS_RESULTAT = {"1-0": (1.0, 0.0), "0-1": (0.0, 1.0), "0.5-0.5": (0.5, 0.5)}  # Points (blancs, noirs) par résultat
+POINTS_EXEMPT = 1.0  # Points accordés au joueur exempt (bye)
+POINTS_CODE = tuple(POINTS_RESULTAT.get(resultat, (0.0, 0.0)) for resultat in RESULTATS)  # Points par code de résultat
+
+
+# Fonction pour obtenir les points (blancs, noirs) d'un résultat ((0, 0) si le match n'est pas joué)
+def points_resultat(resultat: str) -> Tuple[float, float]:
+    return POINTS_RESULTAT.get(resultat, (0.0, 0.0))
+
+
+# Définition de la classe Classement : points des joueurs et ordre de classement maintenu trié
+#
+# La révision est incrémentée à chaque modification : les lignes du classement après une ronde ne sont
+# reformatées que si le classement a changé.
+class Classement:
+    __slots__ = ("points", "joueurs", "_ordre", "_cles", "revision")
+
+    # Constructeur de la classe Classement
+    def __init__(self, joueurs: Iterable[Joueur] = ()):
+        self.points: Dict[int, float] = {}  # Points de chaque joueur, par index
+        self.joueurs: Dict[int, Joueur] = {}  # Joueurs classés, par index
+        self._ordre: List[Tuple[float, int, int]] = []  # Liste triée de (-points, -elo, index)
+        self._cles: Dict[int, Tuple[float, int, int]] = {}  # Clé de tri actuelle de chaque joueur
+        self.revision = 0  # Nombre de modifications (joueurs ajoutés ou retirés, points)
+        for joueur in joueurs:
+            self.ajouter_joueur(joueur)
+
+    # Méthode pour ajouter un joueur au classement
+    def ajouter_joueur(self, joueur: Joueur, points: float = 0.0) -> None:
+        if joueur.index in self.points:
+            return
+        self.joueurs[joueur.index] = joueur
+        self.points[joueur.index] = points
+        self._inserer(joueur.index)
+        self.revision += 1
+
+    # Méthode pour retirer un joueur du classement
+    def retirer_joueur(self, joueur: Joueur) -> None:
+        if joueur.index not in self.points:
+            return
+        self._retirer(joueur.index)
+        del self.points[joueur.index]
+        del self.joueurs[joueur.index]
+        self.revision += 1
+
+    # Méthode pour ajouter (ou retirer) des points à un joueur (O(log n) pour retrouver et replacer le joueur)
+    def ajouter_points(self, joueur: Joueur, delta: float) -> None:
+        if not delta or joueur.index not in self.points:
+            return
+        self._retirer(joueur.index)
+        self.points[joueur.index] += delta
+        self._inserer(joueur.index)
+        self.revision += 1
+
+    # Méthode pour obtenir le rang d'un joueur (1 pour le premier, None s'il n'est pas classé)
+    def rang(self, joueur: Joueur) -> Optional[int]:
+        cle = self._cles.get(joueur.index)
+        return bisect.bisect_left(self._ordre, cle) + 1 if cle is not None else None
+
+    # Méthode pour obtenir le classement (les `limite` premiers seulement si précisé)
+    def classement(self, limite: Optional[int] = None) -> List[Tuple[Joueur, float]]:
+        return [(self.joueurs[index], self.points[index]) for _, _, index in self._ordre[:limite]]
+
+    # Méthode pour obtenir le classement sous forme de lignes affichables
+    def lignes(self, limite: Optional[int] = None) -> List[str]:
+        return [f"{i + 1}. {joueur.nom} {joueur.prenom} : {points:g}"
+                for i, (joueur, points) in enumerate(self.classement(limite))]
+
+    # Méthode pour copier le classement (instantané indépendant)
+    def copie(self) -> 'Classement':
+        copie = Classement()
+        copie.points = dict(self.points)
+        copie.joueurs = dict(self.joueurs)
+        copie._ordre = list(self._ordre)
+        copie._cles = dict(self._cles)
+        return copie
+
+    # Méthode pour connaître le nombre de joueurs classés
+    def __len__(self) -> int:
+        return len(self.points)
+
+    # Méthodes internes de maintien de la liste triée
+    def _inserer(self, index: int) -> None:
+        cle = (-self.points[index], -int(self.joueurs[index].elo), index)
+        self._cles[index] = cle
+        bisect.insort(self._ordre, cle)
+
+    def _retirer(self, index: int) -> None:
+        cle = self._cles.pop(index)
+        position = bisect.bisect_left(self._ordre, cle)  # Recherche dichotomique de l'entrée du joueur
+        del self._ordre[position]
+
+
+# Définition de la classe MoteurClassement : classement général et instantanés après chaque ronde
+#
+# Chaque résultat est appliqué comme une différence de points au classement général et aux instantanés
+# des rondes suivantes (une seule ronde en pratique : la ronde en cours), sans reparcourir les matchs.
+# Le moteur tient aussi l'inscription de chaque joueur (points, couleurs, exemptions dans ce tournoi).
+class MoteurClassement:
+    # Constructeur de la classe MoteurClassement
+    def __init__(self, joueurs: Iterable[Joueur] = (), rondes: Iterable['Ronde'] = ()):
+        self.general = Classement(joueurs)  # Classement après tous les résultats saisis
+        self.rondes: List['Ronde'] = []  # Rondes prises en compte, dans l'ordre du tournoi
+        self.apres_ronde: List[Classement] = []  # Instantané du classement après chaque ronde
+        self.inscriptions: Dict[int, Inscription] = {index: Inscription(joueur)
+                                                     for index, joueur in self.general.joueurs.items()}
+        for ronde in rondes:
+            self.ajouter_ronde(ronde)
+
+    # Méthode pour prendre en compte une nouvelle ronde (ses résultats et son exempt)
+    def ajouter_ronde(self, ronde: 'Ronde') -> None:
+        joueurs = self.general.joueurs
+        inscriptions = self.inscriptions
+        for blanc, noir, code in ronde.parties():  # Lecture directe des colonnes, sans objet Match
+            if blanc in inscriptions:
+                inscriptions[blanc].couleurs += "B"
+            if noir in inscriptions:
+                inscriptions[noir].couleurs += "N"
+            points_blanc, points_noir = POINTS_CODE[code]
+            if points_blanc and blanc in joueurs:
+                self._ajouter_points(joueurs[blanc], points_blanc, self.general)
+            if points_noir and noir in joueurs:
+                self._ajouter_points(joueurs[noir], points_noir, self.general)
+        if ronde.exempt is not None:
+            self._ajouter_points(ronde.exempt, POINTS_EXEMPT, self.general)
+            if ronde.exempt.index in inscriptions:
+                inscriptions[ronde.exempt.index].exempts += 1
+        ronde.classement = self.general.copie()  # Instantané partagé avec la ronde
+        self.rondes.append(ronde)
+        self.apres_ronde.append(ronde.classement)
+
+    # Méthode pour saisir (ou corriger) le résultat d'un match et mettre à jour les classements
+    def enregistrer_resultat(self, ronde: 'Ronde', match: 'Match', resultat: str) -> None:
+        ancien = match.resultat
+        match.saisir_resultat(resultat)  # Valide le résultat (ValueError si le format est invalide)
+        position = next((i for i, r in enumerate(self.rondes) if r is ronde), None)
+        if position is None:  # Ronde inconnue du moteur : seul le classement général est mis à jour
+            self._appliquer(match, ancien, match.resultat, self.general)
+            return
+        for classement in [self.general] + self.apres_ronde[position:]:
+            self._appliquer(match, ancien, match.resultat, classement)
+
+    # Méthode pour ajouter un joueur (0 point) au classement général et aux instantanés
+    def ajouter_joueur(self, joueur: Joueur) -> None:
+        self.inscriptions.setdefault(joueur.index, Inscription(joueur))
+        for classement in [self.general] + self.apres_ronde:
+            classement.ajouter_joueur(joueur)
+
+    # Méthode pour retirer un joueur du classement général et des instantanés
+    def retirer_joueur(self, joueur: Joueur) -> None:
+        for classement in [self.general] + self.apres_ronde:
+            classement.retirer_joueur(joueur)
+        self.inscriptions.pop(joueur.index, None)
+
+    # Méthode pour vérifier que le moteur correspond encore aux joueurs et aux rondes du tournoi
+    def est_a_jour(self, joueurs: List[Joueur], rondes: List['Ronde']) -> bool:
+        return (len(joueurs) == len(self.general) and len(rondes) == len(self.rondes)
+                and (not rondes or rondes[-1] is self.rondes[-1]))
+
+    # Méthode interne pour appliquer la différence entre l'ancien et le nouveau résultat d'un match
+    def _appliquer(self, match: 'Match', ancien: str, nouveau: str, classement: Classement) -> None:
+        ancien_blanc, ancien_noir = points_resultat(ancien)
+        nouveau_blanc, nouveau_noir = points_resultat(nouveau)
+        self._ajouter_points(match.joueur_blanc, nouveau_blanc - ancien_blanc, classement)
+        self._ajouter_points(match.joueur_noir, nouveau_noir - ancien_noir, classement)
+
+    # Méthode interne pour ajouter des points (le score de l'inscription suit le classement général)
+    def _ajouter_points(self, joueur: Joueur, delta: float, classement: Classement) -> None:
+        classement.ajouter_points(joueur, delta)
+        if classement is self.general and joueur.index in self.inscriptions:
+            self.inscriptions[joueur.index].score = classement.points[joueur.index]
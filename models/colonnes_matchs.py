@@ -0,0 +1,62 @@
+# Importation des modules nécessaires
+from array import array  # Tableaux compacts de types numériques
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple  # Pour les annotations de type
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.joueur_model
+    from models.joueur_model import Joueur
+
+RESULTATS = ("", "1-0", "0-1", "0.5-0.5")  # Résultat correspondant à chaque code ("" : match non joué)
+CODES_RESULTAT = {resultat: code for code, resultat in enumerate(RESULTATS)}  # Code de chaque résultat
+NON_JOUE = 0  # Code d'un match non joué
+
+
+# Fonction pour obtenir le code d'un résultat (les résultats inconnus sont traités comme non joués)
+def code_resultat(resultat: str) -> int:
+    return CODES_RESULTAT.get(resultat, NON_JOUE)
+
+
+# Définition de la classe ColonnesMatchs : matchs rangés par colonnes (index des joueurs, code du résultat)
+#
+# Un match occupe 9 octets (deux index sur 4 octets, un code sur 1 octet) au lieu d'un objet Python complet.
+# Les objets Match ne sont que des vues (colonnes, position) créées à la lecture ; les parcours de toute une
+# archive (classements, départages, Elo) lisent directement les colonnes avec parties().
+# La révision est incrémentée à chaque modification : une ronde sérialisée n'est reconstruite que si elle a changé.
+class ColonnesMatchs:
+    __slots__ = ("blancs", "noirs", "resultats", "joueurs", "revision")
+
+    # Constructeur de la classe ColonnesMatchs
+    def __init__(self, joueurs: Optional[Dict[int, 'Joueur']] = None):
+        self.blancs = array("i")  # Index des joueurs avec les blancs
+        self.noirs = array("i")  # Index des joueurs avec les noirs
+        self.resultats = array("b")  # Code du résultat de chaque match
+        self.joueurs: Dict[int, 'Joueur'] = joueurs if joueurs is not None else {}  # Joueurs par index (partagé)
+        self.revision = 0  # Nombre de modifications (ajouts, résultats, vidage)
+
+    # Méthode pour ajouter un match et obtenir sa position
+    def ajouter(self, joueur_blanc: 'Joueur', joueur_noir: 'Joueur', code: int = NON_JOUE) -> int:
+        self.joueurs.setdefault(joueur_blanc.index, joueur_blanc)
+        self.joueurs.setdefault(joueur_noir.index, joueur_noir)
+        self.blancs.append(joueur_blanc.index)
+        self.noirs.append(joueur_noir.index)
+        self.resultats.append(code)
+        self.revision += 1
+        return len(self.resultats) - 1
+
+    # Méthode pour modifier le code du résultat d'un match
+    def modifier_resultat(self, position: int, code: int) -> None:
+        if self.resultats[position] != code:
+            self.resultats[position] = code
+            self.revision += 1
+
+    # Méthode pour parcourir les matchs sans créer d'objets : (index blancs, index noirs, code du résultat)
+    def parties(self) -> Iterator[Tuple[int, int, int]]:
+        return zip(self.blancs, self.noirs, self.resultats)
+
+    # Méthode pour retirer tous les matchs
+    def vider(self) -> None:
+        del self.blancs[:], self.noirs[:], self.resultats[:]
+        self.revision += 1
+
+    # Méthode pour connaître le nombre de matchs
+    def __len__(self) -> int:
+        return len(self.resultats)
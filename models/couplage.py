@@ -0,0 +1,419 @@
+# Importation des modules nécessaires
+from typing import Iterator, List, Optional, Sequence, Set, Tuple  # Pour les annotations de type
+
+Arete = Tuple[int, int, int]  # (sommet, sommet, poids entier)
+
+# Couplage de poids maximal dans un graphe quelconque : algorithme d'Edmonds (fleurs) avec variables duales,
+# dans la version en O(n³) de Galil (« Efficient algorithms for finding maximum matching in graphs », 1986).
+#
+# Les sommets sont numérotés de 0 à n - 1. Chaque étape cherche un chemin augmentant dans la forêt des sommets
+# libres ; lorsqu'aucune arête n'est serrée, les variables duales sont ajustées (au plus O(n) fois par étape).
+# Il y a au plus n / 2 étapes. Avec cardinalite_max, le couplage retourné est de cardinalité maximale et, parmi
+# ceux-là, de poids maximal. Les poids sont entiers : tous les calculs restent exacts.
+#
+# Avec parfait, seul un couplage parfait est recherché : les variables duales partent du plus grand poids incident
+# de chaque sommet, abaissé au plus juste, et les arêtes serrées forment un couplage glouton initial. Chaque étape
+# ne fait ensuite pousser qu'un arbre, depuis un sommet resté libre. Le résultat est un couplage parfait de poids
+# maximal s'il en existe un ; sinon l'arbre bloqué prouve qu'il n'en existe pas et des sommets restent libres.
+
+
+# Fonction pour calculer un couplage de poids maximal (conjoint de chaque sommet, -1 s'il reste libre)
+def couplage_poids_maximal(aretes: Sequence[Arete], cardinalite_max: bool = False, parfait: bool = False) -> List[int]:
+    if not aretes:
+        return []
+    aretes = [(i, j, 2 * poids) for i, j, poids in aretes]  # Poids pairs : les écarts divisés par deux restent entiers
+    nb_aretes = len(aretes)
+    nb_sommets = 1 + max(max(i, j) for i, j, _ in aretes)
+    poids_max = max(0, max(poids for _, _, poids in aretes))
+
+    # Extrémités : 2k et 2k + 1 désignent les deux extrémités de l'arête k (p ^ 1 : l'extrémité opposée)
+    extremite = [aretes[p // 2][p % 2] for p in range(2 * nb_aretes)]
+    voisins: List[List[int]] = [[] for _ in range(nb_sommets)]  # Extrémités opposées des arêtes de chaque sommet
+    for k, (i, j, _) in enumerate(aretes):
+        voisins[i].append(2 * k + 1)
+        voisins[j].append(2 * k)
+
+    conjoint = [-1] * nb_sommets  # Extrémité distante de l'arête couplée de chaque sommet (-1 : sommet libre)
+    # Étiquettes des sommets et des fleurs de plus haut niveau : 0 aucune, 1 externe (S), 2 interne (T)
+    etiquette = [0] * (2 * nb_sommets)
+    fin_etiquette = [-1] * (2 * nb_sommets)  # Extrémité par laquelle l'étiquette a été attribuée
+    dans_fleur = list(range(nb_sommets))  # Fleur de plus haut niveau contenant chaque sommet
+    parent_fleur = [-1] * (2 * nb_sommets)
+    enfants_fleur: List[Optional[List[int]]] = [None] * (2 * nb_sommets)  # Sous-fleurs, dans l'ordre du cycle
+    base_fleur = list(range(nb_sommets)) + [-1] * nb_sommets
+    extremites_fleur: List[Optional[List[int]]] = [None] * (2 * nb_sommets)  # Arêtes reliant les sous-fleurs
+    meilleure_arete = [-1] * (2 * nb_sommets)  # Arête de plus petit écart vers un sommet ou une fleur externe
+    meilleures_aretes_fleur: List[Optional[List[int]]] = [None] * (2 * nb_sommets)
+    fleurs_libres = list(range(nb_sommets, 2 * nb_sommets))  # Numéros de fleurs disponibles
+    duale = [poids_max] * nb_sommets + [0] * nb_sommets  # Variables duales des sommets puis des fleurs
+    admissible = [False] * nb_aretes  # Arêtes serrées (écart nul) utilisables dans l'étape en cours
+    file: List[int] = []  # Sommets externes dont les arêtes restent à examiner
+    foret: List[int] = []  # Sommets étiquetés pendant l'étape (seules leurs variables duales changent)
+    dans_foret = [False] * nb_sommets
+    candidats_delta: List[int] = []  # Sommets et fleurs dont la meilleure arête a été fixée pendant l'étape
+    est_candidat = [False] * (2 * nb_sommets)
+    fleurs_actives: Set[int] = set()  # Fleurs existantes (numéros de nb_sommets à 2 * nb_sommets - 1)
+    cardinalite_max = cardinalite_max or parfait
+
+    if parfait:  # Départ glouton : variables duales paires (parité commune des racines), arêtes serrées couplées
+        for v in range(nb_sommets):
+            if voisins[v]:
+                duale[v] = max(aretes[p // 2][2] for p in voisins[v])
+        for v in range(nb_sommets):
+            if conjoint[v] != -1 or not voisins[v]:
+                continue
+            duale[v] = max(2 * aretes[p // 2][2] - duale[extremite[p]] for p in voisins[v])  # Au plus juste
+            for p in voisins[v]:
+                w = extremite[p]
+                if conjoint[w] == -1 and w != v and duale[v] + duale[w] == 2 * aretes[p // 2][2]:
+                    conjoint[v] = p
+                    conjoint[w] = p ^ 1
+                    break
+
+    # Écart de l'arête k : somme des variables duales de ses extrémités moins son poids (doublé)
+    def ecart(k: int) -> int:
+        i, j, poids = aretes[k]
+        return duale[i] + duale[j] - 2 * poids
+
+    # Sommets contenus dans la fleur b (ou b lui-même s'il s'agit d'un sommet)
+    def feuilles(b: int) -> Iterator[int]:
+        if b < nb_sommets:
+            yield b
+            return
+        pile = [b]
+        while pile:
+            for enfant in enfants_fleur[pile.pop()]:
+                if enfant < nb_sommets:
+                    yield enfant
+                else:
+                    pile.append(enfant)
+
+    # Étiquetage de la fleur contenant w, atteinte par l'extrémité p ; un sommet interne étiquette son conjoint
+    def etiqueter(w: int, t: int, p: int) -> None:
+        while True:
+            b = dans_fleur[w]
+            etiquette[w] = etiquette[b] = t
+            fin_etiquette[w] = fin_etiquette[b] = p
+            meilleure_arete[w] = meilleure_arete[b] = -1
+            nouveaux = [v for v in feuilles(b) if not dans_foret[v]]
+            for v in nouveaux:
+                dans_foret[v] = True
+            foret.extend(nouveaux)
+            if t == 1:
+                file.extend(feuilles(b))
+                return
+            base = base_fleur[b]  # Sommet interne : son conjoint devient externe
+            w, t, p = extremite[conjoint[base]], 1, conjoint[base] ^ 1
+
+    # Recherche de l'ancêtre commun de v et w dans la forêt (base de la nouvelle fleur, -1 : chemin augmentant)
+    def chercher_fleur(v: int, w: int) -> int:
+        chemin = []
+        base = -1
+        while v != -1 or w != -1:
+            b = dans_fleur[v]
+            if etiquette[b] & 4:
+                base = base_fleur[b]
+                break
+            chemin.append(b)
+            etiquette[b] = 5  # Marque temporaire
+            if fin_etiquette[b] == -1:
+                v = -1  # Racine atteinte
+            else:
+                v = extremite[fin_etiquette[b]]
+                b = dans_fleur[v]
+                v = extremite[fin_etiquette[b]]
+            if w != -1:
+                v, w = w, v
+        for b in chemin:
+            etiquette[b] = 1
+        return base
+
+    # Création d'une fleur de base `base` fermée par l'arête k
+    def ajouter_fleur(base: int, k: int) -> None:
+        v, w, _ = aretes[k]
+        bb, bv, bw = dans_fleur[base], dans_fleur[v], dans_fleur[w]
+        b = fleurs_libres.pop()
+        fleurs_actives.add(b)
+        base_fleur[b] = base
+        parent_fleur[b] = -1
+        parent_fleur[bb] = b
+        enfants_fleur[b] = chemin = []
+        extremites_fleur[b] = extremites = []
+        while bv != bb:
+            parent_fleur[bv] = b
+            chemin.append(bv)
+            extremites.append(fin_etiquette[bv])
+            v = extremite[fin_etiquette[bv]]
+            bv = dans_fleur[v]
+        chemin.append(bb)
+        chemin.reverse()
+        extremites.reverse()
+        extremites.append(2 * k)
+        while bw != bb:
+            parent_fleur[bw] = b
+            chemin.append(bw)
+            extremites.append(fin_etiquette[bw] ^ 1)
+            w = extremite[fin_etiquette[bw]]
+            bw = dans_fleur[w]
+        etiquette[b] = 1
+        fin_etiquette[b] = fin_etiquette[bb]
+        duale[b] = 0
+        for v in feuilles(b):
+            if etiquette[dans_fleur[v]] == 2:
+                file.append(v)  # Sommets internes devenus externes avec la fleur
+            dans_fleur[v] = b
+        meilleure_vers = [-1] * (2 * nb_sommets)  # Meilleure arête vers chaque fleur externe voisine
+        for bv in chemin:
+            if meilleures_aretes_fleur[bv] is None:
+                listes = [[p // 2 for p in voisins[v]] for v in feuilles(bv)]
+            else:
+                listes = [meilleures_aretes_fleur[bv]]
+            for liste in listes:
+                for k in liste:
+                    i, j, _ = aretes[k]
+                    if dans_fleur[j] == b:
+                        i, j = j, i
+                    bj = dans_fleur[j]
+                    if bj != b and etiquette[bj] == 1 and (
+                            meilleure_vers[bj] == -1 or ecart(k) < ecart(meilleure_vers[bj])):
+                        meilleure_vers[bj] = k
+            meilleures_aretes_fleur[bv] = None
+            meilleure_arete[bv] = -1
+        meilleures_aretes_fleur[b] = [k for k in meilleure_vers if k != -1]
+        meilleure_arete[b] = -1
+        for k in meilleures_aretes_fleur[b]:
+            if meilleure_arete[b] == -1 or ecart(k) < ecart(meilleure_arete[b]):
+                meilleure_arete[b] = k
+                if not est_candidat[b]:
+                    est_candidat[b] = True
+                    candidats_delta.append(b)
+
+    # Dissolution d'une fleur (en fin d'étape, ou pendant l'étape lorsque sa variable duale atteint zéro)
+    def developper_fleur(b: int, fin_etape: bool) -> None:
+        for s in enfants_fleur[b]:
+            parent_fleur[s] = -1
+            if s < nb_sommets:
+                dans_fleur[s] = s
+            elif fin_etape and duale[s] == 0:
+                developper_fleur(s, fin_etape)
+            else:
+                for v in feuilles(s):
+                    dans_fleur[v] = s
+        if not fin_etape and etiquette[b] == 2:
+            # Fleur interne : le chemin pair du cycle, de l'entrée à la base, garde ses étiquettes
+            entree = dans_fleur[extremite[fin_etiquette[b] ^ 1]]
+            j = enfants_fleur[b].index(entree)
+            if j & 1:
+                j -= len(enfants_fleur[b])
+                pas, decalage = 1, 0
+            else:
+                pas, decalage = -1, 1
+            p = fin_etiquette[b]
+            while j != 0:
+                etiquette[extremite[p ^ 1]] = 0
+                etiquette[extremite[extremites_fleur[b][j - decalage] ^ decalage ^ 1]] = 0
+                etiqueter(extremite[p ^ 1], 2, p)
+                admissible[extremites_fleur[b][j - decalage] // 2] = True
+                j += pas
+                p = extremites_fleur[b][j - decalage] ^ decalage
+                admissible[p // 2] = True
+                j += pas
+            bv = enfants_fleur[b][j]
+            etiquette[extremite[p ^ 1]] = etiquette[bv] = 2
+            fin_etiquette[extremite[p ^ 1]] = fin_etiquette[bv] = p
+            meilleure_arete[bv] = -1
+            j += pas
+            while enfants_fleur[b][j] != entree:
+                bv = enfants_fleur[b][j]
+                if etiquette[bv] == 1:
+                    j += pas
+                    continue
+                v = next((v for v in feuilles(bv) if etiquette[v] != 0), None)
+                if v is not None:  # Sous-fleur atteinte depuis l'extérieur : étiquette interne
+                    etiquette[v] = 0
+                    etiquette[extremite[conjoint[base_fleur[bv]]]] = 0
+                    etiqueter(v, 2, fin_etiquette[v])
+                j += pas
+        etiquette[b] = fin_etiquette[b] = -1
+        enfants_fleur[b] = extremites_fleur[b] = None
+        base_fleur[b] = -1
+        meilleures_aretes_fleur[b] = None
+        meilleure_arete[b] = -1
+        fleurs_libres.append(b)
+        fleurs_actives.discard(b)
+
+    # Inversion du couplage le long du cycle de la fleur b, pour que v en devienne la base
+    def augmenter_fleur(b: int, v: int) -> None:
+        t = v
+        while parent_fleur[t] != b:
+            t = parent_fleur[t]
+        if t >= nb_sommets:
+            augmenter_fleur(t, v)
+        i = j = enfants_fleur[b].index(t)
+        if i & 1:
+            j -= len(enfants_fleur[b])
+            pas, decalage = 1, 0
+        else:
+            pas, decalage = -1, 1
+        while j != 0:
+            j += pas
+            t = enfants_fleur[b][j]
+            p = extremites_fleur[b][j - decalage] ^ decalage
+            if t >= nb_sommets:
+                augmenter_fleur(t, extremite[p])
+            j += pas
+            t = enfants_fleur[b][j]
+            if t >= nb_sommets:
+                augmenter_fleur(t, extremite[p ^ 1])
+            conjoint[extremite[p]] = p ^ 1
+            conjoint[extremite[p ^ 1]] = p
+        enfants_fleur[b] = enfants_fleur[b][i:] + enfants_fleur[b][:i]
+        extremites_fleur[b] = extremites_fleur[b][i:] + extremites_fleur[b][:i]
+        base_fleur[b] = base_fleur[enfants_fleur[b][0]]
+
+    # Inversion du couplage le long du chemin augmentant passant par l'arête k
+    def augmenter_couplage(k: int) -> None:
+        v, w, _ = aretes[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = dans_fleur[s]
+                if bs >= nb_sommets:
+                    augmenter_fleur(bs, s)
+                conjoint[s] = p
+                if fin_etiquette[bs] == -1:
+                    break  # Racine de l'arbre atteinte
+                t = extremite[fin_etiquette[bs]]
+                bt = dans_fleur[t]
+                s = extremite[fin_etiquette[bt]]
+                j = extremite[fin_etiquette[bt] ^ 1]
+                if bt >= nb_sommets:
+                    augmenter_fleur(bt, j)
+                conjoint[j] = fin_etiquette[bt]
+                p = fin_etiquette[bt] ^ 1
+
+    racines = [v for v in range(nb_sommets) if conjoint[v] == -1]  # Sommets libres après le départ glouton
+    for _ in range(nb_sommets):  # Chaque étape augmente le couplage d'une arête, ou termine
+        etiquette[:] = [0] * (2 * nb_sommets)
+        meilleure_arete[:] = [-1] * (2 * nb_sommets)
+        meilleures_aretes_fleur[nb_sommets:] = [None] * nb_sommets
+        admissible[:] = [False] * nb_aretes
+        file[:] = []
+        for v in foret:
+            dans_foret[v] = False
+        foret[:] = []
+        for b in candidats_delta:
+            est_candidat[b] = False
+        candidats_delta[:] = []
+        if parfait:  # Un seul arbre à la fois : la forêt reste locale au sommet libre traité
+            while racines and conjoint[racines[-1]] != -1:
+                racines.pop()
+            if not racines:
+                break
+            etiqueter(racines[-1], 1, -1)
+        else:
+            for v in range(nb_sommets):
+                if conjoint[v] == -1 and etiquette[dans_fleur[v]] == 0:
+                    etiqueter(v, 1, -1)  # Chaque sommet libre est la racine d'un arbre
+        augmente = False
+        while True:
+            while file and not augmente:
+                v = file.pop()
+                for p in voisins[v]:
+                    k = p // 2
+                    w = extremite[p]
+                    if dans_fleur[v] == dans_fleur[w]:
+                        continue
+                    if not admissible[k]:
+                        ecart_k = ecart(k)
+                        if ecart_k <= 0:
+                            admissible[k] = True
+                    if admissible[k]:
+                        if etiquette[dans_fleur[w]] == 0 and conjoint[base_fleur[dans_fleur[w]]] == -1:
+                            etiqueter(w, 1, -1)  # Sommet libre hors de la forêt (un seul arbre) : chemin augmentant
+                            augmenter_couplage(k)
+                            augmente = True
+                            break
+                        elif etiquette[dans_fleur[w]] == 0:
+                            etiqueter(w, 2, p ^ 1)  # w rejoint l'arbre comme sommet interne
+                        elif etiquette[dans_fleur[w]] == 1:
+                            base = chercher_fleur(v, w)
+                            if base >= 0:
+                                ajouter_fleur(base, k)
+                            else:
+                                augmenter_couplage(k)
+                                augmente = True
+                                break
+                        elif etiquette[w] == 0:
+                            etiquette[w] = 2  # Sommet d'une fleur interne atteint pour la première fois
+                            fin_etiquette[w] = p ^ 1
+                    elif etiquette[dans_fleur[w]] == 1:
+                        b = dans_fleur[v]
+                        if meilleure_arete[b] == -1 or ecart_k < ecart(meilleure_arete[b]):
+                            meilleure_arete[b] = k
+                            if not est_candidat[b]:
+                                est_candidat[b] = True
+                                candidats_delta.append(b)
+                    elif etiquette[w] == 0:
+                        if meilleure_arete[w] == -1 or ecart_k < ecart(meilleure_arete[w]):
+                            meilleure_arete[w] = k
+                            if not est_candidat[w]:
+                                est_candidat[w] = True
+                                candidats_delta.append(w)
+            if augmente:
+                break
+
+            # Aucune arête serrée : ajustement des variables duales du plus petit écart possible
+            type_delta = -1
+            delta = arete_delta = fleur_delta = None
+            if not cardinalite_max:
+                type_delta = 1  # Une variable duale de sommet atteint zéro : couplage optimal
+                delta = min(duale[:nb_sommets])
+            for v in candidats_delta:  # Seuls les sommets et fleurs ayant reçu une meilleure arête sont candidats
+                if v < nb_sommets and etiquette[dans_fleur[v]] == 0 and meilleure_arete[v] != -1:
+                    d = ecart(meilleure_arete[v])
+                    if type_delta == -1 or d < delta:
+                        delta, type_delta, arete_delta = d, 2, meilleure_arete[v]
+            for b in candidats_delta:
+                if parent_fleur[b] == -1 and etiquette[b] == 1 and meilleure_arete[b] != -1:
+                    d = ecart(meilleure_arete[b]) // 2
+                    if type_delta == -1 or d < delta:
+                        delta, type_delta, arete_delta = d, 3, meilleure_arete[b]
+            for b in sorted(fleurs_actives):
+                if parent_fleur[b] == -1 and etiquette[b] == 2 and (type_delta == -1 or duale[b] < delta):
+                    delta, type_delta, fleur_delta = duale[b], 4, b
+            if type_delta == -1:  # Cardinalité maximale atteinte : dernier ajustement puis fin
+                type_delta = 1
+                delta = max(0, min(duale[:nb_sommets]))
+
+            for v in foret:
+                if etiquette[dans_fleur[v]] == 1:
+                    duale[v] -= delta
+                elif etiquette[dans_fleur[v]] == 2:
+                    duale[v] += delta
+            for b in fleurs_actives:
+                if parent_fleur[b] == -1:
+                    if etiquette[b] == 1:
+                        duale[b] += delta
+                    elif etiquette[b] == 2:
+                        duale[b] -= delta
+
+            if type_delta == 1:
+                break
+            elif type_delta == 2:  # Arête serrée vers un sommet hors de la forêt
+                admissible[arete_delta] = True
+                i, j, _ = aretes[arete_delta]
+                if etiquette[dans_fleur[i]] == 0:
+                    i, j = j, i
+                file.append(i)
+            elif type_delta == 3:  # Arête serrée entre deux fleurs externes
+                admissible[arete_delta] = True
+                file.append(aretes[arete_delta][0])
+            else:  # Variable duale d'une fleur interne nulle : la fleur est dissoute
+                developper_fleur(fleur_delta, False)
+        if not augmente:
+            break
+        for b in sorted(fleurs_actives):  # Fleurs externes de variable duale nulle dissoutes
+            if parent_fleur[b] == -1 and etiquette[b] == 1 and duale[b] == 0:
+                developper_fleur(b, True)
+
+    return [extremite[conjoint[v]] if conjoint[v] >= 0 else -1 for v in range(nb_sommets)]
@@ -0,0 +1,125 @@
+# Importation des modules nécessaires
+import atexit  # Pour afficher le rapport à la fermeture de l'application
+import builtins  # Pour mesurer les importations (à la manière de python -X importtime)
+import contextlib  # Pour le contexte sans effet utilisé lorsque le rapport est inactif
+import sys  # Pour afficher le rapport sur la sortie d'erreur
+import threading  # Pour distinguer le chargement en arrière-plan du fil principal
+import time  # Pour mesurer les durées
+from typing import Dict, Iterator, List, Tuple  # Pour les annotations de type
+
+import config  # Paramètres de l'application (activation du rapport de démarrage)
+
+# Le rapport de démarrage détaille, comme python -X importtime, le temps propre et le temps cumulé de chaque
+# importation et de chaque étape du démarrage (ouverture du dépôt, chargement des joueurs et des tournois),
+# puis les jalons : premier menu affiché, données prêtes. Il est écrit sur la sortie d'erreur à la fermeture.
+
+_origine = time.perf_counter_ns()  # Instant zéro : importation de ce module, la première de main_menu
+_actif = False  # Vrai lorsque le démarrage est mesuré
+_import_original = builtins.__import__  # Fonction d'importation remplacée pendant la mesure
+_etapes: List[Tuple[str, int, str, int, int]] = []  # (fil, profondeur, nom, propre ns, cumulé ns), dans l'ordre de fin
+_jalons: Dict[str, int] = {}  # Nom -> instant (ns depuis l'origine), première occurrence seulement
+_local = threading.local()  # Pile des étapes en cours, propre à chaque fil : [[début, durée des sous-étapes], ...]
+_verrou = threading.Lock()
+_enregistre_a_la_sortie = False  # Vrai une fois la fonction de fermeture enregistrée
+
+
+# Fonction pour obtenir la pile des étapes en cours du fil courant
+def _pile() -> List[List[int]]:
+    pile = getattr(_local, "pile", None)
+    if pile is None:
+        pile = _local.pile = []
+    return pile
+
+
+# Fonction pour mesurer une étape : with etape("chargement des joueurs"): ...
+@contextlib.contextmanager
+def _mesurer(nom: str) -> Iterator[None]:
+    pile = _pile()
+    pile.append([time.perf_counter_ns(), 0])
+    try:
+        yield
+    finally:
+        debut, enfants = pile.pop()
+        cumule = time.perf_counter_ns() - debut
+        if pile:
+            pile[-1][1] += cumule  # Temps retiré du temps propre de l'étape englobante
+        with _verrou:
+            _etapes.append((threading.current_thread().name, len(pile), nom, cumule - enfants, cumule))
+
+
+# Fonction pour mesurer une étape du démarrage (sans effet si le rapport est inactif)
+def etape(nom: str) -> contextlib.AbstractContextManager:
+    return _mesurer(nom) if _actif else contextlib.nullcontext()
+
+
+# Fonction pour noter un jalon du démarrage (seule la première occurrence de chaque nom est retenue)
+def jalon(nom: str) -> None:
+    if _actif:
+        with _verrou:
+            _jalons.setdefault(nom, time.perf_counter_ns() - _origine)
+
+
+# Fonction d'importation mesurée : seules les premières importations du fil principal sont détaillées
+def _importer(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or threading.current_thread() is not threading.main_thread():
+        return _import_original(name, globals, locals, fromlist, level)
+    module = sys.modules.get(name)
+    nom = name if module is None else next(
+        (f"{name}.{element}" for element in fromlist or () if not hasattr(module, element)), None
+    )  # from paquet import module : le module importé est le sous-module (pas encore attribut du paquet)
+    if nom is None:
+        return _import_original(name, globals, locals, fromlist, level)  # Déjà importé : rien à mesurer
+    with _mesurer(nom):
+        return _import_original(name, globals, locals, fromlist, level)
+
+
+# Fonction pour activer la mesure du démarrage (à appeler avant les autres importations)
+def activer() -> None:
+    global _actif, _enregistre_a_la_sortie
+    _actif = True
+    builtins.__import__ = _importer
+    if not _enregistre_a_la_sortie:
+        atexit.register(terminer)
+        _enregistre_a_la_sortie = True
+
+
+# Fonction pour arrêter la mesure des importations (les étapes et jalons déjà notés sont conservés)
+def desactiver() -> None:
+    global _actif
+    _actif = False
+    builtins.__import__ = _import_original
+
+
+# Fonction pour savoir si le démarrage est mesuré
+def est_actif() -> bool:
+    return _actif
+
+
+# Fonction pour obtenir le rapport de démarrage : étapes du fil principal, puis du chargement en arrière-plan
+def rapport() -> str:
+    with _verrou:
+        etapes = list(_etapes)
+        jalons = sorted(_jalons.items(), key=lambda element: element[1])
+    principal = threading.main_thread().name
+    lignes = [f"{'propre ms':>10} | {'cumulé ms':>10} | étape"]
+    for fil in [principal] + sorted({fil for fil, *_ in etapes} - {principal}):
+        if fil != principal:
+            lignes.append(f"{'':>10} | {'':>10} | [{fil}]")
+        for _, profondeur, nom, propre, cumule in (element for element in etapes if element[0] == fil):
+            lignes.append(f"{propre / 1e6:>10.2f} | {cumule / 1e6:>10.2f} | {'  ' * profondeur}{nom}")
+    if jalons:
+        lignes.append("")
+        lignes.extend(f"{instant / 1e6:>10.2f} ms  {nom}" for nom, instant in jalons)
+    return "\n".join(lignes)
+
+
+# Fonction appelée à la fermeture : rapport sur la sortie d'erreur
+def terminer() -> None:
+    if not _etapes and not _jalons:
+        return
+    print("\n===== Démarrage =====", file=sys.stderr)
+    print(rapport(), file=sys.stderr)
+
+
+if config.RAPPORT_DEMARRAGE:  # Activation depuis config.py
+    activer()
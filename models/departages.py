@@ -0,0 +1,109 @@
+# Importation des modules nécessaires
+import math  # Pour le calcul de la performance
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple  # Pour les annotations de type
+
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+from models.classement import POINTS_CODE, POINTS_EXEMPT  # Barème des points
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.tournoi_model
+    from models.tournoi_model import Ronde
+
+# Libellés courts des départages (colonnes des rapports)
+LIBELLES_DEPARTAGES = {
+    "confrontation": "Conf",
+    "buchholz_median": "BuM",  # Buchholz médian : sans le meilleur ni le plus faible adversaire
+    "buchholz": "Bu",
+    "sonneborn_berger": "SB",
+    "progressif": "Prog",
+    "performance": "Perf",
+}
+ORDRE_DEPARTAGES = ("confrontation", "buchholz_median", "buchholz", "sonneborn_berger", "progressif", "performance")
+ECART_PERFORMANCE_MAX = 800  # Écart Elo retenu pour un score de 100 % (ou 0 %)
+
+
+# Définition de la classe Departages : score et départages de chaque joueur d'un tournoi
+class Departages:
+    # Constructeur de la classe Departages
+    def __init__(self, joueurs: List[Joueur]):
+        self.joueurs = joueurs  # Joueurs du tournoi
+        self.score: Dict[int, float] = {}  # Points de chaque joueur, par index
+        # Valeur de chaque départage : critère -> index -> valeur
+        self.valeurs: Dict[str, Dict[int, float]] = {critere: {} for critere in LIBELLES_DEPARTAGES}
+
+    # Méthode pour obtenir la valeur d'un départage pour un joueur
+    def valeur(self, critere: str, joueur: Joueur) -> float:
+        return self.valeurs[critere].get(joueur.index, 0)
+
+    # Méthode pour obtenir la clé de tri d'un joueur (score, départages dans l'ordre demandé, Elo, index)
+    def cle(self, joueur: Joueur, ordre: Sequence[str] = ORDRE_DEPARTAGES) -> Tuple:
+        return (-self.score.get(joueur.index, 0), *(-self.valeur(critere, joueur) for critere in ordre),
+                -int(joueur.elo), joueur.index)
+
+    # Méthode pour classer les joueurs (score puis départages)
+    def classer(self, ordre: Sequence[str] = ORDRE_DEPARTAGES) -> List[Tuple[Joueur, float]]:
+        joueurs = sorted(self.joueurs, key=lambda joueur: self.cle(joueur, ordre))
+        return [(joueur, self.score.get(joueur.index, 0)) for joueur in joueurs]
+
+
+# Fonction pour calculer tous les départages en un seul passage sur les résultats
+#
+# Les parties sont d'abord rangées dans une table (position du joueur -> liste de (position de l'adversaire,
+# points marqués)), les scores finaux et progressifs étant cumulés au même moment. Chaque départage est ensuite
+# obtenu en parcourant une seule fois cette table : le coût total est proportionnel au nombre de parties.
+def calculer_departages(joueurs: List[Joueur], rondes: Iterable['Ronde']) -> Departages:
+    departages = Departages(joueurs)
+    position = {joueur.index: p for p, joueur in enumerate(joueurs)}
+    n = len(joueurs)
+    parties: List[List[Tuple[int, float]]] = [[] for _ in range(n)]  # Table des adversaires et des résultats
+    score = [0.0] * n
+    progressif = [0.0] * n
+    for ronde in rondes:
+        for index_blanc, index_noir, code in ronde.parties():  # Lecture directe des colonnes de la ronde
+            blanc, noir = position.get(index_blanc), position.get(index_noir)
+            if not code or blanc is None or noir is None:
+                continue  # Partie non jouée ou joueur retiré : ignorée par les départages
+            points_blanc, points_noir = POINTS_CODE[code]
+            parties[blanc].append((noir, points_blanc))
+            parties[noir].append((blanc, points_noir))
+            score[blanc] += points_blanc
+            score[noir] += points_noir
+        if ronde.exempt is not None and ronde.exempt.index in position:
+            score[position[ronde.exempt.index]] += POINTS_EXEMPT
+        progressif = [cumul + points for cumul, points in zip(progressif, score)]  # Score cumulé après la ronde
+
+    groupes: Dict[float, set] = {}  # Joueurs à égalité de points (pour la confrontation directe)
+    for p, points in enumerate(score):
+        groupes.setdefault(points, set()).add(p)
+
+    valeurs = departages.valeurs
+    for p, joueur in enumerate(joueurs):
+        scores_adversaires = [score[a] for a, _ in parties[p]]
+        buchholz = sum(scores_adversaires)
+        median = buchholz
+        if len(scores_adversaires) >= 3:  # Sans le meilleur ni le plus faible adversaire
+            median -= max(scores_adversaires) + min(scores_adversaires)
+        egalite = groupes[score[p]]
+        departages.score[joueur.index] = score[p]
+        valeurs["buchholz"][joueur.index] = buchholz
+        valeurs["buchholz_median"][joueur.index] = median
+        valeurs["sonneborn_berger"][joueur.index] = sum(score[a] * points for a, points in parties[p])
+        valeurs["progressif"][joueur.index] = progressif[p]
+        valeurs["confrontation"][joueur.index] = sum(points for a, points in parties[p] if a in egalite)
+        valeurs["performance"][joueur.index] = performance(
+            [int(joueurs[a].elo) for a, _ in parties[p]], sum(points for _, points in parties[p]))
+    return departages
+
+
+# Fonction pour calculer la performance Elo d'un joueur (moyenne Elo des adversaires + écart lié au pourcentage)
+def performance(elos_adversaires: List[int], points: float) -> int:
+    if not elos_adversaires:
+        return 0
+    moyenne = sum(elos_adversaires) / len(elos_adversaires)
+    pourcentage = points / len(elos_adversaires)
+    if pourcentage >= 1:
+        ecart = ECART_PERFORMANCE_MAX
+    elif pourcentage <= 0:
+        ecart = -ECART_PERFORMANCE_MAX
+    else:
+        ecart = max(-ECART_PERFORMANCE_MAX, min(ECART_PERFORMANCE_MAX, -400 * math.log10(1 / pourcentage - 1)))
+    return round(moyenne + ecart)
@@ -0,0 +1,407 @@
+# Importation des modules nécessaires
+import contextlib  # Pour les gestionnaires de contexte
+import functools  # Pour conserver le nom des méthodes décorées
+import json  # Pour stocker le classement d'une ronde
+import os  # Pour les opérations liées au système de fichiers
+import sqlite3  # Base de données embarquée de la bibliothèque standard
+import threading  # La connexion est partagée avec le fil de chargement en arrière-plan
+from typing import Dict, Iterable, Iterator, List, Optional  # Pour les annotations de type
+
+from models.depots import Depot, migrer_depot  # Interface commune des couches de stockage et reprise des données
+from models.instrumentation import mesure  # Mesure des temps (si l'instrumentation est activée)
+
+# Schéma normalisé : joueurs, tournois, inscriptions, rondes et matchs
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS joueurs (
+    joueur_index INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    prenom TEXT NOT NULL,
+    date_naissance TEXT NOT NULL,
+    elo INTEGER NOT NULL,
+    historique TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS joueurs_details ON joueurs (nom, prenom, date_naissance);
+CREATE INDEX IF NOT EXISTS joueurs_elo ON joueurs (elo);
+
+CREATE TABLE IF NOT EXISTS tournois (
+    nom TEXT PRIMARY KEY,
+    tournoi_index INTEGER NOT NULL,
+    date_debut TEXT NOT NULL,
+    date_fin TEXT NOT NULL,
+    nb_rondes INTEGER NOT NULL,
+    nb_max_joueurs INTEGER NOT NULL,
+    type_tournoi TEXT NOT NULL,
+    statut TEXT,
+    liste INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS inscriptions (
+    tournoi TEXT NOT NULL,
+    joueur_index INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (tournoi, joueur_index)
+);
+
+CREATE TABLE IF NOT EXISTS rondes (
+    tournoi TEXT NOT NULL REFERENCES tournois (nom) ON DELETE CASCADE ON UPDATE CASCADE,
+    numero INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    statut TEXT NOT NULL,
+    classement TEXT NOT NULL DEFAULT '[]',
+    exempt INTEGER,
+    PRIMARY KEY (tournoi, numero)
+);
+
+CREATE TABLE IF NOT EXISTS matchs (
+    tournoi TEXT NOT NULL,
+    ronde INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    libelle TEXT NOT NULL,
+    score TEXT NOT NULL,
+    blanc INTEGER,
+    noir INTEGER,
+    PRIMARY KEY (tournoi, ronde, position),
+    FOREIGN KEY (tournoi, ronde) REFERENCES rondes (tournoi, numero) ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    cle TEXT PRIMARY KEY,
+    valeur INTEGER NOT NULL
+);
+"""
+
+
+# Requête d'ajout ou de mise à jour d'un joueur
+ENREGISTRER_JOUEUR = (
+    "INSERT INTO joueurs (joueur_index, nom, prenom, date_naissance, elo, historique) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (joueur_index) DO UPDATE SET nom = excluded.nom, prenom = excluded.prenom, "
+    "date_naissance = excluded.date_naissance, elo = excluded.elo, historique = excluded.historique"
+)
+
+
+# Décorateur des méthodes qui utilisent la connexion hors transaction : un seul fil à la fois
+def _exclusif(methode):
+    @functools.wraps(methode)
+    def appel(self, *args, **kwargs):
+        with self._verrou:
+            return methode(self, *args, **kwargs)
+    return appel
+
+
+# Définition de la classe DepotSQLite : stockage des joueurs et tournois dans une base SQLite
+class DepotSQLite(Depot):
+    # Constructeur de la classe DepotSQLite
+    def __init__(self, fichier: str, durabilite: str = "immediat"):
+        dossier = os.path.dirname(fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        self.fichier = fichier  # Chemin de la base de données
+        # Transactions gérées explicitement ; la connexion peut être ouverte par le fil de chargement en arrière-plan
+        # puis utilisée par le fil principal : chaque accès se fait sous le verrou, une transaction le garde
+        # de BEGIN à COMMIT (les requêtes d'un autre fil ne peuvent ni s'y mêler ni la valider)
+        self.connexion = sqlite3.connect(fichier, isolation_level=None, check_same_thread=False)
+        self._verrou = threading.RLock()  # Réentrant : transactions imbriquées et lectures dans une transaction
+        self.connexion.row_factory = sqlite3.Row
+        self.connexion.execute("PRAGMA foreign_keys = ON")
+        self.connexion.execute("PRAGMA journal_mode = WAL")  # Écritures en ajout, lectures non bloquées
+        # Mode "immediat" : fsync à chaque validation ;
+        # sinon fsync aux points de contrôle du WAL (sans risque de corruption)
+        self.connexion.execute(f"PRAGMA synchronous = {'FULL' if durabilite == 'immediat' else 'NORMAL'}")
+        self.connexion.executescript(SCHEMA)
+        self._profondeur = 0  # Niveau d'imbrication des transactions
+        self._entetes: Dict[str, Dict] = {}  # Dernières en-têtes persistées
+        self._rondes: Dict[str, Dict[int, Dict]] = {}  # Dernières rondes persistées, par tournoi
+        self._inscrits: Dict[str, List[int]] = {}  # Derniers inscrits persistés, par tournoi
+
+    # Méthode pour regrouper plusieurs écritures en une seule transaction (les transactions imbriquées sont fusionnées)
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._verrou:  # Gardé jusqu'à la validation : le niveau d'imbrication appartient à un seul fil
+            if self._profondeur == 0:
+                self.connexion.execute("BEGIN IMMEDIATE")
+            self._profondeur += 1
+            try:
+                yield
+            except BaseException:
+                self._profondeur -= 1
+                if self._profondeur == 0:
+                    self.connexion.execute("ROLLBACK")
+                raise
+            self._profondeur -= 1
+            if self._profondeur == 0:
+                with mesure("sqlite.commit", "io"):
+                    self.connexion.execute("COMMIT")
+
+    # Méthode pour charger la liste des joueurs
+    @_exclusif
+    def charger_joueurs(self) -> List[Dict]:
+        lignes = self.connexion.execute(
+            "SELECT joueur_index, nom, prenom, date_naissance, elo, historique FROM joueurs ORDER BY rowid"
+        )
+        return [self._joueur_vers_dict(ligne) for ligne in lignes]
+
+    # Méthode pour enregistrer un joueur ajouté ou modifié
+    def enregistrer_joueur(self, joueur_data: Dict) -> None:
+        with self.transaction():
+            self.connexion.execute(
+                ENREGISTRER_JOUEUR,
+                self._joueur_vers_ligne(joueur_data) + (self._historique_vers_texte(joueur_data),)
+            )
+
+    # Méthode pour enregistrer un lot de joueurs (une seule requête préparée, une seule validation)
+    def enregistrer_joueurs(self, joueurs_data: Iterable[Dict]) -> None:
+        with self.transaction():
+            self.connexion.executemany(
+                ENREGISTRER_JOUEUR,
+                (self._joueur_vers_ligne(joueur_data) + (self._historique_vers_texte(joueur_data),)
+                 for joueur_data in joueurs_data)
+            )
+
+    # Méthode pour supprimer un joueur
+    def supprimer_joueur(self, index: int) -> None:
+        with self.transaction():
+            self.connexion.execute("DELETE FROM joueurs WHERE joueur_index = ?", (index,))
+
+    # Méthode pour enregistrer la liste complète des joueurs
+    def synchroniser_joueurs(self, joueurs_data: List[Dict]) -> None:
+        with self.transaction():
+            index_conserves = [joueur_data['index'] for joueur_data in joueurs_data]
+            self.connexion.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS index_conserves (joueur_index INTEGER PRIMARY KEY)"
+            )
+            self.connexion.execute("DELETE FROM index_conserves")
+            self.connexion.executemany("INSERT OR IGNORE INTO index_conserves VALUES (?)",
+                                       ((i,) for i in index_conserves))
+            self.connexion.execute(
+                "DELETE FROM joueurs WHERE joueur_index NOT IN (SELECT joueur_index FROM index_conserves)"
+            )
+            self.connexion.executemany(
+                ENREGISTRER_JOUEUR,
+                (self._joueur_vers_ligne(joueur_data) + (self._historique_vers_texte(joueur_data),)
+                 for joueur_data in joueurs_data)
+            )
+
+    # Méthode pour charger le plus grand index de joueur jamais attribué (table meta)
+    @_exclusif
+    def charger_index_max(self) -> int:
+        return self._lire_meta("index_max")
+
+    # Méthode pour enregistrer le plus grand index de joueur jamais attribué
+    def enregistrer_index_max(self, index_max: int) -> None:
+        with self.transaction():
+            self._ecrire_meta("index_max", index_max)
+
+    # Méthode pour savoir si les fichiers JSON ont déjà été repris dans la base (table meta)
+    @_exclusif
+    def est_migree(self) -> bool:
+        return bool(self._lire_meta("migration_json"))
+
+    # Méthode pour reprendre les données d'un autre dépôt (fichiers JSON) dans la base
+    #
+    # L'indicateur est écrit dans la transaction de la reprise : une reprise interrompue ne laisse ni données
+    # partielles ni indicateur, et sera refaite au démarrage suivant au lieu de partir d'une base vide.
+    def migrer_depuis(self, source: Depot) -> None:
+        with self.transaction():
+            migrer_depot(source, self)
+            self._ecrire_meta("migration_json", 1)
+
+    # Méthode pour charger les en-têtes des tournois (une seule requête, sans rondes ni matchs)
+    @_exclusif
+    def charger_entetes(self) -> Dict[str, Dict]:
+        lignes = self.connexion.execute("SELECT * FROM tournois WHERE liste = 1 ORDER BY rowid")
+        self._entetes = {ligne["nom"]: self._entete_vers_dict(ligne) for ligne in lignes}
+        return dict(self._entetes)
+
+    # Méthode pour enregistrer les en-têtes des tournois (seules les différences sont écrites)
+    def synchroniser_entetes(self, entetes: Dict[str, Dict]) -> None:
+        with self.transaction():
+            for nom in [nom for nom in self._entetes if nom not in entetes]:
+                self._supprimer_inscriptions(nom)
+                self.connexion.execute("DELETE FROM tournois WHERE nom = ?", (nom,))
+                del self._entetes[nom]
+                self._rondes.pop(nom, None)
+            for nom, entete in entetes.items():
+                if self._entetes.get(nom) != entete:
+                    self._ecrire_entete(nom, entete, liste=True)
+                    self._entetes[nom] = entete
+
+    # Méthode pour charger les données complètes d'un tournoi
+    @_exclusif
+    def charger_tournoi(self, nom: str) -> Dict:
+        ligne = self.connexion.execute("SELECT * FROM tournois WHERE nom = ?", (nom,)).fetchone()
+        if ligne is None or ligne["statut"] is None:
+            return {}
+        inscrits = [row[0] for row in self.connexion.execute(
+            "SELECT joueur_index FROM inscriptions WHERE tournoi = ? ORDER BY position", (nom,)
+        )]
+        self._inscrits[nom] = inscrits
+        matchs: Dict[int, List[Dict]] = {}
+        for row in self.connexion.execute(
+            "SELECT ronde, libelle, score, blanc, noir FROM matchs WHERE tournoi = ? ORDER BY ronde, position",
+            (nom,)
+        ):
+            match_data = {"match": row["libelle"], "score": row["score"]}
+            if row["blanc"] is not None:
+                match_data["blanc"] = row["blanc"]
+                match_data["noir"] = row["noir"]
+            matchs.setdefault(row["ronde"], []).append(match_data)
+        rondes = [
+            {
+                "numero": row["numero"],
+                "date": row["date"],
+                "statut": row["statut"],
+                "matchs": matchs.get(row["numero"], []),
+                "classement_apres_ronde": json.loads(row["classement"]),
+                **({"exempt": row["exempt"]} if row["exempt"] is not None else {})
+            }
+            for row in self.connexion.execute("SELECT * FROM rondes WHERE tournoi = ? ORDER BY numero", (nom,))
+        ]
+        self._rondes[nom] = {ronde["numero"]: ronde for ronde in rondes}
+        return {
+            **self._entete_vers_dict(ligne),
+            "nb_inscrits": len(inscrits),
+            "statut": ligne["statut"],
+            "joueurs_inscrits": inscrits,
+            "rondes": rondes
+        }
+
+    # Méthode pour enregistrer les données complètes d'un tournoi en une transaction
+    def synchroniser_tournoi(self, nom: str, data: Dict) -> None:
+        with self.transaction():
+            self._ecrire_entete(nom, data, liste=False)
+            self.connexion.execute("UPDATE tournois SET statut = ? WHERE nom = ?",
+                                   (data.get("statut", "En attente"), nom))
+            inscrits = list(data.get("joueurs_inscrits", []))
+            if self._inscrits.get(nom) != inscrits:  # Liste des index réécrite seulement si elle a changé
+                self.connexion.execute("DELETE FROM inscriptions WHERE tournoi = ?", (nom,))
+                self.connexion.executemany(
+                    "INSERT OR IGNORE INTO inscriptions (tournoi, joueur_index, position) VALUES (?, ?, ?)",
+                    ((nom, index, position) for position, index in enumerate(inscrits))
+                )
+                self._inscrits[nom] = inscrits
+            persistees = self._rondes.setdefault(nom, {})
+            numeros = {ronde_data["numero"] for ronde_data in data.get("rondes", [])}
+            for numero in [numero for numero in persistees if numero not in numeros]:
+                self.connexion.execute("DELETE FROM rondes WHERE tournoi = ? AND numero = ?", (nom, numero))
+                del persistees[numero]
+            for ronde_data in data.get("rondes", []):
+                persistee = persistees.get(ronde_data["numero"])  # Même dictionnaire si la ronde n'a pas changé
+                if persistee is not ronde_data and persistee != ronde_data:  # Seules les rondes modifiées sont écrites
+                    self._ecrire_ronde(nom, ronde_data)
+                    persistees[ronde_data["numero"]] = ronde_data
+
+    # Méthode pour lire les copies de joueurs de l'ancien format (la base n'enregistre que les inscriptions)
+    def charger_joueurs_tournoi(self, nom: str) -> Optional[List[Dict]]:
+        return None
+
+    # Méthode pour supprimer toutes les données d'un tournoi
+    @_exclusif
+    def supprimer_tournoi(self, nom: str) -> None:
+        with self.transaction():
+            self._supprimer_inscriptions(nom)
+            self.connexion.execute("DELETE FROM tournois WHERE nom = ?", (nom,))
+        self._entetes.pop(nom, None)
+        self._rondes.pop(nom, None)
+        self._inscrits.pop(nom, None)
+
+    # Méthode pour lister les tournois qui référencent un joueur (inscriptions, matchs, exempts : sans lire les rondes)
+    @_exclusif
+    def tournois_du_joueur(self, index: int) -> List[str]:
+        lignes = self.connexion.execute(
+            "SELECT tournoi FROM inscriptions WHERE joueur_index = ? "
+            "UNION SELECT tournoi FROM matchs WHERE blanc = ? OR noir = ? "
+            "UNION SELECT tournoi FROM rondes WHERE exempt = ? ORDER BY tournoi",
+            (index, index, index, index)
+        )
+        return [ligne["tournoi"] for ligne in lignes]
+
+    # Méthode pour fermer la connexion à la base
+    @_exclusif
+    def fermer(self) -> None:
+        self.connexion.close()
+
+    # Méthode pour forcer l'écriture sur disque des transactions validées (point de contrôle du WAL)
+    @_exclusif
+    def vider(self) -> None:
+        with mesure("sqlite.checkpoint", "io"):
+            self.connexion.execute("PRAGMA wal_checkpoint(FULL)")
+
+    # Méthodes internes de conversion et d'écriture
+    def _lire_meta(self, cle: str) -> int:
+        ligne = self.connexion.execute("SELECT valeur FROM meta WHERE cle = ?", (cle,)).fetchone()
+        return ligne[0] if ligne else 0
+
+    def _ecrire_meta(self, cle: str, valeur: int) -> None:
+        self.connexion.execute(
+            "INSERT INTO meta (cle, valeur) VALUES (?, ?) ON CONFLICT (cle) DO UPDATE SET valeur = excluded.valeur",
+            (cle, valeur)
+        )
+
+    def _supprimer_inscriptions(self, nom: str) -> None:
+        self.connexion.execute("DELETE FROM inscriptions WHERE tournoi = ?", (nom,))
+        self._inscrits.pop(nom, None)
+
+    def _ecrire_entete(self, nom: str, entete: Dict, liste: bool) -> None:
+        self.connexion.execute(
+            "INSERT INTO tournois "
+            "(nom, tournoi_index, date_debut, date_fin, nb_rondes, nb_max_joueurs, type_tournoi, liste) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (nom) DO UPDATE SET tournoi_index = excluded.tournoi_index, "
+            "date_debut = excluded.date_debut, date_fin = excluded.date_fin, nb_rondes = excluded.nb_rondes, "
+            "nb_max_joueurs = excluded.nb_max_joueurs, type_tournoi = excluded.type_tournoi, "
+            "liste = MAX(liste, excluded.liste)",
+            (nom, entete["index"], entete["date_debut"], entete["date_fin"], int(entete["nb_rondes"]),
+             int(entete["nb_max_joueurs"]), entete["type_tournoi"], int(liste))
+        )
+
+    def _ecrire_ronde(self, nom: str, ronde_data: Dict) -> None:
+        numero = ronde_data["numero"]
+        self.connexion.execute(
+            "INSERT INTO rondes (tournoi, numero, date, statut, classement, exempt) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (tournoi, numero) DO UPDATE SET date = excluded.date, statut = excluded.statut, "
+            "classement = excluded.classement, exempt = excluded.exempt",
+            (nom, numero, ronde_data["date"], ronde_data["statut"],
+             json.dumps(ronde_data.get("classement_apres_ronde", []), ensure_ascii=False), ronde_data.get("exempt"))
+        )
+        self.connexion.execute("DELETE FROM matchs WHERE tournoi = ? AND ronde = ?", (nom, numero))
+        self.connexion.executemany(
+            "INSERT INTO matchs (tournoi, ronde, position, libelle, score, blanc, noir) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((nom, numero, position, match_data["match"], match_data["score"],
+              match_data.get("blanc"), match_data.get("noir"))
+             for position, match_data in enumerate(ronde_data.get("matchs", [])))
+        )
+
+    @staticmethod
+    def _joueur_vers_ligne(joueur_data: Dict) -> tuple:
+        return (joueur_data['index'], joueur_data['nom'], joueur_data['prenom'],
+                joueur_data['date_naissance'], int(joueur_data['elo']))
+
+    @staticmethod
+    def _historique_vers_texte(joueur_data: Dict) -> str:
+        historique = joueur_data.get('historique_elo')
+        return json.dumps(historique, ensure_ascii=False) if historique else "[]"  # Cas courant d'un import : vide
+
+    @staticmethod
+    def _joueur_vers_dict(ligne: sqlite3.Row) -> Dict:
+        joueur_data = {
+            'index': ligne['joueur_index'],
+            'nom': ligne['nom'],
+            'prenom': ligne['prenom'],
+            'date_naissance': ligne['date_naissance'],
+            'elo': ligne['elo']
+        }
+        historique = json.loads(ligne['historique'])
+        if historique:  # Absent tant que vide, comme dans joueur.json
+            joueur_data['historique_elo'] = historique
+        return joueur_data
+
+    @staticmethod
+    def _entete_vers_dict(ligne: sqlite3.Row) -> Dict:
+        return {
+            "index": ligne["tournoi_index"],
+            "nom_tournoi": ligne["nom"],
+            "date_debut": ligne["date_debut"],
+            "date_fin": ligne["date_fin"],
+            "nb_rondes": ligne["nb_rondes"],
+            "nb_max_joueurs": ligne["nb_max_joueurs"],
+            "type_tournoi": ligne["type_tournoi"]
+        }
@@ -0,0 +1,362 @@
+# Importation des modules nécessaires
+import contextlib  # Pour les gestionnaires de contexte
+import os  # Pour les opérations liées au système de fichiers
+from typing import Dict, Iterable, Iterator, List, Optional  # Pour les annotations de type
+
+import config  # Paramètres de l'application (choix du stockage)
+from models.journal import Journal  # Stockage en ajout seul des modifications
+from models.persistance import Persistance, obtenir_persistance  # Écritures atomiques et durabilité
+
+
+# Définition de la classe Depot : interface commune des couches de stockage
+class Depot:
+    # Méthode pour charger la liste des joueurs (dictionnaires au format de joueur.json)
+    def charger_joueurs(self) -> List[Dict]:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer un joueur ajouté ou modifié
+    def enregistrer_joueur(self, joueur_data: Dict) -> None:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer un lot de joueurs ajoutés ou modifiés en une seule écriture
+    def enregistrer_joueurs(self, joueurs_data: Iterable[Dict]) -> None:
+        with self.transaction():
+            for joueur_data in joueurs_data:
+                self.enregistrer_joueur(joueur_data)
+
+    # Méthode pour supprimer un joueur
+    def supprimer_joueur(self, index: int) -> None:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer la liste complète des joueurs (seules les différences sont écrites)
+    def synchroniser_joueurs(self, joueurs_data: List[Dict]) -> None:
+        raise NotImplementedError
+
+    # Méthode pour charger le plus grand index de joueur jamais attribué (0 si aucun n'a été enregistré)
+    #
+    # Les tournois référencent les joueurs par leur index : un index libéré par une suppression ne doit jamais
+    # être réattribué. Le maximum est donc enregistré à part, et non déduit des joueurs restants.
+    def charger_index_max(self) -> int:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer le plus grand index de joueur jamais attribué
+    def enregistrer_index_max(self, index_max: int) -> None:
+        raise NotImplementedError
+
+    # Méthode pour charger les en-têtes des tournois (nom -> données au format de tournaments.json)
+    def charger_entetes(self) -> Dict[str, Dict]:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer les en-têtes des tournois (seules les différences sont écrites)
+    def synchroniser_entetes(self, entetes: Dict[str, Dict]) -> None:
+        raise NotImplementedError
+
+    # Méthode pour charger les données complètes d'un tournoi (dictionnaire vide s'il n'existe pas)
+    def charger_tournoi(self, nom: str) -> Dict:
+        raise NotImplementedError
+
+    # Méthode pour enregistrer les données complètes d'un tournoi (seules les rondes modifiées sont écrites)
+    def synchroniser_tournoi(self, nom: str, data: Dict) -> None:
+        raise NotImplementedError
+
+    # Méthode pour lire les copies de joueurs de l'ancien format (None si le tournoi n'en a pas)
+    #
+    # Les tournois ne copient plus leurs joueurs : ils enregistrent seulement leurs index ("joueurs_inscrits").
+    # Cette lecture sert aux tournois enregistrés avant ce changement.
+    def charger_joueurs_tournoi(self, nom: str) -> Optional[List[Dict]]:
+        raise NotImplementedError
+
+    # Méthode pour supprimer toutes les données d'un tournoi
+    def supprimer_tournoi(self, nom: str) -> None:
+        raise NotImplementedError
+
+    # Méthode pour lister les tournois qui référencent un joueur (inscrit, joueur d'un match ou exempt)
+    #
+    # Les tournois n'enregistrent que l'index de leurs joueurs : un joueur référencé ne peut pas être supprimé
+    # sans rendre ces tournois impossibles à recharger. Implémentation générique : lecture de chaque tournoi.
+    def tournois_du_joueur(self, index: int) -> List[str]:
+        return [nom for nom in self.charger_entetes() if joueur_reference(self.charger_tournoi(nom), index)]
+
+    # Méthode pour écrire les fichiers d'export complets (sans effet pour les dépôts sans export)
+    def exporter(self) -> None:
+        pass
+
+    # Méthode pour écrire les fichiers d'export d'un tournoi (sans effet pour les dépôts sans export)
+    def exporter_tournoi(self, nom: str) -> None:
+        pass
+
+    # Méthode pour regrouper plusieurs écritures en une seule transaction
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        yield
+
+    # Méthode pour forcer l'écriture sur disque des modifications en attente (modes "periodique" et "manuel")
+    def vider(self) -> None:
+        pass
+
+
+CLE_INDEX_MAX = "index_max"  # Clé du journal des joueurs réservée au plus grand index attribué (jamais un index)
+
+
+# Fonction pour découper les données d'un tournoi en sections journalisables (en-tête et une section par ronde)
+def sections_tournoi(data: Dict) -> Dict[str, Dict]:
+    if not data:
+        return {}
+    sections = {"entete": {cle: valeur for cle, valeur in data.items() if cle != "rondes"}}
+    for ronde_data in data.get("rondes", []):
+        sections[f"ronde:{ronde_data['numero']}"] = ronde_data
+    return sections
+
+
+# Fonction pour reconstituer le format d'export d'un tournoi à partir de ses sections
+def exporter_sections_tournoi(sections: Dict[str, Dict]) -> Dict:
+    rondes = sorted((cle for cle in sections if cle.startswith("ronde:")), key=lambda cle: int(cle.split(":")[1]))
+    return {**sections.get("entete", {}), "rondes": [sections[cle] for cle in rondes]}
+
+
+# Fonction pour savoir si les données d'un tournoi référencent l'index d'un joueur
+def joueur_reference(data: Dict, index: int) -> bool:
+    if index in data.get("joueurs_inscrits", ()):
+        return True
+    for ronde_data in data.get("rondes", []):
+        if ronde_data.get("exempt") == index:
+            return True
+        if any(match_data.get("blanc") == index or match_data.get("noir") == index
+               for match_data in ronde_data.get("matchs", [])):
+            return True
+    return False
+
+
+# Fonction pour indexer une liste de joueurs par leur index (clés du journal)
+def sections_joueurs(joueurs_data: Optional[Iterable[Dict]]) -> Dict[str, Dict]:
+    return {str(joueur_data['index']): joueur_data for joueur_data in joueurs_data or []}
+
+
+# Fonction pour reconstituer une liste de joueurs à partir des clés du journal
+def exporter_sections_joueurs(sections: Dict[str, Dict]) -> List[Dict]:
+    return list(sections.values())
+
+
+# Fonction pour découper joueur.json en sections : un joueur par index, plus le plus grand index attribué
+#
+# joueur.json est un objet {"index_max": ..., "joueurs": [...]} ; l'ancien format (liste seule) est toujours lu.
+def sections_fichier_joueurs(data) -> Dict[str, object]:
+    if not isinstance(data, dict):
+        return sections_joueurs(data)
+    sections: Dict[str, object] = dict(sections_joueurs(data.get("joueurs")))
+    if "index_max" in data:
+        sections[CLE_INDEX_MAX] = data["index_max"]
+    return sections
+
+
+# Fonction pour reconstituer joueur.json à partir des clés du journal
+def exporter_sections_fichier_joueurs(sections: Dict[str, object]) -> Dict:
+    return {
+        "index_max": sections.get(CLE_INDEX_MAX, 0),
+        "joueurs": [joueur_data for cle, joueur_data in sections.items() if cle != CLE_INDEX_MAX]
+    }
+
+
+# Définition de la classe DepotJSON : fichiers JSON d'export + journaux en ajout seul
+class DepotJSON(Depot):
+    # Constructeur de la classe DepotJSON
+    def __init__(self, racine: str = "data", persistance: Optional[Persistance] = None):
+        self.racine = racine  # Dossier contenant les fichiers de données
+        self._journaux: Dict[str, Journal] = {}  # Journaux ouverts, par chemin de fichier
+        self.persistance = persistance or obtenir_persistance()  # Écritures regroupées et durabilité
+
+    # Méthode pour obtenir le chemin du fichier d'un tournoi
+    def fichier_tournoi(self, nom: str, suffixe: str = "") -> str:
+        return os.path.join(self.racine, "tournaments", f"{nom.replace(' ', '_')}{suffixe}.json")
+
+    # Méthode pour charger la liste des joueurs
+    def charger_joueurs(self) -> List[Dict]:
+        fichier = os.path.join(self.racine, "joueur.json")
+        journal = self._journal(fichier, sections_fichier_joueurs, exporter_sections_fichier_joueurs, recharger=True)
+        if not journal.etat and not os.path.exists(fichier):
+            print(f"Fichier {fichier} non trouvé. Création d'une nouvelle liste de joueurs.")
+        return [joueur_data for cle, joueur_data in journal.etat.items() if cle != CLE_INDEX_MAX]
+
+    # Méthode pour enregistrer un joueur ajouté ou modifié
+    def enregistrer_joueur(self, joueur_data: Dict) -> None:
+        self._journal_joueurs().enregistrer(str(joueur_data['index']), joueur_data)
+
+    # Méthode pour enregistrer un lot de joueurs (au-delà du seuil de compaction : une seule réécriture de joueur.json)
+    def enregistrer_joueurs(self, joueurs_data: Iterable[Dict]) -> None:
+        self._journal_joueurs().enregistrer_lot(sections_joueurs(joueurs_data))
+
+    # Méthode pour supprimer un joueur
+    def supprimer_joueur(self, index: int) -> None:
+        self._journal_joueurs().supprimer(str(index))
+
+    # Méthode pour enregistrer la liste complète des joueurs (le plus grand index attribué est conservé)
+    def synchroniser_joueurs(self, joueurs_data: List[Dict]) -> None:
+        journal = self._journal_joueurs()
+        sections: Dict[str, object] = dict(sections_joueurs(joueurs_data))
+        if CLE_INDEX_MAX in journal.etat:
+            sections[CLE_INDEX_MAX] = journal.etat[CLE_INDEX_MAX]
+        journal.synchroniser(sections)
+
+    # Méthode pour charger le plus grand index de joueur jamais attribué (fichier joueur.json puis journal)
+    def charger_index_max(self) -> int:
+        return int(self._journal_joueurs().etat.get(CLE_INDEX_MAX, 0))
+
+    # Méthode pour enregistrer le plus grand index de joueur jamais attribué (ignoré s'il n'a pas changé)
+    def enregistrer_index_max(self, index_max: int) -> None:
+        self._journal_joueurs().enregistrer(CLE_INDEX_MAX, index_max)
+
+    # Méthode pour charger les en-têtes des tournois
+    def charger_entetes(self) -> Dict[str, Dict]:
+        return dict(self._journal_entetes(recharger=True).etat)
+
+    # Méthode pour enregistrer les en-têtes des tournois
+    def synchroniser_entetes(self, entetes: Dict[str, Dict]) -> None:
+        self._journal_entetes().synchroniser(entetes)
+
+    # Méthode pour charger les données complètes d'un tournoi
+    def charger_tournoi(self, nom: str) -> Dict:
+        journal = self._journal_tournoi(nom)
+        return exporter_sections_tournoi(journal.etat) if journal.etat else {}
+
+    # Méthode pour enregistrer les données complètes d'un tournoi
+    def synchroniser_tournoi(self, nom: str, data: Dict) -> None:
+        self._journal_tournoi(nom).synchroniser(sections_tournoi(data))
+
+    # Méthode pour lire l'ancien fichier <nom>_joueurs.json d'un tournoi (plus jamais écrit)
+    def charger_joueurs_tournoi(self, nom: str) -> Optional[List[Dict]]:
+        journal = self._journal_joueurs_tournoi(nom)
+        if journal.etat or os.path.exists(journal.fichier) or os.path.exists(journal.fichier_journal):
+            return list(journal.etat.values())
+        return None
+
+    # Méthode pour supprimer les fichiers d'un tournoi et leurs journaux (y compris l'ancienne copie des joueurs)
+    def supprimer_tournoi(self, nom: str) -> None:
+        self._journal_tournoi(nom).detruire()
+        self._journal_joueurs_tournoi(nom).detruire()
+
+    # Méthode pour réécrire tous les fichiers JSON ouverts et vider leurs journaux
+    def exporter(self) -> None:
+        for journal in self._journaux.values():
+            if journal.etat or os.path.exists(journal.fichier_journal):
+                journal.compacter()
+
+    # Méthode pour réécrire les fichiers JSON d'un tournoi et vider leurs journaux
+    def exporter_tournoi(self, nom: str) -> None:
+        self._journal_tournoi(nom).compacter()
+
+    # Méthode pour regrouper les sauvegardes : une seule écriture par fichier à la fin de la transaction
+    def transaction(self) -> contextlib.AbstractContextManager:
+        return self.persistance.transaction()
+
+    # Méthode pour forcer l'écriture sur disque des modifications en attente
+    def vider(self) -> None:
+        self.persistance.vider()
+
+    # Méthodes internes d'accès aux journaux
+    def _journal_joueurs(self) -> Journal:
+        fichier = os.path.join(self.racine, "joueur.json")
+        return self._journal(fichier, sections_fichier_joueurs, exporter_sections_fichier_joueurs)
+
+    def _journal_entetes(self, recharger: bool = False) -> Journal:
+        fichier = os.path.join(self.racine, "tournaments.json")
+        return self._journal(fichier, lambda data: dict(data or {}), dict, recharger)
+
+    def _journal_tournoi(self, nom: str) -> Journal:
+        return self._journal(self.fichier_tournoi(nom), sections_tournoi, exporter_sections_tournoi)
+
+    def _journal_joueurs_tournoi(self, nom: str) -> Journal:
+        return self._journal(self.fichier_tournoi(nom, "_joueurs"), sections_joueurs, exporter_sections_joueurs)
+
+    def _journal(self, fichier: str, vers_sections, vers_export, recharger: bool = False) -> Journal:
+        journal = self._journaux.get(fichier)
+        if journal is None or recharger:
+            journal = Journal(fichier, vers_export, self.persistance)
+            journal.charger(vers_sections(journal.lire_export()))  # Fichier d'export puis rejeu du journal
+            self._journaux[fichier] = journal
+        return journal
+
+
+# Définition de la classe DepotInstantane : copie en mémoire, en lecture seule, de données déjà chargées
+#
+# Sert aux processus de publication : ils reconstruisent les tournois depuis l'instantané transmis une fois
+# à leur démarrage, sans relire les fichiers ni ouvrir la base, et ne peuvent rien modifier.
+class DepotInstantane(Depot):
+    # Constructeur de la classe DepotInstantane
+    def __init__(self, joueurs_data: List[Dict], tournois_data: Dict[str, Dict]):
+        self.joueurs_data = joueurs_data  # Joueurs au format de joueur.json
+        self.tournois_data = tournois_data  # Nom -> données complètes du tournoi
+
+    # Méthode pour charger la liste des joueurs
+    def charger_joueurs(self) -> List[Dict]:
+        return self.joueurs_data
+
+    # Méthode pour charger le plus grand index attribué (déduit des joueurs de l'instantané, jamais modifié)
+    def charger_index_max(self) -> int:
+        return 0
+
+    # Méthode pour charger les en-têtes des tournois
+    def charger_entetes(self) -> Dict[str, Dict]:
+        return self.tournois_data
+
+    # Méthode pour charger les données complètes d'un tournoi
+    def charger_tournoi(self, nom: str) -> Dict:
+        return self.tournois_data.get(nom, {})
+
+    # Méthode pour lire les copies de joueurs de l'ancien format (l'instantané contient déjà tous les inscrits)
+    def charger_joueurs_tournoi(self, nom: str) -> Optional[List[Dict]]:
+        return None
+
+    # Méthode interne appelée par toutes les écritures
+    def _lecture_seule(self, *args, **kwargs) -> None:
+        raise PermissionError("Instantané en lecture seule : aucune modification n'est possible.")
+
+    enregistrer_joueur = enregistrer_joueurs = supprimer_joueur = synchroniser_joueurs = _lecture_seule
+    enregistrer_index_max = _lecture_seule
+    synchroniser_entetes = synchroniser_tournoi = supprimer_tournoi = _lecture_seule
+
+
+# Fonction pour copier toutes les données d'un dépôt vers un autre
+def migrer_depot(source: Depot, cible: Depot) -> None:
+    with cible.transaction():
+        joueurs_data = source.charger_joueurs()
+        cible.synchroniser_joueurs(joueurs_data)
+        index_max = max([source.charger_index_max()] + [joueur_data['index'] for joueur_data in joueurs_data])
+        cible.enregistrer_index_max(index_max)  # Index des joueurs supprimés jamais réattribués après la migration
+        entetes = source.charger_entetes()
+        cible.synchroniser_entetes(entetes)
+        for nom in entetes:
+            data = source.charger_tournoi(nom)
+            if data and "joueurs_inscrits" not in data:  # Ancien format : inscrits déduits de la copie des joueurs
+                copies = source.charger_joueurs_tournoi(nom) or []
+                data["joueurs_inscrits"] = [joueur_data['index'] for joueur_data in copies]
+            if data:
+                cible.synchroniser_tournoi(nom, data)
+
+
+_depot_par_defaut: Optional[Depot] = None  # Dépôt partagé par les gestionnaires
+
+
+# Fonction pour obtenir le dépôt configuré dans config.py (créé une seule fois)
+def obtenir_depot() -> Depot:
+    global _depot_par_defaut
+    if _depot_par_defaut is None:
+        if config.STOCKAGE == "sqlite":
+            # Import à la demande : dépendance facultative de l'application
+            from models.depot_sqlite import DepotSQLite
+            base = DepotSQLite(config.FICHIER_SQLITE, config.DURABILITE)
+            if not base.est_migree():  # Première utilisation (ou reprise interrompue) : fichiers JSON existants
+                try:
+                    base.migrer_depuis(DepotJSON(config.DOSSIER_DONNEES))
+                except BaseException:
+                    base.fermer()  # Rien n'a été validé : la reprise sera refaite au prochain démarrage
+                    raise
+            _depot_par_defaut = base
+        else:
+            _depot_par_defaut = DepotJSON(config.DOSSIER_DONNEES)
+    return _depot_par_defaut
+
+
+# Fonction pour remplacer le dépôt par défaut (autre dossier de données, autre moteur)
+def definir_depot(depot: Optional[Depot]) -> None:
+    global _depot_par_defaut
+    _depot_par_defaut = depot
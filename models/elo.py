@@ -0,0 +1,125 @@
+# Importation des modules nécessaires
+import datetime  # Pour manipuler les dates
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple  # Pour les annotations de type
+
+from models.joueur_model import Joueur, JoueurManager  # Joueurs et gestionnaire des joueurs
+from models.import_joueurs import ELO_NON_CLASSE  # Elo des joueurs entrés sans classement
+from models.classement import POINTS_CODE  # Barème des points
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.tournoi_model
+    from models.tournoi_model import Ronde, Tournoi
+
+ECART_MAX = 400  # Règle des 400 points : écart Elo maximal pris en compte
+TABLE_ESPERANCE = [1 / (1 + 10 ** (-ecart / 400)) for ecart in range(ECART_MAX + 1)]  # Score attendu par écart
+K_DEBUTANT = 40  # Moins de 30 parties depuis un premier classement, ou moins de 18 ans sous 2300
+K_STANDARD = 20  # Joueur n'ayant jamais atteint 2400
+K_ELITE = 10  # Joueur ayant déjà atteint 2400
+PARTIES_DEBUTANT = 30  # Nombre de parties avant de quitter le coefficient débutant
+
+
+# Fonction pour obtenir le score attendu d'un joueur selon l'écart Elo avec son adversaire (lecture de table)
+def esperance(ecart: int) -> float:
+    ecart = max(-ECART_MAX, min(ECART_MAX, ecart))
+    return TABLE_ESPERANCE[ecart] if ecart >= 0 else 1 - TABLE_ESPERANCE[-ecart]
+
+
+# Fonction pour obtenir le coefficient K d'un joueur à une date donnée (règles FIDE)
+def coefficient_k(joueur: Joueur, date: datetime.date) -> int:
+    age = date.year - joueur.date_naissance.year  # Âge atteint au cours de l'année
+    if est_debutant(joueur) or (age < 18 and joueur.elo < 2300):
+        return K_DEBUTANT
+    if max(joueur.elo, joueur.elo_max) >= 2400:  # 2400 atteint une fois : K réduit définitivement
+        return K_ELITE
+    return K_STANDARD
+
+
+# Fonction pour savoir si un joueur a joué moins de PARTIES_DEBUTANT parties depuis son premier classement
+#
+# Seules les parties d'un joueur entré sans classement (ELO_NON_CLASSE) sont toutes dans l'historique :
+# un Elo saisi ou importé vient d'un classement établi ailleurs, dont les parties ne sont pas comptées.
+def est_debutant(joueur: Joueur) -> bool:
+    if joueur.nb_parties >= PARTIES_DEBUTANT:
+        return False
+    premiere = joueur.historique_elo[0] if joueur.historique_elo else None
+    elo_initial = premiere["elo"] - premiere["variation"] if premiere else joueur.elo  # Elo avant la première partie
+    return int(elo_initial) <= ELO_NON_CLASSE
+
+
+# Fonction pour calculer les variations Elo d'un lot de parties (Elo d'avant le lot pour toutes les parties)
+#
+# parties : liste de (index blancs, index noirs, points des blancs). Un seul parcours cumule pour chaque joueur
+# l'écart entre score obtenu et score attendu, multiplié ensuite par son coefficient K.
+def calculer_variations(parties: Iterable[Tuple[int, int, float]], elos: Dict[int, int],
+                        coefficients: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
+    ecarts: Dict[int, float] = {}
+    nombres: Dict[int, int] = {}
+    for blanc, noir, points_blanc in parties:
+        attendu = esperance(elos[blanc] - elos[noir])
+        ecarts[blanc] = ecarts.get(blanc, 0.0) + points_blanc - attendu
+        ecarts[noir] = ecarts.get(noir, 0.0) + attendu - points_blanc  # (1 - points) - (1 - attendu)
+        nombres[blanc] = nombres.get(blanc, 0) + 1
+        nombres[noir] = nombres.get(noir, 0) + 1
+    return {index: (round(coefficients[index] * ecart), nombres[index]) for index, ecart in ecarts.items()}
+
+
+# Définition de la classe MoteurElo : mise à jour des Elo après une ronde, un tournoi ou une saison
+class MoteurElo:
+    # Constructeur de la classe MoteurElo
+    def __init__(self, joueur_manager: JoueurManager):
+        self.joueur_manager = joueur_manager  # Gestionnaire des joueurs (Elo de référence et historique)
+
+    # Méthode pour mettre à jour les Elo après une ronde d'un tournoi
+    def noter_ronde(self, tournoi: 'Tournoi', numero_ronde: int) -> Dict[int, Tuple[int, int]]:
+        if numero_ronde <= 0 or numero_ronde > len(tournoi.rondes):
+            print(f"Numéro de ronde invalide. Il y a {len(tournoi.rondes)} rondes dans ce tournoi.")
+            return {}
+        ronde = tournoi.rondes[numero_ronde - 1]
+        if self._deja_note(self.joueur_manager.rondes_notees, tournoi, ronde.numero):
+            print(f"La ronde {ronde.numero} du tournoi {tournoi.nom} a déjà été prise en compte.")
+            return {}
+        variations = self._variations(tournoi, [ronde])
+        self.joueur_manager.appliquer_variations_elo(variations, tournoi.nom, ronde.numero, ronde.date.date())
+        return variations
+
+    # Méthode pour mettre à jour les Elo après un tournoi complet (un seul lot, Elo d'avant le tournoi)
+    def noter_tournoi(self, tournoi: 'Tournoi') -> Dict[int, Tuple[int, int]]:
+        if self._deja_note(self.joueur_manager.rondes_notees, tournoi):
+            print(f"Le tournoi {tournoi.nom} a déjà été pris en compte.")
+            return {}
+        variations = self._variations(tournoi, tournoi.rondes)
+        self.joueur_manager.appliquer_variations_elo(variations, tournoi.nom, None, tournoi.date_fin)
+        return variations
+
+    # Méthode pour recalculer une saison : tournois dans l'ordre chronologique, une seule écriture à la fin
+    def noter_saison(self, tournois: Iterable['Tournoi']) -> int:
+        modifies = set()
+        notees = self.joueur_manager.rondes_notees  # Tenu à jour à chaque tournoi noté
+        for tournoi in sorted(tournois, key=lambda t: (t.date_debut, t.index)):
+            if self._deja_note(notees, tournoi):
+                continue
+            variations = self._variations(tournoi, tournoi.rondes)
+            self.joueur_manager.appliquer_variations_elo(variations, tournoi.nom, None, tournoi.date_fin,
+                                                         sauvegarder=False)
+            modifies.update(variations)
+        self.joueur_manager.enregistrer_joueurs(modifies)  # Une seule transaction pour toute la saison
+        return len(modifies)
+
+    # Méthode interne pour calculer les variations d'un lot de rondes
+    def _variations(self, tournoi: 'Tournoi', rondes: Iterable['Ronde']) -> Dict[int, Tuple[int, int]]:
+        joueurs = self.joueur_manager.registre
+        parties: List[Tuple[int, int, float]] = []
+        for ronde in rondes:
+            for blanc, noir, code in ronde.parties():  # Lecture directe des colonnes de la ronde
+                if code and blanc in joueurs and noir in joueurs:  # Parties jouées entre joueurs connus
+                    parties.append((blanc, noir, POINTS_CODE[code][0]))
+        concernes = {index for partie in parties for index in partie[:2]}
+        elos = {index: int(joueurs.par_index(index).elo) for index in concernes}  # Elo d'avant le lot
+        coefficients = {index: coefficient_k(joueurs.par_index(index), tournoi.date_fin) for index in concernes}
+        return calculer_variations(parties, elos, coefficients)
+
+    # Méthode interne pour savoir si un tournoi (ou l'une de ses rondes) figure déjà dans l'historique
+    @staticmethod
+    def _deja_note(notees: Dict[str, Set[Optional[int]]], tournoi: 'Tournoi',
+                   numero_ronde: Optional[int] = None) -> bool:
+        rondes = notees.get(tournoi.nom, set())
+        return bool(rondes) if numero_ronde is None else bool(rondes & {None, numero_ronde})
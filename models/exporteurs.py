@@ -0,0 +1,500 @@
+# Importation des modules nécessaires
+import csv  # Pour écrire les exports CSV
+import functools  # Pour le cache des modèles compilés
+import html  # Pour échapper le texte des exports HTML
+import io  # Pour formater les lignes CSV
+import itertools  # Pour répéter les paramètres communs à tous les tournois exportés
+import os  # Pour les opérations liées au système de fichiers
+import re  # Pour construire des noms de fichiers sûrs
+import string  # Pour les modèles de mise en page ($titre, $contenu...)
+from typing import (  # Pour les annotations de type
+    TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+)
+
+import config  # Paramètres de l'application (dossier des modèles personnalisés)
+from models.colonnes_matchs import RESULTATS  # Résultat correspondant à chaque code
+from models.cache_fichiers import obtenir_cache  # Modèles personnalisés relus seulement s'ils ont changé
+from models.departages import LIBELLES_DEPARTAGES, ORDRE_DEPARTAGES, Departages  # Colonnes du classement
+from models.depots import DepotInstantane  # Copie en lecture seule transmise aux processus de publication
+from models.instrumentation import chronometre, compter  # Mesure des temps (si l'instrumentation est activée)
+from models.persistance import ecrire_atomique_flux  # Écriture atomique d'un fichier produit au fil de l'eau
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.tournoi_model
+    from models.joueur_model import Joueur, JoueurManager
+    from models.tournoi_model import Tournoi
+
+DOSSIER_EXPORTS = "exports"  # Dossier par défaut des exports
+
+# Modèles de mise en page intégrés, par format ; un fichier "<DOSSIER_MODELES>/<format>/<nom>.tmpl" les remplace.
+# Le modèle "page" entoure le document : $contenu y marque la place des tableaux, écrits au fil de l'eau.
+MODELES: Dict[str, Dict[str, str]] = {
+    "html": {
+        "page": ("<!DOCTYPE html>\n<html lang=\"fr\">\n<head>\n<meta charset=\"utf-8\">\n<title>$titre</title>\n"
+                 "<style>table{border-collapse:collapse;margin-bottom:1.5em}"
+                 "th,td{border:1px solid #999;padding:2px 8px}th{background:#eee}</style>\n"
+                 "</head>\n<body>\n<h1>$titre</h1>\n$contenu</body>\n</html>\n"),
+        "tableau": "<h2>$titre</h2>\n<table>\n<thead><tr>$entetes</tr></thead>\n<tbody>\n$lignes</tbody>\n</table>\n"
+    },
+    "md": {
+        "page": "# $titre\n\n$contenu",
+        "tableau": "## $titre\n\n$entetes\n$lignes\n"
+    },
+    "txt": {
+        "page": "$titre\n$soulignement\n\n$contenu",
+        "tableau": "$titre\n\n$entetes\n$lignes\n"
+    }
+}
+
+
+# Définition de la classe Lien : cellule pointant vers un autre fichier exporté (lien en HTML et Markdown)
+class Lien:
+    __slots__ = ("texte", "cible")
+
+    # Constructeur de la classe Lien
+    def __init__(self, texte: str, cible: str):
+        self.texte = texte  # Texte affiché
+        self.cible = cible  # Chemin relatif du fichier visé
+
+    # Méthode pour représenter le lien sous forme de chaîne (formats sans liens)
+    def __str__(self) -> str:
+        return self.texte
+
+
+# Définition de la classe Tableau : données d'un rapport indépendantes du format de sortie
+class Tableau:
+    __slots__ = ("section", "titre", "colonnes", "lignes", "largeurs")
+
+    # Constructeur de la classe Tableau
+    def __init__(self, section: str, titre: str, colonnes: Sequence[str], lignes: Iterable[Sequence],
+                 largeurs: Optional[Sequence[int]] = None):
+        self.section = section  # Identifiant court (nom de fichier des exports CSV)
+        self.titre = titre  # Titre affiché
+        self.colonnes = tuple(colonnes)  # En-têtes des colonnes
+        self.lignes = lignes  # Cellules de chaque ligne (liste si le tableau est exporté dans plusieurs formats)
+        # Largeurs des colonnes en texte brut
+        self.largeurs = tuple(largeurs) if largeurs else tuple(max(len(colonne), 8) for colonne in colonnes)
+
+
+# Fonction pour convertir une cellule en texte (nombres sans décimales inutiles)
+def texte_cellule(valeur) -> str:
+    if isinstance(valeur, float):
+        return f"{valeur:g}"
+    return "" if valeur is None else str(valeur)
+
+
+# Fonction pour obtenir un modèle de mise en page compilé (lu et compilé une seule fois tant qu'il n'est pas modifié)
+def modele(format_export: str, nom: str) -> string.Template:
+    if config.DOSSIER_MODELES:
+        try:
+            chemin = os.path.join(config.DOSSIER_MODELES, format_export, nom + ".tmpl")
+            return obtenir_cache().lire(chemin, _lire_modele)
+        except OSError:
+            pass  # Pas de modèle personnalisé (ou illisible) : modèle intégré
+    return _modele_integre(format_export, nom)
+
+
+# Fonction interne pour compiler un modèle personnalisé (appelée par le cache des fichiers à chaque modification)
+def _lire_modele(file: TextIO) -> string.Template:
+    compter("export.modeles_compiles")
+    return string.Template(file.read())
+
+
+# Fonction interne pour compiler un modèle intégré
+@functools.lru_cache(maxsize=None)
+def _modele_integre(format_export: str, nom: str) -> string.Template:
+    compter("export.modeles_compiles")
+    return string.Template(MODELES[format_export][nom])
+
+
+# Fonction pour découper un modèle autour d'un marqueur ($contenu, $lignes) : le texte placé avant et après
+def decouper_modele(format_export: str, nom: str, marqueur: str, **valeurs: str) -> Tuple[str, str]:
+    texte = modele(format_export, nom).safe_substitute(**valeurs)  # Le marqueur, non fourni, reste en place
+    avant, _, apres = texte.partition("$" + marqueur)
+    return avant, apres
+
+
+# Définition de la classe Exporteur : produit un document, morceau par morceau, à partir de tableaux
+class Exporteur:
+    format = ""  # Nom du format ("csv", "html"...)
+    extension = ""  # Extension des fichiers produits
+    fichier_par_tableau = False  # Vrai si chaque tableau est écrit dans son propre fichier
+
+    # Méthode pour produire un document complet (titre puis tableaux)
+    def document(self, titre: str, tableaux: Iterable[Tableau]) -> Iterator[str]:
+        avant, apres = decouper_modele(self.format, "page", "contenu", titre=self.echapper(titre),
+                                       soulignement="=" * len(titre))
+        yield avant
+        for tableau in tableaux:
+            yield from self.tableau(tableau)
+        yield apres
+
+    # Méthode pour produire un tableau : en-tête du modèle, une ligne par enregistrement, fin du modèle
+    def tableau(self, tableau: Tableau) -> Iterator[str]:
+        avant, apres = decouper_modele(self.format, "tableau", "lignes", titre=self.echapper(tableau.titre),
+                                       entetes=self.entetes(tableau))
+        yield avant
+        gabarit = self.gabarit_ligne(len(tableau.colonnes), tableau.largeurs)
+        for cellules in tableau.lignes:
+            yield self.ligne(gabarit, cellules)
+        yield apres
+
+    # Méthode pour produire une ligne du tableau à partir de son gabarit
+    def ligne(self, gabarit: str, cellules: Sequence) -> str:
+        return gabarit.format(*(self.cellule(valeur) for valeur in cellules))
+
+    # Méthode pour échapper un texte propre au format
+    def echapper(self, texte: str) -> str:
+        return texte
+
+    # Méthode pour convertir une cellule dans le format de sortie
+    def cellule(self, valeur) -> str:
+        return self.echapper(texte_cellule(valeur))
+
+    # Méthode pour produire la ligne d'en-tête d'un tableau
+    def entetes(self, tableau: Tableau) -> str:
+        raise NotImplementedError
+
+    # Méthode pour obtenir le gabarit d'une ligne de n cellules (chaîne pour str.format)
+    def gabarit_ligne(self, nb_colonnes: int, largeurs: Tuple[int, ...]) -> str:
+        raise NotImplementedError
+
+
+EXPORTEURS: Dict[str, Exporteur] = {}  # Format -> exporteur
+
+
+# Décorateur pour enregistrer un exporteur (un nouveau format s'ajoute sans modifier le reste de l'application)
+def enregistrer_exporteur(classe: type) -> type:
+    EXPORTEURS[classe.format] = classe()
+    return classe
+
+
+# Fonction pour obtenir l'exporteur d'un format (ValueError si le format est inconnu)
+def obtenir_exporteur(format_export: str) -> Exporteur:
+    exporteur = EXPORTEURS.get(format_export.lower().lstrip("."))
+    if exporteur is None:
+        raise ValueError(f"Format d'export '{format_export}' non supporté (formats : {', '.join(EXPORTEURS)}).")
+    return exporteur
+
+
+# Exporteur CSV : un fichier par tableau, en-têtes sur la première ligne
+@enregistrer_exporteur
+class ExporteurCSV(Exporteur):
+    format = "csv"
+    extension = "csv"
+    fichier_par_tableau = True
+
+    # Méthode pour produire les tableaux sans titre ni mise en page (tableaux séparés par une ligne vide)
+    def document(self, titre: str, tableaux: Iterable[Tableau]) -> Iterator[str]:
+        for rang, tableau in enumerate(tableaux):
+            if rang:
+                yield "\n"
+            yield from self.tableau(tableau)
+
+    # Méthode pour produire un tableau CSV (guillemets ajoutés par le module csv si nécessaire)
+    def tableau(self, tableau: Tableau) -> Iterator[str]:
+        tampon = io.StringIO()
+        writer = csv.writer(tampon, lineterminator="\n")
+        writer.writerow(tableau.colonnes)
+        for cellules in tableau.lignes:
+            writer.writerow([texte_cellule(valeur) for valeur in cellules])
+            if tampon.tell() > 65536:  # Écrit par paquets de 64 Kio
+                yield tampon.getvalue()
+                tampon.seek(0)
+                tampon.truncate()
+        yield tampon.getvalue()
+
+
+# Exporteur HTML : page autonome, un tableau <table> par section
+@enregistrer_exporteur
+class ExporteurHTML(Exporteur):
+    format = "html"
+    extension = "html"
+
+    # Méthode pour échapper les caractères spéciaux HTML
+    def echapper(self, texte: str) -> str:
+        return html.escape(texte)
+
+    # Méthode pour convertir une cellule (les liens deviennent des balises <a>)
+    def cellule(self, valeur) -> str:
+        if isinstance(valeur, Lien):
+            return f"<a href=\"{html.escape(valeur.cible)}\">{html.escape(valeur.texte)}</a>"
+        return html.escape(texte_cellule(valeur))
+
+    # Méthode pour produire la ligne d'en-tête
+    def entetes(self, tableau: Tableau) -> str:
+        return "".join(f"<th>{html.escape(colonne)}</th>" for colonne in tableau.colonnes)
+
+    # Méthode pour obtenir le gabarit d'une ligne (mis en cache par nombre de colonnes)
+    def gabarit_ligne(self, nb_colonnes: int, largeurs: Tuple[int, ...]) -> str:
+        return _gabarit_html(nb_colonnes)
+
+
+# Exporteur Markdown : titres et tableaux au format GitHub
+@enregistrer_exporteur
+class ExporteurMarkdown(Exporteur):
+    format = "md"
+    extension = "md"
+
+    # Méthode pour échapper le HTML brut (<, > et &, interprétés par les rendus Markdown) et les séparateurs |
+    def echapper(self, texte: str) -> str:
+        return html.escape(texte, quote=False).replace("|", "\\|")
+
+    # Méthode pour convertir une cellule (les liens deviennent [texte](cible))
+    def cellule(self, valeur) -> str:
+        if isinstance(valeur, Lien):
+            return f"[{self.echapper(valeur.texte)}]({valeur.cible.replace(' ', '%20')})"
+        return self.echapper(texte_cellule(valeur))
+
+    # Méthode pour produire la ligne d'en-tête et la ligne de séparation
+    def entetes(self, tableau: Tableau) -> str:
+        return ("| " + " | ".join(self.echapper(colonne) for colonne in tableau.colonnes) + " |\n"
+                + "|" + "|".join("---" for _ in tableau.colonnes) + "|")
+
+    # Méthode pour obtenir le gabarit d'une ligne (mis en cache par nombre de colonnes)
+    def gabarit_ligne(self, nb_colonnes: int, largeurs: Tuple[int, ...]) -> str:
+        return _gabarit_markdown(nb_colonnes)
+
+
+# Exporteur texte brut : colonnes de largeur fixe, imprimable tel quel (sans PDF)
+@enregistrer_exporteur
+class ExporteurTexte(Exporteur):
+    format = "txt"
+    extension = "txt"
+
+    # Méthode pour produire la ligne d'en-tête et son soulignement
+    def entetes(self, tableau: Tableau) -> str:
+        gabarit = _gabarit_texte(tableau.largeurs)
+        soulignement = self.ligne(gabarit, ["-" * largeur for largeur in tableau.largeurs])
+        return self.ligne(gabarit, tableau.colonnes) + soulignement.rstrip("\n")
+
+    # Méthode pour produire une ligne sans espaces inutiles en fin de ligne
+    def ligne(self, gabarit: str, cellules: Sequence) -> str:
+        return gabarit.format(*(self.cellule(valeur) for valeur in cellules)).rstrip() + "\n"
+
+    # Méthode pour obtenir le gabarit d'une ligne (mis en cache par largeurs de colonnes)
+    def gabarit_ligne(self, nb_colonnes: int, largeurs: Tuple[int, ...]) -> str:
+        return _gabarit_texte(largeurs)
+
+
+# Fonctions internes pour construire une seule fois les gabarits de ligne
+@functools.lru_cache(maxsize=None)
+def _gabarit_html(nb_colonnes: int) -> str:
+    return "<tr>" + "<td>{}</td>" * nb_colonnes + "</tr>\n"
+
+
+@functools.lru_cache(maxsize=None)
+def _gabarit_markdown(nb_colonnes: int) -> str:
+    return "| " + " | ".join(["{}"] * nb_colonnes) + " |\n"
+
+
+@functools.lru_cache(maxsize=None)
+def _gabarit_texte(largeurs: Tuple[int, ...]) -> str:
+    return "  ".join(f"{{:<{largeur}}}" for largeur in largeurs)
+
+
+# Fonction pour obtenir le tableau des joueurs, par ordre alphabétique
+def tableau_joueurs(joueurs: Iterable['Joueur'], titre: str = "Joueurs") -> Tableau:
+    joueurs_tries = sorted(joueurs, key=lambda joueur: (joueur.nom, joueur.prenom))
+    return Tableau(
+        "joueurs", titre, ("Index", "Nom", "Prénom", "Date de naissance", "Elo"),
+        [(joueur.index, joueur.nom, joueur.prenom, joueur.date_naissance.isoformat(), joueur.elo)
+         for joueur in joueurs_tries],
+        (6, 20, 20, 17, 5)
+    )
+
+
+# Fonction pour obtenir le tableau des détails d'un tournoi
+def tableau_details(tournoi: 'Tournoi') -> Tableau:
+    return Tableau("details", "Détails du tournoi", ("Champ", "Valeur"), [
+        ("Nom", tournoi.nom),
+        ("Date de début", tournoi.date_debut.isoformat()),
+        ("Date de fin", tournoi.date_fin.isoformat()),
+        ("Type", tournoi.type_tournoi),
+        ("Rondes", f"{len(tournoi.rondes)} / {tournoi.nb_rondes}"),
+        ("Joueurs inscrits", f"{len(tournoi.joueurs)} / {tournoi.nb_max_joueurs}"),
+        ("Statut", tournoi.statut)
+    ], (16, 40))
+
+
+# Fonction pour obtenir le tableau des rondes et des matchs d'un tournoi
+def tableau_rondes(tournoi: 'Tournoi') -> Tableau:
+    lignes = []
+    for ronde in tournoi.rondes:
+        for table, (blancs, noirs, score) in enumerate(ronde.lignes_matchs(), start=1):  # Forme sérialisée de la ronde
+            lignes.append((ronde.numero, table, blancs, noirs, score))
+        if ronde.exempt is not None:
+            lignes.append((ronde.numero, "", f"{ronde.exempt.nom} {ronde.exempt.prenom}", "(exempt)", ""))
+    return Tableau("rondes", "Rondes et matchs", ("Ronde", "Table", "Blancs", "Noirs", "Résultat"), lignes,
+                   (5, 5, 30, 30, 9))
+
+
+# Fonction pour obtenir le tableau du classement d'un tournoi avec ses départages
+def tableau_classement(tournoi: 'Tournoi', departages: Optional[Departages] = None) -> Tableau:
+    departages = departages or tournoi.departages()
+    lignes = [
+        (rang, f"{joueur.nom} {joueur.prenom}", points,
+         *(departages.valeur(critere, joueur) for critere in ORDRE_DEPARTAGES))
+        for rang, (joueur, points) in enumerate(departages.classer(), start=1)
+    ]
+    return Tableau("classement", "Classement",
+                   ("Rang", "Joueur", "Pts", *(LIBELLES_DEPARTAGES[critere] for critere in ORDRE_DEPARTAGES)),
+                   lignes, (4, 30, 4, *(6 for _ in ORDRE_DEPARTAGES)))
+
+
+# Fonction pour obtenir tous les tableaux d'un tournoi (calculés une fois, réutilisés par chaque format)
+def tableaux_tournoi(tournoi: 'Tournoi') -> List[Tableau]:
+    return [
+        tableau_details(tournoi),
+        tableau_joueurs(tournoi.joueurs, "Joueurs inscrits"),
+        tableau_rondes(tournoi),
+        tableau_classement(tournoi)
+    ]
+
+
+# Fonction pour obtenir un nom de fichier sûr à partir d'un nom de tournoi
+def nom_fichier(nom: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", nom).strip("._") or "export"
+
+
+# Fonction pour écrire des tableaux dans un format (retourne les fichiers écrits)
+def ecrire_tableaux(titre: str, tableaux: Sequence[Tableau], dossier: str, base: str, format_export: str) -> List[str]:
+    exporteur = obtenir_exporteur(format_export)
+    os.makedirs(dossier, exist_ok=True)
+    if exporteur.fichier_par_tableau:
+        fichiers = []
+        for tableau in tableaux:
+            fichier = os.path.join(dossier, f"{base}_{tableau.section}.{exporteur.extension}")
+            ecrire_atomique_flux(fichier, exporteur.document(titre, (tableau,)))
+            fichiers.append(fichier)
+        return fichiers
+    fichier = os.path.join(dossier, f"{base}.{exporteur.extension}")
+    ecrire_atomique_flux(fichier, exporteur.document(titre, tableaux))
+    return [fichier]
+
+
+# Fonction pour exporter un tournoi dans plusieurs formats (tableaux et départages calculés une seule fois)
+@chronometre("export.tournoi", "rapport")
+def exporter_tournoi(tournoi: 'Tournoi', formats: Iterable[str], dossier: str = DOSSIER_EXPORTS) -> List[str]:
+    tableaux = tableaux_tournoi(tournoi)
+    fichiers = []
+    for format_export in formats:
+        fichiers.extend(ecrire_tableaux(tournoi.nom, tableaux, dossier, nom_fichier(tournoi.nom), format_export))
+    return fichiers
+
+
+# Fonction pour exporter la liste des joueurs dans un format (lignes produites au fil de l'eau)
+@chronometre("export.joueurs", "rapport")
+def exporter_joueurs(joueurs: Iterable['Joueur'], format_export: str, dossier: str = DOSSIER_EXPORTS,
+                     titre: str = "Liste des joueurs") -> List[str]:
+    return ecrire_tableaux(titre, (tableau_joueurs(joueurs, titre),), dossier, "joueurs", format_export)
+
+
+# Fonction pour exporter un tournoi de la saison : fichiers écrits et ligne de l'index de la saison
+def exporter_tournoi_saison(tournoi: 'Tournoi', formats: Sequence[str], dossier: str) -> Tuple[List[str], Tuple]:
+    tableaux = tableaux_tournoi(tournoi)
+    base = nom_fichier(tournoi.nom)
+    fichiers = []
+    for format_export in formats:
+        fichiers.extend(ecrire_tableaux(tournoi.nom, tableaux, dossier, base, format_export))
+    classement = tableaux[-1].lignes
+    vainqueur = classement[0][1] if classement and tournoi.statut == "Terminé" else ""
+    return fichiers, (tournoi.nom, tournoi.date_debut.isoformat(), tournoi.date_fin.isoformat(),
+                      len(tournoi.rondes), tournoi.statut, vainqueur, base)
+
+
+# Fonction pour obtenir l'instantané d'un tournoi : données complètes, sans les classements après ronde
+#
+# Les classements sont recalculés par le processus qui exporte le tournoi : le processus principal se contente
+# de copier les résultats bruts (index des joueurs et codes des résultats).
+def instantane_tournoi(tournoi: 'Tournoi') -> Dict:
+    data = tournoi.to_dict_base()
+    data["statut"] = tournoi.statut
+    data["joueurs_inscrits"] = [joueur.index for joueur in tournoi.joueurs]
+    data["rondes"] = []
+    for ronde in tournoi.rondes:
+        ronde_data = {
+            "numero": ronde.numero,
+            "date": ronde.date.isoformat(),
+            "statut": ronde.statut,
+            "matchs": [{"blanc": blanc, "noir": noir, "score": RESULTATS[code]}
+                       for blanc, noir, code in ronde.parties()]
+        }
+        if ronde.exempt is not None:
+            ronde_data["exempt"] = ronde.exempt.index
+        data["rondes"].append(ronde_data)
+    return data
+
+
+_instantane: Optional[Tuple['JoueurManager', 'DepotInstantane']] = None  # Instantané d'un processus de publication
+
+
+# Fonction d'initialisation d'un processus de publication (l'instantané est transmis une seule fois par processus)
+def _initialiser_processus(joueurs_data: List[Dict], tournois_data: Dict[str, Dict],
+                           dossier_modeles: Optional[str]) -> None:
+    global _instantane
+    from models.joueur_model import JoueurManager  # Import à la demande : évite l'import circulaire
+    config.DOSSIER_MODELES = dossier_modeles  # Mêmes modèles que le processus principal
+    depot = DepotInstantane(joueurs_data, tournois_data)
+    _instantane = (JoueurManager(depot), depot)
+
+
+# Fonction exécutée par un processus de publication : reconstruit un tournoi depuis l'instantané puis l'exporte
+def _exporter_depuis_instantane(nom: str, formats: Sequence[str], dossier: str) -> Tuple[List[str], Tuple]:
+    from models.tournoi_model import Tournoi  # Import à la demande : évite l'import circulaire
+    joueur_manager, depot = _instantane
+    tournoi = Tournoi.from_dict(depot.charger_tournoi(nom), depot, joueur_manager)
+    return exporter_tournoi_saison(tournoi, formats, dossier)
+
+
+# Fonction pour exporter tous les tournois d'une saison (année de début), en une seule passe
+#
+# Chaque tournoi est chargé et classé une fois, puis écrit dans tous les formats ; une page d'index par format
+# récapitule la saison avec un lien vers chaque tournoi. Avec plusieurs processus (par défaut un par cœur), les
+# tournois sont répartis entre eux à partir d'un instantané en lecture seule ; les fichiers et l'index restent
+# dans l'ordre des tournois, quel que soit l'ordre de fin des processus. Retourne les fichiers écrits.
+@chronometre("export.saison", "rapport")
+def exporter_saison(tournois: Iterable['Tournoi'], formats: Sequence[str], saison: Optional[int] = None,
+                    dossier: str = DOSSIER_EXPORTS, processus: Optional[int] = None) -> List[str]:
+    for format_export in formats:
+        obtenir_exporteur(format_export)  # Format inconnu signalé avant d'écrire quoi que ce soit
+    titre = f"Saison {saison}" if saison is not None else "Tous les tournois"
+    dossier = os.path.join(dossier, nom_fichier(titre.lower()))
+    selection = [tournoi for tournoi in sorted(tournois, key=lambda tournoi: (tournoi.date_debut, tournoi.nom))
+                 if saison is None or tournoi.date_debut.year == saison]
+    processus = min(processus or config.PROCESSUS_EXPORT or os.cpu_count() or 1, len(selection))
+    if processus > 1:
+        resultats = _exporter_en_parallele(selection, formats, dossier, processus)
+    else:
+        resultats = [exporter_tournoi_saison(tournoi, formats, dossier) for tournoi in selection]
+    fichiers = [fichier for fichiers_tournoi, _ in resultats for fichier in fichiers_tournoi]
+    resume = [ligne for _, ligne in resultats]  # (nom, début, fin, rondes, statut, vainqueur, base)
+    for format_export in formats:
+        exporteur = obtenir_exporteur(format_export)
+        suffixe = "_classement" if exporteur.fichier_par_tableau else ""  # CSV : lien vers le classement
+        index = Tableau("index", titre, ("Tournoi", "Début", "Fin", "Rondes", "Statut", "Vainqueur"),
+                        [(Lien(nom, f"{base}{suffixe}.{exporteur.extension}"), *autres)
+                         for nom, *autres, base in resume],
+                        (30, 10, 10, 6, 10, 30))
+        os.makedirs(dossier, exist_ok=True)
+        fichier = os.path.join(dossier, f"index.{exporteur.extension}")
+        ecrire_atomique_flux(fichier, exporteur.document(titre, (index,)))
+        fichiers.append(fichier)
+    return fichiers
+
+
+# Fonction interne pour répartir l'export des tournois entre plusieurs processus (résultats dans l'ordre des tournois)
+def _exporter_en_parallele(selection: List['Tournoi'], formats: Sequence[str], dossier: str,
+                           processus: int) -> List[Tuple[List[str], Tuple]]:
+    import concurrent.futures  # Import à la demande : inutile au démarrage de l'application
+    tournois_data: Dict[str, Dict] = {}
+    joueurs_data: Dict[int, Dict] = {}  # Seuls les joueurs référencés (inscrits ou joueurs des rondes) des tournois
+    for tournoi in selection:
+        tournois_data[tournoi.nom] = instantane_tournoi(tournoi)
+        for joueur in tournoi.joueurs_references():
+            joueurs_data.setdefault(joueur.index, joueur.to_dict())
+    os.makedirs(dossier, exist_ok=True)  # Créé une fois, avant que les processus n'écrivent
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processus, initializer=_initialiser_processus,
+            initargs=(list(joueurs_data.values()), tournois_data, config.DOSSIER_MODELES)) as executeur:
+        return list(executeur.map(_exporter_depuis_instantane, tournois_data,
+                                  itertools.repeat(tuple(formats)), itertools.repeat(dossier)))
@@ -0,0 +1,185 @@
+# Importation des modules nécessaires
+import csv  # Pour lire et écrire les fichiers CSV
+import datetime  # Pour manipuler les dates
+import io  # Pour assembler les lignes CSV exportées par paquets
+import os  # Pour les opérations liées au système de fichiers
+import re  # Pour repérer les colonnes des listes de classement FIDE
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple  # Pour les annotations de type
+
+from models.persistance import ecrire_atomique_flux  # Écriture atomique d'un fichier produit au fil de l'eau
+from models.registre_joueurs import normaliser_nom  # Normalisation des en-têtes de colonnes
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.joueur_model
+    from models.joueur_model import Joueur
+
+COLONNES_JOUEURS = ("index", "nom", "prenom", "date_naissance", "elo")  # Colonnes des fichiers CSV de joueurs
+ALIAS_COLONNES = {  # En-têtes acceptés (normalisés) -> colonne
+    "date de naissance": "date_naissance",
+    "naissance": "date_naissance",
+    "classement": "elo",
+    "rating": "elo"
+}
+FORMATS = ("csv", "fide")  # CSV de l'application, liste de classement FIDE (texte à colonnes fixes)
+ELO_NON_CLASSE = 1000  # Elo attribué aux joueurs sans classement (minimum accepté à la saisie)
+TAILLE_PAQUET = 1000  # Nombre de lignes assemblées avant chaque écriture de l'export
+MAX_ERREURS = 20  # Nombre de refus détaillés conservés dans le rapport
+
+REFUS_INVALIDE = "invalide"  # Ligne illisible (date, Elo, nom manquant)
+REFUS_DOUBLON = "doublon"  # Joueur déjà présent (dans la base ou plus haut dans le fichier)
+REFUS_AGE = "age"  # Joueur de moins de 7 ans
+REFUS_QUOTA = "quota"  # Nombre maximum de joueurs atteint
+MESSAGES_REFUS = {
+    REFUS_DOUBLON: "Ce joueur existe déjà.",
+    REFUS_AGE: "Le joueur doit avoir au moins 7 ans pour s'inscrire.",
+    REFUS_QUOTA: "Nombre maximum de joueurs atteint."
+}
+
+
+# Définition de la classe RapportImport : bilan d'un import de joueurs
+class RapportImport:
+    # Constructeur de la classe RapportImport
+    def __init__(self):
+        self.lues = 0  # Nombre de lignes lues
+        self.importes = 0  # Nombre de joueurs ajoutés
+        self.refus: Dict[str, int] = {motif: 0 for motif in (REFUS_INVALIDE, REFUS_DOUBLON, REFUS_AGE, REFUS_QUOTA)}
+        self.erreurs: List[str] = []  # Premiers refus détaillés (MAX_ERREURS au plus)
+
+    # Méthode pour comptabiliser une ligne refusée
+    def refuser(self, motif: str, ligne: Dict, message: str) -> None:
+        self.refus[motif] += 1
+        if len(self.erreurs) < MAX_ERREURS:
+            self.erreurs.append(f"Ligne {ligne.get('ligne', '?')} : {message}")
+
+    # Méthode pour convertir le rapport en dictionnaire
+    def to_dict(self) -> Dict:
+        return {"lues": self.lues, "importes": self.importes, "refus": dict(self.refus), "erreurs": list(self.erreurs)}
+
+    # Méthode pour représenter le rapport sous forme de chaîne
+    def __str__(self) -> str:
+        refus = ", ".join(f"{motif} : {nombre}" for motif, nombre in self.refus.items() if nombre)
+        bilan = f"{self.importes} joueur(s) importé(s) sur {self.lues} ligne(s)"
+        return bilan + (f" (refusés : {refus})" if refus else "")
+
+
+# Fonction pour convertir une ligne lue en (nom, prénom, date de naissance, Elo) ; ValueError si elle est invalide
+def convertir_ligne(ligne: Dict[str, str]) -> Tuple[str, str, datetime.date, int]:
+    nom = (ligne.get("nom") or "").strip()
+    prenom = (ligne.get("prenom") or "").strip()
+    if not nom:
+        raise ValueError("nom manquant.")
+    date_naissance = lire_date((ligne.get("date_naissance") or "").strip())
+    elo = (ligne.get("elo") or "").strip()
+    if not elo:
+        return nom, prenom, date_naissance, ELO_NON_CLASSE
+    if not elo.isdigit():
+        raise ValueError(f"Elo invalide : {elo}.")
+    return nom, prenom, date_naissance, int(elo)
+
+
+# Fonction pour lire une date de naissance : AAAA-MM-JJ, JJ/MM/AAAA ou année seule (1er janvier, listes FIDE)
+def lire_date(texte: str) -> datetime.date:
+    try:
+        if len(texte) == 4 and texte.isdigit():
+            return datetime.date(int(texte), 1, 1)
+        if "/" in texte:
+            return datetime.datetime.strptime(texte, "%d/%m/%Y").date()
+        return datetime.date.fromisoformat(texte)
+    except ValueError:
+        raise ValueError(f"date de naissance invalide : {texte or '(vide)'}.") from None
+
+
+# Fonction pour deviner le format d'un fichier de joueurs d'après son extension
+def format_fichier(fichier: str) -> str:
+    return "csv" if os.path.splitext(fichier)[1].lower() == ".csv" else "fide"
+
+
+# Fonction pour lire un fichier de joueurs ligne à ligne (le fichier n'est jamais chargé en entier)
+def lire_fichier_joueurs(fichier: str, format_joueurs: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    format_joueurs = format_joueurs or format_fichier(fichier)
+    if format_joueurs not in FORMATS:
+        raise ValueError(f"Format de fichier inconnu : {format_joueurs} (attendu : {', '.join(FORMATS)}).")
+    with open(fichier, 'r', encoding='utf-8-sig', errors='replace', newline='') as file:
+        yield from (lire_csv_joueurs(file) if format_joueurs == "csv" else lire_liste_fide(file))
+
+
+# Fonction pour obtenir la colonne correspondant à un en-tête CSV ("Date de naissance" -> date_naissance)
+def nom_colonne(entete: str) -> str:
+    normalise = normaliser_nom(entete)
+    return ALIAS_COLONNES.get(normalise, normalise.replace(" ", "_"))
+
+
+# Fonction pour lire un CSV de joueurs (séparateur ",", ";" ou tabulation, en-têtes en français)
+def lire_csv_joueurs(lignes: Iterable[str]) -> Iterator[Dict[str, str]]:
+    lignes = iter(lignes)
+    entete = next(lignes, "")
+    try:
+        separateur = csv.Sniffer().sniff(entete, delimiters=",;\t").delimiter
+    except csv.Error:
+        separateur = ","
+    colonnes = [nom_colonne(colonne) for colonne in next(csv.reader([entete], delimiter=separateur), [])]
+    for numero, valeurs in enumerate(csv.reader(lignes, delimiter=separateur), start=2):
+        if not any(valeurs):
+            continue  # Ligne vide
+        ligne = dict(zip(colonnes, valeurs))
+        ligne["ligne"] = str(numero)
+        yield ligne
+
+
+# Fonction pour lire une liste de classement FIDE au format texte (colonnes de largeur fixe)
+#
+# Les colonnes sont repérées dans la ligne d'en-tête ("ID Number  Name  Fed Sex ... SRtng ... B-day Flag") :
+# l'Elo lu est le classement standard (SRtng, ou la colonne du mois dans les anciennes listes), le nom est
+# au format "Nom, Prénom" et seule l'année de naissance est connue.
+def lire_liste_fide(lignes: Iterable[str]) -> Iterator[Dict[str, str]]:
+    lignes = iter(lignes)
+    entete = next(lignes, "").replace("ID Number", "ID_Number")
+    positions = [(resultat.group(), resultat.start()) for resultat in re.finditer(r"\S+", entete)]
+    colonnes = {nom: (debut, positions[rang + 1][1] if rang + 1 < len(positions) else None)
+                for rang, (nom, debut) in enumerate(positions)}
+    colonne_elo = next((nom for nom in ("SRtng", "Rtng", "Rating") if nom in colonnes), None)
+    if colonne_elo is None:  # Anciennes listes : colonne nommée d'après le mois ("Mar24")
+        colonne_elo = next((nom for nom in colonnes if re.fullmatch(r"[A-Z][a-z]{2}\d{2}", nom)), None)
+    colonne_naissance = next((nom for nom in ("B-day", "Born") if nom in colonnes), None)
+    if "Name" not in colonnes or colonne_naissance is None:
+        raise ValueError("En-tête de liste FIDE non reconnu (colonnes Name et B-day attendues).")
+
+    # Fonction interne pour extraire la valeur d'une colonne
+    def valeur(texte: str, colonne: Optional[str]) -> str:
+        if colonne is None:
+            return ""
+        debut, fin = colonnes[colonne]
+        return texte[debut:fin].strip()
+
+    for numero, texte in enumerate(lignes, start=2):
+        if not texte.strip():
+            continue  # Ligne vide
+        nom, _, prenom = valeur(texte, "Name").partition(",")
+        yield {
+            "nom": nom.strip(),
+            "prenom": prenom.strip(),
+            "date_naissance": valeur(texte, colonne_naissance),
+            "elo": valeur(texte, colonne_elo),
+            "ligne": str(numero)
+        }
+
+
+# Fonction pour produire le CSV des joueurs par paquets de lignes (même format que l'import)
+def lignes_csv_joueurs(joueurs: Iterable['Joueur']) -> Iterator[str]:
+    tampon = io.StringIO()
+    writer = csv.writer(tampon, lineterminator="\n")
+    writer.writerow(COLONNES_JOUEURS)
+    for numero, joueur in enumerate(joueurs, start=1):
+        writer.writerow((joueur.index, joueur.nom, joueur.prenom, joueur.date_naissance.isoformat(), joueur.elo))
+        if numero % TAILLE_PAQUET == 0:
+            yield tampon.getvalue()
+            tampon.seek(0)
+            tampon.truncate()
+    yield tampon.getvalue()
+
+
+# Fonction pour exporter les joueurs dans un fichier CSV (écriture atomique, sans assembler le fichier en mémoire)
+def exporter_csv_joueurs(joueurs: Iterable['Joueur'], fichier: str) -> None:
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    ecrire_atomique_flux(fichier, lignes_csv_joueurs(joueurs))
@@ -0,0 +1,37 @@
+# Importation des modules nécessaires
+from typing import Dict  # Pour les annotations de type
+
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+
+
+# Définition de la classe Inscription : état d'un joueur propre à un tournoi
+#
+# Le joueur lui-même (nom, Elo, historique) est partagé par tous les tournois via la table d'identité du
+# JoueurManager ; l'inscription ne garde que ce qui dépend du tournoi : points, couleurs jouées et exemptions.
+class Inscription:
+    __slots__ = ("joueur", "score", "couleurs", "exempts")
+
+    # Constructeur de la classe Inscription
+    def __init__(self, joueur: Joueur):
+        self.joueur = joueur  # Joueur inscrit (objet partagé, jamais copié)
+        self.score = 0.0  # Points marqués dans le tournoi
+        self.couleurs = ""  # Couleurs jouées, ronde après ronde ("B" ou "N")
+        self.exempts = 0  # Nombre de rondes reçues en exempt (bye)
+
+    # Propriété pour obtenir l'index du joueur inscrit
+    @property
+    def index(self) -> int:
+        return self.joueur.index
+
+    # Méthode pour convertir une inscription en dictionnaire (rapports, exports)
+    def to_dict(self) -> Dict:
+        return {
+            "index": self.joueur.index,
+            "score": self.score,
+            "couleurs": self.couleurs,
+            "exempts": self.exempts
+        }
+
+    # Méthode pour représenter une inscription sous forme de chaîne
+    def __repr__(self) -> str:
+        return f"{self.joueur.nom} {self.joueur.prenom} : {self.score:g} ({self.couleurs or '-'})"
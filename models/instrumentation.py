@@ -0,0 +1,168 @@
+# Importation des modules nécessaires
+import atexit  # Pour afficher le résumé et écrire la trace à la fermeture de l'application
+import contextlib  # Pour le contexte sans effet utilisé lorsque l'instrumentation est inactive
+import functools  # Pour conserver le nom des fonctions décorées
+import json  # Pour écrire la trace au format Chrome
+import os  # Pour les opérations liées au système de fichiers
+import sys  # Pour afficher le résumé sur la sortie d'erreur
+import threading  # Pour identifier le fil d'exécution de chaque mesure
+import time  # Pour mesurer les durées
+from typing import Any, Callable, Dict, List, Optional, TypeVar  # Pour les annotations de type
+
+import config  # Paramètres de l'application (activation de l'instrumentation)
+
+MAX_EVENEMENTS = 1_000_000  # Nombre maximal d'événements conservés pour la trace (les statistiques restent complètes)
+Fonction = TypeVar("Fonction", bound=Callable[..., Any])
+
+_INACTIF = contextlib.nullcontext()  # Contexte sans effet renvoyé par mesure() lorsque l'instrumentation est inactive
+_actif = False  # Vrai lorsque les mesures sont enregistrées
+_fichier_trace: Optional[str] = None  # Fichier de la trace écrite à la fermeture (None : pas de trace)
+_origine = time.perf_counter_ns()  # Instant zéro de la trace
+_statistiques: Dict[str, List[float]] = {}  # Nom -> [appels, durée totale (ns), durée maximale (ns)]
+_compteurs: Dict[str, int] = {}  # Nom -> valeur cumulée
+_evenements: List[Dict] = []  # Événements de la trace (format Chrome trace-event)
+_verrou = threading.Lock()
+_enregistre_a_la_sortie = False  # Vrai une fois la fonction de fermeture enregistrée
+
+
+# Définition de la classe _Mesure : chronomètre d'un bloc de code (utilisé seulement si l'instrumentation est active)
+class _Mesure:
+    __slots__ = ("nom", "categorie", "debut")
+
+    # Constructeur de la classe _Mesure
+    def __init__(self, nom: str, categorie: str):
+        self.nom = nom  # Nom de l'opération mesurée
+        self.categorie = categorie  # Catégorie affichée dans la trace (io, json, appariement...)
+        self.debut = 0  # Instant de début (ns)
+
+    # Méthode appelée à l'entrée du bloc mesuré
+    def __enter__(self) -> '_Mesure':
+        self.debut = time.perf_counter_ns()
+        return self
+
+    # Méthode appelée à la sortie du bloc mesuré (y compris sur exception)
+    def __exit__(self, *exc) -> None:
+        fin = time.perf_counter_ns()
+        enregistrer(self.nom, self.categorie, self.debut, fin - self.debut)
+
+
+# Fonction pour mesurer un bloc de code : with mesure("joueurs.charger", "io"): ...
+#
+# Inactive, elle renvoie un contexte partagé sans effet : le coût se limite à un test et un appel.
+def mesure(nom: str, categorie: str = "") -> contextlib.AbstractContextManager:
+    return _Mesure(nom, categorie) if _actif else _INACTIF
+
+
+# Décorateur pour mesurer chaque appel d'une fonction ou d'une méthode
+def chronometre(nom: str, categorie: str = "") -> Callable[[Fonction], Fonction]:
+    def decorateur(fonction: Fonction) -> Fonction:
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            if not _actif:
+                return fonction(*args, **kwargs)
+            with _Mesure(nom, categorie):
+                return fonction(*args, **kwargs)
+        return enveloppe  # type: ignore[return-value]
+    return decorateur
+
+
+# Fonction pour incrémenter un compteur (octets écrits, lignes lues, entrées de journal...)
+def compter(nom: str, valeur: int = 1) -> None:
+    if _actif:
+        with _verrou:
+            _compteurs[nom] = _compteurs.get(nom, 0) + valeur
+
+
+# Fonction pour enregistrer une durée mesurée (statistiques et événement de trace)
+def enregistrer(nom: str, categorie: str, debut_ns: int, duree_ns: int) -> None:
+    with _verrou:
+        statistique = _statistiques.get(nom)
+        if statistique is None:
+            _statistiques[nom] = [1, duree_ns, duree_ns]
+        else:
+            statistique[0] += 1
+            statistique[1] += duree_ns
+            statistique[2] = max(statistique[2], duree_ns)
+        if _fichier_trace is not None and len(_evenements) < MAX_EVENEMENTS:
+            _evenements.append({
+                "name": nom, "cat": categorie or "application", "ph": "X",
+                "ts": (debut_ns - _origine) / 1000, "dur": duree_ns / 1000,  # Microsecondes
+                "pid": os.getpid(), "tid": threading.get_ident()
+            })
+
+
+# Fonction pour activer l'instrumentation (résumé affiché et trace écrite à la fermeture de l'application)
+def activer(fichier_trace: Optional[str] = None) -> None:
+    global _actif, _fichier_trace, _enregistre_a_la_sortie
+    _actif = True
+    _fichier_trace = fichier_trace
+    if not _enregistre_a_la_sortie:
+        atexit.register(terminer)
+        _enregistre_a_la_sortie = True
+
+
+# Fonction pour désactiver l'instrumentation (les mesures déjà prises sont conservées)
+def desactiver() -> None:
+    global _actif
+    _actif = False
+
+
+# Fonction pour savoir si l'instrumentation est active
+def est_active() -> bool:
+    return _actif
+
+
+# Fonction pour effacer toutes les mesures
+def reinitialiser() -> None:
+    global _origine
+    with _verrou:
+        _statistiques.clear()
+        _compteurs.clear()
+        _evenements.clear()
+        _origine = time.perf_counter_ns()
+
+
+# Fonction pour obtenir le tableau récapitulatif : une ligne par opération, de la plus coûteuse à la moins coûteuse
+def resume() -> str:
+    with _verrou:
+        statistiques = sorted(_statistiques.items(), key=lambda element: -element[1][1])
+        compteurs = sorted(_compteurs.items())
+    lignes = [f"{'Opération':<44} {'Appels':>8} {'Total ms':>11} {'Moyenne ms':>11} {'Max ms':>10}"]
+    for nom, (appels, total, maximum) in statistiques:
+        lignes.append(f"{nom:<44} {appels:>8} {total / 1e6:>11.2f} {total / appels / 1e6:>11.3f} "
+                      f"{maximum / 1e6:>10.2f}")
+    if compteurs:
+        lignes.append("")
+        lignes.append(f"{'Compteur':<44} {'Valeur':>8}")
+        lignes.extend(f"{nom:<44} {valeur:>8}" for nom, valeur in compteurs)
+    return "\n".join(lignes)
+
+
+# Fonction pour écrire la trace au format Chrome trace-event (chrome://tracing, Perfetto)
+def ecrire_trace(fichier: str) -> None:
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    with _verrou:
+        trace = {"traceEvents": list(_evenements), "displayTimeUnit": "ms",
+                 "otherData": {"compteurs": dict(_compteurs)}}
+    with open(fichier, 'w', encoding='utf-8') as file:
+        json.dump(trace, file, ensure_ascii=False)
+
+
+# Fonction appelée à la fermeture : résumé sur la sortie d'erreur, puis trace si un fichier a été demandé
+def terminer() -> None:
+    if not _statistiques and not _compteurs:
+        return
+    print("\n===== Instrumentation =====", file=sys.stderr)
+    print(resume(), file=sys.stderr)
+    if _fichier_trace is not None:
+        try:
+            ecrire_trace(_fichier_trace)
+            print(f"Trace écrite dans {_fichier_trace}", file=sys.stderr)
+        except OSError as erreur:
+            print(f"Impossible d'écrire la trace {_fichier_trace} : {erreur}", file=sys.stderr)
+
+
+if config.INSTRUMENTATION:  # Activation depuis config.py
+    activer(config.FICHIER_TRACE)
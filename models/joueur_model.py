@@ -1,12 +1,21 @@
 # Importation des modules nécessaires
-import json  # Pour manipuler les fichiers JSON
-import os  # Pour les opérations liées au système de fichiers
 import datetime  # Pour manipuler les dates
-from typing import Optional, List, Dict  # Pour les annotations de type
+from typing import Optional, Iterable, Iterator, List, Dict, Set, Tuple  # Pour les annotations de type
+import config  # Paramètres de l'application (quota de joueurs)
+from models.registre_joueurs import RegistreJoueurs  # Index en mémoire des joueurs
+from models.depots import Depot, obtenir_depot  # Couche de stockage (JSON journalisé ou SQLite)
+from models.instrumentation import chronometre  # Mesure des temps (si l'instrumentation est activée)
+from models.unite_travail import unite_en_cours  # Sauvegardes regroupées en fin d'opération
+from models.import_joueurs import (MESSAGES_REFUS, REFUS_AGE, REFUS_DOUBLON, REFUS_INVALIDE, REFUS_QUOTA,
+                                   RapportImport, convertir_ligne)  # Import de joueurs par lots
 
 
 # Définition de la classe Joueur pour représenter un joueur
 class Joueur:
+    __slots__ = ("index", "nom", "prenom", "date_naissance", "elo", "historique_elo", "nb_parties", "elo_max",
+                 "revision_nom")
+    revision_noms = 0  # Nombre total de changements de nom (les rondes ne vérifient leurs joueurs que s'il change)
+
     # Constructeur de la classe Joueur
     def __init__(self, index: int, nom: str, prenom: str, date_naissance: datetime.date, elo: int):
         self.index = index  # Index du joueur
@@ -14,7 +23,10 @@ class Joueur:
         self.prenom = prenom  # Prénom du joueur
         self.date_naissance = date_naissance  # Date de naissance du joueur
         self.elo = elo  # Classement Elo du joueur
-        self.score = 0  # Initialiser le score à 0
+        self.historique_elo: List[Dict] = []  # Variations Elo successives (tournoi, ronde, parties, nouvel Elo)
+        self.nb_parties = 0  # Nombre de parties prises en compte dans l'Elo
+        self.elo_max = elo  # Meilleur Elo atteint
+        self.revision_nom = 0  # Nombre de changements de nom du joueur (libellés des rondes sérialisées)
 
     # Méthode pour convertir un objet Joueur en dictionnaire
     def to_dict(self) -> Dict:
@@ -24,19 +36,28 @@ class Joueur:
             'prenom': self.prenom,
             'date_naissance': self.date_naissance.isoformat(),  # Convertir la date en chaîne ISO
             'elo': self.elo,
-            'score': self.score
+            **({'historique_elo': self.historique_elo} if self.historique_elo else {})  # Absent tant que vide
         }
 
     # Méthode de classe pour créer un objet Joueur à partir d'un dictionnaire
     @classmethod
     def from_dict(cls, data: Dict) -> 'Joueur':
-        return cls(
+        joueur = cls(
             index=data['index'],
             nom=data['nom'],
             prenom=data['prenom'],
             date_naissance=datetime.date.fromisoformat(data['date_naissance']),  # Convertir la date ISO en objet date
             elo=data['elo']
         )
+        for entree in data.get('historique_elo', []):
+            joueur.ajouter_historique_elo(entree)
+        return joueur
+
+    # Méthode pour ajouter une entrée à l'historique Elo (nombre de parties et meilleur Elo tenus à jour)
+    def ajouter_historique_elo(self, entree: Dict) -> None:
+        self.historique_elo.append(entree)
+        self.nb_parties += entree["parties"]
+        self.elo_max = max(self.elo_max, entree["elo"])
 
     # Méthode pour comparer deux objets Joueur
     def __eq__(self, other: object) -> bool:
@@ -55,66 +76,200 @@ class Joueur:
 
 # Définition de la classe JoueurManager pour gérer les opérations sur les joueurs
 class JoueurManager:
-    MAX_JOUEURS = 100  # Nombre maximum de joueurs
-    FICHIER_JSON = "data/joueur.json"  # Chemin du fichier JSON
-
     # Constructeur de la classe JoueurManager
-    def __init__(self):
+    def __init__(self, depot: Optional[Depot] = None):
+        self.quota: Optional[int] = config.QUOTA_JOUEURS  # Nombre maximum de joueurs (None : illimité)
         self.joueurs: List[Joueur] = []  # Liste des joueurs
-        self.charger_joueurs()  # Charger les joueurs depuis le fichier JSON
+        self.registre = RegistreJoueurs()  # Index des joueurs (index, détails, nom normalisé, Elo)
+        self.rondes_notees: Dict[str, Set[Optional[int]]] = {}  # Rondes prises en compte par tournoi (None : complet)
+        self.depot = depot or obtenir_depot()  # Dépôt de stockage configuré
+        self.charger_joueurs()  # Charger les joueurs depuis le dépôt
 
-    # Méthode pour charger les joueurs depuis le fichier JSON
+    # Méthode pour charger les joueurs depuis le dépôt
+    @chronometre("joueurs.charger", "io")
     def charger_joueurs(self) -> List[Joueur]:
-        try:
-            with open(self.FICHIER_JSON, 'r', encoding='utf-8') as f:
-                joueurs_data = json.load(f)  # Charger les données JSON
-            self.joueurs = [Joueur.from_dict(joueur_data) for joueur_data in joueurs_data]  # Convertir les dictionnaires en objets Joueur
-        except FileNotFoundError:
-            print("Fichier data/joueur.json non trouvé. Création d'une nouvelle liste de joueurs.")
-        except json.JSONDecodeError:
-            print("Erreur dans le format du fichier data/joueur.json. Création d'une nouvelle liste de joueurs.")
-
-    # Méthode pour sauvegarder les joueurs dans le fichier JSON
+        joueurs_data = self.depot.charger_joueurs()  # Charger les données des joueurs
+        # Convertir les dictionnaires en objets Joueur
+        self.joueurs = [Joueur.from_dict(joueur_data) for joueur_data in joueurs_data]
+        self.registre.reconstruire(self.joueurs, self.depot.charger_index_max())  # Index des supprimés non réattribués
+        self.rondes_notees = {}
+        for joueur in self.joueurs:  # Historiques parcourus une seule fois, au chargement
+            for entree in joueur.historique_elo:
+                self.rondes_notees.setdefault(entree["tournoi"], set()).add(entree["ronde"])
+        return self.joueurs
+
+    # Méthode pour sauvegarder les joueurs (seules les différences sont écrites)
+    @chronometre("joueurs.sauvegarder", "io")
     def sauvegarder_joueurs(self) -> None:
-        with open(self.FICHIER_JSON, "w", encoding='utf-8') as file:
-            data = [joueur.to_dict() for joueur in self.joueurs]  # Convertir les objets Joueur en dictionnaires
-            json.dump(data, file, indent=4)  # Sauvegarder les données JSON
+        self.depot.synchroniser_joueurs([joueur.to_dict() for joueur in self.joueurs])
+
+    # Méthode pour réécrire les fichiers d'export complets
+    @chronometre("joueurs.exporter", "io")
+    def exporter_joueurs(self) -> None:
+        self.sauvegarder_joueurs()
+        self.depot.exporter()
 
     # Méthode pour ajouter un joueur
     def ajouter_joueur(self, nom: str, prenom: str, date_naissance: datetime.date, elo: int) -> bool:
-        joueur_existant = self.trouver_joueur_par_details(nom, prenom, date_naissance)  # Vérifier si le joueur existe déjà
-        if joueur_existant:
-            print("Ce joueur existe déjà.")
+        motif = self.motif_refus(nom, prenom, date_naissance)
+        if motif:
+            print(MESSAGES_REFUS[motif])
             return False
+        index = self.registre.prochain_index()  # Définir l'index du nouveau joueur (jamais réutilisé)
+        nouveau_joueur = Joueur(index, nom, prenom, date_naissance, elo)  # Créer un nouvel objet Joueur
+        self.joueurs.append(nouveau_joueur)  # Ajouter le joueur à la liste
+        self.registre.ajouter(nouveau_joueur)  # Indexer le nouveau joueur
+        with self.depot.transaction():
+            self.depot.enregistrer_index_max(self.registre.index_max)
+            self.enregistrer_joueur(nouveau_joueur)  # Écrire le seul joueur ajouté
+        return True
 
+    # Méthode pour vérifier qu'un joueur peut être ajouté (motif du refus, None s'il est accepté)
+    #
+    # Pour un joueur modifié (joueur), seuls les doublons avec un autre joueur et l'âge sont vérifiés :
+    # deux joueurs de mêmes nom, prénom et date de naissance rendraient la recherche par détails ambiguë.
+    def motif_refus(self, nom: str, prenom: str, date_naissance: datetime.date,
+                    aujourdhui: Optional[datetime.date] = None, joueur: Optional[Joueur] = None) -> Optional[str]:
+        existant = self.trouver_joueur_par_details(nom, prenom, date_naissance)
+        if existant is not None and existant is not joueur:  # Vérifier si le joueur existe déjà
+            return REFUS_DOUBLON
         age_minimum = datetime.timedelta(days=7 * 365)  # Définir l'âge minimum (7 ans)
-        if (datetime.date.today() - date_naissance) < age_minimum:
-            print("Le joueur doit avoir au moins 7 ans pour s'inscrire.")
+        if ((aujourdhui or datetime.date.today()) - date_naissance) < age_minimum:
+            return REFUS_AGE
+        if joueur is None and self.quota_atteint():
+            return REFUS_QUOTA
+        return None
+
+    # Méthode pour savoir si le quota de joueurs est atteint (le registre compte aussi un import en cours)
+    def quota_atteint(self) -> bool:
+        return self.quota is not None and len(self.registre) >= self.quota
+
+    # Méthode pour importer un lot de joueurs (mêmes règles qu'ajouter_joueur, une seule écriture)
+    #
+    # Les lignes sont consommées au fil de l'eau ; chaque joueur accepté est indexé aussitôt, ce qui écarte
+    # les doublons internes au fichier. Les joueurs ajoutés sont écrits en une fois à la fin du lot.
+    @chronometre("joueurs.importer", "io")
+    def importer_joueurs(self, lignes: Iterable[Dict[str, str]]) -> RapportImport:
+        rapport = RapportImport()
+        nouveaux = self.registre.ajouter_lot(self._joueurs_acceptes(lignes, rapport))
+        self.joueurs.extend(nouveaux)
+        if nouveaux:
+            with self.depot.transaction():
+                self.depot.enregistrer_index_max(self.registre.index_max)
+                self.depot.enregistrer_joueurs(joueur.to_dict() for joueur in nouveaux)
+        return rapport
+
+    # Méthode interne pour créer les joueurs des lignes valides (les refus sont comptés dans le rapport)
+    def _joueurs_acceptes(self, lignes: Iterable[Dict[str, str]], rapport: RapportImport) -> Iterator[Joueur]:
+        aujourdhui = datetime.date.today()
+        for ligne in lignes:
+            rapport.lues += 1
+            try:
+                nom, prenom, date_naissance, elo = convertir_ligne(ligne)
+            except ValueError as erreur:
+                rapport.refuser(REFUS_INVALIDE, ligne, str(erreur))
+                continue
+            motif = self.motif_refus(nom, prenom, date_naissance, aujourdhui)
+            if motif:
+                rapport.refuser(motif, ligne, MESSAGES_REFUS[motif])
+                continue
+            rapport.importes += 1
+            yield Joueur(self.registre.prochain_index(), nom, prenom, date_naissance, elo)
+
+    # Méthode pour modifier un joueur existant
+    def modifier_joueur(self, index: int, nom: str, prenom: str, date_naissance, elo) -> bool:
+        joueur = self.trouver_joueur_par_index(index)
+        if not joueur:
+            print("Joueur non trouvé.")
             return False
+        if isinstance(date_naissance, str):  # La vue peut transmettre la date saisie telle quelle
+            date_naissance = datetime.date.fromisoformat(date_naissance)
+        motif = self.motif_refus(nom, prenom, date_naissance, joueur=joueur)
+        if motif:
+            print(MESSAGES_REFUS[motif])
+            return False
+        self.registre.retirer(joueur)  # Retirer les anciennes clés avant la modification
+        if (nom, prenom) != (joueur.nom, joueur.prenom):
+            joueur.revision_nom += 1  # Seules les rondes où figure le joueur seront sérialisées à nouveau
+            Joueur.revision_noms += 1
+        joueur.nom = nom
+        joueur.prenom = prenom
+        joueur.date_naissance = date_naissance
+        joueur.elo = int(elo)
+        self.registre.ajouter(joueur)  # Réindexer le joueur avec ses nouvelles valeurs
+        self.enregistrer_joueur(joueur)
+        return True
 
-        if len(self.joueurs) < self.MAX_JOUEURS:
-            index = len(self.joueurs) + 1  # Définir l'index du nouveau joueur
-            nouveau_joueur = Joueur(index, nom, prenom, date_naissance, elo)  # Créer un nouvel objet Joueur
-            self.joueurs.append(nouveau_joueur)  # Ajouter le joueur à la liste
-            self.sauvegarder_joueurs()  # Sauvegarder les modifications
-            return True
+    # Méthode pour appliquer des variations Elo (index -> (variation, nombre de parties)) et les historiser
+    def appliquer_variations_elo(self, variations: Dict[int, Tuple[int, int]], tournoi: str, ronde: Optional[int],
+                                 date: datetime.date, sauvegarder: bool = True) -> None:
+        for index, (variation, parties) in variations.items():
+            joueur = self.trouver_joueur_par_index(index)
+            if not joueur:
+                continue
+            joueur.elo = int(joueur.elo) + variation
+            joueur.ajouter_historique_elo({
+                "date": date.isoformat(),
+                "tournoi": tournoi,
+                "ronde": ronde,
+                "parties": parties,
+                "variation": variation,
+                "elo": joueur.elo
+            })
+            self.registre.mettre_a_jour(joueur)  # Réindexer le nouvel Elo
+            self.rondes_notees.setdefault(tournoi, set()).add(ronde)
+        if sauvegarder:
+            self.enregistrer_joueurs(variations)
+
+    # Méthode pour enregistrer plusieurs joueurs modifiés en une seule transaction
+    @chronometre("joueurs.enregistrer", "io")
+    def enregistrer_joueurs(self, index_joueurs: Iterable[int]) -> None:
+        with self.depot.transaction():
+            for index in index_joueurs:
+                joueur = self.trouver_joueur_par_index(index)
+                if joueur:
+                    self.enregistrer_joueur(joueur)
+
+    # Méthode pour enregistrer un joueur ajouté ou modifié : immédiat, ou à la fin de l'unité de travail en cours
+    def enregistrer_joueur(self, joueur: Joueur) -> None:
+        unite = unite_en_cours(self.depot)
+        if unite is not None:
+            unite.marquer_joueur(joueur)
         else:
-            print("Nombre maximum de joueurs atteint.")
-            return False
+            self.depot.enregistrer_joueur(joueur.to_dict())
 
     # Méthode pour trouver un joueur par ses détails
     def trouver_joueur_par_details(self, nom: str, prenom: str, date_naissance: datetime.date) -> Optional[Joueur]:
-        for joueur in self.joueurs:
-            if joueur.nom == nom and joueur.prenom == prenom and joueur.date_naissance == date_naissance:
-                return joueur
-        return None
+        return self.registre.par_details(nom, prenom, date_naissance)
+
+    # Méthode pour rechercher des joueurs par nom et prénom (sans tenir compte des accents ni de la casse)
+    def rechercher_joueurs_par_nom(self, nom: str, prenom: str) -> List[Joueur]:
+        return self.registre.par_nom(nom, prenom)
+
+    # Méthode pour rechercher les joueurs dans une plage d'Elo
+    def rechercher_joueurs_par_elo(self, elo_min: int, elo_max: int) -> List[Joueur]:
+        return self.registre.par_elo(elo_min, elo_max)
 
     # Méthode pour supprimer un joueur
     def supprimer_joueur(self, index: int) -> bool:
         joueur = self.trouver_joueur_par_index(index)
         if joueur:
+            tournois = self.depot.tournois_du_joueur(joueur.index)
+            unite = unite_en_cours(self.depot)
+            if unite is not None:  # Tournois modifiés pendant l'opération, pas encore écrits dans le dépôt
+                tournois += [tournoi.nom for tournoi in unite.tournois.values()
+                             if tournoi.nom not in tournois and joueur in tournoi.joueurs_references()]
+            if tournois:  # Les tournois ne gardent que l'index : ils ne pourraient plus être rechargés
+                print(f"Suppression impossible : le joueur {joueur.nom} {joueur.prenom} est référencé par les "
+                      f"tournois {', '.join(tournois)}.")
+                return False
             self.joueurs.remove(joueur)
-            self.sauvegarder_joueurs()
+            self.registre.retirer(joueur)
+            if unite is not None:
+                unite.oublier_joueur(joueur.index)  # Un enregistrement en attente recréerait le joueur supprimé
+            with self.depot.transaction():
+                self.depot.enregistrer_index_max(self.registre.index_max)  # Données sans maximum enregistré
+                self.depot.supprimer_joueur(joueur.index)
             return True
         else:
             print("Joueur non trouvé.")
@@ -122,7 +277,19 @@ class JoueurManager:
 
     # Méthode pour trouver un joueur par son index
     def trouver_joueur_par_index(self, index: int) -> Optional[Joueur]:
-        for joueur in self.joueurs:
-            if joueur.index == index:
-                return joueur
-        return None
\ No newline at end of file
+        return self.registre.par_index(index)
+
+
+_gestionnaires: Dict[int, JoueurManager] = {}  # Gestionnaire (table d'identité des joueurs) de chaque dépôt
+
+
+# Fonction pour obtenir le gestionnaire partagé des joueurs d'un dépôt (créé une seule fois par dépôt)
+#
+# Tous les tournois d'un même dépôt référencent ainsi les mêmes objets Joueur : un joueur n'est chargé
+# qu'une fois, quel que soit le nombre de tournois auxquels il participe.
+def obtenir_joueur_manager(depot: Optional[Depot] = None) -> JoueurManager:
+    depot = depot or obtenir_depot()
+    gestionnaire = _gestionnaires.get(id(depot))
+    if gestionnaire is None or gestionnaire.depot is not depot:
+        gestionnaire = _gestionnaires[id(depot)] = JoueurManager(depot)
+    return gestionnaire
@@ -0,0 +1,169 @@
+# Importation des modules nécessaires
+import json  # Pour manipuler les fichiers JSON
+import os  # Pour les opérations liées au système de fichiers
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple  # Pour les annotations de type
+
+from models.cache_fichiers import obtenir_cache  # Contenu analysé des fichiers inchangés depuis la dernière lecture
+from models.persistance import Persistance, obtenir_persistance  # Écritures atomiques et durabilité
+from models.instrumentation import compter, mesure  # Mesure des temps (si l'instrumentation est activée)
+
+
+# Définition de la classe Journal : stockage en ajout seul devant un fichier JSON d'export
+#
+# Chaque modification est ajoutée au fichier "<fichier>.journal" sous forme d'une ligne JSON
+# ({"op": "maj"|"suppr", "cle": ..., "valeur": ...}). Au-delà de seuil() entrées,
+# l'état complet est réécrit dans le fichier JSON d'origine (format d'export inchangé)
+# et le journal est vidé. Au démarrage, le fichier JSON est lu puis le journal est rejoué.
+# Les écritures passent par une Persistance : ajouts regroupés par transaction, export réécrit de façon atomique.
+class Journal:
+    SEUIL_COMPACTION = 500  # Nombre minimal d'entrées avant réécriture complète du fichier d'export
+    RATIO_COMPACTION = 0.5  # Au-delà du minimum, entrées tolérées par clé de l'état avant réécriture
+    EXTENSION = ".journal"  # Extension du fichier journal
+
+    # Constructeur de la classe Journal
+    def __init__(self, fichier: str, vers_export: Callable[[Dict[str, Any]], Any],
+                 persistance: Optional[Persistance] = None):
+        self.fichier = fichier  # Chemin du fichier JSON d'export (instantané)
+        self.fichier_journal = fichier + self.EXTENSION  # Chemin du fichier journal
+        self.vers_export = vers_export  # Fonction convertissant l'état (clé -> valeur) au format d'export
+        self.etat: Dict[str, Any] = {}  # Dernier état persisté, clé -> valeur
+        self.nb_entrees = 0  # Nombre d'entrées présentes dans le journal
+        self._fin_propre = True  # Faux si la dernière ligne du journal a été tronquée
+        self.persistance = persistance or obtenir_persistance()  # Écritures sur disque
+
+    # Méthode pour lire le fichier d'export (None s'il n'existe pas)
+    #
+    # Le contenu analysé vient du cache des fichiers tant que le fichier n'a pas changé : il ne doit pas être modifié
+    # (les sections de l'état sont remplacées, jamais modifiées sur place).
+    # Un fichier illisible lève ValueError : partir d'un état vide finirait par le compacter, donc par l'écraser.
+    def lire_export(self) -> Any:
+        try:
+            return obtenir_cache().lire(self.fichier, _analyser_export)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as erreur:
+            print(f"Erreur dans le format du fichier {self.fichier}.")
+            raise ValueError(f"Fichier {self.fichier} illisible ({erreur}) : corrigez-le ou restaurez une sauvegarde "
+                             "avant de relancer l'application.") from erreur
+
+    # Méthode pour rejouer le journal sur l'état issu du fichier d'export
+    def charger(self, etat_initial: Dict[str, Any]) -> Dict[str, Any]:
+        self.etat = etat_initial
+        self.nb_entrees = 0
+        self._fin_propre = True
+        try:
+            entrees, self._fin_propre = obtenir_cache().lire(self.fichier_journal, _analyser_journal)
+        except FileNotFoundError:
+            return self.etat
+        with mesure("json.rejouer_journal", "json"):
+            for entree in entrees:
+                if entree.get("op") == "maj":
+                    self.etat[entree["cle"]] = entree["valeur"]
+                elif entree.get("op") == "suppr":
+                    self.etat.pop(entree["cle"], None)
+        self.nb_entrees = len(entrees)
+        compter("journal.entrees_rejouees", self.nb_entrees)
+        return self.etat
+
+    # Méthode pour obtenir le nombre d'entrées déclenchant la compaction
+    #
+    # Le seuil grandit avec l'état : chaque réécriture complète (O(n)) est payée par au moins n / 2
+    # modifications, ce qui garde un coût constant par modification quelle que soit la taille du fichier.
+    def seuil(self) -> int:
+        return max(self.SEUIL_COMPACTION, int(len(self.etat) * self.RATIO_COMPACTION))
+
+    # Méthode pour enregistrer la nouvelle valeur d'une clé (ignorée si inchangée)
+    def enregistrer(self, cle: str, valeur: Any) -> None:
+        if cle in self.etat and _identique(self.etat[cle], valeur):
+            return
+        self.etat[cle] = valeur
+        self._ajouter({"op": "maj", "cle": cle, "valeur": valeur})
+
+    # Méthode pour enregistrer un lot de valeurs (clé -> valeur) en une fois
+    #
+    # Si le lot ferait dépasser le seuil de compaction, l'état est mis à jour puis le fichier d'export est
+    # réécrit une seule fois, au lieu d'une compaction à chaque dépassement du seuil pendant le lot.
+    def enregistrer_lot(self, valeurs: Dict[str, Any]) -> None:
+        modifiees = {cle: valeur for cle, valeur in valeurs.items()
+                     if cle not in self.etat or not _identique(self.etat[cle], valeur)}
+        if self.nb_entrees + len(modifiees) < self.seuil():
+            with self.persistance.transaction():  # Toutes les entrées du lot en une seule écriture
+                for cle, valeur in modifiees.items():
+                    self.enregistrer(cle, valeur)
+            return
+        self.etat.update(modifiees)
+        self.compacter()
+
+    # Méthode pour enregistrer la suppression d'une clé
+    def supprimer(self, cle: str) -> None:
+        if cle not in self.etat:
+            return
+        del self.etat[cle]
+        self._ajouter({"op": "suppr", "cle": cle})
+
+    # Méthode pour n'enregistrer que les différences entre l'état persisté et les sections fournies
+    def synchroniser(self, sections: Dict[str, Any]) -> None:
+        for cle in [cle for cle in self.etat if cle not in sections]:
+            self.supprimer(cle)
+        self.enregistrer_lot(sections)
+
+    # Méthode pour réécrire le fichier d'export complet et vider le journal
+    def compacter(self) -> None:
+        dossier = os.path.dirname(self.fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        with mesure("json.encoder_export", "json"):
+            contenu = json.dumps(self.vers_export(self.etat), indent=4, ensure_ascii=False)
+        compter("journal.compactions")
+        self.persistance.remplacer(self.fichier, contenu)
+        self.persistance.supprimer(self.fichier_journal)  # Rejouer le journal sur le nouvel export serait sans effet
+        self.nb_entrees = 0
+        self._fin_propre = True
+
+    # Méthode pour supprimer le fichier d'export et le journal
+    def detruire(self) -> None:
+        for fichier in (self.fichier, self.fichier_journal):
+            self.persistance.supprimer(fichier)
+        self.etat = {}
+        self.nb_entrees = 0
+        self._fin_propre = True
+
+    # Méthode interne pour ajouter une entrée à la fin du journal
+    def _ajouter(self, entree: Dict[str, Any]) -> None:
+        ligne = json.dumps(entree, ensure_ascii=False, separators=(",", ":")) + "\n"
+        if not self._fin_propre:
+            ligne = "\n" + ligne  # Isole la ligne tronquée pour ne pas corrompre la nouvelle entrée
+            self._fin_propre = True
+        self.persistance.ajouter(self.fichier_journal, ligne)  # Écrit à la fin de la transaction en cours
+        compter("journal.entrees_ajoutees")
+        self.nb_entrees += 1
+        if self.nb_entrees >= self.seuil():
+            self.compacter()
+
+
+# Fonction interne pour comparer une valeur persistée et une nouvelle valeur
+#
+# Une ronde inchangée fournit le même dictionnaire qu'à la sauvegarde précédente (forme sérialisée conservée) :
+# l'identité évite alors de comparer tous ses matchs.
+def _identique(persistee: Any, valeur: Any) -> bool:
+    return persistee is valeur or persistee == valeur
+
+
+# Fonction interne pour analyser un fichier d'export JSON
+def _analyser_export(file: TextIO) -> Any:
+    with mesure("json.lire_export", "json"):
+        return json.load(file)
+
+
+# Fonction interne pour analyser un journal : entrées décodées et fin propre (dernière ligne terminée par "\n")
+def _analyser_journal(file: TextIO) -> Tuple[List[Dict], bool]:
+    entrees: List[Dict] = []
+    fin_propre = True
+    with mesure("json.lire_journal", "json"):
+        for ligne in file:
+            fin_propre = ligne.endswith("\n")
+            try:
+                entrees.append(json.loads(ligne))
+            except json.JSONDecodeError:
+                continue  # Ligne tronquée par un arrêt brutal : ignorée
+    return entrees, fin_propre
@@ -0,0 +1,187 @@
+# Importation des modules nécessaires
+import atexit  # Pour écrire les données en attente à la fermeture de l'application
+import contextlib  # Pour les gestionnaires de contexte
+import hashlib  # Pour les empreintes des fichiers réécrits
+import os  # Pour les opérations liées au système de fichiers
+import tempfile  # Pour les fichiers temporaires des écritures atomiques
+import threading  # Pour la synchronisation périodique
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple  # Pour les annotations de type
+
+import config  # Paramètres de l'application (mode de durabilité)
+from models.instrumentation import chronometre, compter  # Mesure des temps (si l'instrumentation est activée)
+
+MODES_DURABILITE = ("immediat", "periodique", "manuel")  # À chaque modification, toutes les N ms, sur demande
+
+
+# Fonction pour écrire un fichier de façon atomique : fichier temporaire, fsync puis renommage
+#
+# Le fichier cible contient toujours soit l'ancienne version complète, soit la nouvelle : un arrêt brutal
+# pendant l'écriture ne laisse au pire qu'un fichier temporaire, ignoré au chargement.
+def ecrire_atomique(fichier: str, contenu: str) -> None:
+    ecrire_atomique_flux(fichier, (contenu,))
+
+
+# Fonction pour écrire un fichier de façon atomique à partir de morceaux de texte produits au fil de l'eau
+#
+# Les morceaux sont écrits dans le fichier temporaire dès qu'ils sont produits : le contenu complet
+# n'est jamais assemblé en mémoire (exports de plusieurs centaines de milliers de lignes).
+@chronometre("fichier.ecrire_atomique", "io")
+def ecrire_atomique_flux(fichier: str, morceaux: Iterable[str]) -> None:
+    dossier = os.path.dirname(fichier) or "."
+    descripteur, temporaire = tempfile.mkstemp(dir=dossier, prefix=os.path.basename(fichier) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(descripteur, 'w', encoding='utf-8') as file:
+            file.writelines(morceaux)
+            file.flush()
+            os.fsync(file.fileno())  # Contenu sur disque avant le renommage
+        os.replace(temporaire, fichier)  # Renommage atomique (y compris sous Windows)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+    synchroniser_dossier(dossier)
+
+
+# Fonction pour rendre durable le renommage ou la suppression d'un fichier (sans effet hors POSIX)
+def synchroniser_dossier(dossier: str) -> None:
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descripteur = os.open(dossier, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descripteur)
+    finally:
+        os.close(descripteur)
+
+
+# Définition de la classe Persistance : ajouts aux journaux regroupés et politique de durabilité
+#
+# Les lignes ajoutées pendant une transaction sont gardées en mémoire puis écrites en une seule fois par
+# fichier à la fin de la transaction. Le mode de durabilité fixe le moment des fsync :
+# "immediat" après chaque écriture, "periodique" au plus tard `intervalle_ms` millisecondes après,
+# "manuel" uniquement lors d'un appel à vider() (et à la fermeture de l'application).
+class Persistance:
+    # Constructeur de la classe Persistance
+    def __init__(self, mode: str = "immediat", intervalle_ms: int = 200):
+        if mode not in MODES_DURABILITE:
+            raise ValueError(f"Mode de durabilité inconnu : {mode} (attendu : {', '.join(MODES_DURABILITE)}).")
+        self.mode = mode  # Mode de durabilité
+        self.intervalle = intervalle_ms / 1000  # Intervalle maximal entre deux fsync en mode périodique (secondes)
+        self._en_attente: Dict[str, List[str]] = {}  # Lignes non encore écrites, par fichier
+        self._a_synchroniser: Set[str] = set()  # Fichiers écrits mais pas encore synchronisés sur disque
+        self._profondeur = 0  # Niveau d'imbrication des transactions
+        self._minuterie: Optional[threading.Timer] = None  # Synchronisation périodique programmée
+        self._empreintes: Dict[str, Tuple[bytes, Tuple[int, int, int]]] = {}  # Fichier -> (empreinte, signature)
+        self._verrou = threading.RLock()
+        atexit.register(self.vider)
+
+    # Méthode pour ajouter du texte à la fin d'un fichier (différé jusqu'à la fin de la transaction en cours)
+    def ajouter(self, fichier: str, texte: str) -> None:
+        with self._verrou:
+            self._en_attente.setdefault(fichier, []).append(texte)
+            if self._profondeur == 0:
+                self._ecrire()
+
+    # Méthode pour remplacer un fichier de façon atomique (sans effet si son contenu est déjà celui-ci)
+    #
+    # L'empreinte du contenu écrit est conservée avec la signature du fichier (date, taille, inode) : un contenu
+    # identique n'est pas réécrit tant que le fichier n'a pas été modifié par ailleurs. Un fichier inconnu
+    # de même taille est relu une fois pour comparer les empreintes, ce qui coûte moins qu'une écriture.
+    def remplacer(self, fichier: str, contenu: str) -> None:
+        donnees = contenu.encode('utf-8')
+        empreinte = hashlib.blake2b(donnees, digest_size=16).digest()
+        with self._verrou:
+            if self._est_inchange(fichier, donnees, empreinte):
+                compter("fichier.remplacements_evites")
+                return
+            ecrire_atomique(fichier, contenu)
+            etat = os.stat(fichier)
+            self._empreintes[fichier] = (empreinte, (etat.st_mtime_ns, etat.st_size, etat.st_ino))
+
+    # Méthode interne pour savoir si un fichier contient déjà les données indiquées
+    def _est_inchange(self, fichier: str, donnees: bytes, empreinte: bytes) -> bool:
+        try:
+            etat = os.stat(fichier)
+        except FileNotFoundError:
+            return False
+        signature = (etat.st_mtime_ns, etat.st_size, etat.st_ino)
+        connue = self._empreintes.get(fichier)
+        if connue is not None and connue[1] == signature:
+            return connue[0] == empreinte
+        if etat.st_size != len(donnees) or fichier in self._en_attente:
+            return False
+        with open(fichier, 'rb') as file:
+            sur_disque = hashlib.blake2b(file.read(), digest_size=16).digest()
+        self._empreintes[fichier] = (sur_disque, signature)
+        return sur_disque == empreinte
+
+    # Méthode pour supprimer un fichier et abandonner les ajouts en attente qui le concernent
+    def supprimer(self, fichier: str) -> None:
+        with self._verrou:
+            self._en_attente.pop(fichier, None)
+            self._a_synchroniser.discard(fichier)
+            self._empreintes.pop(fichier, None)
+            if os.path.exists(fichier):
+                os.remove(fichier)
+                synchroniser_dossier(os.path.dirname(fichier) or ".")
+
+    # Méthode pour regrouper plusieurs sauvegardes en une seule écriture par fichier
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._verrou:
+            self._profondeur += 1
+        try:
+            yield
+        finally:
+            with self._verrou:
+                self._profondeur -= 1
+                if self._profondeur == 0:
+                    self._ecrire()  # Y compris après une erreur : les sauvegardes déjà faites sont conservées
+
+    # Méthode pour écrire et synchroniser sur disque tout ce qui est en attente
+    def vider(self) -> None:
+        with self._verrou:
+            self._ecrire(synchroniser=False)
+            self._synchroniser()
+
+    # Méthode interne pour synchroniser sur disque les fichiers déjà écrits (appelée par la minuterie)
+    def _synchroniser(self) -> None:
+        with self._verrou:
+            if self._minuterie is not None:
+                self._minuterie.cancel()
+                self._minuterie = None
+            for fichier in sorted(self._a_synchroniser):
+                if os.path.exists(fichier):
+                    with open(fichier, 'a', encoding='utf-8') as file:
+                        os.fsync(file.fileno())
+            self._a_synchroniser.clear()
+
+    # Méthode interne pour écrire les ajouts en attente (un seul write par fichier)
+    @chronometre("fichier.ajouter", "io")
+    def _ecrire(self, synchroniser: bool = True) -> None:
+        en_attente, self._en_attente = self._en_attente, {}
+        for fichier, textes in en_attente.items():
+            dossier = os.path.dirname(fichier)
+            if dossier:
+                os.makedirs(dossier, exist_ok=True)
+            with open(fichier, 'a', encoding='utf-8') as file:
+                compter("fichier.caracteres_ajoutes", file.write("".join(textes)))
+                file.flush()
+                if self.mode == "immediat" and synchroniser:
+                    os.fsync(file.fileno())
+                else:
+                    self._a_synchroniser.add(fichier)
+        if self.mode == "periodique" and self._a_synchroniser and self._minuterie is None:
+            self._minuterie = threading.Timer(self.intervalle, self._synchroniser)  # fsync au plus tard dans N ms
+            self._minuterie.daemon = True
+            self._minuterie.start()
+
+
+_persistance_par_defaut: Optional[Persistance] = None  # Persistance partagée par les dépôts JSON
+
+
+# Fonction pour obtenir la persistance configurée dans config.py (créée une seule fois)
+def obtenir_persistance() -> Persistance:
+    global _persistance_par_defaut
+    if _persistance_par_defaut is None:
+        _persistance_par_defaut = Persistance(config.DURABILITE, config.INTERVALLE_DURABILITE_MS)
+    return _persistance_par_defaut
@@ -0,0 +1,187 @@
+# Importation des modules nécessaires
+import bisect  # Pour maintenir l'index Elo trié
+import datetime  # Pour manipuler les dates
+import unicodedata  # Pour normaliser les noms (accents, casse)
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple  # Pour les annotations de type
+
+if TYPE_CHECKING:  # Évite l'import circulaire avec models.joueur_model
+    from models.joueur_model import Joueur
+
+
+# Fonction pour normaliser un nom (sans accents, sans casse, espaces réduits)
+def normaliser_nom(texte: str) -> str:
+    if texte.isascii():  # Cas courant : aucun accent à retirer (évite la décomposition Unicode)
+        return " ".join(texte.casefold().split())
+    decompose = unicodedata.normalize("NFKD", texte)  # Sépare les lettres de leurs accents
+    sans_accents = "".join(c for c in decompose if not unicodedata.combining(c))  # Supprime les accents
+    return " ".join(sans_accents.casefold().split())  # Ignore la casse et les espaces superflus
+
+
+# Définition de la classe RegistreJoueurs : index en mémoire sur la liste des joueurs
+class RegistreJoueurs:
+    # Constructeur de la classe RegistreJoueurs
+    def __init__(self, joueurs: Iterable['Joueur'] = ()):
+        self._par_index: Dict[int, 'Joueur'] = {}  # Index principal : index -> joueur
+        self._par_details: Dict[Tuple[str, str, datetime.date], 'Joueur'] = {}  # (nom, prénom, naissance) -> joueur
+        self._par_nom: Dict[Tuple[str, str], Dict[int, 'Joueur']] = {}  # Nom normalisé -> joueurs homonymes
+        self._par_elo: Dict[int, List[int]] = {}  # Elo -> index triés des joueurs ayant cet Elo
+        self._valeurs_elo: List[int] = []  # Valeurs d'Elo distinctes triées, pour les recherches par plage
+        self._cles: Dict[int, Tuple] = {}  # Clés utilisées à l'insertion (pour retirer un joueur modifié)
+        self._index_max = 0  # Plus grand index jamais attribué
+        for joueur in joueurs:
+            self.ajouter(joueur)
+
+    # Méthode pour reconstruire tous les index à partir d'une liste de joueurs
+    #
+    # index_max est le plus grand index jamais attribué, tel qu'enregistré par le dépôt : les index des joueurs
+    # supprimés ne sont pas réattribués, même s'ils dépassent ceux des joueurs restants.
+    def reconstruire(self, joueurs: Iterable['Joueur'], index_max: int = 0) -> None:
+        self._par_index.clear()
+        self._par_details.clear()
+        self._par_nom.clear()
+        self._cles.clear()
+        self._par_elo.clear()
+        self._valeurs_elo = []
+        self._index_max = index_max
+        for joueur in joueurs:
+            self._indexer(joueur)
+        self._inserer_elo_lot(cles[2] for cles in self._cles.values())  # Un seul tri au lieu de n insertions
+
+    # Méthode pour ajouter un joueur dans tous les index
+    def ajouter(self, joueur: 'Joueur') -> None:
+        self._indexer(joueur)
+        self._inserer_elo(self._cles[joueur.index][2])
+
+    # Méthode pour ajouter un lot de joueurs (index Elo trié une seule fois, à la fin du lot)
+    #
+    # Chaque joueur est indexé dès qu'il est produit par l'itérable : un générateur peut donc interroger
+    # le registre (par_details) pour écarter les doublons internes au lot.
+    def ajouter_lot(self, joueurs: Iterable['Joueur']) -> List['Joueur']:
+        ajoutes = []
+        for joueur in joueurs:
+            self._indexer(joueur)
+            ajoutes.append(joueur)
+        self._inserer_elo_lot(self._cles[joueur.index][2] for joueur in ajoutes)  # Un seul tri pour tout le lot
+        return ajoutes
+
+    # Méthode pour retirer un joueur de tous les index
+    def retirer(self, joueur: 'Joueur') -> None:
+        cles = self._cles.pop(joueur.index, None)
+        if cles is None:
+            return
+        details, nom, elo = cles
+        del self._par_index[joueur.index]
+        if self._par_details.get(details) is joueur:
+            del self._par_details[details]
+        homonymes = self._par_nom.get(nom)
+        if homonymes is not None:
+            homonymes.pop(joueur.index, None)
+            if not homonymes:
+                del self._par_nom[nom]
+        self._retirer_elo(elo)
+
+    # Méthode pour réindexer un joueur après modification de ses attributs
+    def mettre_a_jour(self, joueur: 'Joueur') -> None:
+        cles = self._cles.get(joueur.index)
+        if cles is not None and cles[0] == (joueur.nom, joueur.prenom, joueur.date_naissance):
+            self._deplacer_elo(joueur, cles)  # Seul l'Elo a pu changer : les index de noms sont conservés
+            return
+        self.retirer(joueur)  # Retire les anciennes clés mémorisées
+        self.ajouter(joueur)  # Indexe les nouvelles valeurs
+
+    # Méthode pour trouver un joueur par son index (O(1))
+    def par_index(self, index: int) -> Optional['Joueur']:
+        return self._par_index.get(index)
+
+    # Méthode pour trouver un joueur par ses détails (O(1))
+    def par_details(self, nom: str, prenom: str, date_naissance: datetime.date) -> Optional['Joueur']:
+        return self._par_details.get((nom, prenom, date_naissance))
+
+    # Méthode pour rechercher les joueurs par nom et prénom normalisés (O(1))
+    def par_nom(self, nom: str, prenom: str) -> List['Joueur']:
+        homonymes = self._par_nom.get((normaliser_nom(nom), normaliser_nom(prenom)), {})
+        return list(homonymes.values())
+
+    # Méthode pour rechercher les joueurs dont l'Elo est compris entre deux bornes incluses
+    # (O(log v + k), v étant le nombre de valeurs d'Elo distinctes, quelques milliers au plus)
+    def par_elo(self, elo_min: int, elo_max: int) -> List['Joueur']:
+        debut = bisect.bisect_left(self._valeurs_elo, elo_min)
+        fin = bisect.bisect_right(self._valeurs_elo, elo_max)
+        return [self._par_index[index] for elo in self._valeurs_elo[debut:fin] for index in self._par_elo[elo]]
+
+    # Méthode pour obtenir le prochain index libre
+    def prochain_index(self) -> int:
+        return self._index_max + 1
+
+    # Propriété pour obtenir le plus grand index jamais attribué (à enregistrer avec les joueurs)
+    @property
+    def index_max(self) -> int:
+        return self._index_max
+
+    # Méthode pour connaître le nombre de joueurs indexés
+    def __len__(self) -> int:
+        return len(self._par_index)
+
+    # Méthode pour vérifier si un index est présent dans le registre
+    def __contains__(self, index: object) -> bool:
+        return index in self._par_index
+
+    # Méthode interne pour replacer un joueur dans l'index Elo trié
+    def _deplacer_elo(self, joueur: 'Joueur', cles: Tuple) -> None:
+        details, nom, ancien = cles
+        nouveau = (int(joueur.elo), joueur.index)
+        if nouveau == ancien:
+            return
+        self._retirer_elo(ancien)
+        self._inserer_elo(nouveau)
+        self._cles[joueur.index] = (details, nom, nouveau)
+
+    # Méthode interne pour ajouter une entrée (elo, index) à l'index Elo
+    #
+    # Les joueurs sont rangés par valeur d'Elo : une insertion ne déplace que les joueurs de même Elo,
+    # quelle que soit la taille de la base (les nouveaux index, croissants, sont ajoutés en fin de liste).
+    def _inserer_elo(self, cle: Tuple[int, int]) -> None:
+        elo, index = cle
+        meme_elo = self._par_elo.get(elo)
+        if meme_elo is None:
+            self._par_elo[elo] = [index]
+            bisect.insort(self._valeurs_elo, elo)
+        else:
+            bisect.insort(meme_elo, index)
+
+    # Méthode interne pour ajouter un lot d'entrées (elo, index) à l'index Elo (un tri par valeur touchée)
+    def _inserer_elo_lot(self, cles: Iterable[Tuple[int, int]]) -> None:
+        touches = set()
+        for elo, index in cles:
+            self._par_elo.setdefault(elo, []).append(index)
+            touches.add(elo)
+        for elo in touches:
+            self._par_elo[elo].sort()
+        if touches:
+            self._valeurs_elo = sorted(self._par_elo)
+
+    # Méthode interne pour retirer une entrée (elo, index) de l'index Elo
+    def _retirer_elo(self, cle: Tuple[int, int]) -> None:
+        elo, index = cle
+        meme_elo = self._par_elo.get(elo)
+        if meme_elo is None:
+            return
+        position = bisect.bisect_left(meme_elo, index)  # Recherche dichotomique de l'entrée Elo
+        if position < len(meme_elo) and meme_elo[position] == index:
+            del meme_elo[position]
+        if not meme_elo:
+            del self._par_elo[elo]
+            del self._valeurs_elo[bisect.bisect_left(self._valeurs_elo, elo)]
+
+    # Méthode interne pour remplir les index de hachage d'un joueur
+    def _indexer(self, joueur: 'Joueur') -> None:
+        if joueur.index in self._cles:
+            self.retirer(joueur)  # Évite les entrées fantômes si le joueur est déjà indexé
+        details = (joueur.nom, joueur.prenom, joueur.date_naissance)
+        nom = (normaliser_nom(joueur.nom), normaliser_nom(joueur.prenom))
+        elo = (int(joueur.elo), joueur.index)
+        self._par_index[joueur.index] = joueur
+        self._par_details.setdefault(details, joueur)
+        self._par_nom.setdefault(nom, {})[joueur.index] = joueur
+        self._cles[joueur.index] = (details, nom, elo)
+        self._index_max = max(self._index_max, joueur.index)
@@ -2,32 +2,37 @@
 import datetime  # Pour manipuler les dates
 import json  # Pour manipuler les fichiers JSON
 import os  # Pour les opérations liées au système de fichiers
-from typing import List, Optional, Tuple  # Pour les annotations de type
+from typing import Dict, List, Optional, Tuple, Union  # Pour les annotations de type
+
+import config  # Paramètres de l'application (quota de tournois)
 
 # Importation des classes nécessaires depuis les modules correspondants
 from models.tournoi_model import Tournoi  # Modèle pour les tournois
-from models.joueur_model import Joueur  # Modèle pour les joueurs
+from models.joueur_model import Joueur, JoueurManager  # Modèle pour les joueurs et table d'identité partagée
+from models.depots import Depot, obtenir_depot  # Couche de stockage (JSON journalisé ou SQLite)
+from models.persistance import ecrire_atomique  # Écriture atomique des fichiers
+from models.instrumentation import chronometre  # Mesure des temps (si l'instrumentation est activée)
+from models.unite_travail import unite_de_travail, unite_en_cours  # Sauvegardes regroupées en fin d'opération
+from models import exporteurs  # Exports CSV, HTML, Markdown et texte
 
 # Définition de la classe TournoiManager pour gérer les opérations sur les tournois
 class TournoiManager:
-    MAX_TOURNOIS = 30  # Nombre maximum de tournois
-    FICHIER_JSON = "data/tournaments.json"  # Chemin du fichier JSON
-
     # Constructeur de la classe TournoiManager
-    def __init__(self):
+    def __init__(self, depot: Optional[Depot] = None, joueur_manager: Optional[JoueurManager] = None):
+        self.quota: Optional[int] = config.QUOTA_TOURNOIS  # Nombre maximum de tournois (None : illimité)
         self.tournois: List[Tournoi] = []  # Liste des tournois
-        self.charger_tournois()  # Charger les tournois depuis le fichier JSON
+        self.depot = depot or obtenir_depot()  # Dépôt de stockage configuré
+        self.joueur_manager = joueur_manager  # Table d'identité des joueurs (par défaut : celle du dépôt)
+        self.charger_tournois()  # Charger les tournois depuis le dépôt
 
-    # Méthode pour charger les tournois depuis un fichier JSON
+    # Méthode pour charger les tournois depuis le dépôt
+    @chronometre("tournois.charger", "io")
     def charger_tournois(self) -> None:
-        if os.path.exists(self.FICHIER_JSON):  # Vérifie si le fichier JSON existe
-            with open(self.FICHIER_JSON, "r", encoding='utf-8') as file:  # Ouvre le fichier en lecture
-                try:
-                    data = json.load(file)  # Charge les données JSON
-                    self.tournois = [Tournoi.from_dict(tournoi_data) for tournoi_data in data.values()]  # Convertit les dictionnaires en objets Tournoi
-                    self.reindexer_tournois()  # Réindexe les tournois
-                except json.JSONDecodeError as e:
-                    print(f"Erreur lors du chargement des tournois: {str(e)}")  # Affiche un message d'erreur en cas d'exception
+        data = self.depot.charger_entetes()  # Charge les en-têtes des tournois
+        # Convertit les dictionnaires en objets Tournoi
+        self.tournois = [Tournoi.from_dict(tournoi_data, self.depot, self.joueur_manager)
+                         for tournoi_data in data.values()]
+        self.reindexer_tournois()  # Réindexe les tournois
 
     # Méthode pour charger un tournoi spécifique depuis un fichier JSON
     def charger_tournoi(nom_tournoi):
@@ -54,16 +59,30 @@ class TournoiManager:
                     joueur_blanc = next(j for j in tournoi.joueurs if j.nom == joueur_blanc_nom.strip())
                     joueur_noir = next(j for j in tournoi.joueurs if j.nom == joueur_noir_nom.strip())
                     match = Match(joueur_blanc, joueur_noir, match_data['score'])
-                    ronde.matchs.append(match)
+                    ronde.ajouter_match(match)
                 ronde.classement_apres_ronde = ronde_data['classement_apres_ronde']
                 tournoi.rondes.append(ronde)
             return tournoi
 
-    # Méthode pour sauvegarder les tournois dans un fichier JSON
+    # Méthode pour sauvegarder les en-têtes des tournois : immédiate, ou à la fin de l'unité de travail en cours
     def sauvegarder_tournois(self) -> None:
+        unite = unite_en_cours(self.depot)
+        if unite is not None:
+            unite.marquer_entetes(self)
+        else:
+            self.ecrire_tournois()
+
+    # Méthode pour écrire les en-têtes des tournois (tournaments.json)
+    @chronometre("tournois.sauvegarder", "io")
+    def ecrire_tournois(self) -> None:
         data = {tournoi.nom: tournoi.to_dict_base() for tournoi in self.tournois}  # Convertit les objets Tournoi en dictionnaires
-        with open(self.FICHIER_JSON, "w", encoding='utf-8') as file:  # Ouvre le fichier en écriture
-            json.dump(data, file, indent=4, ensure_ascii=False)  # Écrit les données JSON dans le fichier
+        self.depot.synchroniser_entetes(data)  # N'écrit que les en-têtes ajoutés, modifiés ou supprimés
+
+    # Méthode pour réécrire les fichiers d'export complets des tournois
+    @chronometre("tournois.exporter", "io")
+    def exporter_tournois(self) -> None:
+        self.sauvegarder_tournois()
+        self.depot.exporter()
 
     # Méthode pour trouver un tournoi par son index
     def trouver_tournoi_par_index(self, index: int) -> Optional[Tournoi]:
@@ -74,12 +93,14 @@ class TournoiManager:
 
     # Méthode pour ajouter un nouveau tournoi
     def ajouter_tournoi(self, nom: str, date_debut: datetime.date, date_fin: datetime.date, nb_max_joueurs: int, nb_rondes: int, type_tournoi: str) -> Optional[Tournoi]:
-        if len(self.tournois) >= self.MAX_TOURNOIS:  # Vérifie si le nombre maximum de tournois est atteint
+        if self.quota_atteint():  # Vérifie si le nombre maximum de tournois est atteint
             print("Nombre maximum de tournois atteint.")
             return None
         try:
             index = max((tournoi.index for tournoi in self.tournois), default=0) + 1  # Détermine le nouvel index
-            nouveau_tournoi = Tournoi(index, nom, date_debut, date_fin, nb_max_joueurs, nb_rondes, type_tournoi)  # Crée un nouvel objet Tournoi
+            # Crée un nouvel objet Tournoi
+            nouveau_tournoi = Tournoi(index, nom, date_debut, date_fin, nb_max_joueurs, nb_rondes, type_tournoi,
+                                      depot=self.depot, joueur_manager=self.joueur_manager)
             self.tournois.append(nouveau_tournoi)  # Ajoute le nouveau tournoi à la liste
             self.sauvegarder_tournois()  # Sauvegarde les tournois
             print(f"Tournoi '{nom}' ajouté avec succès.")
@@ -88,17 +109,16 @@ class TournoiManager:
             print(f"Erreur lors de l'ajout du tournoi : {str(e)}")  # Affiche un message d'erreur en cas d'exception
             return None
 
+    # Méthode pour savoir si le quota de tournois est atteint
+    def quota_atteint(self) -> bool:
+        return self.quota is not None and len(self.tournois) >= self.quota
+
     # Méthode pour supprimer un tournoi par son index
     def supprimer_tournoi(self, index_tournoi: int) -> bool:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
             self.tournois.remove(tournoi)  # Supprime le tournoi de la liste
-            fichier_tournoi = f"data/tournaments/{tournoi.nom.replace(' ', '_')}.json"  # Chemin du fichier du tournoi
-            if os.path.exists(fichier_tournoi):  # Vérifie si le fichier existe
-                os.remove(fichier_tournoi)  # Supprime le fichier
-            fichier_joueurs = f"data/tournaments/{tournoi.nom.replace(' ', '_')}_joueurs.json"  # Chemin du fichier des joueurs
-            if os.path.exists(fichier_joueurs):  # Vérifie si le fichier existe
-                os.remove(fichier_joueurs)  # Supprime le fichier
+            tournoi.supprimer_fichiers()  # Supprime les fichiers du tournoi et leurs journaux
             self.reindexer_tournois()  # Réindexe les tournois
             self.sauvegarder_tournois()  # Sauvegarde les tournois
             print("Tournoi supprimé avec succès.")
@@ -116,21 +136,30 @@ class TournoiManager:
                 print("Warning: Un tournoi est None. Ignorer.")  # Affiche un avertissement si un tournoi est None
 
     # Méthode pour ajouter un joueur à un tournoi
-    def ajouter_joueur_au_tournoi(self, index_tournoi: int, joueur: dict) -> bool:
+    def ajouter_joueur_au_tournoi(self, index_tournoi: int, joueur: Union[Joueur, Dict, int]) -> bool:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if tournoi:  # Si le tournoi est trouvé
-            nouveau_joueur = Joueur(
-                index=joueur['index'],
-                nom=joueur['nom'],
-                prenom=joueur['prenom'],
-                date_naissance=datetime.datetime.strptime(joueur['date_naissance'], '%Y-%m-%d').date(),
-                elo=joueur['elo']
-            )
-            if tournoi.ajouter_joueur(nouveau_joueur):  # Ajoute le joueur au tournoi
-                self.sauvegarder_tournois()  # Sauvegarde les tournois
-                return True
+            joueur_inscrit = self.trouver_joueur(tournoi, joueur)  # Objet partagé de la table d'identité
+            if joueur_inscrit is None:
+                print("Joueur non trouvé.")
+                return False
+            with unite_de_travail(self.depot):  # Le tournoi et les en-têtes sont écrits une fois chacun
+                if tournoi.ajouter_joueur(joueur_inscrit):  # Ajoute le joueur au tournoi
+                    self.sauvegarder_tournois()  # Sauvegarde les tournois
+                    return True
         return False
 
+    # Méthode pour retrouver un joueur (objet, dictionnaire ou index) dans la table d'identité d'un tournoi
+    @staticmethod
+    def trouver_joueur(tournoi: Tournoi, joueur: Union[Joueur, Dict, int]) -> Optional[Joueur]:
+        if isinstance(joueur, Joueur):
+            index = joueur.index
+        elif isinstance(joueur, dict):
+            index = joueur['index']
+        else:
+            index = joueur
+        return tournoi.joueur_manager.trouver_joueur_par_index(index)
+
     # Méthode pour supprimer un joueur d'un tournoi
     def supprimer_joueur_tournoi(self, index_tournoi: int, joueur: Joueur) -> bool:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
@@ -141,9 +170,12 @@ class TournoiManager:
     # Méthode pour créer une nouvelle ronde pour un tournoi
     def creer_ronde(self, index_tournoi: int) -> bool:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
-        if tournoi and tournoi.creer_ronde():  # Si le tournoi est trouvé et la ronde est créée
-            self.sauvegarder_tournois()  # Sauvegarde les tournois
-            return True
+        if not tournoi:
+            return False
+        with unite_de_travail(self.depot):  # La ronde et l'index des tournois sont écrits ensemble, une fois chacun
+            if tournoi.creer_ronde():  # Si la ronde est créée
+                self.sauvegarder_tournois()  # Sauvegarde les tournois
+                return True
         return False
 
     # Méthode pour obtenir le classement final d'un tournoi
@@ -151,19 +183,29 @@ class TournoiManager:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         return tournoi.classement() if tournoi else []  # Retourne le classement du tournoi ou une liste vide
 
-    # Méthode pour exporter les données d'un tournoi
-    def exporter_tournoi(self, index_tournoi: int, format: str = 'json') -> bool:
+    # Méthode pour exporter les données d'un tournoi (json, ou l'un des formats de models.exporteurs)
+    def exporter_tournoi(self, index_tournoi: int, format: str = 'json',
+                         dossier: str = exporteurs.DOSSIER_EXPORTS) -> bool:
         tournoi = self.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         if not tournoi:  # Si le tournoi n'est pas trouvé
             return False
         if format == 'json':  # Si le format est JSON
-            fichier = f"exports/{tournoi.nom}_export.json"  # Chemin du fichier d'export
-            with open(fichier, 'w', encoding='utf-8') as file:  # Ouvre le fichier en écriture
-                json.dump(tournoi.to_dict(), file, indent=4, ensure_ascii=False)  # Écrit les données JSON dans le fichier
+            os.makedirs(dossier, exist_ok=True)  # Crée le dossier d'export s'il n'existe pas
+            # Chemin du fichier d'export
+            fichier = os.path.join(dossier, f"{exporteurs.nom_fichier(tournoi.nom)}_export.json")
+            # Écriture atomique : fichier temporaire synchronisé sur disque puis renommé
+            ecrire_atomique(fichier, json.dumps(tournoi.to_dict(), indent=4, ensure_ascii=False))
             return True
-        else:
+        if format not in exporteurs.EXPORTEURS:
             print(f"Format d'export '{format}' non supporté.")  # Affiche un message d'erreur pour format non supporté
             return False
+        exporteurs.exporter_tournoi(tournoi, (format,), dossier)
+        return True
+
+    # Méthode pour exporter tous les tournois d'une saison (année de début ; None : tous) dans plusieurs formats
+    def exporter_saison(self, saison: Optional[int], formats: List[str], dossier: str = exporteurs.DOSSIER_EXPORTS,
+                        processus: Optional[int] = None) -> List[str]:
+        return exporteurs.exporter_saison(self.tournois, formats, saison, dossier, processus)
 
     # Méthode pour importer un tournoi depuis un fichier JSON
     def importer_tournoi(self, fichier: str) -> Optional[Tournoi]:
@@ -180,7 +222,9 @@ class TournoiManager:
                     datetime.datetime.fromisoformat(data.get('date_fin', '2000-01-02')).date(),
                     int(data.get('nb_max_joueurs', 0)),
                     int(data.get('nb_rondes', 0)),
-                    data.get('type_tournoi', 'Type inconnu')
+                    data.get('type_tournoi', 'Type inconnu'),
+                    depot=self.depot,
+                    joueur_manager=self.joueur_manager
                 )
                 self.tournois.append(nouveau_tournoi)  # Ajoute le nouveau tournoi à la liste
                 self.sauvegarder_tournois()  # Sauvegarde les tournois
@@ -1,17 +1,46 @@
 # Importation des modules nécessaires
 import datetime  # Pour manipuler les dates
-import json  # Pour manipuler les fichiers JSON
-import os  # Pour les opérations liées au système de fichiers
-import random  # Pour générer des nombres aléatoires
-from typing import List, Dict, Tuple, Optional  # Pour les annotations de type
-from models.joueur_model import Joueur  # Importation de la classe Joueur
+from typing import Iterator, List, Dict, Sequence, Tuple, Optional  # Pour les annotations de type
+from models.joueur_model import Joueur, JoueurManager, obtenir_joueur_manager  # Joueurs et table d'identité partagée
+from models.depots import Depot, obtenir_depot  # Couche de stockage (JSON journalisé ou SQLite)
+from models.colonnes_matchs import RESULTATS, ColonnesMatchs, code_resultat  # Stockage des matchs en colonnes
+from models.appariement import ParticipantAppariement, apparier_suisse, participants_depuis_rondes  # Système suisse
+from models.classement import Classement, MoteurClassement, points_resultat  # Classement incrémental
+from models.inscription import Inscription  # État d'un joueur propre au tournoi
+from models.departages import ORDRE_DEPARTAGES, Departages, calculer_departages  # Départages (Buchholz, SB...)
+from models.instrumentation import chronometre, compter, mesure  # Mesure des temps (si l'instrumentation est activée)
+from models.unite_travail import unite_en_cours  # Sauvegardes regroupées en fin d'opération
 
-# Définition de la classe Match
+# Définition de la classe Match : vue sur une position des colonnes de matchs d'une ronde
 class Match:
+    __slots__ = ("_colonnes", "_position")
+
     def __init__(self, joueur_blanc: Joueur, joueur_noir: Joueur, resultat: str = ""):
-        self.joueur_blanc = joueur_blanc  # Joueur avec les pièces blanches
-        self.joueur_noir = joueur_noir  # Joueur avec les pièces noires
-        self.resultat = resultat  # Résultat du match (vide par défaut)
+        self._colonnes = ColonnesMatchs()  # Match isolé : colonnes propres jusqu'à son ajout dans une ronde
+        self._position = self._colonnes.ajouter(joueur_blanc, joueur_noir, code_resultat(resultat))
+
+    @classmethod
+    def vue(cls, colonnes: ColonnesMatchs, position: int) -> 'Match':
+        match = cls.__new__(cls)  # Aucune copie : le match lit et écrit directement dans les colonnes
+        match._colonnes = colonnes
+        match._position = position
+        return match
+
+    @property
+    def joueur_blanc(self) -> Joueur:  # Joueur avec les pièces blanches
+        return self._colonnes.joueurs[self._colonnes.blancs[self._position]]
+
+    @property
+    def joueur_noir(self) -> Joueur:  # Joueur avec les pièces noires
+        return self._colonnes.joueurs[self._colonnes.noirs[self._position]]
+
+    @property
+    def resultat(self) -> str:  # Résultat du match (vide s'il n'est pas joué)
+        return RESULTATS[self._colonnes.resultats[self._position]]
+
+    @resultat.setter
+    def resultat(self, valeur: str) -> None:
+        self._colonnes.modifier_resultat(self._position, code_resultat(valeur))  # Révision de la ronde incrémentée
 
     def saisir_resultat(self, resultat: str) -> None:
         if resultat in ["1-0", "0-1", "0.5-0.5"]:  # Vérification du format du résultat
@@ -19,45 +48,161 @@ class Match:
         else:
             raise ValueError("Le résultat doit être '1-0', '0-1' ou '0.5-0.5'.")  # Erreur si format invalide
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> Dict:
         return {
             "match": f"{self.joueur_blanc.nom} {self.joueur_blanc.prenom} - {self.joueur_noir.nom} {self.joueur_noir.prenom}",
+            "blanc": self.joueur_blanc.index,  # Index stable du joueur (le libellé "match" reste pour la lecture)
+            "noir": self.joueur_noir.index,
             "score": self.resultat if self.resultat else "Non joué"
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict, joueurs_par_index: Dict[int, Joueur],
+                  joueurs_par_nom: Optional[Dict[str, Joueur]] = None) -> Optional['Match']:
+        partie = cls.lire_dict(data, joueurs_par_index, joueurs_par_nom)
+        return cls(*partie) if partie else None
+
+    @staticmethod
+    def lire_dict(data: Dict, joueurs_par_index: Dict[int, Joueur],
+                  joueurs_par_nom: Optional[Dict[str, Joueur]] = None) -> Optional[Tuple[Joueur, Joueur, str]]:
+        if "blanc" in data and "noir" in data:
+            joueur_blanc = joueurs_par_index.get(data["blanc"])
+            joueur_noir = joueurs_par_index.get(data["noir"])
+        elif joueurs_par_nom is not None:  # Ancien format "Nom Prenom - Nom Prenom"
+            nom_blanc, _, nom_noir = data["match"].partition(" - ")
+            joueur_blanc = joueurs_par_nom.get(nom_blanc.strip())
+            joueur_noir = joueurs_par_nom.get(nom_noir.strip())
+        else:
+            return None
+        if not joueur_blanc or not joueur_noir:
+            return None
+        score = data.get("score", "")
+        return joueur_blanc, joueur_noir, "" if score == "Non joué" else score
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Match):
+            return NotImplemented
+        return self._colonnes is other._colonnes and self._position == other._position  # Même match des colonnes
+
+    def __hash__(self):
+        return hash((id(self._colonnes), self._position))
+
     def __repr__(self) -> str:
         return f"{self.joueur_blanc.nom} vs {self.joueur_noir.nom}: {self.resultat}"
 
 # Définition de la classe Ronde
+#
+# La forme sérialisée de la ronde (to_dict) est conservée avec la révision de chaque élément dont elle dépend :
+# champs de la ronde, colonnes de matchs, classement après la ronde et noms des joueurs qui y figurent. Elle n'est
+# reconstruite que si l'un d'eux a changé ; le dictionnaire retourné est partagé et ne doit pas être modifié.
 class Ronde:
-    def __init__(self, numero: int, date: Optional[datetime.datetime] = None, statut: str = "en cours"):
+    __slots__ = ("numero", "date", "date_fin", "statut", "exempt", "classement", "_colonnes", "revision",
+                 "_fragment", "_cle_fragment", "_lignes_matchs", "_noms_vus", "_revisions_noms")
+    CHAMPS_SERIALISES = frozenset(("numero", "date", "statut", "exempt", "classement"))  # Champs présents dans to_dict
+
+    def __init__(self, numero: int, date: Optional[datetime.datetime] = None, statut: str = "en cours",
+                 joueurs: Optional[Dict[int, Joueur]] = None):
+        self.revision = 0  # Nombre de modifications des champs sérialisés
+        self._fragment: Optional[Dict] = None  # Dernière forme sérialisée de la ronde
+        self._cle_fragment: Optional[Tuple[int, int, int]] = None  # Révisions au moment de la sérialisation
+        self._noms_vus = 0  # Changements de nom (tous joueurs) déjà vérifiés pour la forme sérialisée
+        self._revisions_noms = 0  # Somme des révisions de nom des joueurs de la forme sérialisée
+        self._lignes_matchs: List[Tuple[str, str, str]] = []  # (blancs, noirs, score) de la forme sérialisée
         self.numero = numero  # Numéro de la ronde
         self.date = date if date else datetime.datetime.now()  # Date de la ronde (par défaut: maintenant)
+        self.date_fin: Optional[datetime.datetime] = None  # Date de fin de la ronde
         self.statut = statut  # Statut de la ronde
-        self.matchs: List[Match] = []  # Liste des matchs de la ronde
+        self.exempt: Optional[Joueur] = None  # Joueur exempt (bye) de la ronde
+        self.classement: Optional[Classement] = None  # Classement cumulé après la ronde (tenu par le tournoi)
+        self._colonnes = ColonnesMatchs(joueurs)  # Matchs de la ronde (joueurs partagés avec le tournoi si fournis)
+
+    def __setattr__(self, nom: str, valeur) -> None:
+        object.__setattr__(self, nom, valeur)
+        if nom in Ronde.CHAMPS_SERIALISES:  # Modification visible dans to_dict : nouvelle révision
+            object.__setattr__(self, "revision", self.revision + 1)
+
+    @property
+    def matchs(self) -> List[Match]:  # Vues sur les matchs de la ronde, dans l'ordre
+        return [Match.vue(self._colonnes, position) for position in range(len(self._colonnes))]
+
+    @matchs.setter
+    def matchs(self, matchs: List[Match]) -> None:
+        self._colonnes.vider()
+        for match in matchs:
+            self.ajouter_match(match)
 
     def ajouter_match(self, match: Match) -> None:
-        self.matchs.append(match)  # Ajout d'un match à la ronde
+        code = match._colonnes.resultats[match._position]
+        position = self._colonnes.ajouter(match.joueur_blanc, match.joueur_noir, code)  # Ajout d'un match à la ronde
+        match._colonnes, match._position = self._colonnes, position  # Le match devient une vue sur la ronde
+
+    def ajouter_partie(self, joueur_blanc: Joueur, joueur_noir: Joueur, resultat: str = "") -> None:
+        self._colonnes.ajouter(joueur_blanc, joueur_noir, code_resultat(resultat))  # Sans objet Match intermédiaire
+
+    def parties(self) -> Iterator[Tuple[int, int, int]]:
+        return self._colonnes.parties()  # (index blancs, index noirs, code du résultat) de chaque match
 
     def terminer_ronde(self) -> None:
         self.date_fin = datetime.datetime.now()  # Enregistrement de la date de fin
         self.statut = "terminée"  # Changement du statut à "terminée"
 
     def to_dict(self) -> Dict:
-        return {
-            "numero": self.numero,
-            "date": self.date.isoformat(),
-            "statut": self.statut,
-            "matchs": [match.to_dict() for match in self.matchs],
-            "classement_apres_ronde": self.obtenir_classement_ronde()
-        }
+        classement = self.classement
+        cle = (self.revision, self._colonnes.revision, -1 if classement is None else classement.revision)
+        if self._fragment is not None and self._cle_fragment == cle and self._noms_a_jour():
+            compter("ronde.fragments_reutilises")
+            return self._fragment  # Ronde inchangée depuis la dernière sérialisation
+        with mesure("ronde.serialiser", "json"):
+            joueurs = self._colonnes.joueurs
+            parties = list(self.parties())
+            lignes = [(f"{joueurs[blanc].nom} {joueurs[blanc].prenom}", f"{joueurs[noir].nom} {joueurs[noir].prenom}",
+                       RESULTATS[code] or "Non joué") for blanc, noir, code in parties]
+            data = {
+                "numero": self.numero,
+                "date": self.date.isoformat(),
+                "statut": self.statut,
+                "matchs": [{"match": f"{libelle_blanc} - {libelle_noir}", "blanc": blanc, "noir": noir, "score": score}
+                           for (blanc, noir, _), (libelle_blanc, libelle_noir, score) in zip(parties, lignes)],
+                "classement_apres_ronde": self._calculer_classement_ronde()
+            }
+            if self.exempt is not None:
+                data["exempt"] = self.exempt.index  # Index du joueur exempt
+        self._fragment, self._cle_fragment, self._lignes_matchs = data, cle, lignes  # Ancien dictionnaire intact
+        self._noms_vus, self._revisions_noms = Joueur.revision_noms, self._somme_revisions_noms()
+        return data
+
+    # Méthode interne pour vérifier qu'aucun joueur de la ronde n'a changé de nom depuis la sérialisation
+    #
+    # Tant qu'aucun joueur n'a été renommé, le compteur global suffit ; sinon, la somme des révisions de nom des
+    # joueurs de la ronde (toujours croissantes) est comparée à celle de la sérialisation. Renommer un joueur absent
+    # de la ronde ne la fait donc pas sérialiser à nouveau.
+    def _noms_a_jour(self) -> bool:
+        if self._noms_vus == Joueur.revision_noms:
+            return True
+        if self._somme_revisions_noms() != self._revisions_noms:
+            return False
+        self._noms_vus = Joueur.revision_noms  # Renommages vérifiés : rien à parcourir jusqu'au prochain
+        return True
+
+    # Méthode interne pour additionner les révisions de nom des joueurs des matchs et du classement de la ronde
+    def _somme_revisions_noms(self) -> int:
+        joueurs = self._colonnes.joueurs
+        somme = sum(joueurs[blanc].revision_nom + joueurs[noir].revision_nom for blanc, noir, _ in self.parties())
+        if self.classement is not None:
+            somme += sum(joueur.revision_nom for joueur in self.classement.joueurs.values())
+        return somme
+
+    # Lignes des matchs (blancs "Nom Prénom", noirs, score ou "Non joué"), tirées de la forme sérialisée
+    def lignes_matchs(self) -> List[Tuple[str, str, str]]:
+        self.to_dict()  # Reconstruite seulement si la ronde a changé
+        return self._lignes_matchs
 
     def appariement_ronde(self, joueurs: List[Joueur]) -> None:
         if len(joueurs) < 2:
             print("Nombre insuffisant de joueurs pour créer des paires.")
             return
-        random.shuffle(joueurs)  # Mélange aléatoire des joueurs
-        paires = [(joueurs[i], joueurs[i + 1]) for i in range(0, len(joueurs), 2) if i + 1 < len(joueurs)]
+        # Appariement hollandais
+        paires, self.exempt = apparier_suisse([ParticipantAppariement(joueur) for joueur in joueurs])
         self.matchs = [Match(pair[0], pair[1]) for pair in paires]  # Création des matchs
 
     def obtenir_resultats_ronde(self) -> None:
@@ -66,34 +211,120 @@ class Ronde:
             print(f"Match entre {match.joueur_blanc.nom} et {match.joueur_noir.nom}: {match.resultat}")
 
     def obtenir_classement_ronde(self) -> List[str]:
-        classement: Dict[Joueur, float] = {match.joueur_blanc: 0 for match in self.matchs}
-        classement.update({match.joueur_noir: 0 for match in self.matchs})
-        for match in self.matchs:
-            if match.resultat == "1-0":
-                classement[match.joueur_blanc] += 1
-            elif match.resultat == "0-1":
-                classement[match.joueur_noir] += 1
-            elif match.resultat == "0.5-0.5":
-                classement[match.joueur_blanc] += 0.5
-                classement[match.joueur_noir] += 0.5
-        classement = sorted(classement.items(), key=lambda item: item[1], reverse=True)
-        return [f"{i + 1}. {joueur.nom} {joueur.prenom} : {points}" for i, (joueur, points) in enumerate(classement)]
+        return self.to_dict()["classement_apres_ronde"]  # Lignes déjà formatées si la ronde n'a pas changé
+
+    def _calculer_classement_ronde(self) -> List[str]:
+        if self.classement is not None:
+            return self.classement.lignes()
+        classement = Classement(joueur for match in self.matchs for joueur in (match.joueur_blanc, match.joueur_noir))
+        for match in self.matchs:  # Ronde hors tournoi : classement sur ses seuls résultats
+            points_blanc, points_noir = points_resultat(match.resultat)
+            classement.ajouter_points(match.joueur_blanc, points_blanc)
+            classement.ajouter_points(match.joueur_noir, points_noir)
+        return classement.lignes()
 
 # Définition de la classe Tournoi
 class Tournoi:
     def __init__(self, index: int, nom: str, date_debut: datetime.date, date_fin: datetime.date, nb_max_joueurs: int,
-                 nb_rondes: int, type_tournoi: str):
+                 nb_rondes: int, type_tournoi: str, depot: Optional[Depot] = None,
+                 joueur_manager: Optional[JoueurManager] = None):
+        self._charge = False  # Vrai une fois les joueurs, rondes et statut chargés depuis le dépôt
         self.index = index  # Index du tournoi
-        self.nom = nom  # Nom du tournoi
+        self._nom = nom  # Nom du tournoi
         self.date_debut = date_debut  # Date de début du tournoi
         self.date_fin = date_fin  # Date de fin du tournoi
         self.nb_max_joueurs = nb_max_joueurs  # Nombre maximum de joueurs
         self.nb_rondes = nb_rondes  # Nombre de rondes
         self.type_tournoi = type_tournoi  # Type de tournoi
-        self.joueurs: List[Joueur] = []  # Liste des joueurs
-        self.rondes: List[Ronde] = []  # Liste des rondes
-        self.statut = "En attente"  # Statut initial du tournoi
-        self.charger_joueurs()  # Chargement des joueurs
+        self._joueurs: List[Joueur] = []  # Liste des joueurs (chargée au premier accès)
+        self._rondes: List[Ronde] = []  # Liste des rondes (chargée au premier accès)
+        self._statut = "En attente"  # Statut initial du tournoi
+        self._moteur_classement: Optional[MoteurClassement] = None  # Classement incrémental (construit au chargement)
+        self._joueurs_par_index: Dict[int, Joueur] = {}  # Joueurs des matchs par index, partagé par toutes les rondes
+        self.depot = depot or obtenir_depot()  # Dépôt de stockage configuré
+        self._joueur_manager = joueur_manager  # Table d'identité des joueurs (celle du dépôt par défaut)
+
+    # Propriétés chargées à la demande : un tournoi listé n'est lu depuis le dépôt qu'au premier accès
+    @property
+    def nom(self) -> str:
+        return self._nom
+
+    @nom.setter
+    def nom(self, valeur: str) -> None:
+        if valeur != self._nom:
+            self.charger()  # Les données sont lues sous l'ancien nom avant le renommage
+        self._nom = valeur
+
+    @property
+    def joueurs(self) -> List[Joueur]:
+        self.charger()
+        return self._joueurs
+
+    @joueurs.setter
+    def joueurs(self, valeur: List[Joueur]) -> None:
+        self.charger()
+        self._joueurs = valeur
+        self._moteur_classement = None
+
+    @property
+    def rondes(self) -> List['Ronde']:
+        self.charger()
+        return self._rondes
+
+    @rondes.setter
+    def rondes(self, valeur: List['Ronde']) -> None:
+        self.charger()
+        self._rondes = valeur
+        self._moteur_classement = None
+
+    @property
+    def statut(self) -> str:
+        self.charger()
+        return self._statut
+
+    @statut.setter
+    def statut(self, valeur: str) -> None:
+        self.charger()
+        self._statut = valeur
+
+    @property
+    def est_charge(self) -> bool:
+        return self._charge
+
+    # Gestionnaire des joueurs : les inscrits sont les objets Joueur partagés de sa table d'identité
+    @property
+    def joueur_manager(self) -> JoueurManager:
+        if self._joueur_manager is None:
+            self._joueur_manager = obtenir_joueur_manager(self.depot)
+        return self._joueur_manager
+
+    # Inscriptions des joueurs (points, couleurs, exemptions dans ce tournoi), dans l'ordre d'inscription
+    @property
+    def inscriptions(self) -> List[Inscription]:
+        inscriptions = self.moteur_classement.inscriptions
+        return [inscriptions[joueur.index] for joueur in self.joueurs if joueur.index in inscriptions]
+
+    # Moteur de classement, reconstruit seulement si les listes de joueurs ou de rondes ont été modifiées directement
+    @property
+    def moteur_classement(self) -> MoteurClassement:
+        self.charger()
+        if self._moteur_classement is None or not self._moteur_classement.est_a_jour(self._joueurs, self._rondes):
+            with mesure("classement.reconstruire", "classement"):
+                self._moteur_classement = MoteurClassement(self._joueurs, self._rondes)
+        return self._moteur_classement
+
+    def charger(self) -> None:
+        if self._charge:
+            return
+        self._charge = True
+        try:
+            with mesure("tournoi.charger", "io"):
+                data = self.depot.charger_tournoi(self._nom)
+                self.charger_joueurs(data)
+                self._charger_donnees(data)
+        except Exception:
+            self._charge = False  # Chargement à refaire : le tournoi ne doit pas paraître vide
+            raise
 
     def to_dict(self) -> Dict:
         return {
@@ -107,7 +338,7 @@ class Tournoi:
             "type_tournoi": self.type_tournoi,
             "statut": self.statut,
             "joueurs_inscrits": [joueur.index for joueur in self.joueurs],
-            "rondes": [ronde.to_dict() for ronde in self.rondes]
+            "rondes": [ronde.to_dict() for ronde in self.moteur_classement.rondes]  # Classements après ronde à jour
         }
 
     def to_dict_base(self) -> Dict:
@@ -122,7 +353,8 @@ class Tournoi:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Tournoi':
+    def from_dict(cls, data: Dict, depot: Optional[Depot] = None,
+                  joueur_manager: Optional[JoueurManager] = None) -> 'Tournoi':
         tournoi = cls(
             data["index"],
             data["nom_tournoi"],
@@ -130,39 +362,88 @@ class Tournoi:
             datetime.date.fromisoformat(data["date_fin"]),
             data["nb_max_joueurs"],
             data["nb_rondes"],
-            data["type_tournoi"]
+            data["type_tournoi"],
+            depot=depot,
+            joueur_manager=joueur_manager
         )
-        tournoi.statut = data.get("statut", "En attente")
-        tournoi.charger_joueurs()
+        if "rondes" in data:  # Données complètes fournies : pas de lecture du fichier du tournoi
+            tournoi._charge = True
+            tournoi.charger_joueurs(data)
+            tournoi._charger_donnees(data)
+        return tournoi  # En-tête seul (tournaments.json) : joueurs et rondes chargés au premier accès
+
+    def _charger_donnees(self, data: Dict) -> None:
+        self._statut = data.get("statut", "En attente")
+        self._rondes = []
+        joueurs_par_index = {joueur.index: joueur for joueur in self._joueurs}  # Recherche des joueurs en O(1)
+        self._joueurs_par_index = joueurs_par_index
+        joueurs_par_nom: Optional[Dict[str, Joueur]] = None
         for ronde_data in data.get("rondes", []):
             ronde = Ronde(
                 numero=ronde_data["numero"],
                 date=datetime.datetime.fromisoformat(ronde_data["date"]),
-                statut=ronde_data["statut"]
+                statut=ronde_data["statut"],
+                joueurs=joueurs_par_index
             )
+            if ronde_data.get("exempt") is not None:
+                ronde.exempt = self._joueur_reference(ronde_data["exempt"])
             for match_data in ronde_data.get("matchs", []):
-                joueur_blanc = next(
-                    (j for j in tournoi.joueurs if f"{j.nom} {j.prenom}" == match_data["match"].split(" - ")[0].strip()),
-                    None
-                )
-                joueur_noir = next(
-                    (j for j in tournoi.joueurs if f"{j.nom} {j.prenom}" == match_data["match"].split(" - ")[1].strip()),
-                    None
-                )
-                if joueur_blanc and joueur_noir:
-                    match = Match(joueur_blanc, joueur_noir, match_data["score"])
-                    ronde.ajouter_match(match)
-            tournoi.rondes.append(ronde)
-        return tournoi
+                if joueurs_par_nom is None and ("blanc" not in match_data or "noir" not in match_data):
+                    joueurs_par_nom = {}  # Construit une seule fois, uniquement pour l'ancien format
+                    for joueur in self._joueurs:
+                        joueurs_par_nom.setdefault(f"{joueur.nom} {joueur.prenom}", joueur)
+                for couleur in ("blanc", "noir"):
+                    if couleur in match_data:
+                        self._joueur_reference(match_data[couleur])  # Joueur retiré du tournoi : ajouté à la table
+                partie = Match.lire_dict(match_data, joueurs_par_index, joueurs_par_nom)
+                if partie:
+                    ronde.ajouter_partie(*partie)
+            self._rondes.append(ronde)
+        with mesure("classement.reconstruire", "classement"):
+            self._moteur_classement = MoteurClassement(self._joueurs, self._rondes)  # Un seul parcours des résultats
+
+    # Méthode pour retrouver un joueur référencé par une ronde (inscrit, ou retiré du tournoi après avoir joué)
+    def _joueur_reference(self, index: int) -> Joueur:
+        joueur = self._joueurs_par_index.get(index) or self.joueur_manager.trouver_joueur_par_index(index)
+        if joueur is None:  # Ignorer la référence ferait disparaître des parties et fausserait le classement
+            raise ValueError(f"Tournoi {self._nom} : joueur d'index {index} introuvable.")
+        return self._joueurs_par_index.setdefault(index, joueur)
+
+    # Méthode pour lister les joueurs référencés par le tournoi : inscrits, puis joueurs des rondes retirés depuis
+    def joueurs_references(self) -> List[Joueur]:
+        joueurs = {joueur.index: joueur for joueur in self.joueurs}
+        for ronde in self.rondes:
+            if ronde.exempt:
+                joueurs.setdefault(ronde.exempt.index, ronde.exempt)
+            for match in ronde.matchs:
+                joueurs.setdefault(match.joueur_blanc.index, match.joueur_blanc)
+                joueurs.setdefault(match.joueur_noir.index, match.joueur_noir)
+        return list(joueurs.values())
 
     def ajouter_joueur(self, joueur: Joueur) -> bool:
+        joueur = self.joueur_manager.trouver_joueur_par_index(joueur.index) or joueur  # Objet partagé, pas une copie
         if len(self.joueurs) < self.nb_max_joueurs and joueur not in self.joueurs:
+            self.moteur_classement.ajouter_joueur(joueur)
             self.joueurs.append(joueur)
-            self.sauvegarder_joueurs()
-            self.sauvegarder_tournoi()
+            self.sauvegarder_tournoi()  # Les inscriptions (index des joueurs) font partie du tournoi
             return True
         return False
 
+    def supprimer_joueur(self, joueur: Joueur) -> bool:
+        if joueur not in self.joueurs:
+            return False
+        self.moteur_classement.retirer_joueur(joueur)
+        self.joueurs.remove(joueur)
+        self.sauvegarder_tournoi()
+        return True
+
+    def supprimer_ronde(self, numero_ronde: int) -> bool:
+        if numero_ronde <= 0 or numero_ronde > len(self.rondes):
+            return False
+        self.rondes.pop(numero_ronde - 1)
+        self._moteur_classement = None  # Les instantanés des rondes suivantes changent : reconstruction
+        return True
+
     def creer_ronde(self) -> Optional[Ronde]:
         if len(self.rondes) >= self.nb_rondes:
             print(f"Impossible de créer une nouvelle ronde. Le nombre maximum de rondes ({self.nb_rondes}) a déjà été atteint.")
@@ -170,16 +451,15 @@ class Tournoi:
         if len(self.joueurs) < 8:
             print(f"Impossible de créer une ronde. Il y a actuellement {len(self.joueurs)} joueurs inscrits, mais un minimum de 8 joueurs est requis.")
             return None
-        nouvelle_ronde = Ronde(len(self.rondes) + 1, datetime.datetime.now())
-        joueurs_disponibles = self.joueurs.copy()
-        random.shuffle(joueurs_disponibles)
-        while len(joueurs_disponibles) >= 2:
-            joueur1 = joueurs_disponibles.pop()
-            joueur2 = joueurs_disponibles.pop()
+        nouvelle_ronde = Ronde(len(self.rondes) + 1, datetime.datetime.now(), joueurs=self._joueurs_par_index)
+        paires, nouvelle_ronde.exempt = self.apparier()
+        for joueur1, joueur2 in paires:
             match = Match(joueur1, joueur2)
             nouvelle_ronde.ajouter_match(match)
-        if joueurs_disponibles:
-            print(f"Le joueur {joueurs_disponibles[0].nom} {joueurs_disponibles[0].prenom} reçoit un bye pour cette ronde.")
+        if nouvelle_ronde.exempt:
+            exempt = nouvelle_ronde.exempt
+            print(f"Le joueur {exempt.nom} {exempt.prenom} reçoit un bye pour cette ronde.")
+        self.moteur_classement.ajouter_ronde(nouvelle_ronde)
         self.rondes.append(nouvelle_ronde)
         print(f"Ronde {nouvelle_ronde.numero} créée avec succès.")
         for match in nouvelle_ronde.matchs:
@@ -187,40 +467,48 @@ class Tournoi:
         self.sauvegarder_tournoi()
         return nouvelle_ronde
 
-    def charger_joueurs(self) -> None:
-        fichier_joueurs = f"data/tournaments/{self.nom.replace(' ', '_')}_joueurs.json"
-        if os.path.exists(fichier_joueurs):
-            with open(fichier_joueurs, 'r', encoding='utf-8') as file:
-                joueurs_data = json.load(file)
-            self.joueurs = [Joueur.from_dict(joueur_data) for joueur_data in joueurs_data]
-        else:
-            print(f"Fichier {fichier_joueurs} non trouvé.")
+    def charger_joueurs(self, data: Optional[Dict] = None) -> None:
+        if data is None:
+            data = self.depot.charger_tournoi(self._nom)
+        inscrits = data.get("joueurs_inscrits")  # Index des joueurs dans la table d'identité partagée
+        joueurs = self.joueur_manager
+        copies: Dict[int, Dict] = {}
+        if inscrits is None or any(joueurs.trouver_joueur_par_index(index) is None for index in inscrits):
+            # Ancien format : copie des joueurs dans <nom>_joueurs.json, lue seulement si nécessaire
+            copies = {joueur_data['index']: joueur_data
+                      for joueur_data in self.depot.charger_joueurs_tournoi(self._nom) or []}
+            if inscrits is None:
+                inscrits = list(copies)
+        self._joueurs = []
+        for index in inscrits:
+            joueur = joueurs.trouver_joueur_par_index(index)
+            if joueur is None and index in copies:
+                # Joueur retiré de la liste générale : copie de l'ancien format
+                joueur = Joueur.from_dict(copies[index])
+            if joueur is None:  # Ignorer l'inscription viderait le tournoi à la prochaine sauvegarde
+                raise ValueError(f"Tournoi {self._nom} : joueur inscrit d'index {index} introuvable.")
+            self._joueurs.append(joueur)
+        self._moteur_classement = None
+
+    @chronometre("tournoi.apparier", "appariement")
+    def apparier(self) -> Tuple[List[Tuple[Joueur, Joueur]], Optional[Joueur]]:
+        # Scores, adversaires, couleurs et exempts
+        participants = participants_depuis_rondes(self.joueurs, self.rondes)
+        return apparier_suisse(participants)  # Paires (blancs, noirs) et joueur exempt
 
     def generer_paires(self) -> List[Tuple[Joueur, Joueur]]:
-        joueurs = set(self.joueurs)
-        paires = []
-        deja_apparies = set()
-        while len(joueurs) >= 2:
-            j1 = joueurs.pop()
-            j2 = joueurs.pop()
-            while (j1, j2) in deja_apparies or (j2, j1) in deja_apparies:
-                joueurs.add(j1)
-                j1 = joueurs.pop()
-                joueurs.add(j2)
-                j2 = joueurs.pop()
-            paires.append((j1, j2))
-            deja_apparies.add((j1, j2))
-        return paires
+        return self.apparier()[0]
 
     def jouer_ronde(self) -> None:
         if len(self.rondes) >= self.nb_rondes:
             print("Toutes les rondes ont été jouées.")
             return
-        nouvelle_ronde = Ronde(len(self.rondes) + 1, datetime.datetime.now())
-        paires = self.generer_paires()
+        nouvelle_ronde = Ronde(len(self.rondes) + 1, datetime.datetime.now(), joueurs=self._joueurs_par_index)
+        paires, nouvelle_ronde.exempt = self.apparier()
         for j1, j2 in paires:
             match = Match(j1, j2)
             nouvelle_ronde.ajouter_match(match)
+        self.moteur_classement.ajouter_ronde(nouvelle_ronde)
         self.rondes.append(nouvelle_ronde)
         print(f"Ronde {nouvelle_ronde.numero} créée avec succès.")
         for match in nouvelle_ronde.matchs:
@@ -229,8 +517,7 @@ class Tournoi:
             while True:
                 resultat = input(f"Résultat du match {match.joueur_blanc.nom} {match.joueur_blanc.prenom} vs {match.joueur_noir.nom} {match.joueur_noir.prenom} (1-0, 0-1, 0.5-0.5) : ")
                 try:
-                    match.saisir_resultat(resultat)
-                    self.mettre_a_jour_scores_match(match, resultat)
+                    self.enregistrer_resultat(nouvelle_ronde, match, resultat)
                     break
                 except ValueError as e:
                     print(e)
@@ -238,7 +525,6 @@ class Tournoi:
         print("\nClassement après la ronde :")
         for ligne in nouvelle_ronde.obtenir_classement_ronde():
             print(ligne)
-        self.calculer_classement_cumulatif()
         self.sauvegarder_tournoi()
         print(f"Ronde {nouvelle_ronde.numero} terminée et sauvegardée.")
 
@@ -252,63 +538,42 @@ class Tournoi:
             while True:
                 resultat = input(f"Résultat du match {match.joueur_blanc.nom} vs {match.joueur_noir.nom} (1-0, 0-1, 0.5-0.5) : ")
                 try:
-                    match.saisir_resultat(resultat)
-                    self.mettre_a_jour_scores_match(match, resultat)
+                    self.enregistrer_resultat(ronde, match, resultat)
                     break
                 except ValueError as e:
                     print(e)
         ronde.statut = "terminée"
-        self.calculer_classement_cumulatif()
         print("\nClassement après la ronde :")
         for ligne in ronde.obtenir_classement_ronde():
             print(ligne)
         self.sauvegarder_tournoi()
         print(f"Résultats de la ronde {numero_ronde} saisis, classement mis à jour et sauvegardés.")
 
-    def mettre_a_jour_scores_match(self, match: Match, resultat: str) -> None:
-        if resultat == "1-0":
-            match.joueur_blanc.score += 1
-        elif resultat == "0-1":
-            match.joueur_noir.score += 1
-        elif resultat == "0.5-0.5":
-            match.joueur_blanc.score += 0.5
-            match.joueur_noir.score += 0.5
+    def enregistrer_resultat(self, ronde: Ronde, match: Match, resultat: str) -> None:
+        self.moteur_classement.enregistrer_resultat(ronde, match, resultat)  # Mise à jour par différence, O(log n)
 
+    @chronometre("classement.recalculer", "classement")
     def mettre_a_jour_scores(self) -> None:
-        for joueur in self.joueurs:
-            joueur.score = 0
-        for ronde in self.rondes:
-            for match in ronde.matchs:
-                if match.resultat == "1-0":
-                    match.joueur_blanc.score += 1
-                elif match.resultat == "0-1":
-                    match.joueur_noir.score += 1
-                elif match.resultat == "0.5-0.5":
-                    match.joueur_blanc.score += 0.5
-                    match.joueur_noir.score += 0.5
-
-    def classement(self) -> List[Tuple[Joueur, float]]:
-        return sorted([(j, j.score) for j in self.joueurs], key=lambda x: x[1], reverse=True)
-
-    def calculer_classement_cumulatif(self) -> None:
-        points_cumules = {joueur.nom: 0 for joueur in self.joueurs}
-        for ronde in self.rondes:
-            for match in ronde.matchs:
-                if match.resultat == "1-0":
-                    points_cumules[match.joueur_blanc.nom] += 1
-                elif match.resultat == "0-1":
-                    points_cumules[match.joueur_noir.nom] += 1
-                elif match.resultat == "0.5-0.5":
-                    points_cumules[match.joueur_blanc.nom] += 0.5
-                    points_cumules[match.joueur_noir.nom] += 0.5
-        classement = sorted(points_cumules.items(), key=lambda item: item[1], reverse=True)
-        for ronde in self.rondes:
-            ronde.obtenir_classement_ronde = lambda: [f"{i + 1}. {joueur} : {points}" for i, (joueur, points) in enumerate(classement)]
+        self._moteur_classement = MoteurClassement(self.joueurs, self.rondes)  # Recalcul complet
+
+    def classement(self, ordre: Sequence[str] = ORDRE_DEPARTAGES) -> List[Tuple[Joueur, float]]:
+        return self.departages().classer(ordre)  # Score puis départages dans l'ordre demandé
+
+    @chronometre("classement.departages", "classement")
+    def departages(self) -> Departages:
+        return calculer_departages(self.joueurs, self.rondes)
 
+    # Sauvegarde du tournoi : immédiate, ou une seule fois à la fin de l'unité de travail en cours
     def sauvegarder_tournoi(self) -> None:
-        fichier_tournoi = f"data/tournaments/{self.nom.replace(' ', '_')}.json"
-        with open(fichier_tournoi, "w", encoding='utf-8') as file:
-            json.dump(self.to_dict(), file, indent=4, ensure_ascii=False)
+        unite = unite_en_cours(self.depot)
+        if unite is not None:
+            unite.marquer_tournoi(self)
+        else:
+            self.ecrire_tournoi()
+
+    @chronometre("tournoi.sauvegarder", "io")
+    def ecrire_tournoi(self) -> None:
+        self.depot.synchroniser_tournoi(self.nom, self.to_dict())  # Seules les rondes modifiées sont écrites
 
     def demarrer_tournoi(self) -> None:
         if self.statut == "En attente":
@@ -319,9 +584,15 @@ class Tournoi:
             self.statut = "Terminé"
 
     def sauvegarder_joueurs(self) -> None:
-        fichier_joueurs = f"data/tournaments/{self.nom.replace(' ', '_')}_joueurs.json"
-        joueurs_data = [joueur.to_dict() for joueur in self.joueurs]
-        with open(fichier_joueurs, 'w', encoding='utf-8') as file:
-            json.dump(joueurs_data, file, indent=4, ensure_ascii=False)
+        self.sauvegarder_tournoi()  # Les inscriptions sont enregistrées avec le tournoi (plus de copie des joueurs)
+
+    @chronometre("tournoi.exporter", "io")
+    def exporter_fichiers(self) -> None:
+        self.sauvegarder_tournoi()
+        self.depot.exporter_tournoi(self.nom)  # Réécrit les fichiers d'export complets
 
-    
\ No newline at end of file
+    def supprimer_fichiers(self) -> None:
+        unite = unite_en_cours(self.depot)
+        if unite is not None:
+            unite.oublier_tournoi(self)  # Une sauvegarde en attente recréerait les fichiers supprimés
+        self.depot.supprimer_tournoi(self.nom)
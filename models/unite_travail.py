@@ -0,0 +1,94 @@
+# Importation des modules nécessaires
+import contextlib  # Pour les gestionnaires de contexte
+import threading  # Une unité de travail appartient au fil qui l'a ouverte
+from typing import TYPE_CHECKING, Dict, Iterator, Optional  # Pour les annotations de type
+
+from models.instrumentation import compter  # Sauvegardes regroupées (si l'instrumentation est activée)
+
+if TYPE_CHECKING:  # Annotations seulement : les modèles importent ce module
+    from models.depots import Depot
+    from models.joueur_model import Joueur
+    from models.tournoi_manager import TournoiManager
+    from models.tournoi_model import Tournoi
+
+_local = threading.local()  # Unités de travail ouvertes dans le fil courant, par dépôt (id -> unité)
+
+
+# Définition de la classe UniteTravail : objets modifiés pendant une opération, sauvegardés une seule fois à la fin
+#
+# Pendant une unité de travail, les sauvegardes des tournois, des en-têtes et des joueurs ne font que marquer
+# l'objet modifié. À la fin de l'opération, chaque objet marqué est sérialisé et écrit une seule fois,
+# dans une seule transaction du dépôt : chaque fichier concerné est écrit au plus une fois.
+class UniteTravail:
+    # Constructeur de la classe UniteTravail
+    def __init__(self, depot: 'Depot'):
+        self.depot = depot  # Dépôt dans lequel les objets marqués sont écrits
+        self.tournois: Dict[int, 'Tournoi'] = {}  # Tournois à sauvegarder (id -> tournoi), dans l'ordre de marquage
+        self.gestionnaires: Dict[int, 'TournoiManager'] = {}  # Gestionnaires dont les en-têtes sont à sauvegarder
+        self.joueurs: Dict[int, 'Joueur'] = {}  # Joueurs à enregistrer (index -> joueur)
+        self.marquages = 0  # Sauvegardes demandées pendant l'unité
+
+    # Méthode pour marquer un tournoi à sauvegarder (joueurs inscrits, rondes, statut)
+    def marquer_tournoi(self, tournoi: 'Tournoi') -> None:
+        self.tournois[id(tournoi)] = tournoi
+        self.marquages += 1
+
+    # Méthode pour marquer les en-têtes d'un gestionnaire de tournois à sauvegarder (tournaments.json)
+    def marquer_entetes(self, tournoi_manager: 'TournoiManager') -> None:
+        self.gestionnaires[id(tournoi_manager)] = tournoi_manager
+        self.marquages += 1
+
+    # Méthode pour marquer un joueur à enregistrer
+    def marquer_joueur(self, joueur: 'Joueur') -> None:
+        self.joueurs[joueur.index] = joueur
+        self.marquages += 1
+
+    # Méthode pour oublier un tournoi marqué (tournoi supprimé : ses fichiers ne doivent pas être recréés)
+    def oublier_tournoi(self, tournoi: 'Tournoi') -> None:
+        self.tournois.pop(id(tournoi), None)
+
+    # Méthode pour oublier un joueur marqué (joueur supprimé)
+    def oublier_joueur(self, index: int) -> None:
+        self.joueurs.pop(index, None)
+
+    # Méthode pour écrire tous les objets marqués, une seule fois chacun, dans une seule transaction
+    def valider(self) -> None:
+        ecritures = len(self.tournois) + len(self.gestionnaires) + (1 if self.joueurs else 0)
+        compter("unite_travail.sauvegardes_regroupees", self.marquages - ecritures)
+        with self.depot.transaction():
+            while self.tournois:  # Vidé au fur et à mesure : une erreur n'écrit pas deux fois le même tournoi
+                self.tournois.pop(next(iter(self.tournois))).ecrire_tournoi()
+            while self.gestionnaires:
+                self.gestionnaires.pop(next(iter(self.gestionnaires))).ecrire_tournois()
+            if self.joueurs:
+                joueurs, self.joueurs = self.joueurs, {}
+                self.depot.enregistrer_joueurs(joueur.to_dict() for joueur in joueurs.values())
+        self.marquages = 0
+
+
+# Fonction pour obtenir l'unité de travail ouverte pour un dépôt dans le fil courant (None s'il n'y en a pas)
+def unite_en_cours(depot: 'Depot') -> Optional[UniteTravail]:
+    unites = getattr(_local, "unites", None)
+    return unites.get(id(depot)) if unites else None
+
+
+# Fonction pour regrouper les sauvegardes d'une opération : with unite_de_travail(depot): ...
+#
+# Une unité ouverte dans une autre la rejoint : seule la plus externe écrit. Les objets marqués sont écrits
+# même si l'opération échoue, comme l'auraient été les sauvegardes immédiates déjà faites.
+@contextlib.contextmanager
+def unite_de_travail(depot: 'Depot') -> Iterator[UniteTravail]:
+    unite = unite_en_cours(depot)
+    if unite is not None:
+        yield unite
+        return
+    if getattr(_local, "unites", None) is None:
+        _local.unites = {}
+    unite = _local.unites[id(depot)] = UniteTravail(depot)
+    try:
+        yield unite
+    finally:
+        try:
+            unite.valider()
+        finally:
+            del _local.unites[id(depot)]
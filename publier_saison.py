@@ -0,0 +1,60 @@
+# Importation des modules nécessaires
+import argparse  # Pour analyser les arguments de la ligne de commande
+import os  # Pour les opérations liées au système de fichiers
+import sys  # Pour le code de sortie
+import time  # Pour mesurer la durée de la publication
+from typing import List, Optional  # Pour les annotations de type
+
+import config  # Paramètres de l'application (dossier de données, stockage, processus)
+
+
+# Fonction pour construire l'analyseur des arguments
+def analyseur() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Publication de fin de saison : exporte tous les tournois d'une saison, répartis entre les cœurs.",
+        epilog="Codes de sortie : 0 terminé, 1 échec de l'export, 2 arguments invalides."
+    )
+    parser.add_argument("saison", nargs="?", type=int,
+                        help="Année de début des tournois (par défaut : tous les tournois)")
+    parser.add_argument("-f", "--formats", default="html,csv",
+                        help="Formats séparés par des virgules : csv, html, md, txt (par défaut : html,csv)")
+    parser.add_argument("-o", "--dossier", default="exports", help="Dossier de destination (par défaut : exports)")
+    parser.add_argument("-j", "--processus", type=int,
+                        help="Nombre de processus (par défaut : un par cœur ; 1 : sans parallélisme)")
+    parser.add_argument("--donnees", help="Dossier de données à utiliser à la place de celui de config.py")
+    parser.add_argument("--stockage", choices=("json", "sqlite"), help="Moteur de stockage à utiliser")
+    return parser
+
+
+# Fonction principale : exporte la saison et retourne le code de sortie
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = analyseur()
+    args = parser.parse_args(arguments)  # Code 2 en cas d'arguments invalides
+    if args.processus is not None and args.processus < 1:
+        parser.error("--processus doit être au moins 1.")
+    if args.donnees:
+        config.DOSSIER_DONNEES = args.donnees
+        config.FICHIER_SQLITE = os.path.join(args.donnees, os.path.basename(config.FICHIER_SQLITE))
+    if args.stockage:
+        config.STOCKAGE = args.stockage
+
+    from models.exporteurs import EXPORTEURS  # Après la configuration du dépôt
+    from controllers.tournoi_controller import TournoiController
+
+    formats = [format_export.strip() for format_export in args.formats.split(",") if format_export.strip()]
+    inconnus = [format_export for format_export in formats if format_export not in EXPORTEURS]
+    if not formats or inconnus:
+        parser.error(f"Formats inconnus : {', '.join(inconnus) or '(aucun)'} (formats : {', '.join(EXPORTEURS)}).")
+
+    debut = time.perf_counter()
+    fichiers = TournoiController().exporter_saison(args.saison, formats, args.dossier, args.processus)
+    if not fichiers:
+        return 1
+    print(f"{len(fichiers)} fichier(s) écrit(s) en {time.perf_counter() - debut:.2f} s, "
+          f"index : {os.path.dirname(fichiers[-1])}")
+    return 0
+
+
+# Point d'entrée du programme
+if __name__ == "__main__":
+    sys.exit(main())
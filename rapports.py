@@ -1,86 +1,178 @@
 # Importation des modules nécessaires
-from typing import List  # Pour les annotations de type de liste
+import os  # Pour les opérations liées au système de fichiers
+import shutil  # Pour connaître la hauteur de la console
+import sys  # Pour la sortie standard
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO  # Pour les annotations de type
 from models.joueur_model import Joueur  # Importation de la classe Joueur depuis le module joueur_model
 from models.tournoi_model import Tournoi  # Importation de la classe Tournoi depuis le module tournoi_model
+from models.departages import LIBELLES_DEPARTAGES, ORDRE_DEPARTAGES  # Départages affichés dans le classement
+from models.instrumentation import chronometre, mesure  # Mesure des temps (si l'instrumentation est activée)
+from models.persistance import ecrire_atomique_flux  # Écriture atomique d'un fichier produit au fil de l'eau
 
+# Les rapports sont produits ligne à ligne (chaque ligne se termine par "\n") : ils peuvent être affichés
+# page par page ou écrits dans un fichier au fil de l'eau, sans jamais assembler le texte complet en mémoire.
+# Les fonctions retournant une chaîne sont conservées pour les rapports courts.
 
-# Fonction pour générer une liste de joueurs triée par ordre alphabétique
-def liste_joueurs_alphabetique(joueurs: List[Joueur]) -> str:
+
+# Fonction pour générer une liste de joueurs triée par ordre alphabétique, ligne à ligne
+def lignes_joueurs_alphabetique(joueurs: Iterable[Joueur]) -> Iterator[str]:
+    yield "Liste de tous les joueurs par ordre alphabétique:\n"
     # Trie les joueurs par nom et prénom
-    joueurs_triees = sorted(joueurs, key=lambda joueur: (joueur.nom, joueur.prenom))
-    # Initialise le rapport avec un titre
-    rapport = "Liste de tous les joueurs par ordre alphabétique:\n"
-    # Ajoute chaque joueur trié au rapport
-    rapport += "\n".join(f"{joueur.nom} {joueur.prenom}" for joueur in joueurs_triees)
-    return rapport  # Retourne le rapport
+    for joueur in sorted(joueurs, key=lambda joueur: (joueur.nom, joueur.prenom)):
+        yield f"{joueur.nom} {joueur.prenom}\n"
 
 
-# Fonction pour générer une liste de tournois
-def liste_tournois(tournois: List[Tournoi]) -> str:
-    # Initialise le rapport avec un titre
-    rapport = "Liste de tous les tournois:\n"
-    # Ajoute chaque tournoi au rapport
-    rapport += "\n".join(tournoi.nom for tournoi in tournois)
-    return rapport  # Retourne le rapport
+# Fonction pour générer une liste de tournois, ligne à ligne
+def lignes_tournois(tournois: Iterable[Tournoi]) -> Iterator[str]:
+    yield "Liste de tous les tournois:\n"
+    for tournoi in tournois:
+        yield f"{tournoi.nom}\n"
 
 
-# Fonction pour générer les détails d'un tournoi
-def details_tournoi(tournoi: Tournoi) -> str:
-    # Initialise le rapport avec les détails du tournoi
-    rapport = f"Nom du tournoi: {tournoi.nom}\n"
-    rapport += f"Date de début: {tournoi.date_debut}\n"
-    rapport += f"Date de fin: {tournoi.date_fin}\n"
-    return rapport  # Retourne le rapport
+# Fonction pour générer les détails d'un tournoi, ligne à ligne
+def lignes_details_tournoi(tournoi: Tournoi) -> Iterator[str]:
+    yield f"Nom du tournoi: {tournoi.nom}\n"
+    yield f"Date de début: {tournoi.date_debut}\n"
+    yield f"Date de fin: {tournoi.date_fin}\n"
 
 
-# Fonction pour générer une liste de joueurs d'un tournoi triée par ordre alphabétique
-def liste_joueurs_tournoi_alphabetique(tournoi: Tournoi) -> str:
-    # Utilise la fonction liste_joueurs_alphabetique pour trier les joueurs du tournoi
-    return liste_joueurs_alphabetique(tournoi.joueurs)
+# Fonction pour générer une liste de joueurs d'un tournoi triée par ordre alphabétique, ligne à ligne
+def lignes_joueurs_tournoi_alphabetique(tournoi: Tournoi) -> Iterator[str]:
+    return lignes_joueurs_alphabetique(tournoi.joueurs)
 
 
-# Fonction pour générer la liste des tours et des matchs d'un tournoi
-def liste_tours_et_matchs(tournoi: Tournoi) -> str:
-    # Initialise le résultat avec un titre
-    resultat = f"Tours et matchs du tournoi {tournoi.nom}:\n\n"
+# Fonction pour générer le classement d'un tournoi avec ses départages, ligne à ligne
+def lignes_classement_tournoi(tournoi: Tournoi) -> Iterator[str]:
+    departages = tournoi.departages()  # Calcul de tous les départages en un seul passage
+    # Titre et en-tête des colonnes
+    yield f"Classement du tournoi {tournoi.nom}:\n"
+    yield "Rang  Joueur                          Pts  " + " ".join(
+        f"{LIBELLES_DEPARTAGES[critere]:>6}" for critere in ORDRE_DEPARTAGES) + "\n"
+    # Une ligne par joueur, dans l'ordre du classement
+    for rang, (joueur, points) in enumerate(departages.classer(), 1):
+        colonnes = " ".join(f"{departages.valeur(critere, joueur):>6g}" for critere in ORDRE_DEPARTAGES)
+        yield f"{rang:>4}  {joueur.nom + ' ' + joueur.prenom:<30} {points:>4g}  {colonnes}\n"
+
+
+# Fonction pour générer la liste des tours et des matchs d'un tournoi, ligne à ligne
+def lignes_tours_et_matchs(tournoi: Tournoi) -> Iterator[str]:
+    yield f"Tours et matchs du tournoi {tournoi.nom}:\n"
+    yield "\n"
 
     # Vérifie si des rondes ont été jouées
     if not tournoi.rondes:
-        return resultat + "Aucune ronde n'a été jouée dans ce tournoi.\n"
+        yield "Aucune ronde n'a été jouée dans ce tournoi.\n"
+        return
 
     # Parcourt chaque ronde du tournoi
     for ronde in tournoi.rondes:
-        resultat += f"Ronde {ronde.numero} ({ronde.statut}):\n"
+        yield f"Ronde {ronde.numero} ({ronde.statut}):\n"
         # Vérifie si des matchs ont été joués dans la ronde
-        if ronde.matchs:
-            for match in ronde.matchs:
-                resultat += f" {match.joueur_blanc.nom} vs {match.joueur_noir.nom} : {match.resultat or 'Non joué'}\n"
+        matchs = ronde.matchs
+        if matchs:
+            for match in matchs:
+                yield f" {match.joueur_blanc.nom} vs {match.joueur_noir.nom} : {match.resultat or 'Non joué'}\n"
         else:
-            resultat += " Aucun match n'a été joué dans cette ronde.\n"
-        resultat += "\n"
+            yield " Aucun match n'a été joué dans cette ronde.\n"
+        yield "\n"
 
-        # Obtient le classement après la ronde
+        # Classement après la ronde
         classement = ronde.obtenir_classement_ronde()
         if classement:
-            resultat += "Classement après la ronde:\n"
+            yield "Classement après la ronde:\n"
             for ligne in classement:
-                resultat += f" {ligne}\n"
-            resultat += "\n"
-
-    return resultat  # Retourne le résultat
+                yield f" {ligne}\n"
+            yield "\n"
 
 
-# Fonction alternative pour générer la liste des tours et des matchs d'un tournoi
-def liste_tours_et_matchs_alternative(tournoi: Tournoi) -> str:
-    resultat = ""  # Initialise le résultat
+# Fonction alternative pour générer la liste des tours et des matchs d'un tournoi, ligne à ligne
+def lignes_tours_et_matchs_alternative(tournoi: Tournoi) -> Iterator[str]:
     # Parcourt chaque ronde du tournoi
     for ronde in tournoi.rondes:
-        resultat += f"Ronde {ronde.numero} ({ronde.date} - {ronde.statut})\n"
+        yield f"Ronde {ronde.numero} ({ronde.date} - {ronde.statut})\n"
         # Parcourt chaque match de la ronde
         for match in ronde.matchs:
-            resultat += f"  Match : {match.joueur_blanc.nom} vs {match.joueur_noir.nom} - Score : {match.resultat}\n"
-        resultat += "Classement après la ronde :\n"
+            yield f"  Match : {match.joueur_blanc.nom} vs {match.joueur_noir.nom} - Score : {match.resultat}\n"
+        yield "Classement après la ronde :\n"
         # Ajoute le classement après la ronde
-        for classement in ronde.classement_apres_ronde:
-            resultat += f"  {classement}\n"
-    return resultat  # Retourne le résultat
\ No newline at end of file
+        for classement in ronde.obtenir_classement_ronde():
+            yield f"  {classement}\n"
+
+
+# Fonction pour générer une liste de joueurs triée par ordre alphabétique
+@chronometre("rapport.liste_joueurs_alphabetique", "rapport")
+def liste_joueurs_alphabetique(joueurs: List[Joueur]) -> str:
+    return "".join(lignes_joueurs_alphabetique(joueurs))
+
+
+# Fonction pour générer une liste de tournois
+@chronometre("rapport.liste_tournois", "rapport")
+def liste_tournois(tournois: List[Tournoi]) -> str:
+    return "".join(lignes_tournois(tournois))
+
+
+# Fonction pour générer les détails d'un tournoi
+@chronometre("rapport.details_tournoi", "rapport")
+def details_tournoi(tournoi: Tournoi) -> str:
+    return "".join(lignes_details_tournoi(tournoi))
+
+
+# Fonction pour générer une liste de joueurs d'un tournoi triée par ordre alphabétique
+@chronometre("rapport.liste_joueurs_tournoi_alphabetique", "rapport")
+def liste_joueurs_tournoi_alphabetique(tournoi: Tournoi) -> str:
+    return "".join(lignes_joueurs_tournoi_alphabetique(tournoi))
+
+
+# Fonction pour générer le classement d'un tournoi avec ses départages
+@chronometre("rapport.classement_tournoi", "rapport")
+def classement_tournoi(tournoi: Tournoi) -> str:
+    return "".join(lignes_classement_tournoi(tournoi))
+
+
+# Fonction pour générer la liste des tours et des matchs d'un tournoi
+@chronometre("rapport.liste_tours_et_matchs", "rapport")
+def liste_tours_et_matchs(tournoi: Tournoi) -> str:
+    return "".join(lignes_tours_et_matchs(tournoi))
+
+
+# Fonction alternative pour générer la liste des tours et des matchs d'un tournoi
+@chronometre("rapport.liste_tours_et_matchs_alternative", "rapport")
+def liste_tours_et_matchs_alternative(tournoi: Tournoi) -> str:
+    return "".join(lignes_tours_et_matchs_alternative(tournoi))
+
+
+# Fonction pour écrire un rapport dans un flux texte (fichier ouvert, sys.stdout, io.StringIO...)
+def ecrire_rapport(lignes: Iterable[str], sortie: TextIO) -> int:
+    nb_lignes = 0
+    with mesure("rapport.ecrire", "rapport"):
+        for ligne in lignes:
+            sortie.write(ligne)
+            nb_lignes += 1
+    return nb_lignes  # Nombre de lignes écrites
+
+
+# Fonction pour écrire un rapport dans un fichier (écriture atomique, au fil de l'eau)
+def ecrire_rapport_fichier(lignes: Iterable[str], fichier: str) -> None:
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    with mesure("rapport.ecrire_fichier", "rapport"):
+        ecrire_atomique_flux(fichier, lignes)
+
+
+# Fonction pour afficher un rapport dans la console, page par page
+#
+# Après chaque page, l'utilisateur appuie sur Entrée pour continuer ou saisit "q" pour arrêter.
+# Par défaut, une page occupe la hauteur de la console ; sans console interactive (sortie redirigée)
+# ou avec une hauteur nulle, le rapport est écrit d'un seul tenant.
+def afficher_rapport(lignes: Iterable[str], hauteur: Optional[int] = None,
+                     saisir: Callable[[str], str] = input) -> None:
+    if hauteur is None:
+        hauteur = max(shutil.get_terminal_size().lines - 1, 1) if sys.stdout.isatty() else 0  # Ligne de l'invite
+    if hauteur <= 0:
+        ecrire_rapport(lignes, sys.stdout)
+        return
+    for numero, ligne in enumerate(lignes, start=1):
+        sys.stdout.write(ligne)
+        if numero % hauteur == 0 and saisir("-- Entrée : page suivante, q : arrêter -- ").strip().lower() == "q":
+            return
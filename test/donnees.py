@@ -0,0 +1,65 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates des joueurs et des tournois
+import tempfile  # Pour des dossiers de données jetables
+import unittest  # Pour les tests unitaires
+from typing import List, Optional  # Pour les annotations de type
+
+from models.depots import Depot, DepotJSON  # Dépôts de stockage
+from models.joueur_model import Joueur, JoueurManager  # Joueurs et table d'identité
+from models.tournoi_manager import TournoiManager  # Gestionnaire des tournois
+from models.tournoi_model import Tournoi  # Tournois
+
+
+# Définition de la classe TestAvecDepot : gestionnaires de joueurs et de tournois sur un dossier de données jetable
+#
+# Le stockage est choisi par l'attribut de classe "stockage" ("json" ou "sqlite") : une sous-classe
+# qui le redéfinit rejoue les mêmes tests sur l'autre dépôt.
+class TestAvecDepot(unittest.TestCase):
+    stockage = "json"
+
+    # Préparation : dossier vide, dépôt et gestionnaires
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.depot: Optional[Depot] = None
+        self.rouvrir()
+
+    # Nettoyage : fermeture de la base et suppression du dossier
+    def tearDown(self):
+        self.fermer()
+        self.dossier.cleanup()
+
+    # Méthode pour fermer le dépôt ouvert (base SQLite)
+    def fermer(self) -> None:
+        if self.depot is not None and hasattr(self.depot, "fermer"):
+            self.depot.fermer()
+
+    # Méthode pour rouvrir le dossier de données : nouveau dépôt et nouveaux gestionnaires, relus depuis le disque
+    def rouvrir(self) -> None:
+        self.fermer()
+        if self.stockage == "sqlite":
+            from models.depot_sqlite import DepotSQLite
+            self.depot = DepotSQLite(f"{self.dossier.name}/echecs.sqlite3")
+        else:
+            self.depot = DepotJSON(self.dossier.name)
+        self.joueur_manager = JoueurManager(self.depot)
+        self.tournoi_manager = TournoiManager(self.depot, self.joueur_manager)
+
+    # Méthode pour ajouter des joueurs d'Elo décroissant
+    def ajouter_joueurs(self, nb: int) -> List[Joueur]:
+        debut = len(self.joueur_manager.joueurs)
+        for numero in range(debut, debut + nb):
+            naissance = datetime.date(1990, 1, 1) + datetime.timedelta(days=numero)
+            self.joueur_manager.ajouter_joueur(f"Nom{numero}", f"Prenom{numero}", naissance, 2000 - 10 * numero)
+        return self.joueur_manager.joueurs[-nb:]
+
+    # Méthode pour créer un tournoi et y inscrire des joueurs
+    def creer_tournoi(self, nom: str, joueurs: List[Joueur], nb_rondes: int = 3) -> Tournoi:
+        tournoi = self.tournoi_manager.ajouter_tournoi(nom, datetime.date(2024, 5, 1), datetime.date(2024, 5, 2),
+                                                       40, nb_rondes, "blitz")
+        for joueur in joueurs:
+            self.tournoi_manager.ajouter_joueur_au_tournoi(tournoi.index, joueur.index)
+        return tournoi
+
+    # Méthode pour trouver un tournoi par son nom dans le gestionnaire courant
+    def tournoi(self, nom: str) -> Tournoi:
+        return next(tournoi for tournoi in self.tournoi_manager.tournois if tournoi.nom == nom)
@@ -0,0 +1,100 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance des joueurs
+import random  # Pour des résultats aléatoires reproductibles
+import unittest  # Pour les tests unitaires
+from functools import lru_cache  # Pour mémoriser la recherche exhaustive
+from unittest import mock  # Pour réduire la taille des blocs
+
+from models.appariement import ParticipantAppariement, apparier_suisse, participants_depuis_rondes  # Système suisse
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+from models.tournoi_model import Ronde  # Rondes jouées
+
+
+# Fonction pour savoir si une ronde peut être appariée sans revanche ni second exempt (recherche exhaustive)
+def appariement_sans_revanche_possible(participants: list) -> bool:
+    nb = len(participants)
+    exempt = nb if nb % 2 == 1 else None  # Sommet fictif de l'exempt
+
+    # Paire possible sans revanche (j pouvant être l'exempt)
+    def compatibles(i: int, j: int) -> bool:
+        if j == exempt:
+            return not participants[i].exempte
+        return participants[j].joueur.index not in participants[i].adversaires
+
+    @lru_cache(maxsize=None)
+    def parfait(libres: int) -> bool:
+        if not libres:
+            return True
+        v = (libres & -libres).bit_length() - 1
+        reste = libres & ~(1 << v)
+        return any(reste >> w & 1 and compatibles(v, w) and parfait(reste & ~(1 << w))
+                   for w in range(v + 1, nb + (exempt is not None)))
+    return parfait((1 << (nb + (exempt is not None))) - 1)
+
+
+# Définition de la classe TestApparierSuisse : simulations de tournois aux résultats aléatoires
+class TestApparierSuisse(unittest.TestCase):
+    # Méthode pour créer des joueurs d'Elo décroissant
+    def joueurs(self, nb: int) -> list:
+        return [Joueur(i, f"Nom{i}", "Prénom", datetime.date(2000, 1, 1), 2500 - 10 * i) for i in range(1, nb + 1)]
+
+    # Méthode pour simuler un tournoi et compter les revanches évitables
+    def simuler(self, nb_joueurs: int, nb_rondes: int, graine: int) -> int:
+        generateur = random.Random(graine)
+        joueurs = self.joueurs(nb_joueurs)
+        rondes = []
+        evitables = 0
+        for numero in range(1, nb_rondes + 1):
+            participants = participants_depuis_rondes(joueurs, rondes)
+            possible = appariement_sans_revanche_possible(participants)
+            paires, exempt = apparier_suisse(participants)
+
+            apparies = [joueur.index for paire in paires for joueur in paire] + ([exempt.index] if exempt else [])
+            self.assertEqual(sorted(apparies), [joueur.index for joueur in joueurs])  # Chaque joueur une fois
+            par_index = {p.joueur.index: p for p in participants}
+            revanches = sum(noir.index in par_index[blanc.index].adversaires for blanc, noir in paires)
+            revanches += exempt is not None and par_index[exempt.index].exempte
+            if possible:
+                evitables += revanches
+
+            ronde = Ronde(numero)
+            for blanc, noir in paires:
+                ronde.ajouter_partie(blanc, noir, generateur.choice(("1-0", "0-1", "0.5-0.5")))
+            ronde.exempt = exempt
+            rondes.append(ronde)
+        return evitables
+
+    # Test de l'absence de revanche évitable : 16 joueurs sur 5 rondes
+    def test_seize_joueurs_cinq_rondes(self):
+        for graine in range(30):
+            self.assertEqual(self.simuler(16, 5, graine), 0, f"graine {graine}")
+
+    # Test de l'absence de revanche évitable : 8 joueurs sur 6 rondes
+    def test_huit_joueurs_six_rondes(self):
+        for graine in range(30):
+            self.assertEqual(self.simuler(8, 6, graine), 0, f"graine {graine}")
+
+    # Test de l'absence de revanche et de second exempt évitables avec un nombre impair de joueurs
+    def test_sept_joueurs_six_rondes(self):
+        for graine in range(30):
+            self.assertEqual(self.simuler(7, 6, graine), 0, f"graine {graine}")
+
+    # Test des blocs et des candidats restreints : fusions et élargissements gardent la garantie sur les revanches
+    def test_blocs_et_candidats(self):
+        with mock.patch("models.appariement.TAILLE_BLOC", 4), mock.patch("models.appariement.NB_CANDIDATS", 1), \
+                mock.patch("models.appariement.SEUIL_GRAPHE_COMPLET", 2):
+            for graine in range(30):
+                self.assertEqual(self.simuler(16, 5, graine), 0, f"graine {graine}")
+                self.assertEqual(self.simuler(9, 6, graine), 0, f"graine {graine}")
+
+    # Test de la première ronde : moitié haute contre moitié basse, exempt au dernier du classement
+    def test_premiere_ronde(self):
+        joueurs = self.joueurs(9)
+        paires, exempt = apparier_suisse([ParticipantAppariement(joueur) for joueur in joueurs])
+        self.assertEqual(exempt.index, 9)
+        self.assertEqual(sorted(sorted((blanc.index, noir.index)) for blanc, noir in paires),
+                         [[1, 5], [2, 6], [3, 7], [4, 8]])
+
+
+if __name__ == "__main__":
+    unittest.main()
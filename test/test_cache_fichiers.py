@@ -0,0 +1,83 @@
+# Importation des modules nécessaires
+import json  # Pour analyser les fichiers lus
+import os  # Pour les chemins et les dates de modification
+import tempfile  # Pour des dossiers de données jetables
+import unittest  # Pour les tests unitaires
+from typing import TextIO  # Pour les annotations de type
+
+from models.cache_fichiers import CacheFichiers  # Cache testé
+from models.persistance import ecrire_atomique  # Remplacement atomique d'un fichier
+
+
+# Définition de la classe TestCacheFichiers : contenu analysé réutilisé tant que le fichier ne change pas
+class TestCacheFichiers(unittest.TestCase):
+    # Préparation : cache vide et fichier JSON dans un dossier temporaire
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "joueur.json")
+        ecrire_atomique(self.fichier, "[1]")
+        self.cache = CacheFichiers()
+        self.analyses = 0  # Nombre d'appels de la fonction d'analyse
+        self.analyser = self.analyser_json  # Même objet à chaque lecture (le cache compare les fonctions d'analyse)
+
+    # Nettoyage : suppression du dossier
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    # Méthode d'analyse comptant ses appels
+    def analyser_json(self, file: TextIO):
+        self.analyses += 1
+        return json.load(file)
+
+    # Test d'un fichier inchangé : analysé une seule fois, même contenu retourné
+    def test_fichier_inchange(self):
+        premier = self.cache.lire(self.fichier, self.analyser)
+        self.assertIs(self.cache.lire(self.fichier, self.analyser), premier)
+        self.assertEqual(self.analyses, 1)
+        self.assertEqual(self.cache.statistiques(), {"succes": 1, "echecs": 1, "fichiers": 1})
+
+    # Test d'un fichier modifié (taille différente) : analysé à nouveau
+    def test_fichier_modifie(self):
+        self.cache.lire(self.fichier, self.analyser)
+        with open(self.fichier, "w", encoding="utf-8") as file:
+            file.write("[1, 2]")
+        self.assertEqual(self.cache.lire(self.fichier, self.analyser), [1, 2])
+        self.assertEqual(self.analyses, 2)
+
+    # Test d'un remplacement atomique de même taille et de même date : détecté par l'inode
+    def test_remplacement_atomique(self):
+        self.cache.lire(self.fichier, self.analyser)
+        date = os.stat(self.fichier).st_mtime_ns
+        ecrire_atomique(self.fichier, "[2]")
+        os.utime(self.fichier, ns=(date, date))
+        self.assertEqual(self.cache.lire(self.fichier, self.analyser), [2])
+
+    # Test d'une autre fonction d'analyse : le contenu n'est pas partagé entre analyses différentes
+    def test_autre_analyse(self):
+        self.cache.lire(self.fichier, self.analyser)
+        self.assertEqual(self.cache.lire(self.fichier, lambda file: file.read()), "[1]")
+
+    # Test d'un fichier supprimé ou illisible : erreur propagée, rien n'est conservé
+    def test_fichier_absent_ou_illisible(self):
+        self.cache.lire(self.fichier, self.analyser)
+        os.remove(self.fichier)
+        with self.assertRaises(FileNotFoundError):
+            self.cache.lire(self.fichier, self.analyser)
+        self.assertEqual(self.cache.statistiques()["fichiers"], 0)
+        ecrire_atomique(self.fichier, "[1, ")
+        with self.assertRaises(json.JSONDecodeError):
+            self.cache.lire(self.fichier, self.analyser)
+        self.assertEqual(self.cache.statistiques()["fichiers"], 0)
+
+    # Test de l'invalidation explicite : fichier analysé à nouveau
+    def test_invalider(self):
+        self.cache.lire(self.fichier, self.analyser)
+        self.cache.invalider(self.fichier)
+        self.cache.lire(self.fichier, self.analyser)
+        self.cache.invalider()
+        self.cache.lire(self.fichier, self.analyser)
+        self.assertEqual(self.analyses, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
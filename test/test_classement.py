@@ -0,0 +1,105 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance
+import io  # Pour capturer les messages affichés
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+
+from models.classement import Classement, MoteurClassement  # Classement testé
+from models.joueur_model import Joueur  # Joueurs indexés
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+NAISSANCE = datetime.date(1990, 1, 1)  # Date de naissance commune aux joueurs des tests
+
+
+# Définition de la classe TestClassement : ordre par points, puis Elo, puis index
+class TestClassement(unittest.TestCase):
+    # Préparation : trois joueurs, dont deux de même Elo
+    def setUp(self):
+        self.joueurs = [Joueur(1, "A", "a", NAISSANCE, 1500), Joueur(2, "B", "b", NAISSANCE, 1800),
+                        Joueur(3, "C", "c", NAISSANCE, 1500)]
+        self.classement = Classement(self.joueurs)
+
+    # Test de l'ordre initial et des rangs après des points
+    def test_ordre_et_rangs(self):
+        self.assertEqual([joueur.index for joueur, _ in self.classement.classement()], [2, 1, 3])
+        self.classement.ajouter_points(self.joueurs[2], 1.0)
+        self.classement.ajouter_points(self.joueurs[0], 0.5)
+        self.assertEqual(self.classement.classement(), [(self.joueurs[2], 1.0), (self.joueurs[0], 0.5),
+                                                        (self.joueurs[1], 0.0)])
+        self.assertEqual([self.classement.rang(joueur) for joueur in self.joueurs], [2, 3, 1])
+        self.assertEqual(self.classement.lignes(1), ["1. C c : 1"])
+
+    # Test de la copie : indépendante du classement d'origine
+    def test_copie_independante(self):
+        copie = self.classement.copie()
+        self.classement.ajouter_points(self.joueurs[0], 1.0)
+        self.classement.retirer_joueur(self.joueurs[1])
+        self.assertEqual(copie.points, {1: 0.0, 2: 0.0, 3: 0.0})
+        self.assertEqual(copie.rang(self.joueurs[1]), 1)
+        self.assertIsNone(self.classement.rang(self.joueurs[1]))
+
+    # Test de la révision : incrémentée seulement par une modification effective
+    def test_revision(self):
+        revision = self.classement.revision
+        self.classement.ajouter_points(self.joueurs[0], 0.0)
+        self.classement.ajouter_joueur(self.joueurs[0])
+        self.assertEqual(self.classement.revision, revision)
+        self.classement.ajouter_points(self.joueurs[0], 1.0)
+        self.assertEqual(self.classement.revision, revision + 1)
+
+
+# Définition de la classe TestMoteurClassement : classements mis à jour par différence égaux à un recalcul complet
+class TestMoteurClassement(TestAvecDepot):
+    # Méthode pour jouer deux rondes d'un tournoi de 9 joueurs (un exempt par ronde)
+    def jouer_deux_rondes(self):
+        tournoi = self.creer_tournoi("Open", self.ajouter_joueurs(9))
+        for resultat in ("1-0", "0.5-0.5"):
+            with redirect_stdout(io.StringIO()):
+                ronde = tournoi.creer_ronde()
+            for match in ronde.matchs:
+                tournoi.enregistrer_resultat(ronde, match, resultat)
+        return tournoi
+
+    # Méthode pour vérifier le moteur du tournoi contre un moteur reconstruit depuis les rondes
+    def verifier_contre_recalcul(self, tournoi) -> None:
+        moteur = tournoi.moteur_classement
+        general = moteur.general.classement()
+        apres_ronde = [classement.classement() for classement in moteur.apres_ronde]
+        scores = {index: inscription.score for index, inscription in moteur.inscriptions.items()}
+        recalcul = MoteurClassement(tournoi.joueurs, tournoi.rondes)
+        self.assertEqual(general, recalcul.general.classement())
+        self.assertEqual(apres_ronde, [classement.classement() for classement in recalcul.apres_ronde])
+        self.assertEqual(scores, {index: inscription.score for index, inscription in recalcul.inscriptions.items()})
+
+    # Test des résultats saisis ronde après ronde, exempts compris
+    def test_saisie(self):
+        tournoi = self.jouer_deux_rondes()
+        self.verifier_contre_recalcul(tournoi)
+        points = [points for _, points in tournoi.moteur_classement.general.classement()]
+        self.assertEqual(sum(points), 10.0)  # 4 matchs et 1 exempt par ronde
+
+    # Test de la correction d'un résultat de la première ronde : instantanés suivants mis à jour aussi
+    def test_correction(self):
+        tournoi = self.jouer_deux_rondes()
+        premiere = tournoi.rondes[0]
+        match = premiere.matchs[0]
+        tournoi.enregistrer_resultat(premiere, match, "0-1")
+        self.verifier_contre_recalcul(tournoi)
+        self.assertEqual(tournoi.moteur_classement.apres_ronde[0].points[match.joueur_noir.index], 1.0)
+        with self.assertRaises(ValueError):
+            tournoi.enregistrer_resultat(premiere, match, "2-0")
+        self.assertEqual(match.resultat, "0-1")
+
+    # Test du retrait d'un joueur : absent du classement général et des instantanés
+    def test_retrait(self):
+        tournoi = self.jouer_deux_rondes()
+        retire = tournoi.joueurs[0]
+        tournoi.supprimer_joueur(retire)
+        moteur = tournoi.moteur_classement
+        for classement in [moteur.general] + moteur.apres_ronde:
+            self.assertIsNone(classement.rang(retire))
+        self.assertNotIn(retire.index, moteur.inscriptions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Importation des modules nécessaires
+import random  # Pour générer des graphes aléatoires reproductibles
+import unittest  # Pour les tests unitaires
+from functools import lru_cache  # Pour mémoriser la recherche exhaustive
+
+from models.couplage import couplage_poids_maximal  # Couplage de poids maximal
+
+
+# Fonction pour calculer par recherche exhaustive la meilleure (cardinalité, poids) d'un couplage
+def meilleur_couplage(nb_sommets: int, poids: dict, cardinalite_max: bool) -> tuple:
+    @lru_cache(maxsize=None)
+    def meilleur(libres: int) -> tuple:
+        if not libres:
+            return (0, 0)
+        v = (libres & -libres).bit_length() - 1  # Plus petit sommet libre
+        reste = libres & ~(1 << v)
+        resultat = meilleur(reste)  # v reste libre
+        for w in range(v + 1, nb_sommets):
+            if reste >> w & 1 and (v, w) in poids:
+                cardinalite, total = meilleur(reste & ~(1 << w))
+                candidat = (cardinalite + 1, total + poids[(v, w)])
+                if cardinalite_max and candidat > resultat or not cardinalite_max and candidat[1] > resultat[1]:
+                    resultat = candidat
+        return resultat
+    return meilleur((1 << nb_sommets) - 1)
+
+
+# Définition de la classe TestCouplage : comparaison avec une recherche exhaustive sur de petits graphes
+class TestCouplage(unittest.TestCase):
+    # Méthode pour générer un graphe aléatoire (arêtes et dictionnaire des poids)
+    def graphe(self, generateur: random.Random, nb_sommets: int) -> tuple:
+        densite = generateur.choice((0.3, 0.6, 1.0))
+        aretes = [(i, j, generateur.randint(-20, 50)) for i in range(nb_sommets) for j in range(i + 1, nb_sommets)
+                  if generateur.random() < densite]
+        return aretes, {(i, j): p for i, j, p in aretes}
+
+    # Méthode pour vérifier qu'un résultat est un couplage et en calculer (cardinalité, poids)
+    def mesurer(self, conjoints: list, poids: dict) -> tuple:
+        cardinalite = total = 0
+        for v, w in enumerate(conjoints):
+            if w >= 0:
+                self.assertEqual(conjoints[w], v)
+            if w > v:
+                cardinalite += 1
+                total += poids[(v, w)]
+        return cardinalite, total
+
+    # Test du couplage de poids maximal, avec et sans cardinalité maximale
+    def test_poids_maximal(self):
+        generateur = random.Random(1)
+        for _ in range(500):
+            aretes, poids = self.graphe(generateur, generateur.randint(2, 9))
+            if not aretes:
+                continue
+            nb_sommets = 1 + max(max(i, j) for i, j, _ in aretes)
+            for cardinalite_max in (False, True):
+                attendu = meilleur_couplage(nb_sommets, poids, cardinalite_max)
+                obtenu = self.mesurer(couplage_poids_maximal(aretes, cardinalite_max), poids)
+                if cardinalite_max:
+                    self.assertEqual(obtenu, attendu)
+                else:
+                    self.assertEqual(obtenu[1], attendu[1])
+
+    # Test du couplage parfait : optimal lorsqu'il en existe un
+    def test_parfait(self):
+        generateur = random.Random(2)
+        for _ in range(500):
+            aretes, poids = self.graphe(generateur, 2 * generateur.randint(1, 5))
+            if not aretes:
+                continue
+            nb_sommets = 1 + max(max(i, j) for i, j, _ in aretes)
+            attendu = meilleur_couplage(nb_sommets, poids, True)
+            obtenu = self.mesurer(couplage_poids_maximal(aretes, parfait=True), poids)
+            if 2 * attendu[0] == nb_sommets:
+                self.assertEqual(obtenu, attendu)
+
+
+if __name__ == "__main__":
+    unittest.main()
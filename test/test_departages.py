@@ -0,0 +1,74 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance
+import unittest  # Pour les tests unitaires
+
+from models.departages import calculer_departages, performance  # Départages testés
+from models.joueur_model import Joueur  # Joueurs indexés
+from models.tournoi_model import Ronde  # Rondes et leurs matchs
+
+NAISSANCE = datetime.date(1990, 1, 1)  # Date de naissance commune aux joueurs des tests
+
+
+# Définition de la classe TestDepartages : valeurs calculées à la main sur un tournoi de trois rondes
+class TestDepartages(unittest.TestCase):
+    # Préparation : quatre joueurs (A, B, C, D d'Elo décroissant) et trois rondes
+    #
+    # Scores : A 1.5, B 1, C 2.5, D 1 ; B a battu D, son seul adversaire à égalité de points.
+    def setUp(self):
+        self.a, self.b, self.c, self.d = self.joueurs = [
+            Joueur(index, nom, nom.lower(), NAISSANCE, elo)
+            for index, nom, elo in ((1, "A", 2000), (2, "B", 1900), (3, "C", 1800), (4, "D", 1700))]
+        self.rondes = []
+        for numero, parties in enumerate([[(self.a, self.b, "1-0"), (self.c, self.d, "1-0")],
+                                          [(self.a, self.c, "0.5-0.5"), (self.b, self.d, "1-0")],
+                                          [(self.a, self.d, "0-1"), (self.b, self.c, "0-1")]], start=1):
+            ronde = Ronde(numero)
+            for partie in parties:
+                ronde.ajouter_partie(*partie)
+            self.rondes.append(ronde)
+        self.departages = calculer_departages(self.joueurs, self.rondes)
+
+    # Méthode pour lire un départage de chaque joueur, dans l'ordre A, B, C, D
+    def valeurs(self, critere: str):
+        return [self.departages.valeur(critere, joueur) for joueur in self.joueurs]
+
+    # Test des scores et de chaque départage
+    def test_valeurs(self):
+        self.assertEqual([self.departages.score[joueur.index] for joueur in self.joueurs], [1.5, 1.0, 2.5, 1.0])
+        self.assertEqual(self.valeurs("buchholz"), [4.5, 5.0, 3.5, 5.0])
+        self.assertEqual(self.valeurs("buchholz_median"), [1.0, 1.5, 1.0, 1.5])
+        self.assertEqual(self.valeurs("sonneborn_berger"), [2.25, 1.0, 2.75, 1.5])
+        self.assertEqual(self.valeurs("progressif"), [4.0, 2.0, 5.0, 1.0])
+        self.assertEqual(self.valeurs("confrontation"), [0, 1.0, 0, 0])
+        self.assertEqual(self.valeurs("performance"), [1800, 1713, 2146, 1780])
+
+    # Test du classement : l'ordre des départages départage B et D
+    def test_classement(self):
+        self.assertEqual(self.departages.classer(), [(self.c, 2.5), (self.a, 1.5), (self.b, 1.0), (self.d, 1.0)])
+        ordre = [joueur for joueur, _ in self.departages.classer(("sonneborn_berger",))]
+        self.assertEqual(ordre, [self.c, self.a, self.d, self.b])
+        ordre = [joueur for joueur, _ in self.departages.classer(("buchholz",))]  # Égalité : Elo le plus haut
+        self.assertEqual(ordre, [self.c, self.a, self.b, self.d])
+
+    # Test d'une ronde avec un match non joué, un exempt et un joueur retiré du tournoi
+    def test_non_joue_exempt_et_retire(self):
+        ronde = Ronde(1)
+        ronde.ajouter_partie(self.a, self.b)
+        ronde.ajouter_partie(self.c, self.d, "1-0")
+        ronde.exempt = self.d
+        departages = calculer_departages([self.a, self.b, self.d], [ronde])  # C retiré
+        self.assertEqual(departages.score, {1: 0.0, 2: 0.0, 4: 1.0})
+        self.assertEqual(departages.valeur("buchholz", self.a), 0)
+        self.assertEqual(departages.valeur("performance", self.d), 0)
+
+    # Test de la performance : écart plafonné pour un score de 100 % ou de 0 %
+    def test_performance(self):
+        self.assertEqual(performance([], 0), 0)
+        self.assertEqual(performance([1500], 1.0), 2300)
+        self.assertEqual(performance([1500, 1700], 0), 800)
+        self.assertEqual(performance([1600, 1800], 2.0), 2500)
+        self.assertEqual(performance([1600, 1800], 1.5), 1891)
+
+
+if __name__ == "__main__":
+    unittest.main()
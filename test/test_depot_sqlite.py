@@ -0,0 +1,175 @@
+# Importation des modules nécessaires
+import json  # Pour écrire les fichiers JSON de départ
+import os  # Pour les chemins des fichiers
+import tempfile  # Pour des dossiers de données jetables
+import threading  # Pour le fil de chargement en arrière-plan
+import unittest  # Pour les tests unitaires
+from unittest import mock  # Pour interrompre une reprise et changer la configuration
+
+import config  # Paramètres de l'application (choix du stockage)
+from models import depots  # Dépôt par défaut et reprise des fichiers JSON
+from models.depot_sqlite import DepotSQLite  # Dépôt testé
+from models.depots import DepotJSON  # Source de la reprise
+
+JOUEURS = [
+    {"index": 1, "nom": "Durand", "prenom": "Alice", "date_naissance": "1990-01-02", "elo": 1800},
+    {"index": 2, "nom": "Martin", "prenom": "Bruno", "date_naissance": "1985-03-04", "elo": 1650,
+     "historique_elo": [{"tournoi": "Open", "ronde": 1, "avant": 1640, "apres": 1650}]},
+    {"index": 4, "nom": "Petit", "prenom": "Chloé", "date_naissance": "2001-05-06", "elo": 1500},
+]
+
+ENTETE = {"index": 0, "nom_tournoi": "Open", "date_debut": "2024-05-01", "date_fin": "2024-05-02",
+          "nb_rondes": 3, "nb_max_joueurs": 20, "type_tournoi": "blitz"}
+
+TOURNOI = {
+    **ENTETE,
+    "nb_inscrits": 3,
+    "statut": "En cours",
+    "joueurs_inscrits": [1, 2, 4],
+    "rondes": [{
+        "numero": 1,
+        "date": "2024-05-01T10:00:00",
+        "statut": "terminée",
+        "matchs": [{"match": "Durand Alice - Martin Bruno", "score": "1-0", "blanc": 1, "noir": 2}],
+        "classement_apres_ronde": [[1, 1.0], [4, 1.0], [2, 0.0]],
+        "exempt": 4
+    }]
+}
+
+
+# Fonction pour écrire un fichier JSON de départ
+def ecrire_json(fichier: str, data) -> None:
+    os.makedirs(os.path.dirname(fichier), exist_ok=True)
+    with open(fichier, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+# Définition de la classe TestDepotSQLite : données relues telles qu'elles ont été enregistrées
+class TestDepotSQLite(unittest.TestCase):
+    # Préparation : base vide dans un dossier temporaire
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "echecs.sqlite3")
+        self.depot = DepotSQLite(self.fichier)
+
+    # Nettoyage : fermeture de la base et suppression du dossier
+    def tearDown(self):
+        self.depot.fermer()
+        self.dossier.cleanup()
+
+    # Méthode pour rouvrir la base (relecture depuis le disque, sans les états mémorisés)
+    def rouvrir(self) -> DepotSQLite:
+        self.depot.fermer()
+        self.depot = DepotSQLite(self.fichier)
+        return self.depot
+
+    # Test des joueurs relus après réouverture (historique Elo, suppression et plus grand index attribué)
+    def test_joueurs_relus_avec_historique(self):
+        self.depot.enregistrer_joueurs(JOUEURS)
+        self.depot.supprimer_joueur(4)
+        self.depot.enregistrer_index_max(4)
+        depot = self.rouvrir()
+        self.assertEqual(depot.charger_joueurs(), JOUEURS[:2])
+        self.assertEqual(depot.charger_index_max(), 4)
+
+    # Test d'un tournoi relu à l'identique (inscrits, matchs par index, exempt, classement)
+    def test_tournoi_relu_a_l_identique(self):
+        self.depot.enregistrer_joueurs(JOUEURS)
+        self.depot.synchroniser_entetes({"Open": ENTETE})
+        self.depot.synchroniser_tournoi("Open", TOURNOI)
+        depot = self.rouvrir()
+        self.assertEqual(depot.charger_entetes(), {"Open": ENTETE})
+        self.assertEqual(depot.charger_tournoi("Open"), TOURNOI)
+        self.assertEqual(depot.tournois_du_joueur(4), ["Open"])  # Exempt seulement : encore référencé
+        self.assertEqual(depot.tournois_du_joueur(3), [])
+
+    # Test de la suppression d'un tournoi : plus aucune référence à ses joueurs
+    def test_suppression_du_tournoi(self):
+        self.depot.synchroniser_entetes({"Open": ENTETE})
+        self.depot.synchroniser_tournoi("Open", TOURNOI)
+        self.depot.supprimer_tournoi("Open")
+        depot = self.rouvrir()
+        self.assertEqual(depot.charger_tournoi("Open"), {})
+        self.assertEqual(depot.tournois_du_joueur(1), [])
+
+    # Test de la connexion partagée entre deux fils : l'écriture d'un fil n'entre pas dans la transaction de l'autre
+    def test_transactions_de_deux_fils(self):
+        ouverte, ecrite = threading.Event(), threading.Event()
+
+        # Fil de chargement : transaction annulée après avoir laissé à l'autre fil le temps d'écrire
+        def transaction_annulee():
+            try:
+                with self.depot.transaction():
+                    self.depot.enregistrer_joueur(JOUEURS[0])
+                    ouverte.set()
+                    ecrite.wait(0.5)
+                    raise RuntimeError("annulation")
+            except RuntimeError:
+                pass
+
+        fil = threading.Thread(target=transaction_annulee)
+        fil.start()
+        ouverte.wait()
+        self.depot.enregistrer_joueur(JOUEURS[1])  # Attend la fin de la transaction de l'autre fil
+        ecrite.set()
+        fil.join()
+        self.assertEqual(self.rouvrir().charger_joueurs(), [JOUEURS[1]])
+
+
+# Définition de la classe TestMigration : reprise des fichiers JSON au premier démarrage en mode SQLite
+class TestMigration(unittest.TestCase):
+    # Préparation : fichiers JSON (ancien format de tournoi compris) et configuration en mode SQLite
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        racine = self.dossier.name
+        ecrire_json(os.path.join(racine, "joueur.json"), JOUEURS)
+        ecrire_json(os.path.join(racine, "tournaments.json"), {"Open": ENTETE})
+        ancien = {key: valeur for key, valeur in TOURNOI.items() if key != "joueurs_inscrits"}
+        ecrire_json(os.path.join(racine, "tournaments", "Open.json"), ancien)  # Ancien format : copie des joueurs
+        ecrire_json(os.path.join(racine, "tournaments", "Open_joueurs.json"), JOUEURS)
+        self.config = mock.patch.multiple(config, STOCKAGE="sqlite", DOSSIER_DONNEES=racine,
+                                          FICHIER_SQLITE=os.path.join(racine, "echecs.sqlite3"))
+        self.config.start()
+        self.ouverts = []  # Dépôts ouverts par les démarrages simulés
+
+    # Nettoyage : fermeture des bases, dépôt par défaut et configuration rétablis
+    def tearDown(self):
+        for depot in self.ouverts:
+            depot.fermer()
+        depots.definir_depot(None)
+        self.config.stop()
+        self.dossier.cleanup()
+
+    # Méthode pour simuler un démarrage de l'application (dépôt par défaut recréé depuis config.py)
+    def demarrer(self) -> DepotSQLite:
+        depots.definir_depot(None)
+        depot = depots.obtenir_depot()
+        self.ouverts.append(depot)
+        return depot
+
+    # Test de la reprise des fichiers JSON au premier démarrage
+    def test_reprise_des_fichiers_json(self):
+        depot = self.demarrer()
+        self.assertTrue(depot.est_migree())
+        self.assertEqual(depot.charger_joueurs(), JOUEURS)
+        self.assertEqual(depot.charger_index_max(), 4)
+        self.assertEqual(depot.charger_tournoi("Open")["joueurs_inscrits"], [1, 2, 4])
+
+    # Test d'une reprise interrompue : refaite au démarrage suivant au lieu de partir d'une base vide
+    def test_reprise_interrompue_refaite_au_demarrage_suivant(self):
+        with mock.patch.object(DepotJSON, "charger_entetes", side_effect=RuntimeError("interruption")):
+            with self.assertRaises(RuntimeError):
+                self.demarrer()
+        self.assertTrue(os.path.exists(config.FICHIER_SQLITE))  # Base créée, mais vide et sans indicateur
+        depot = self.demarrer()
+        self.assertEqual(len(depot.charger_joueurs()), len(JOUEURS))
+        self.assertEqual(list(depot.charger_entetes()), ["Open"])
+
+    # Test d'une base déjà reprise : les fichiers JSON ne sont plus relus
+    def test_base_reprise_non_reecrite(self):
+        self.demarrer().supprimer_joueur(4)
+        self.assertEqual(len(self.demarrer().charger_joueurs()), 2)  # joueur.json n'est pas relu
+
+
+if __name__ == "__main__":
+    unittest.main()
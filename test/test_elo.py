@@ -0,0 +1,90 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance et de calcul
+import io  # Pour capturer les messages affichés
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+
+from models.elo import (K_DEBUTANT, K_ELITE, K_STANDARD, MoteurElo, calculer_variations, coefficient_k,
+                        esperance)  # Calcul testé
+from models.import_joueurs import ELO_NON_CLASSE  # Elo des joueurs entrés sans classement
+from models.joueur_model import Joueur  # Joueurs indexés
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+DATE = datetime.date(2024, 5, 2)  # Date du calcul
+
+
+# Fonction pour créer un joueur (adulte par défaut) ayant joué un nombre de parties depuis un Elo de départ
+def joueur(elo_depart: int, parties: int = 0, variation: int = 0, naissance: int = 1990) -> Joueur:
+    cree = Joueur(1, "Nom", "Prenom", datetime.date(naissance, 1, 1), elo_depart)
+    if parties:
+        cree.elo = elo_depart + variation
+        cree.ajouter_historique_elo({"date": "2024-01-01", "tournoi": "Ancien", "ronde": None, "parties": parties,
+                                     "variation": variation, "elo": cree.elo})
+    return cree
+
+
+# Définition de la classe TestCalculElo : score attendu, coefficient K et variations
+class TestCalculElo(unittest.TestCase):
+    # Test du score attendu : symétrique, écart plafonné à 400 points
+    def test_esperance(self):
+        self.assertEqual(esperance(0), 0.5)
+        self.assertAlmostEqual(esperance(400), 10 / 11)
+        self.assertEqual(esperance(800), esperance(400))
+        self.assertAlmostEqual(esperance(-150) + esperance(150), 1)
+
+    # Test du coefficient K : débutant seulement pour un joueur entré sans classement, ou mineur sous 2300
+    def test_coefficient_k(self):
+        self.assertEqual(coefficient_k(joueur(ELO_NON_CLASSE), DATE), K_DEBUTANT)
+        self.assertEqual(coefficient_k(joueur(ELO_NON_CLASSE, parties=12, variation=150), DATE), K_DEBUTANT)
+        self.assertEqual(coefficient_k(joueur(ELO_NON_CLASSE, parties=30, variation=300), DATE), K_STANDARD)
+        self.assertEqual(coefficient_k(joueur(1800), DATE), K_STANDARD)  # Elo saisi : classement établi
+        self.assertEqual(coefficient_k(joueur(1800, parties=2, variation=-10), DATE), K_STANDARD)
+        self.assertEqual(coefficient_k(joueur(1800, naissance=2010), DATE), K_DEBUTANT)
+        self.assertEqual(coefficient_k(joueur(2450), DATE), K_ELITE)
+        self.assertEqual(coefficient_k(joueur(2410, parties=5, variation=-20), DATE), K_ELITE)  # 2400 déjà atteint
+
+    # Test des variations d'un lot : Elo d'avant le lot pour toutes les parties, nombre de parties par joueur
+    def test_variations(self):
+        variations = calculer_variations([(1, 2, 1.0), (1, 3, 0.5)], {1: 1600, 2: 1600, 3: 2000},
+                                         {1: 20, 2: 20, 3: 10})
+        self.assertEqual(variations, {1: (10 + 8, 2), 2: (-10, 1), 3: (-4, 1)})
+
+
+# Définition de la classe TestMoteurElo : une ronde ou un tournoi n'est pris en compte qu'une fois
+class TestMoteurElo(TestAvecDepot):
+    # Préparation : tournoi de 8 joueurs classés dont la première ronde est jouée
+    def setUp(self):
+        super().setUp()
+        self.open = self.creer_tournoi("Open", self.ajouter_joueurs(8))
+        with redirect_stdout(io.StringIO()):
+            self.ronde = self.open.creer_ronde()
+        for match in self.ronde.matchs:
+            self.open.enregistrer_resultat(self.ronde, match, "1-0")
+
+    # Test de la notation d'une ronde : joueurs classés au coefficient standard, seconde notation refusée
+    def test_ronde_notee_une_fois(self):
+        elos = {joueur.index: joueur.elo for joueur in self.open.joueurs}
+        variations = MoteurElo(self.joueur_manager).noter_ronde(self.open, 1)
+        self.assertEqual(len(variations), 8)
+        for match in self.ronde.matchs:
+            ecart = elos[match.joueur_blanc.index] - elos[match.joueur_noir.index]
+            attendu = round(K_STANDARD * (1 - esperance(ecart)))
+            self.assertEqual(variations[match.joueur_blanc.index], (attendu, 1))
+        self.assertEqual(self.joueur_manager.rondes_notees, {"Open": {1}})
+        with redirect_stdout(io.StringIO()) as sortie:
+            self.assertEqual(MoteurElo(self.joueur_manager).noter_ronde(self.open, 1), {})
+            self.assertEqual(MoteurElo(self.joueur_manager).noter_tournoi(self.open), {})
+        self.assertIn("déjà été pris", sortie.getvalue())
+
+    # Test après redémarrage : rondes notées retrouvées dans l'historique enregistré
+    def test_rondes_notees_rechargees(self):
+        MoteurElo(self.joueur_manager).noter_tournoi(self.open)
+        self.rouvrir()
+        self.assertEqual(self.joueur_manager.rondes_notees, {"Open": {None}})
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(MoteurElo(self.joueur_manager).noter_ronde(self.tournoi("Open"), 1), {})
+        self.assertEqual(MoteurElo(self.joueur_manager).noter_saison(self.tournoi_manager.tournois), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
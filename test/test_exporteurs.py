@@ -0,0 +1,76 @@
+# Importation des modules nécessaires
+import io  # Pour capturer les messages affichés
+import os  # Pour les chemins des fichiers
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+from unittest import mock  # Pour désactiver les modèles personnalisés
+
+import config  # Paramètres de l'application (dossier des modèles)
+from models.exporteurs import Lien, Tableau, exporter_tournoi, obtenir_exporteur  # Exports testés
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+NOM_PIEGE = "<b>Dupont</b> & | fils"  # Nom contenant du HTML, une esperluette et un séparateur Markdown
+
+
+# Fonction pour produire un document complet dans un format (modèles intégrés)
+def document(format_export: str, titre: str, tableaux) -> str:
+    with mock.patch.object(config, "DOSSIER_MODELES", None):
+        return "".join(obtenir_exporteur(format_export).document(titre, tableaux))
+
+
+# Définition de la classe TestEchappement : texte des joueurs et des tournois jamais interprété par le format
+class TestEchappement(unittest.TestCase):
+    # Préparation : tableau contenant le nom piégé, un lien et un nombre
+    def setUp(self):
+        self.tableau = Tableau("joueurs", "Joueurs <2024>", ("Nom", "Points"),
+                               [(NOM_PIEGE, 1.5), (Lien(NOM_PIEGE, 'fiche "1".html'), 2.0)])
+
+    # Test du HTML : balises, guillemets et esperluettes échappés, liens conservés
+    def test_html(self):
+        sortie = document("html", "Open <Été>", [self.tableau])
+        self.assertNotIn("<b>", sortie)
+        self.assertIn("<title>Open &lt;Été&gt;</title>", sortie)
+        self.assertIn("<h2>Joueurs &lt;2024&gt;</h2>", sortie)
+        self.assertIn("<td>&lt;b&gt;Dupont&lt;/b&gt; &amp; | fils</td><td>1.5</td>", sortie)
+        self.assertIn('<a href="fiche &quot;1&quot;.html">&lt;b&gt;Dupont', sortie)
+
+    # Test du Markdown : HTML brut et séparateurs de colonnes échappés, espaces des liens encodés
+    def test_markdown(self):
+        sortie = document("md", "Open <Été>", [self.tableau])
+        self.assertNotIn("<b>", sortie)
+        self.assertIn("# Open &lt;Été&gt;", sortie)
+        self.assertIn("| &lt;b&gt;Dupont&lt;/b&gt; &amp; \\| fils | 1.5 |", sortie)
+        self.assertIn('](fiche%20"1".html) | 2 |', sortie)
+
+    # Test du texte brut et du CSV : texte inchangé (guillemets CSV ajoutés si nécessaire)
+    def test_texte_et_csv(self):
+        self.assertIn(NOM_PIEGE, document("txt", "Open", [self.tableau]))
+        tableau = Tableau("joueurs", "Joueurs", ("Nom",), [("Dupont, \"fils\"",)])
+        self.assertEqual(document("csv", "Open", [tableau]), 'Nom\n"Dupont, ""fils"""\n')
+
+
+# Définition de la classe TestExportTournoi : fichiers d'un tournoi dont un joueur porte un nom piégé
+class TestExportTournoi(TestAvecDepot):
+    # Test des exports HTML et Markdown d'un tournoi joué
+    def test_fichiers(self):
+        joueurs = self.ajouter_joueurs(8)
+        self.joueur_manager.modifier_joueur(joueurs[0].index, NOM_PIEGE, "Jean", joueurs[0].date_naissance, 2000)
+        tournoi = self.creer_tournoi("Open <Été>", joueurs)
+        with redirect_stdout(io.StringIO()):
+            ronde = tournoi.creer_ronde()
+        for match in ronde.matchs:
+            tournoi.enregistrer_resultat(ronde, match, "1-0")
+        dossier = os.path.join(self.dossier.name, "exports")
+        with mock.patch.object(config, "DOSSIER_MODELES", None):
+            fichiers = exporter_tournoi(tournoi, ["html", "md"], dossier)
+        self.assertEqual(len(fichiers), 2)
+        for fichier in fichiers:
+            with open(fichier, encoding="utf-8") as file:
+                contenu = file.read()
+            self.assertNotIn("<b>", contenu)
+            self.assertNotIn("<Été>", contenu)
+            self.assertIn("&lt;b&gt;Dupont&lt;/b&gt; &amp;", contenu)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Importation des modules nécessaires
+import io  # Pour capturer les messages affichés
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages de l'appariement
+
+from models.tournoi_model import Ronde  # Ronde dont la forme sérialisée est conservée
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+
+# Définition de la classe TestFragmentsRondes : forme sérialisée d'une ronde reconstruite seulement si elle a changé
+class TestFragmentsRondes(TestAvecDepot):
+    # Préparation : deux tournois sans joueur commun, une ronde appariée dans chacun
+    def setUp(self):
+        super().setUp()
+        self.joueurs = self.ajouter_joueurs(16)
+        self.open = self.creer_tournoi("Open", self.joueurs[:8])
+        self.rapide = self.creer_tournoi("Rapide", self.joueurs[8:])
+        with redirect_stdout(io.StringIO()):
+            self.ronde = self.open.creer_ronde()
+            self.autre_ronde = self.rapide.creer_ronde()
+
+    # Méthode pour renommer un joueur par le gestionnaire
+    def renommer(self, joueur, nom: str) -> None:
+        self.assertTrue(self.joueur_manager.modifier_joueur(joueur.index, nom, joueur.prenom,
+                                                            joueur.date_naissance, joueur.elo))
+
+    # Test d'une ronde inchangée : même dictionnaire retourné
+    def test_ronde_inchangee(self):
+        fragment = self.ronde.to_dict()
+        self.assertIs(self.ronde.to_dict(), fragment)
+
+    # Test d'un résultat, du statut ou du classement modifiés : forme sérialisée reconstruite
+    def test_resultat_statut_et_classement(self):
+        fragment = self.ronde.to_dict()
+        self.open.enregistrer_resultat(self.ronde, self.ronde.matchs[0], "1-0")
+        self.assertIsNot(self.ronde.to_dict(), fragment)
+        self.assertEqual(self.ronde.to_dict()["matchs"][0]["score"], "1-0")
+        fragment = self.ronde.to_dict()
+        self.ronde.terminer_ronde()
+        self.assertEqual(self.ronde.to_dict()["statut"], "terminée")
+        fragment = self.ronde.to_dict()
+        self.ronde.classement.ajouter_points(self.joueurs[3], 1.0)
+        self.assertIsNot(self.ronde.to_dict(), fragment)
+
+    # Test d'un joueur de la ronde renommé : libellés des matchs et du classement mis à jour
+    def test_renommage_joueur_de_la_ronde(self):
+        fragment = self.ronde.to_dict()
+        joueur = self.ronde.matchs[0].joueur_blanc
+        self.renommer(joueur, "Renommé")
+        self.assertIsNot(self.ronde.to_dict(), fragment)
+        self.assertEqual(self.ronde.lignes_matchs()[0][0], f"Renommé {joueur.prenom}")
+        self.assertTrue(any("Renommé" in ligne for ligne in self.ronde.obtenir_classement_ronde()))
+
+    # Test d'un joueur absent de la ronde renommé : forme sérialisée réutilisée
+    def test_renommage_joueur_absent(self):
+        fragment = self.ronde.to_dict()
+        autre_fragment = self.autre_ronde.to_dict()
+        self.renommer(self.joueurs[8], "Renommé")
+        self.assertIs(self.ronde.to_dict(), fragment)
+        self.assertIsNot(self.autre_ronde.to_dict(), autre_fragment)
+        self.renommer(self.joueurs[0], "Renommé")
+        self.assertIsNot(self.ronde.to_dict(), fragment)
+        autre_fragment = self.autre_ronde.to_dict()
+        self.assertIs(self.autre_ronde.to_dict(), autre_fragment)
+
+    # Test d'une ronde hors tournoi : seuls les joueurs de ses matchs comptent
+    def test_ronde_hors_tournoi(self):
+        ronde = Ronde(1)
+        ronde.ajouter_partie(self.joueurs[0], self.joueurs[1], "1-0")
+        fragment = ronde.to_dict()
+        self.renommer(self.joueurs[2], "Renommé")
+        self.assertIs(ronde.to_dict(), fragment)
+        self.renommer(self.joueurs[1], "Renommé")
+        self.assertEqual(ronde.lignes_matchs(), [("Nom0 Prenom0", "Renommé Prenom1", "1-0")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Importation des modules nécessaires
+import copy  # Pour modifier une copie des données d'un tournoi
+import io  # Pour capturer les messages affichés
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+
+from controllers.joueur_controller import JoueurController  # Contrôleur des joueurs
+from models.unite_travail import unite_de_travail  # Sauvegardes regroupées
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+
+# Définition de la classe TestIdentiteJoueurs : tournois référençant les joueurs de la table partagée par leur index
+class TestIdentiteJoueurs(TestAvecDepot):
+    # Méthode pour créer un tournoi de 9 joueurs avec une ronde jouée, dont un blanc retiré du tournoi ensuite
+    def tournoi_avec_retrait(self):
+        joueurs = self.ajouter_joueurs(9)
+        tournoi = self.creer_tournoi("Open", joueurs)
+        with redirect_stdout(io.StringIO()):
+            ronde = tournoi.creer_ronde()
+        for match in ronde.matchs:
+            tournoi.enregistrer_resultat(ronde, match, "1-0")
+        retire = ronde.matchs[0].joueur_blanc
+        tournoi.supprimer_joueur(retire)
+        return tournoi, ronde, retire
+
+    # Test du refus de supprimer un joueur inscrit, exempt ou retiré après avoir joué
+    def test_suppression_refusee_si_reference(self):
+        tournoi, ronde, retire = self.tournoi_avec_retrait()
+        for joueur in (retire, ronde.exempt, tournoi.joueurs[0]):
+            with redirect_stdout(io.StringIO()) as sortie:
+                self.assertFalse(self.joueur_manager.supprimer_joueur(joueur.index))
+            self.assertIn("Open", sortie.getvalue())
+            self.assertIs(self.joueur_manager.trouver_joueur_par_index(joueur.index), joueur)
+
+    # Test de la suppression d'un joueur qu'aucun tournoi ne référence
+    def test_suppression_acceptee_sinon(self):
+        self.tournoi_avec_retrait()
+        libre = self.ajouter_joueurs(1)[0]
+        self.assertTrue(self.joueur_manager.supprimer_joueur(libre.index))
+        self.rouvrir()
+        self.assertIsNone(self.joueur_manager.trouver_joueur_par_index(libre.index))
+
+    # Test d'une inscription pas encore écrite (unité de travail en cours) : la suppression est aussi refusée
+    def test_reference_en_attente(self):
+        self.tournoi_avec_retrait()
+        libre = self.ajouter_joueurs(1)[0]
+        with unite_de_travail(self.depot):
+            self.tournoi_manager.ajouter_joueur_au_tournoi(self.tournoi("Open").index, libre.index)
+            with redirect_stdout(io.StringIO()):
+                self.assertFalse(self.joueur_manager.supprimer_joueur(libre.index))
+
+    # Test du contrôleur : message de succès seulement si la suppression a eu lieu
+    def test_controleur(self):
+        tournoi, _, _ = self.tournoi_avec_retrait()
+        controleur = JoueurController(self.joueur_manager)
+        with redirect_stdout(io.StringIO()) as sortie:
+            self.assertFalse(controleur.supprimer_joueur(tournoi.joueurs[0].index))
+        self.assertNotIn("succès", sortie.getvalue())
+
+    # Test du rechargement : les parties du joueur retiré sont conservées
+    def test_parties_du_joueur_retire_rechargees(self):
+        tournoi, ronde, retire = self.tournoi_avec_retrait()
+        tournoi.sauvegarder_tournoi()
+        self.rouvrir()
+        recharge = self.tournoi("Open")
+        self.assertEqual(len(recharge.rondes[0].matchs), len(ronde.matchs))
+        blanc = recharge.rondes[0].matchs[0].joueur_blanc
+        self.assertIs(blanc, self.joueur_manager.trouver_joueur_par_index(retire.index))
+        self.assertNotIn(retire, recharge.joueurs)
+        self.assertIn(retire.index, [joueur.index for joueur in recharge.joueurs_references()])
+
+    # Test d'un index introuvable : erreur explicite, à chaque tentative, au lieu d'un tournoi amputé
+    def test_index_introuvable(self):
+        tournoi, _, _ = self.tournoi_avec_retrait()
+        tournoi.sauvegarder_tournoi()
+        data = copy.deepcopy(self.depot.charger_tournoi("Open"))  # Données du dépôt : jamais modifiées sur place
+        data["joueurs_inscrits"].append(999)
+        self.depot.synchroniser_tournoi("Open", data)
+        self.rouvrir()
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "999"):
+                self.tournoi("Open").joueurs
+
+
+# Définition de la classe TestIdentiteJoueursSQLite : mêmes tests sur le dépôt SQLite
+class TestIdentiteJoueursSQLite(TestIdentiteJoueurs):
+    stockage = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
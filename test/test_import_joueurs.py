@@ -0,0 +1,106 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance
+import io  # Pour lire des fichiers en mémoire
+import os  # Pour les chemins des fichiers
+import unittest  # Pour les tests unitaires
+
+from models.import_joueurs import (ELO_NON_CLASSE, REFUS_AGE, REFUS_DOUBLON, REFUS_INVALIDE, exporter_csv_joueurs,
+                                   lire_csv_joueurs, lire_date, lire_fichier_joueurs,
+                                   lire_liste_fide)  # Import testé
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+# Colonnes (en-tête, largeur) d'une liste de classement FIDE réduite
+COLONNES_FIDE = (("ID Number", 15), ("Name", 34), ("Fed", 4), ("Sex", 4), ("SRtng", 6), ("B-day", 6), ("Flag", 4))
+
+
+# Fonction pour écrire une ligne de liste FIDE à colonnes fixes
+def ligne_fide(*valeurs: str) -> str:
+    return "".join(valeur.ljust(largeur) for valeur, (_, largeur) in zip(valeurs, COLONNES_FIDE)).rstrip() + "\n"
+
+
+# Définition de la classe TestLectureFichiers : lignes lues dans les CSV et les listes FIDE
+class TestLectureFichiers(unittest.TestCase):
+    # Test des formats de date acceptés
+    def test_dates(self):
+        for texte in ("1990-03-04", "04/03/1990"):
+            self.assertEqual(lire_date(texte), datetime.date(1990, 3, 4))
+        self.assertEqual(lire_date("1990"), datetime.date(1990, 1, 1))
+        with self.assertRaisesRegex(ValueError, "(vide)"):
+            lire_date("")
+
+    # Test d'un CSV séparé par des points-virgules, en-têtes en français et ligne vide ignorée
+    def test_csv(self):
+        fichier = io.StringIO("Nom;Prénom;Date de naissance;Classement\nDurand;Zoé;04/03/1990;1800\n;;;\n"
+                              "Martin;Paul;1985-01-02;\n")
+        lignes = list(lire_csv_joueurs(fichier))
+        self.assertEqual(lignes, [
+            {"nom": "Durand", "prenom": "Zoé", "date_naissance": "04/03/1990", "elo": "1800", "ligne": "2"},
+            {"nom": "Martin", "prenom": "Paul", "date_naissance": "1985-01-02", "elo": "", "ligne": "4"}])
+
+    # Test d'une liste FIDE : nom "Nom, Prénom", classement standard et année de naissance
+    def test_liste_fide(self):
+        fichier = io.StringIO(ligne_fide(*(nom for nom, _ in COLONNES_FIDE))
+                              + ligne_fide("1503014", "Carlsen, Magnus", "NOR", "M", "2830", "1990")
+                              + ligne_fide("999", "Nouveau, Jean", "FRA", "M", "", "2001", "i"))
+        lignes = list(lire_liste_fide(fichier))
+        self.assertEqual([(ligne["nom"], ligne["prenom"], ligne["elo"], ligne["date_naissance"]) for ligne in lignes],
+                         [("Carlsen", "Magnus", "2830", "1990"), ("Nouveau", "Jean", "", "2001")])
+
+    # Test d'une liste FIDE sans les colonnes attendues
+    def test_liste_fide_non_reconnue(self):
+        with self.assertRaisesRegex(ValueError, "non reconnu"):
+            list(lire_liste_fide(io.StringIO("ID Number  Fed\n")))
+
+
+# Définition de la classe TestImportJoueurs : mêmes règles que la saisie, une seule écriture par lot
+class TestImportJoueurs(TestAvecDepot):
+    # Méthode pour écrire un fichier dans le dossier du test
+    def ecrire(self, nom: str, contenu: str) -> str:
+        fichier = os.path.join(self.dossier.name, nom)
+        with open(fichier, "w", encoding="utf-8") as file:
+            file.write(contenu)
+        return fichier
+
+    # Test des refus : invalides, doublons (base et fichier), trop jeunes ; joueurs acceptés enregistrés
+    def test_refus_et_enregistrement(self):
+        existant = self.ajouter_joueurs(1)[0]
+        jeune = (datetime.date.today() - datetime.timedelta(days=365)).isoformat()
+        fichier = self.ecrire("joueurs.csv", "nom,prenom,date_naissance,elo\n"
+                                             f"{existant.nom},{existant.prenom},{existant.date_naissance},1500\n"
+                                             "Durand,Zoé,1990-03-04,1800\n"
+                                             "Durand,Zoé,1990-03-04,1700\n"
+                                             f"Petit,Léa,{jeune},1000\n"
+                                             "Martin,Paul,pas une date,1500\n"
+                                             "Martin,Paul,1985-01-02,\n")
+        rapport = self.joueur_manager.importer_joueurs(lire_fichier_joueurs(fichier))
+        self.assertEqual((rapport.lues, rapport.importes), (6, 2))
+        self.assertEqual(rapport.refus[REFUS_DOUBLON], 2)
+        self.assertEqual(rapport.refus[REFUS_AGE], 1)
+        self.assertEqual(rapport.refus[REFUS_INVALIDE], 1)
+        self.assertIn("Ligne 6", rapport.erreurs[-1])
+        self.rouvrir()
+        martin = self.joueur_manager.trouver_joueur_par_details("Martin", "Paul", datetime.date(1985, 1, 2))
+        self.assertEqual(martin.elo, ELO_NON_CLASSE)
+        self.assertEqual(len(self.joueur_manager.joueurs), 3)
+
+    # Test de l'export CSV : relu à l'identique par l'import dans un autre dossier
+    def test_export_reimporte(self):
+        joueurs = self.ajouter_joueurs(3)
+        fichier = os.path.join(self.dossier.name, "export", "joueurs.csv")
+        exporter_csv_joueurs(joueurs, fichier)
+        self.rouvrir()
+        for joueur in joueurs:
+            self.joueur_manager.supprimer_joueur(joueur.index)
+        rapport = self.joueur_manager.importer_joueurs(lire_fichier_joueurs(fichier))
+        self.assertEqual(rapport.importes, 3)
+        self.assertEqual([(joueur.nom, joueur.date_naissance, joueur.elo) for joueur in self.joueur_manager.joueurs],
+                         [(joueur.nom, joueur.date_naissance, joueur.elo) for joueur in joueurs])
+
+
+# Définition de la classe TestImportJoueursSQLite : mêmes tests sur le dépôt SQLite
+class TestImportJoueursSQLite(TestImportJoueurs):
+    stockage = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
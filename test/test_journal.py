@@ -0,0 +1,96 @@
+# Importation des modules nécessaires
+import json  # Pour relire le fichier d'export
+import os  # Pour les chemins des fichiers
+import tempfile  # Pour des dossiers de données jetables
+import unittest  # Pour les tests unitaires
+
+from models.journal import Journal  # Journal testé
+from models.persistance import Persistance  # Écritures sur disque
+
+
+# Définition de la classe TestJournal : état rejoué au démarrage et réécriture complète au-delà du seuil
+class TestJournal(unittest.TestCase):
+    # Préparation : dossier temporaire et persistance propre au test
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "joueur.json")
+        self.persistance = Persistance("manuel")
+
+    # Nettoyage : suppression du dossier
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    # Méthode pour ouvrir le journal comme au démarrage : export lu, puis journal rejoué
+    def ouvrir(self, seuil: int = Journal.SEUIL_COMPACTION) -> Journal:
+        journal = Journal(self.fichier, dict, self.persistance)
+        journal.SEUIL_COMPACTION = seuil
+        journal.charger(dict(journal.lire_export() or {}))
+        return journal
+
+    # Méthode pour relire le fichier d'export
+    def lire_export(self):
+        with open(self.fichier, encoding="utf-8") as file:
+            return json.load(file)
+
+    # Test du rejeu : mises à jour et suppressions retrouvées, valeurs inchangées non réécrites
+    def test_rejeu(self):
+        journal = self.ouvrir()
+        journal.enregistrer("a", 1)
+        journal.enregistrer("b", [1, 2])
+        journal.enregistrer("b", [1, 2])
+        journal.supprimer("a")
+        journal.supprimer("absente")
+        self.assertEqual(journal.nb_entrees, 3)
+        self.assertFalse(os.path.exists(self.fichier))  # Pas encore de compaction
+        recharge = self.ouvrir()
+        self.assertEqual(recharge.etat, {"b": [1, 2]})
+        self.assertEqual(recharge.nb_entrees, 3)
+
+    # Test d'une dernière ligne tronquée : ignorée au rejeu, sans corrompre l'entrée suivante
+    def test_ligne_tronquee(self):
+        journal = self.ouvrir()
+        journal.enregistrer("a", 1)
+        with open(journal.fichier_journal, "a", encoding="utf-8") as file:
+            file.write('{"op":"maj","cle":"b"')
+        journal = self.ouvrir()
+        self.assertEqual(journal.etat, {"a": 1})
+        journal.enregistrer("c", 3)
+        self.assertEqual(self.ouvrir().etat, {"a": 1, "c": 3})
+
+    # Test de la compaction : export réécrit avec l'état complet et journal supprimé au seuil
+    def test_compaction(self):
+        journal = self.ouvrir(seuil=3)
+        journal.enregistrer("a", 1)
+        journal.enregistrer("b", 2)
+        self.assertTrue(os.path.exists(journal.fichier_journal))
+        journal.enregistrer("a", 10)
+        self.assertEqual(self.lire_export(), {"a": 10, "b": 2})
+        self.assertFalse(os.path.exists(journal.fichier_journal))
+        self.assertEqual(journal.nb_entrees, 0)
+        journal.supprimer("b")
+        recharge = self.ouvrir(seuil=3)
+        self.assertEqual(recharge.etat, {"a": 10})
+        self.assertEqual(recharge.nb_entrees, 1)
+
+    # Test d'un lot dépassant le seuil : une seule réécriture de l'export, sans entrée de journal
+    def test_lot_compacte_une_fois(self):
+        journal = self.ouvrir(seuil=3)
+        ecritures = []
+        remplacer = self.persistance.remplacer
+        self.persistance.remplacer = lambda fichier, contenu: (ecritures.append(fichier), remplacer(fichier, contenu))
+        journal.enregistrer_lot({str(numero): numero for numero in range(10)})
+        self.assertEqual(ecritures, [self.fichier])
+        self.assertFalse(os.path.exists(journal.fichier_journal))
+        self.assertEqual(len(self.ouvrir(seuil=3).etat), 10)
+
+    # Test de la synchronisation : clés absentes supprimées, clés inchangées non journalisées
+    def test_synchroniser(self):
+        journal = self.ouvrir()
+        journal.synchroniser({"a": 1, "b": 2})
+        journal.synchroniser({"b": 2, "c": 3})
+        self.assertEqual(journal.nb_entrees, 4)  # maj a, maj b, suppr a, maj c
+        self.assertEqual(self.ouvrir().etat, {"b": 2, "c": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates des joueurs
+import unittest  # Pour les tests unitaires
+
+from models.joueur_model import Joueur  # Joueurs indexés
+from models.tournoi_model import Match, Tournoi  # Matchs et tournois relus
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+NAISSANCE = datetime.date(1990, 1, 1)  # Date de naissance commune aux joueurs des tests
+
+
+# Définition de la classe TestLectureMatch : matchs relus par index, ou par nom dans l'ancien format
+class TestLectureMatch(unittest.TestCase):
+    # Préparation : deux homonymes et un troisième joueur
+    def setUp(self):
+        self.joueurs = [Joueur(1, "Martin", "Paul", NAISSANCE, 1500), Joueur(2, "Martin", "Paul", NAISSANCE, 1600),
+                        Joueur(3, "Durand", "Zoé", NAISSANCE, 1700)]
+        self.par_index = {joueur.index: joueur for joueur in self.joueurs}
+        self.par_nom = {"Martin Paul": self.joueurs[0], "Durand Zoé": self.joueurs[2]}
+
+    # Test du format par index : les homonymes ne sont pas confondus
+    def test_format_par_index(self):
+        data = {"match": "Martin Paul - Martin Paul", "blanc": 2, "noir": 1, "score": "0-1"}
+        self.assertEqual(Match.lire_dict(data, self.par_index, self.par_nom),
+                         (self.joueurs[1], self.joueurs[0], "0-1"))
+
+    # Test de l'ancien format "Nom Prenom - Nom Prenom" et du match non joué
+    def test_ancien_format(self):
+        data = {"match": "Durand Zoé - Martin Paul", "score": "Non joué"}
+        self.assertEqual(Match.lire_dict(data, self.par_index, self.par_nom),
+                         (self.joueurs[2], self.joueurs[0], ""))
+        self.assertIsNone(Match.lire_dict(data, self.par_index))  # Pas de table des noms : ancien format ignoré
+
+    # Test d'un joueur inconnu : match ignoré
+    def test_joueur_inconnu(self):
+        self.assertIsNone(Match.lire_dict({"match": "Inconnu Jean - Durand Zoé", "score": "1-0"},
+                                          self.par_index, self.par_nom))
+        self.assertIsNone(Match.lire_dict({"blanc": 9, "noir": 3}, self.par_index, self.par_nom))
+
+    # Test de l'écriture : index des deux joueurs, libellé conservé, "Non joué" relu comme un résultat vide
+    def test_aller_retour(self):
+        match = Match(self.joueurs[1], self.joueurs[2])
+        data = match.to_dict()
+        self.assertEqual(data, {"match": "Martin Paul - Durand Zoé", "blanc": 2, "noir": 3, "score": "Non joué"})
+        self.assertEqual(Match.lire_dict(data, self.par_index), (self.joueurs[1], self.joueurs[2], ""))
+
+
+# Définition de la classe TestTournoiAncienFormat : tournoi dont les matchs ne référencent les joueurs que par leur nom
+class TestTournoiAncienFormat(TestAvecDepot):
+    # Test du chargement : matchs et classement reconstruits depuis les noms
+    def test_chargement(self):
+        premier, second, exempt = self.ajouter_joueurs(3)
+        data = {"index": 0, "nom_tournoi": "Open", "date_debut": "2024-05-01", "date_fin": "2024-05-02",
+                "nb_rondes": 3, "nb_max_joueurs": 20, "type_tournoi": "blitz", "statut": "En cours",
+                "joueurs_inscrits": [premier.index, second.index, exempt.index],
+                "rondes": [{"numero": 1, "date": "2024-05-01T10:00:00", "statut": "terminée", "exempt": exempt.index,
+                            "matchs": [{"match": "Nom1 Prenom1 - Nom0 Prenom0", "score": "1-0"}]}]}
+        tournoi = Tournoi.from_dict(data, self.depot, self.joueur_manager)
+        match = tournoi.rondes[0].matchs[0]
+        self.assertEqual((match.joueur_blanc, match.joueur_noir, match.resultat), (second, premier, "1-0"))
+        self.assertEqual(match.to_dict()["blanc"], second.index)  # Réécrit au nouveau format
+
+
+if __name__ == "__main__":
+    unittest.main()
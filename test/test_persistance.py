@@ -0,0 +1,112 @@
+# Importation des modules nécessaires
+import io  # Pour capturer les messages affichés
+import json  # Pour écrire les fichiers de départ
+import os  # Pour les chemins des fichiers
+import tempfile  # Pour des dossiers de données jetables
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+from unittest import mock  # Pour remplacer le contexte de l'application
+
+import main_menu  # Point d'entrée de l'application
+from contexte import ContexteApplication  # Contexte de l'application
+from models.depots import DepotJSON  # Dépôt des fichiers JSON
+from models.journal import Journal  # Fichier d'export et journal
+from models.persistance import Persistance, ecrire_atomique, ecrire_atomique_flux  # Écritures atomiques
+
+CORROMPU = '[{"index": 1, "nom": '  # Fichier tronqué au milieu d'un joueur
+
+
+# Définition de la classe TestEcritureAtomique : le fichier contient toujours une version complète
+class TestEcritureAtomique(unittest.TestCase):
+    # Préparation : dossier temporaire contenant une première version du fichier
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "joueur.json")
+        ecrire_atomique(self.fichier, "ancien")
+
+    # Nettoyage : suppression du dossier
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    # Méthode pour lire le fichier testé
+    def lire(self) -> str:
+        with open(self.fichier, encoding="utf-8") as file:
+            return file.read()
+
+    # Test du remplacement complet, sans fichier temporaire restant
+    def test_remplacement(self):
+        ecrire_atomique(self.fichier, "nouveau")
+        self.assertEqual(self.lire(), "nouveau")
+        self.assertEqual(os.listdir(self.dossier.name), ["joueur.json"])
+
+    # Test d'une écriture interrompue : l'ancienne version reste en place
+    def test_ecriture_interrompue(self):
+        def morceaux():
+            yield "début du nouveau contenu"
+            raise OSError("disque plein")
+        with self.assertRaises(OSError):
+            ecrire_atomique_flux(self.fichier, morceaux())
+        self.assertEqual(self.lire(), "ancien")
+        self.assertEqual(os.listdir(self.dossier.name), ["joueur.json"])
+
+    # Test des ajouts d'une transaction : écrits une seule fois, à la fin
+    def test_ajouts_regroupes(self):
+        persistance = Persistance("manuel")
+        journal = os.path.join(self.dossier.name, "joueur.json.journal")
+        with persistance.transaction():
+            persistance.ajouter(journal, "a\n")
+            persistance.ajouter(journal, "b\n")
+            self.assertFalse(os.path.exists(journal))
+        with open(journal, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "a\nb\n")
+
+
+# Définition de la classe TestFichierCorrompu : un fichier d'export illisible n'est jamais remplacé par un état vide
+class TestFichierCorrompu(unittest.TestCase):
+    # Préparation : dossier de données dont le fichier des joueurs est tronqué
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.fichier = os.path.join(self.dossier.name, "joueur.json")
+        with open(self.fichier, "w", encoding="utf-8") as file:
+            file.write(CORROMPU)
+        with open(os.path.join(self.dossier.name, "tournaments.json"), "w", encoding="utf-8") as file:
+            json.dump({}, file)
+
+    # Nettoyage : suppression du dossier
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    # Méthode pour vérifier que le fichier corrompu n'a pas été modifié
+    def verifier_intact(self) -> None:
+        with open(self.fichier, encoding="utf-8") as file:
+            self.assertEqual(file.read(), CORROMPU)
+
+    # Test de la lecture du fichier d'export : erreur explicite au lieu d'un état vide
+    def test_lecture_refusee(self):
+        with redirect_stdout(io.StringIO()), self.assertRaisesRegex(ValueError, "joueur.json"):
+            Journal(self.fichier, list).lire_export()
+        self.verifier_intact()
+
+    # Test du dépôt : aucun joueur chargé, rien d'écrit
+    def test_depot(self):
+        with redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            DepotJSON(self.dossier.name).charger_joueurs()
+        self.verifier_intact()
+
+    # Test du démarrage de l'application : message, code de sortie 1, fichier intact
+    def test_demarrage(self):
+        def contexte(arriere_plan: bool = False) -> ContexteApplication:
+            return ContexteApplication(DepotJSON(self.dossier.name), arriere_plan)
+        for arriere_plan in (False, True):
+            with mock.patch.object(main_menu.config, "CHARGEMENT_ARRIERE_PLAN", arriere_plan), \
+                    mock.patch.object(main_menu, "obtenir_contexte", contexte), \
+                    mock.patch("builtins.input", return_value="1"), \
+                    redirect_stdout(io.StringIO()) as sortie, self.assertRaises(SystemExit) as sortie_application:
+                main_menu.main_menu()
+            self.assertEqual(sortie_application.exception.code, 1)
+            self.assertIn("illisible", sortie.getvalue())
+        self.verifier_intact()
+
+
+if __name__ == "__main__":
+    unittest.main()
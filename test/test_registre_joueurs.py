@@ -0,0 +1,111 @@
+# Importation des modules nécessaires
+import datetime  # Pour les dates de naissance
+import io  # Pour capturer les messages affichés
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stdout  # Pour capturer les messages affichés
+
+from models.joueur_model import Joueur  # Joueurs indexés
+from models.registre_joueurs import RegistreJoueurs  # Registre testé
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+NAISSANCE = datetime.date(1990, 1, 1)  # Date de naissance commune aux joueurs des tests
+
+
+# Définition de la classe TestRegistreJoueurs : recherches par index, détails, nom normalisé et plage d'Elo
+class TestRegistreJoueurs(unittest.TestCase):
+    # Préparation : registre de quatre joueurs, dont deux homonymes à la casse et aux accents près
+    def setUp(self):
+        self.joueurs = [
+            Joueur(1, "Lefèvre", "Élodie", NAISSANCE, 1800),
+            Joueur(2, "LEFEVRE", "elodie", datetime.date(1995, 5, 5), 1500),
+            Joueur(3, "Martin", "Paul", NAISSANCE, 1500),
+            Joueur(7, "Durand", "Zoé", NAISSANCE, 2100),
+        ]
+        self.registre = RegistreJoueurs(self.joueurs)
+
+    # Test des recherches directes
+    def test_recherches(self):
+        self.assertIs(self.registre.par_index(3), self.joueurs[2])
+        self.assertIsNone(self.registre.par_index(4))
+        self.assertIs(self.registre.par_details("Martin", "Paul", NAISSANCE), self.joueurs[2])
+        self.assertEqual(self.registre.par_nom(" lefevre ", "ELODIE"), self.joueurs[:2])
+        self.assertEqual(self.registre.par_elo(1500, 1800), [self.joueurs[1], self.joueurs[2], self.joueurs[0]])
+
+    # Test d'une modification : anciennes clés retirées, nouvelles clés indexées
+    def test_mise_a_jour(self):
+        joueur = self.joueurs[2]
+        joueur.elo = 2200
+        self.registre.mettre_a_jour(joueur)
+        self.assertEqual(self.registre.par_elo(2150, 2300), [joueur])
+        self.registre.retirer(joueur)
+        joueur.nom = "Martinez"
+        self.registre.ajouter(joueur)
+        self.assertIsNone(self.registre.par_details("Martin", "Paul", NAISSANCE))
+        self.assertEqual(self.registre.par_nom("martinez", "paul"), [joueur])
+
+    # Test des index attribués : jamais réutilisés après une suppression
+    def test_index_jamais_reutilises(self):
+        self.assertEqual(self.registre.prochain_index(), 8)
+        self.registre.retirer(self.joueurs[3])
+        self.assertEqual(self.registre.prochain_index(), 8)
+        self.registre.reconstruire(self.joueurs[:3], index_max=7)
+        self.assertEqual(self.registre.prochain_index(), 8)
+        self.assertEqual(len(self.registre), 3)
+
+
+# Définition de la classe TestJoueurManager : index et détails des joueurs enregistrés dans le dépôt
+class TestJoueurManager(TestAvecDepot):
+    # Test du plus grand index attribué : conservé après la suppression du dernier joueur et un redémarrage
+    def test_index_max_persiste(self):
+        joueurs = self.ajouter_joueurs(3)
+        self.assertTrue(self.joueur_manager.supprimer_joueur(joueurs[-1].index))
+        self.rouvrir()
+        self.ajouter_joueurs(1)
+        self.assertEqual([joueur.index for joueur in self.joueur_manager.joueurs], [1, 2, 4])
+
+    # Test de l'ajout d'un doublon ou d'un joueur trop jeune : refusé
+    def test_ajout_refuse(self):
+        joueur = self.ajouter_joueurs(1)[0]
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(self.joueur_manager.ajouter_joueur(joueur.nom, joueur.prenom, joueur.date_naissance,
+                                                                1500))
+            self.assertFalse(self.joueur_manager.ajouter_joueur("Petit", "Léa", datetime.date.today(), 1000))
+        self.assertEqual(len(self.joueur_manager.joueurs), 1)
+
+    # Test d'une modification vers les détails d'un autre joueur : refusée, les deux joueurs restent retrouvables
+    def test_modification_en_doublon_refusee(self):
+        premier, second = self.ajouter_joueurs(2)
+        with redirect_stdout(io.StringIO()) as sortie:
+            self.assertFalse(self.joueur_manager.modifier_joueur(
+                second.index, premier.nom, premier.prenom, premier.date_naissance, 1700))
+        self.assertIn("existe déjà", sortie.getvalue())
+        self.assertEqual(second.nom, "Nom1")
+        self.assertIs(self.joueur_manager.trouver_joueur_par_details(premier.nom, premier.prenom,
+                                                                     premier.date_naissance), premier)
+        self.assertIs(self.joueur_manager.trouver_joueur_par_details(second.nom, second.prenom,
+                                                                     second.date_naissance), second)
+
+    # Test d'une modification de l'Elo seul (mêmes détails que le joueur lui-même) : acceptée et enregistrée
+    def test_modification_acceptee(self):
+        joueur = self.ajouter_joueurs(1)[0]
+        self.assertTrue(self.joueur_manager.modifier_joueur(joueur.index, joueur.nom, joueur.prenom,
+                                                            joueur.date_naissance.isoformat(), "1750"))
+        self.rouvrir()
+        self.assertEqual(self.joueur_manager.trouver_joueur_par_index(joueur.index).elo, 1750)
+
+    # Test d'une modification rendant le joueur trop jeune : refusée
+    def test_modification_trop_jeune_refusee(self):
+        joueur = self.ajouter_joueurs(1)[0]
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(self.joueur_manager.modifier_joueur(joueur.index, joueur.nom, joueur.prenom,
+                                                                 datetime.date.today(), joueur.elo))
+        self.assertEqual(joueur.date_naissance, NAISSANCE)
+
+
+# Définition de la classe TestJoueurManagerSQLite : mêmes tests sur le dépôt SQLite
+class TestJoueurManagerSQLite(TestJoueurManager):
+    stockage = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
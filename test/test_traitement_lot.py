@@ -0,0 +1,115 @@
+# Importation des modules nécessaires
+import io  # Pour capturer les messages affichés
+import json  # Pour écrire les spécifications et relire le compte rendu
+import os  # Pour les chemins des fichiers
+import tempfile  # Pour des dossiers de données jetables
+import unittest  # Pour les tests unitaires
+from contextlib import redirect_stderr  # Pour capturer les messages des modèles
+from typing import Dict, List  # Pour les annotations de type
+from unittest import mock  # Pour rétablir la configuration modifiée par le traitement
+
+import config  # Paramètres de l'application (dossier de données, stockage)
+import traitement_lot  # Point d'entrée testé
+from controllers.lot_controller import (CODE_INCOMPLET, CODE_OK, CODE_RESULTATS_INVALIDES, CODE_SPEC_INVALIDE,
+                                        CODE_USAGE)  # Codes de sortie
+from models import depots  # Dépôt par défaut
+
+SPEC = {"nom_tournoi": "Open", "date_debut": "2024-05-01", "date_fin": "2024-05-02", "nb_rondes": 2,
+        "nb_max_joueurs": 20, "type_tournoi": "blitz",
+        "joueurs": [{"nom": f"Nom{numero}", "prenom": f"Prenom{numero}", "date_naissance": f"199{numero}-01-01",
+                     "elo": 2000 - 10 * numero} for numero in range(8)]}
+
+
+# Définition de la classe TestTraitementLot : code de sortie et compte rendu du traitement sans saisie
+class TestTraitementLot(unittest.TestCase):
+    # Préparation : dossier de données vide, configuration et dépôt par défaut rétablis après le test
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.config = mock.patch.multiple(config, DOSSIER_DONNEES=config.DOSSIER_DONNEES,
+                                          FICHIER_SQLITE=config.FICHIER_SQLITE, STOCKAGE=config.STOCKAGE)
+        self.config.start()
+        depots.definir_depot(None)
+
+    # Nettoyage : dépôt par défaut et configuration rétablis, suppression du dossier
+    def tearDown(self):
+        depots.definir_depot(None)
+        self.config.stop()
+        self.dossier.cleanup()
+
+    # Méthode pour écrire un fichier JSON dans le dossier du test
+    def ecrire(self, nom: str, data) -> str:
+        fichier = os.path.join(self.dossier.name, nom)
+        with open(fichier, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        return fichier
+
+    # Méthode pour lancer le traitement (nouveau démarrage) et relire son compte rendu
+    def lancer(self, *arguments: str) -> Dict:
+        depots.definir_depot(None)
+        sortie = os.path.join(self.dossier.name, "compte_rendu.json")
+        donnees = os.path.join(self.dossier.name, "donnees")
+        with redirect_stderr(io.StringIO()):
+            code = traitement_lot.main([*arguments, "--donnees", donnees, "--stockage", "json", "-o", sortie])
+        with open(sortie, encoding="utf-8") as file:
+            compte_rendu = json.load(file)
+        self.assertEqual(compte_rendu["code"], code)
+        return compte_rendu
+
+    # Méthode pour obtenir les résultats (blancs gagnants) de toutes les parties d'une ronde du compte rendu
+    @staticmethod
+    def resultats(compte_rendu: Dict, numero: int) -> List[Dict]:
+        ronde = compte_rendu["tournois"][0]["rondes"][numero - 1]
+        return [{"ronde": numero, "blanc": match["blanc"], "noir": match["noir"], "resultat": "1-0"}
+                for match in ronde["matchs"]]
+
+    # Test d'un tournoi joué ronde après ronde : incomplet tant que des résultats manquent, puis terminé
+    def test_reprise_jusqu_au_bout(self):
+        spec = self.ecrire("open.json", SPEC)
+        compte_rendu = self.lancer(spec)
+        self.assertEqual(compte_rendu["code"], CODE_INCOMPLET)
+        self.assertEqual(len(compte_rendu["tournois"][0]["rondes"]), 1)  # Ronde 1 appariée, sans résultats
+        resultats = self.resultats(compte_rendu, 1)
+        compte_rendu = self.lancer(spec, "-r", self.ecrire("r1.json", resultats))
+        self.assertEqual(compte_rendu["code"], CODE_INCOMPLET)
+        resultats += self.resultats(compte_rendu, 2)
+        compte_rendu = self.lancer(spec, "-r", self.ecrire("r2.json", resultats))
+        tournoi = compte_rendu["tournois"][0]
+        self.assertEqual(compte_rendu["code"], CODE_OK)
+        self.assertEqual((tournoi["statut"], tournoi["rondes_jouees"]), ("Terminé", 2))
+        self.assertEqual(sum(ligne["points"] for ligne in tournoi["classement"]), 8.0)
+
+    # Test des spécifications invalides : fichier illisible ou champs manquants
+    def test_spec_invalide(self):
+        illisible = os.path.join(self.dossier.name, "absente.json")
+        incomplete = self.ecrire("incomplete.json", {"nom_tournoi": "Open"})
+        for spec in (illisible, incomplete):
+            self.assertEqual(self.lancer(spec)["code"], CODE_SPEC_INVALIDE)
+
+    # Test des résultats invalides : résultat inconnu, ou partie absente des appariements
+    def test_resultats_invalides(self):
+        spec = self.ecrire("open.json", SPEC)
+        inconnu = self.ecrire("inconnu.json", [{"ronde": 1, "blanc": 1, "noir": 2, "resultat": "2-0"}])
+        self.assertEqual(self.lancer(spec, "-r", inconnu)["code"], CODE_RESULTATS_INVALIDES)
+        absente = self.ecrire("absente.json", [{"ronde": 1, "blanc": 1, "noir": 99, "resultat": "1-0"}])
+        compte_rendu = self.lancer(spec, "-r", absente)
+        self.assertEqual(compte_rendu["code"], CODE_RESULTATS_INVALIDES)
+        self.assertIn("1-99", compte_rendu["tournois"][0]["erreurs"][0])
+
+    # Test d'un lot de plusieurs tournois : code le plus grave, les tournois valides sont quand même traités
+    def test_code_le_plus_grave(self):
+        valide = self.ecrire("open.json", SPEC)
+        invalide = self.ecrire("incomplete.json", {"nom_tournoi": "Autre"})
+        compte_rendu = self.lancer(valide, invalide)
+        self.assertEqual(compte_rendu["code"], CODE_SPEC_INVALIDE)
+        codes = [tournoi["code"] for tournoi in compte_rendu["tournois"]]
+        self.assertEqual(codes, [CODE_INCOMPLET, CODE_SPEC_INVALIDE])
+
+    # Test des arguments invalides : code d'argparse
+    def test_arguments_invalides(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as sortie:
+            traitement_lot.main(["a.json", "b.json", "-r", "r.json"])
+        self.assertEqual(sortie.exception.code, CODE_USAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Importation des modules nécessaires
+import threading  # Pour vérifier qu'une unité appartient au fil qui l'a ouverte
+import unittest  # Pour les tests unitaires
+from unittest import mock  # Pour compter les écritures du dépôt
+
+from models.unite_travail import unite_de_travail, unite_en_cours  # Unité de travail testée
+from test.donnees import TestAvecDepot  # Dossier de données jetable
+
+
+# Définition de la classe TestUniteTravail : sauvegardes d'une opération regroupées en une écriture par objet
+class TestUniteTravail(TestAvecDepot):
+    # Préparation : joueurs et tournoi existants, écritures du dépôt comptées à partir d'ici
+    def setUp(self):
+        super().setUp()
+        self.joueurs = self.ajouter_joueurs(6)
+        self.open = self.creer_tournoi("Open", [])
+        self.ecritures = {}
+        for methode in ("synchroniser_tournoi", "synchroniser_entetes", "enregistrer_joueurs", "enregistrer_joueur"):
+            espion = mock.patch.object(self.depot, methode, wraps=getattr(self.depot, methode))
+            self.ecritures[methode] = espion.start()
+            self.addCleanup(espion.stop)
+
+    # Méthode pour obtenir le nombre d'appels de chaque méthode d'écriture du dépôt
+    def appels(self):
+        return {methode: espion.call_count for methode, espion in self.ecritures.items()}
+
+    # Test des inscriptions d'une opération : rien d'écrit avant la fin, puis une écriture du tournoi
+    def test_tournoi_ecrit_une_fois(self):
+        with unite_de_travail(self.depot):
+            for joueur in self.joueurs:
+                self.tournoi_manager.ajouter_joueur_au_tournoi(self.open.index, joueur.index)
+            self.tournoi_manager.sauvegarder_tournois()
+            self.assertEqual(sum(self.appels().values()), 0)
+        self.assertEqual(self.appels()["synchroniser_tournoi"], 1)
+        self.assertEqual(self.appels()["synchroniser_entetes"], 1)
+        self.rouvrir()
+        self.assertEqual(len(self.tournoi("Open").joueurs), 6)
+
+    # Test des joueurs modifiés : enregistrés ensemble, une seule fois chacun
+    def test_joueurs_ecrits_ensemble(self):
+        with unite_de_travail(self.depot):
+            for joueur in self.joueurs[:3]:
+                for elo in (1500, 1600):
+                    self.joueur_manager.modifier_joueur(joueur.index, joueur.nom, joueur.prenom,
+                                                        joueur.date_naissance, elo)
+        self.assertEqual(self.appels()["enregistrer_joueur"], 0)
+        self.assertEqual(self.appels()["enregistrer_joueurs"], 1)
+        self.rouvrir()
+        self.assertEqual([joueur.elo for joueur in self.joueur_manager.joueurs[:3]], [1600] * 3)
+
+    # Test d'une unité imbriquée : elle rejoint l'unité externe, seule celle-ci écrit
+    def test_unite_imbriquee(self):
+        with unite_de_travail(self.depot) as externe:
+            with unite_de_travail(self.depot) as interne:
+                self.assertIs(interne, externe)
+                self.open.ajouter_joueur(self.joueurs[0])
+            self.assertEqual(self.appels()["synchroniser_tournoi"], 0)
+        self.assertEqual(self.appels()["synchroniser_tournoi"], 1)
+        self.assertIsNone(unite_en_cours(self.depot))
+
+    # Test d'une opération qui échoue : les modifications déjà faites sont quand même écrites
+    def test_echec_de_l_operation(self):
+        with self.assertRaises(RuntimeError):
+            with unite_de_travail(self.depot):
+                self.open.ajouter_joueur(self.joueurs[0])
+                raise RuntimeError("interruption")
+        self.rouvrir()
+        self.assertEqual([joueur.index for joueur in self.tournoi("Open").joueurs], [self.joueurs[0].index])
+
+    # Test d'un tournoi supprimé pendant l'unité : ses fichiers ne sont pas recréés à la fin
+    def test_tournoi_supprime(self):
+        with unite_de_travail(self.depot):
+            self.open.ajouter_joueur(self.joueurs[0])
+            self.tournoi_manager.supprimer_tournoi(self.open.index)
+        self.assertEqual(self.appels()["synchroniser_tournoi"], 0)
+        self.rouvrir()
+        self.assertEqual(self.tournoi_manager.tournois, [])
+        self.assertEqual(self.depot.charger_tournoi("Open"), {})
+
+    # Test d'un autre fil : l'unité ouverte par ce fil ne le concerne pas
+    def test_autre_fil(self):
+        vues = []
+        with unite_de_travail(self.depot):
+            fil = threading.Thread(target=lambda: vues.append(unite_en_cours(self.depot)))
+            fil.start()
+            fil.join()
+        self.assertEqual(vues, [None])
+
+
+# Définition de la classe TestUniteTravailSQLite : mêmes tests sur le dépôt SQLite
+class TestUniteTravailSQLite(TestUniteTravail):
+    stockage = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# Importation des modules nécessaires
+import argparse  # Pour analyser les arguments de la ligne de commande
+import contextlib  # Pour rediriger les messages des modèles
+import json  # Pour le compte rendu lisible par machine
+import os  # Pour les opérations liées au système de fichiers
+import sys  # Pour les flux standard et le code de sortie
+from typing import List, Optional  # Pour les annotations de type
+
+import config  # Paramètres de l'application (dossier de données, stockage)
+
+
+# Fonction pour construire l'analyseur des arguments
+def analyseur() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Traitement de tournois sans saisie : appariements, résultats, classements et rapports.",
+        epilog="Codes de sortie : 0 terminé, 1 résultats incomplets, 2 arguments invalides, "
+               "3 résultats invalides, 4 spécification invalide, 5 erreur interne."
+    )
+    parser.add_argument("specs", nargs="+", help="Fichiers JSON de spécification des tournois")
+    parser.add_argument("-r", "--resultats", action="append", default=[],
+                        help="Fichier de résultats CSV ou JSON (un seul tournoi ; sinon champ 'resultats' des specs)")
+    parser.add_argument("-o", "--sortie", help="Fichier du compte rendu JSON (par défaut : sortie standard)")
+    parser.add_argument("--rapports", help="Dossier où écrire les rapports texte de chaque tournoi")
+    parser.add_argument("--donnees", help="Dossier de données à utiliser à la place de celui de config.py")
+    parser.add_argument("--stockage", choices=("json", "sqlite"), help="Moteur de stockage à utiliser")
+    parser.add_argument("--elo", action="store_true", help="Mettre à jour les Elo des tournois traités")
+    parser.add_argument("--instrumentation", action="store_true",
+                        help="Afficher les temps mesurés (entrées/sorties, appariement, classement) "
+                             "sur la sortie d'erreur")
+    parser.add_argument("--trace",
+                        help="Fichier de trace Chrome (chrome://tracing) à écrire ; active l'instrumentation")
+    return parser
+
+
+# Fonction principale : traite les tournois et retourne le code de sortie (le plus grave des tournois)
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = analyseur()
+    args = parser.parse_args(arguments)  # Code 2 en cas d'arguments invalides
+    if args.resultats and len(args.specs) > 1:
+        parser.error("--resultats ne s'utilise qu'avec une seule spécification.")
+    if args.donnees:
+        config.DOSSIER_DONNEES = args.donnees
+        config.FICHIER_SQLITE = os.path.join(args.donnees, os.path.basename(config.FICHIER_SQLITE))
+    if args.stockage:
+        config.STOCKAGE = args.stockage
+    if args.instrumentation or args.trace:
+        from models import instrumentation
+        instrumentation.activer(args.trace or config.FICHIER_TRACE)
+
+    from controllers.lot_controller import CODE_ERREUR_INTERNE, LotController  # Après la configuration du dépôt
+
+    with contextlib.redirect_stdout(sys.stderr):  # Messages des modèles sur la sortie d'erreur : stdout reste du JSON
+        try:
+            controleur = LotController()
+            tournois = [controleur.traiter(spec, args.resultats, args.rapports, args.elo) for spec in args.specs]
+        except Exception as erreur:  # Dépôt inutilisable : aucun tournoi traité
+            tournois = [{"spec": spec, "code": CODE_ERREUR_INTERNE, "erreurs": [repr(erreur)]} for spec in args.specs]
+    code = max(tournoi["code"] for tournoi in tournois)
+    compte_rendu = json.dumps({"code": code, "tournois": tournois}, indent=2, ensure_ascii=False)
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as file:
+            file.write(compte_rendu + "\n")
+    else:
+        print(compte_rendu)
+    return code
+
+
+# Point d'entrée du programme
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,14 @@
 # Importation des modules et classes nécessaires
 import datetime  # Importation du module datetime pour manipuler les dates
 from controllers.joueur_controller import JoueurController  # Importation de la classe JoueurController
-from models.joueur_model import Joueur, JoueurManager  # Importation des classes Joueur et JoueurManager
+from models.joueur_model import Joueur  # Importation de la classe Joueur
+from typing import Optional  # Pour les annotations de type
 
 # Définition de la classe JoueurVue pour gérer l'interface utilisateur des joueurs
 class JoueurVue:
     # Constructeur de la classe JoueurVue
-    def __init__(self, gestion_joueur):
-        self.gestion_joueur = gestion_joueur  # Référence à la fonction de gestion des joueurs
-        self.joueur_controller = JoueurController()  # Création d'une instance de JoueurController
+    def __init__(self, joueur_controller: Optional[JoueurController] = None):
+        self.joueur_controller = joueur_controller or JoueurController()  # Contrôleur fourni ou nouvelle instance
 
     # Méthode pour afficher le menu des joueurs
     def afficher_menu(self):
@@ -18,13 +18,15 @@ class JoueurVue:
         print("3. Supprimer un joueur")
         print("4. Afficher la liste des joueurs")
         print("5. Afficher les détails d'un joueur")
-        print("6. Retour")
+        print("6. Importer des joueurs (CSV ou liste FIDE)")
+        print("7. Exporter les joueurs (CSV)")
+        print("8. Retour")
 
     # Méthode pour saisir les informations d'un joueur
     def saisir_joueur(self):
         while True:
             # Vérifie si le nombre maximal de joueurs est atteint
-            if len(self.joueur_controller.joueur_manager.joueurs) >= JoueurManager.MAX_JOUEURS:
+            if self.joueur_controller.joueur_manager.quota_atteint():
                 print("Nombre maximal de joueurs atteint.")
                 return None
 
@@ -44,8 +46,7 @@ class JoueurVue:
                     continue
                 elif choix.lower() == 'n':
                     print("Retour au menu joueur.")
-                    self.gestion_joueur()
-                    return
+                    return None
                 else:
                     print("Choix invalide. Veuillez répondre par 'o' ou 'n'.")
                     continue
@@ -60,12 +61,33 @@ class JoueurVue:
                     continue
                 elif choix.lower() == 'n':
                     print("Retour au menu joueur.")
-                    self.gestion_joueur()
-                    return
+                    return None
                 else:
                     print("Choix invalide. Veuillez répondre par 'o' ou 'n'.")
                     continue
 
+    # Méthode pour importer des joueurs depuis un fichier
+    def importer_joueurs(self):
+        fichier = input("Chemin du fichier à importer (.csv ou liste FIDE .txt) : ").strip()
+        if not fichier:
+            print("Import annulé.")
+            return
+        rapport = self.joueur_controller.importer_joueurs(fichier)
+        if rapport is None:
+            return
+        print(rapport)
+        for erreur in rapport.erreurs:
+            print(f"  {erreur}")
+
+    # Méthode pour exporter les joueurs dans un fichier CSV
+    def exporter_joueurs(self):
+        fichier = input("Chemin du fichier CSV à créer : ").strip()
+        if not fichier:
+            print("Export annulé.")
+            return
+        if self.joueur_controller.exporter_joueurs(fichier):
+            print(f"{len(self.joueur_controller.joueur_manager.joueurs)} joueur(s) exporté(s) dans {fichier}.")
+
     # Méthode pour modifier un joueur existant
     def modifier_joueur(self):
         index = self.saisir_index_joueur()
@@ -85,8 +107,8 @@ class JoueurVue:
             prenom = input(f"Nouveau prénom ({joueur.prenom}) : ") or joueur.prenom
             date_naissance = input(f"Nouvelle date de naissance ({joueur.date_naissance}) : ") or joueur.date_naissance
             elo = input(f"Nouvel elo ({joueur.elo}) : ") or joueur.elo
-            self.joueur_controller.modifier_joueur(index, nom, prenom, date_naissance, elo)
-            print("Joueur modifié avec succès.")
+            # Le joueur est désigné par son index (et non par sa position dans la liste affichée)
+            self.joueur_controller.modifier_joueur(joueur.index, nom, prenom, date_naissance, elo)
         else:
             print("Aucune modification effectuée.")
 
@@ -1,12 +1,13 @@
 # Importation des modules nécessaires
 import datetime  # Pour manipuler les dates
 import re  # Pour les expressions régulières
-import json  # Pour manipuler les fichiers JSON
 from typing import Optional  # Pour les annotations de type optionnelles
 
 # Importation des classes nécessaires depuis les modules correspondants
 from controllers.tournoi_controller import TournoiController  # Contrôleur pour les tournois
-from models.joueur_model import Joueur, JoueurManager  # Modèles pour les joueurs et gestion des joueurs
+from models.joueur_model import JoueurManager  # Gestion des joueurs (table d'identité partagée avec les tournois)
+from models import exporteurs  # Formats et dossier des exports
+from models.unite_travail import unite_de_travail  # Sauvegardes regroupées en fin d'opération
 
 # Définition de la classe TournoiVue pour gérer l'interface utilisateur des tournois
 class TournoiVue:
@@ -23,7 +24,8 @@ class TournoiVue:
         print("3. Supprimer un tournoi")
         print("4. Afficher la liste des tournois")
         print("5. Afficher les détails d'un tournoi")
-        print("6. Retour")
+        print("6. Exporter un tournoi ou une saison (CSV, HTML, Markdown, texte)")
+        print("7. Retour")
 
     # Méthode pour saisir les informations d'un nouveau tournoi
     def saisir_tournoi(self) -> tuple:
@@ -129,16 +131,6 @@ class TournoiVue:
 
     # Méthode pour saisir les joueurs participants à un tournoi
     def saisir_joueurs_participants(self, index_tournoi: int) -> None:
-        try:
-            with open('data/joueur.json', 'r', encoding='utf-8') as f:  # Ouverture du fichier JSON contenant les joueurs
-                tous_joueurs = json.load(f)  # Chargement des données des joueurs
-        except FileNotFoundError:
-            print("Fichier data/joueur.json non trouvé.")
-            return
-        except json.JSONDecodeError:
-            print("Erreur dans le format du fichier data/joueur.json.")
-            return
-        
         tournoi = self.tournoi_controller.tournoi_manager.trouver_tournoi_par_index(index_tournoi)  # Recherche du tournoi par index
         
         if not tournoi:  # Vérification si le tournoi existe
@@ -149,8 +141,9 @@ class TournoiVue:
         for joueur in tournoi.joueurs:  # Affichage des joueurs déjà inscrits dans le tournoi
             print(f'- {joueur.nom} {joueur.prenom}')
         
-        joueurs_inscrits_indices = [j.index for j in tournoi.joueurs]  # Liste des indices des joueurs inscrits
-        joueurs_disponibles = [j for j in tous_joueurs if j['index'] not in joueurs_inscrits_indices]  # Liste des joueurs disponibles pour l'ajout
+        joueurs_inscrits_indices = {j.index for j in tournoi.joueurs}  # Indices des joueurs inscrits
+        # Joueurs disponibles : objets partagés du gestionnaire, déjà en mémoire (aucune relecture du fichier)
+        joueurs_disponibles = [j for j in tournoi.joueur_manager.joueurs if j.index not in joueurs_inscrits_indices]
         
         if not joueurs_disponibles:  # Vérification si des joueurs sont disponibles pour l'ajout
             print("Aucun joueur disponible pour l'ajout.")
@@ -158,7 +151,7 @@ class TournoiVue:
         
         print('\nJoueurs disponibles:')
         for joueur in joueurs_disponibles:  # Affichage des joueurs disponibles
-            print(f"{joueur['index']}. {joueur['nom']} {joueur['prenom']}")
+            print(f"{joueur.index}. {joueur.nom} {joueur.prenom}")
         
         joueurs_selectionnes = []  # Liste des joueurs sélectionnés
         
@@ -168,10 +161,11 @@ class TournoiVue:
                 if choix == 0:
                     break
                 
-                joueur = next((j for j in joueurs_disponibles if j['index'] == choix), None)  # Recherche du joueur par index
+                # Recherche du joueur par index
+                joueur = next((j for j in joueurs_disponibles if j.index == choix), None)
                 if joueur and joueur not in joueurs_selectionnes:
                     joueurs_selectionnes.append(joueur)  # Ajout du joueur à la liste des sélectionnés
-                    print(f"Joueur {joueur['nom']} {joueur['prenom']} ajouté.")
+                    print(f"Joueur {joueur.nom} {joueur.prenom} ajouté.")
                     joueurs_disponibles.remove(joueur)  # Retrait du joueur de la liste des disponibles
                 else:
                     print('Index invalide ou joueur déjà inscrit.')
@@ -179,17 +173,9 @@ class TournoiVue:
                 print('Veuillez entrer un nombre valide.')
         
         if joueurs_selectionnes:  # Vérification si des joueurs ont été sélectionnés
-            for joueur in joueurs_selectionnes:
-                # Création d'un nouvel objet Joueur à partir des données du joueur sélectionné
-                nouveau_joueur = Joueur(
-                    index=joueur['index'],
-                    nom=joueur['nom'],
-                    prenom=joueur['prenom'],
-                    date_naissance=datetime.date.fromisoformat(joueur['date_naissance']),
-                    elo=joueur['elo']
-                )
-                tournoi.ajouter_joueur(nouveau_joueur)  # Ajout du joueur au tournoi
-            tournoi.sauvegarder_joueurs()  # Sauvegarde des joueurs du tournoi
+            with unite_de_travail(tournoi.depot):  # Tournoi sérialisé et écrit une seule fois pour toute la sélection
+                for joueur in joueurs_selectionnes:
+                    tournoi.ajouter_joueur(joueur)  # Inscription du joueur partagé (aucune copie)
             print('Joueurs ajoutés au tournoi avec succès.')
         else:
             print('Aucun joueur n\'a été ajouté au tournoi.')
@@ -236,8 +222,9 @@ class TournoiVue:
             print('Tournoi non trouvé.')
             return
         
-        tournoi.jouer_ronde()  # Appel de la méthode pour jouer une nouvelle ronde
-        self.tournoi_controller.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
+        with unite_de_travail(tournoi.depot):  # La ronde et les en-têtes sont écrits une fois chacun
+            tournoi.jouer_ronde()  # Appel de la méthode pour jouer une nouvelle ronde
+            self.tournoi_controller.tournoi_manager.sauvegarder_tournois()  # Sauvegarde des modifications des tournois
         print("Ronde créée avec succès.")
 
     # Méthode pour supprimer un joueur d'un tournoi
@@ -274,3 +261,26 @@ class TournoiVue:
                     print("Numéro de joueur invalide.")
             except ValueError:
                 print("Veuillez entrer un nombre valide.")
+
+    # Méthode pour exporter un tournoi, ou tous les tournois d'une saison, dans un ou plusieurs formats
+    def exporter(self) -> None:
+        print(f"Formats disponibles : {', '.join(exporteurs.EXPORTEURS)}")
+        saisie = input("Formats (séparés par des virgules, défaut : html) : ") or "html"
+        formats = [format_export.strip() for format_export in saisie.split(",") if format_export.strip()]
+        dossier = (input(f"Dossier de destination (défaut : {exporteurs.DOSSIER_EXPORTS}) : ").strip()
+                   or exporteurs.DOSSIER_EXPORTS)
+        if input("Exporter toute une saison ? (o/n) : ").lower() == 'o':
+            saison = input("Année de la saison (vide pour tous les tournois) : ").strip()
+            if saison and not saison.isdigit():
+                print("Année invalide.")
+                return
+            fichiers = self.tournoi_controller.exporter_saison(int(saison) if saison else None, formats, dossier)
+        else:
+            index_tournoi = self.saisir_index_tournoi()  # Saisie de l'index du tournoi à exporter
+            if index_tournoi is None:
+                return
+            fichiers = self.tournoi_controller.exporter_tournoi(index_tournoi, formats, dossier)
+        if fichiers:
+            print(f"{len(fichiers)} fichier(s) exporté(s) :")
+            for fichier in fichiers:
+                print(f"  {fichier}")